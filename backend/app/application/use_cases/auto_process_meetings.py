@@ -11,6 +11,7 @@ from app.infrastructure.config.settings import get_settings
 from app.infrastructure.background.job_tracker import JobTracker
 from app.infrastructure.supabase.repositories.meeting_repository_impl import MeetingRepositoryImpl
 from app.infrastructure.zoho.client import ZohoClient
+from app.infrastructure.zoho.candidate_index import get_candidate_index
 from app.domain.services.candidate_title_matcher import CandidateTitleMatcher
 from app.application.use_cases.process_structured_data import ProcessStructuredDataUseCase
 
@@ -44,6 +45,8 @@ class ProcessingResult:
     error_message: Optional[str] = None
     processing_time: Optional[float] = None
     tokens_used: Optional[int] = None
+    result_cache_hits: int = 0
+    result_cache_misses: int = 0
 
 
 class AutoProcessMeetingsUseCase:
@@ -88,6 +91,7 @@ class AutoProcessMeetingsUseCase:
         skipped_no_title_match = 0
         skipped_zoho_not_exact = 0
         skipped_not_first = 0
+        skipped_fetch_error = 0
         errors = 0
         seen_count = 0
 
@@ -109,6 +113,7 @@ class AutoProcessMeetingsUseCase:
         skipped_no_title_match = sum(1 for c in candidates if hasattr(c, 'skip_reason') and c.skip_reason == 'no_title_match')
         skipped_zoho_not_exact = sum(1 for c in candidates if hasattr(c, 'skip_reason') and c.skip_reason == 'zoho_not_exact')
         skipped_already_structured = sum(1 for c in candidates if hasattr(c, 'skip_reason') and c.skip_reason == 'already_structured')
+        skipped_fetch_error = sum(1 for c in candidates if hasattr(c, 'skip_reason') and c.skip_reason == 'fetch_error')
         
         # Filter out skipped candidates to get actual processing candidates
         valid_candidates = [c for c in candidates if isinstance(c, ProcessingCandidate)]
@@ -144,6 +149,8 @@ class AutoProcessMeetingsUseCase:
         execution_time = time.time() - start_time
         avg_processing_time = sum(r.processing_time or 0 for r in results) / max(len(results), 1)
         total_tokens = sum(r.tokens_used or 0 for r in results)
+        result_cache_hits = sum(r.result_cache_hits for r in results)
+        result_cache_misses = sum(r.result_cache_misses for r in results)
         
         # Create enhanced summary with performance metrics
         summary = {
@@ -154,6 +161,7 @@ class AutoProcessMeetingsUseCase:
             "skipped_zoho_not_exact": skipped_zoho_not_exact,
             "skipped_not_first": skipped_not_first,
             "skipped_already_structured": skipped_already_structured,
+            "skipped_fetch_error": skipped_fetch_error,
             "errors": errors,
             "max_items": max_items,
             "dry_run": dry_run,
@@ -165,6 +173,8 @@ class AutoProcessMeetingsUseCase:
             "processing_rate": round(processed / max(execution_time, 1), 2),  # items per second
             "success_rate": round(processed / max(processed + errors, 1), 3),
             "approx_text_chars": approx_text_chars,
+            "result_cache_hits": result_cache_hits,
+            "result_cache_misses": result_cache_misses,
             "results": [
                 {
                     "meeting_id": r.meeting_id,
@@ -180,8 +190,8 @@ class AutoProcessMeetingsUseCase:
         }
         
         logger.info(
-            "[auto] finished: processed=%s skipped={no_text:%s no_title:%s zoho_mismatch:%s not_first:%s already_structured:%s} errors=%s execution_time=%.2fs rate=%.2f/s",
-            processed, skipped_no_text, skipped_no_title_match, skipped_zoho_not_exact, skipped_not_first, skipped_already_structured, errors, execution_time, summary["processing_rate"]
+            "[auto] finished: processed=%s skipped={no_text:%s no_title:%s zoho_mismatch:%s not_first:%s already_structured:%s fetch_error:%s} errors=%s execution_time=%.2fs rate=%.2f/s",
+            processed, skipped_no_text, skipped_no_title_match, skipped_zoho_not_exact, skipped_not_first, skipped_already_structured, skipped_fetch_error, errors, execution_time, summary["processing_rate"]
         )
         
         if job_id:
@@ -189,7 +199,7 @@ class AutoProcessMeetingsUseCase:
                 job_id,
                 message=f"Auto process finished - {processed} processed in {execution_time:.1f}s",
                 stored=processed,
-                skipped=skipped_no_text + skipped_no_title_match + skipped_zoho_not_exact + skipped_not_first + skipped_already_structured,
+                skipped=skipped_no_text + skipped_no_title_match + skipped_zoho_not_exact + skipped_not_first + skipped_already_structured + skipped_fetch_error,
                 collected=seen_count,
             )
 
@@ -203,9 +213,22 @@ class AutoProcessMeetingsUseCase:
         max_items: int,
         title_regex: Optional[str]
     ) -> List[ProcessingCandidate]:
-        """候補会議を収集し、優先度スコアを計算する"""
-        candidates = []
+        """候補会議を収集し、優先度スコアを計算する
+
+        1. 一覧メタデータ（タイトル・作成日時・本文長）だけで絞り込みとスコア計算を行う
+        2. スコア上位 max_items 件を選ぶ
+        3. 選ばれた会議の text_content のみをまとめて取得する
+        """
+        skipped: List[Any] = []
+        scored: List[Tuple[float, Dict[str, Any], str, Dict[str, Any]]] = []
         zoho = ZohoClient()
+        # 求職者名インデックスが使えれば会議ごとの Zoho 検索は行わない（失敗時は Search API にフォールバック）
+        candidate_index = None
+        if get_settings().zoho_candidate_index_enabled:
+            index = get_candidate_index()
+            if index.ensure_fresh(zoho):
+                candidate_index = index
+        logger.info("[auto] zoho lookup mode: %s", "index" if candidate_index else "search_api")
         
         # Page through meetings to collect candidates
         page = 1
@@ -219,9 +242,8 @@ class AutoProcessMeetingsUseCase:
             logger.info("[auto] collecting page=%s page_size=%s (max_pages=%s)", page, page_size, max_pages)
             
             # Early stopping if we have found plenty of valid candidates
-            valid_candidates_so_far = sum(1 for c in candidates if isinstance(c, ProcessingCandidate))
-            if valid_candidates_so_far >= max_items * 3:  # 3x buffer for good selection
-                logger.info("[auto] early stopping: found %s candidates (target: %s)", valid_candidates_so_far, max_items)
+            if len(scored) >= max_items * 3:  # 3x buffer for good selection
+                logger.info("[auto] early stopping: found %s candidates (target: %s)", len(scored), max_items)
                 break
             
             page_result = repo.list_meetings_paginated(
@@ -229,12 +251,12 @@ class AutoProcessMeetingsUseCase:
                 page_size=page_size,
                 accounts=accounts,
                 structured=False,  # only unstructured
+                include_text_length=True,
             )
             
             items = page_result.get("items", [])
             if not items:
                 break
-                
 
             for item in items:
                 total_seen += 1
@@ -246,98 +268,41 @@ class AutoProcessMeetingsUseCase:
                     title = (item.get("title") or "").strip()
 
                     if not title or not self._has_auto_process_keyword(title):
-                        mock_candidate = type('SkippedCandidate', (), {
-                            'skip_reason': 'not_first',
-                            'meeting_id': meeting_id,
-                            'title': title
-                        })()
-                        candidates.append(mock_candidate)
+                        skipped.append(self._skipped("not_first", meeting_id, title))
                         continue
 
                     if item.get("is_structured"):
-                        mock_candidate = type('SkippedCandidate', (), {
-                            'skip_reason': 'already_structured',
-                            'meeting_id': meeting_id,
-                            'title': title
-                        })()
-                        candidates.append(mock_candidate)
+                        skipped.append(self._skipped("already_structured", meeting_id, title))
                         continue
 
-                    # タイトルマッチをtext_content取得の前に実行（不要なDB取得を回避）
                     extracted = matcher.extract_from_title(title)
                     if not extracted:
-                        mock_candidate = type('SkippedCandidate', (), {
-                            'skip_reason': 'no_title_match',
-                            'meeting_id': meeting_id,
-                            'title': title
-                        })()
-                        candidates.append(mock_candidate)
+                        skipped.append(self._skipped("no_title_match", meeting_id, title))
                         continue
 
-                    # Zoho検索: 名前バリエーション（スペース有無等）で複数パターン検索
-                    variations = matcher.get_search_variations(extracted)
-                    matches = zoho.search_app_hc_by_exact_name(extracted, limit=5, name_variations=variations)
-
-                    if not matches:
-                        mock_candidate = type('SkippedCandidate', (), {
-                            'skip_reason': 'zoho_not_exact',
-                            'meeting_id': meeting_id,
-                            'title': title
-                        })()
-                        candidates.append(mock_candidate)
+                    if candidate_index is not None:
+                        matches = candidate_index.lookup(extracted)
+                    else:
+                        # Zoho検索: 名前バリエーション（スペース有無等）で複数パターン検索
+                        variations = matcher.get_search_variations(extracted)
+                        matches = zoho.search_app_hc_by_exact_name(extracted, limit=5, name_variations=variations)
+
+                    # 複数ヒット時は正規化マッチで絞り込み、1件に確定しなければスキップ
+                    verified = [
+                        m for m in matches or []
+                        if matcher.is_exact_match(extracted, m.get("candidate_name", ""), pre_extracted=True)
+                    ]
+                    if len(verified) != 1:
+                        skipped.append(self._skipped("zoho_not_exact", meeting_id, title))
                         continue
 
-                    # 複数ヒット時: 正規化マッチで絞り込み
-                    if len(matches) > 1:
-                        verified = [m for m in matches if matcher.is_exact_match(extracted, m.get("candidate_name", ""), pre_extracted=True)]
-                        if len(verified) != 1:
-                            mock_candidate = type('SkippedCandidate', (), {
-                                'skip_reason': 'zoho_not_exact',
-                                'meeting_id': meeting_id,
-                                'title': title
-                            })()
-                            candidates.append(mock_candidate)
-                            continue
-                        match = verified[0]
-                    else:
-                        match = matches[0]
-                        if not matcher.is_exact_match(extracted, match.get("candidate_name", ""), pre_extracted=True):
-                            mock_candidate = type('SkippedCandidate', (), {
-                                'skip_reason': 'zoho_not_exact',
-                                'meeting_id': meeting_id,
-                                'title': title
-                            })()
-                            candidates.append(mock_candidate)
-                            continue
-
-                    # Zohoマッチ確定後にのみtext_contentを取得
-                    full = repo.get_meeting_core(meeting_id)
-                    if not full or not full.get("text_content"):
-                        mock_candidate = type('SkippedCandidate', (), {
-                            'skip_reason': 'no_text',
-                            'meeting_id': meeting_id,
-                            'title': title
-                        })()
-                        candidates.append(mock_candidate)
+                    # 本文長が一覧で分かる場合は text_content を取得せずに未文字起こしを除外
+                    if item.get("text_length") == 0:
+                        skipped.append(self._skipped("no_text", meeting_id, title))
                         continue
 
-                    priority_score = self._calculate_priority_score(full, extracted)
-                    text_len = len(full.get("text_content", ""))
-
-                    candidate = ProcessingCandidate(
-                        meeting_id=meeting_id,
-                        title=title,
-                        candidate_name=extracted,
-                        zoho_match=match,
-                        priority_score=priority_score,
-                        text_length=text_len,
-                        created_at=full.get("created_at", ""),
-                        meeting_data=full
-                    )
-
-                    candidates.append(candidate)
-                    logger.debug("[auto] candidate added: id=%s name=%s priority=%.2f",
-                                 candidate.meeting_id, candidate.candidate_name, priority_score)
+                    priority_score = self._calculate_priority_score(item, extracted)
+                    scored.append((priority_score, item, extracted, verified[0]))
 
                 except Exception as e:
                     logger.warning("[auto] error collecting candidate %s: %s", item.get("id"), e)
@@ -347,21 +312,77 @@ class AutoProcessMeetingsUseCase:
                 break
             page += 1
             
-        # Sort only valid ProcessingCandidate objects by priority score (highest first) and limit to max_items
-        valid_candidates = [c for c in candidates if isinstance(c, ProcessingCandidate)]
-        valid_candidates.sort(key=lambda c: c.priority_score, reverse=True)
+        # Sort by priority score (highest first) and fetch text only for the top max_items
+        scored.sort(key=lambda s: s[0], reverse=True)
+        selected = self._fetch_selected_texts(repo, scored, max_items, skipped)
         
-        # Keep all candidates for statistics but return only max_items valid candidates
-        limited_valid_candidates = valid_candidates[:max_items]
+        # Combine selected candidates with all skip candidates for statistics
+        result_candidates = selected + skipped
         
-        # Combine limited valid candidates with all skip candidates for statistics
-        skip_candidates = [c for c in candidates if not isinstance(c, ProcessingCandidate)]
-        result_candidates = limited_valid_candidates + skip_candidates
-        
-        logger.info("[auto] candidates collected: total_seen=%s candidates=%s max_items=%s", 
-                   total_seen, len(result_candidates), max_items)
+        logger.info("[auto] candidates collected: total_seen=%s matched=%s selected=%s max_items=%s", 
+                   total_seen, len(scored), len(selected), max_items)
         
         return result_candidates
+
+    def _fetch_selected_texts(
+        self,
+        repo: MeetingRepositoryImpl,
+        scored: List[Tuple[float, Dict[str, Any], str, Dict[str, Any]]],
+        max_items: int,
+        skipped: List[Any],
+    ) -> List[ProcessingCandidate]:
+        """スコア上位から text_content を一括取得し、本文のある max_items 件を ProcessingCandidate にする
+
+        本文が空の会議は no_text、取得に失敗した会議は fetch_error としてスキップし、
+        不足分は次点から補充する（1 件の失敗で収集全体を止めない）。
+        """
+        selected: List[ProcessingCandidate] = []
+        cursor = 0
+        while len(selected) < max_items and cursor < len(scored):
+            chunk = scored[cursor:cursor + min(max_items - len(selected), 50)]
+            cursor += len(chunk)
+            fetch_errors: Dict[str, str] = {}
+            cores = repo.get_meetings_core_batch(
+                [str(item.get("id")) for _, item, _, _ in chunk], errors=fetch_errors
+            )
+            for priority_score, item, extracted, match in chunk:
+                meeting_id = str(item.get("id"))
+                title = (item.get("title") or "").strip()
+                if meeting_id in fetch_errors:
+                    logger.warning("[auto] error collecting candidate %s: %s", meeting_id, fetch_errors[meeting_id])
+                    skipped.append(self._skipped("fetch_error", meeting_id, title))
+                    continue
+                full = cores.get(meeting_id)
+                if not full or not full.get("text_content"):
+                    skipped.append(self._skipped("no_text", meeting_id, title))
+                    continue
+                if item.get("text_length") is None:
+                    # 本文長が一覧に無かった場合は取得した本文でスコアを確定させる
+                    priority_score = self._calculate_priority_score(full, extracted)
+                candidate = ProcessingCandidate(
+                    meeting_id=meeting_id,
+                    title=title,
+                    candidate_name=extracted,
+                    zoho_match=match,
+                    priority_score=priority_score,
+                    text_length=len(full.get("text_content", "")),
+                    created_at=full.get("created_at", ""),
+                    meeting_data=full
+                )
+                selected.append(candidate)
+                logger.debug("[auto] candidate added: id=%s name=%s priority=%.2f",
+                             candidate.meeting_id, candidate.candidate_name, priority_score)
+        selected.sort(key=lambda c: c.priority_score, reverse=True)
+        return selected
+
+    @staticmethod
+    def _skipped(reason: str, meeting_id: str, title: str) -> Any:
+        """統計用のスキップ候補（skip_reason を持つ軽量オブジェクト）"""
+        return type('SkippedCandidate', (), {
+            'skip_reason': reason,
+            'meeting_id': meeting_id,
+            'title': title
+        })()
     
     def _calculate_priority_score(self, meeting_data: Dict[str, Any], candidate_name: str) -> float:
         """会議の優先度スコアを計算する"""
@@ -386,7 +407,9 @@ class AutoProcessMeetingsUseCase:
                 pass
                 
         # Score based on text length (medium length preferred)
-        text_length = len(meeting_data.get("text_content", ""))
+        text_length = meeting_data.get("text_length")
+        if text_length is None:
+            text_length = len(meeting_data.get("text_content") or "")
         if 2000 <= text_length <= 20000:
             score += 3.0
         elif text_length > 20000:
@@ -488,11 +511,13 @@ class AutoProcessMeetingsUseCase:
             # Extract status and tokens from response
             status = "success"
             tokens_used = None
+            cache_stats: Dict[str, Any] = {}
             
             if isinstance(response, dict):
                 zoho_result = response.get("zoho_write_result", {})
                 if isinstance(zoho_result, dict):
                     status = zoho_result.get("status", "success")
+                cache_stats = response.get("result_cache") or {}
                 # TODO: Extract token usage from AI usage logs if available
                 
             logger.info("[auto] candidate processed: id=%s status=%s time=%.2fs", 
@@ -505,7 +530,9 @@ class AutoProcessMeetingsUseCase:
                 zoho_record_id=candidate.zoho_match.get("record_id", ""),
                 status=status,
                 processing_time=processing_time,
-                tokens_used=tokens_used
+                tokens_used=tokens_used,
+                result_cache_hits=cache_stats.get("hits", 0),
+                result_cache_misses=cache_stats.get("misses", 0),
             )
             
         except Exception as e:
@@ -1,8 +1,9 @@
 from __future__ import annotations
-from typing import List, Optional
+from typing import List, Optional, Set
 import logging
 import asyncio
 from app.infrastructure.background.job_tracker import JobTracker
+from app.domain.entities.meeting_document import MeetingDocument
 
 from app.infrastructure.google.drive_docs_collector import DriveDocsCollector
 from app.infrastructure.notta.drive_xlsx_collector import NottaDriveXlsxCollector
@@ -19,12 +20,14 @@ class CollectMeetingsUseCase:
         include_structure: bool = False,
         force_update: bool = False,
         job_id: Optional[str] = None,
+        full_rescan: bool = False,
     ) -> None:
         logger.info(
-            "CollectMeetingsUseCase started: accounts=%s include_structure=%s force_update=%s",
+            "CollectMeetingsUseCase started: accounts=%s include_structure=%s force_update=%s full_rescan=%s",
             accounts,
             include_structure,
             force_update,
+            full_rescan,
         )
         try:
             settings = get_settings()
@@ -40,71 +43,67 @@ class CollectMeetingsUseCase:
                 raise RuntimeError(f"Unknown MEETING_SOURCE: {settings.meeting_source}")
             repo = MeetingRepositoryImpl()
 
-            collected = []
-            for collector in collectors:
-                collected.extend(
-                    await collector.collect_meeting_docs(
-                        accounts, include_structure=include_structure
-                    )
-                )
-            logger.info("Collected meetings from Drive: %d", len(collected))
-            if job_id:
-                JobTracker.update(job_id, collected=len(collected))
+            # Phase 1: 各コレクタはメタデータのみ一覧し、保存済み modifiedTime と比較して
+            # 新規/変更分だけ本文をエクスポートする（force_update 時は全件）
+            known_modified_times = None if force_update else repo.get_modified_time_map
 
+            # Phase 2: コレクタから届いた順にバッチ保存する（全件をメモリに溜めない）
+            collected = 0
             stored = 0
-            skipped = 0
             failed = 0
-            for meeting in collected:
-                try:
-                    # Offload Supabase calls to thread to avoid blocking event loop
-                    existing = await asyncio.to_thread(
-                        repo.get_by_doc_and_organizer,
-                        meeting.doc_id,
-                        meeting.organizer_email or "",
-                    )
-                    if existing and not force_update:
-                        try:
-                            existing_modified = (existing.get("metadata") or {}).get(
-                                "modifiedTime"
-                            )
-                            current_modified = (meeting.metadata or {}).get("modifiedTime")
-                            if (
-                                existing_modified
-                                and current_modified
-                                and existing_modified == current_modified
-                            ):
-                                logger.debug(
-                                    "Skip unchanged meeting: doc_id=%s organizer=%s",
-                                    meeting.doc_id,
-                                    meeting.organizer_email,
-                                )
-                                skipped += 1
-                                continue
-                        except Exception as ex:
-                            logger.debug(
-                                "Comparison failed for doc_id=%s organizer=%s: %s (proceed to upsert)",
-                                meeting.doc_id,
-                                meeting.organizer_email,
-                                ex,
-                            )
-                    
-                    await asyncio.to_thread(repo.upsert_meeting, meeting)
-                    stored += 1
-                except Exception as e:
-                    failed += 1
-                    logger.error(
-                        "Failed to store meeting: doc_id=%s organizer=%s error=%s",
-                        meeting.doc_id,
-                        meeting.organizer_email or "unknown",
-                        str(e)
+            failed_organizers: Set[str] = set()
+            batch: List[MeetingDocument] = []
+            batch_size = max(1, settings.collect_store_batch_size)
+
+            async def _flush(items: List[MeetingDocument]) -> None:
+                nonlocal stored, failed
+                failures = await asyncio.to_thread(self._store_batch, repo, items)
+                stored += len(items) - len(failures)
+                failed += len(failures)
+                failed_organizers.update(m.organizer_email or "" for m in failures)
+                if job_id:
+                    JobTracker.update(
+                        job_id,
+                        collected=collected,
+                        stored=stored,
+                        failed=failed,
+                        skipped=self._count_unchanged(collectors),
                     )
 
+            for collector in collectors:
+                async for meeting in collector.iter_meeting_docs(
+                    accounts,
+                    include_structure=include_structure,
+                    # force_update は全件の再保存が目的なので差分取得では足りない
+                    full_rescan=full_rescan or force_update,
+                    known_modified_times=known_modified_times,
+                ):
+                    collected += 1
+                    batch.append(meeting)
+                    if len(batch) >= batch_size:
+                        await _flush(batch)
+                        batch = []
+            if batch:
+                await _flush(batch)
+                batch = []
+
+            skipped = self._count_unchanged(collectors)
+            account_stats = {}
+            for collector in collectors:
+                account_stats.update(collector.stats)
+
+            # 保存に成功した subject のみ Changes API のトークンを進める
+            for collector in collectors:
+                commit = getattr(collector, "commit_sync_state", None)
+                if commit:
+                    await asyncio.to_thread(commit, failed_organizers)
+
             logger.info(
                 "CollectMeetingsUseCase finished. Stored/updated=%d, skipped=%d, failed=%d, total=%d",
                 stored,
                 skipped,
                 failed,
-                len(collected),
+                collected,
             )
             if job_id:
                 JobTracker.mark_success(
@@ -113,7 +112,8 @@ class CollectMeetingsUseCase:
                     stored=stored,
                     skipped=skipped,
                     failed=failed,
-                    collected=len(collected),
+                    collected=collected,
+                    accounts=account_stats,
                 )
         except Exception as e:
             logger.exception("CollectMeetingsUseCase error: %s", e)
@@ -121,3 +121,34 @@ class CollectMeetingsUseCase:
             if job_id:
                 JobTracker.mark_failed(job_id, error=str(e))
             return None
+
+    @staticmethod
+    def _store_batch(repo: MeetingRepositoryImpl, batch: List[MeetingDocument]) -> List[MeetingDocument]:
+        """Bulk-upsert a batch of meetings and return the ones that failed.
+
+        Rows of a failed chunk are retried one by one so that a single bad
+        document does not fail the whole chunk.
+        """
+        result = repo.upsert_meetings_bulk(batch)
+        failures: List[MeetingDocument] = []
+        for chunk in result["failed_chunks"]:
+            for meeting in chunk["meetings"]:
+                try:
+                    repo.upsert_meeting(meeting)
+                except Exception as e:
+                    failures.append(meeting)
+                    logger.error(
+                        "Failed to store meeting: doc_id=%s organizer=%s error=%s",
+                        meeting.doc_id,
+                        meeting.organizer_email or "unknown",
+                        str(e)
+                    )
+        return failures
+
+    @staticmethod
+    def _count_unchanged(collectors) -> int:
+        return sum(
+            counts.get("unchanged", 0)
+            for collector in collectors
+            for counts in collector.stats.values()
+        )
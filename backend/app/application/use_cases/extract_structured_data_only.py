@@ -109,26 +109,14 @@ class ExtractStructuredDataOnlyUseCase:
         candidate_name: Optional[str], 
         agent_name: Optional[str]
     ) -> dict:
-        """カスタムスキーマを使用した構造化データ抽出"""
-        combined_result = {}
-        
-        # カスタムスキーマのグループを取得
-        schema_groups = custom_schema.to_json_schema_groups()
-        
-        # 各グループを順次処理（並列処理は既存のextract_all_structured_dataに任せる）
-        for schema_dict, group_name in schema_groups:
-            try:
-                result = extractor.extract_structured_data_group(
-                    text_content,
-                    schema_dict,
-                    group_name,
-                    candidate_name,
-                    agent_name
-                )
-                combined_result.update(result)
-            except Exception as e:
-                # 個別グループの失敗は握りつぶし、全体の処理を継続
-                logger.warning(f"Group extraction failed for {group_name}: {e}")
-                continue
-        
-        return combined_result
\ No newline at end of file
+        """カスタムスキーマを使用した構造化データ抽出
+
+        デフォルトスキーマと同じ経路（並列実行・コンテキストキャッシュ共有）で抽出する。
+        """
+        return extractor.extract_all_structured_data(
+            text_content,
+            candidate_name=candidate_name,
+            agent_name=agent_name,
+            use_parallel=True,
+            schema_groups=custom_schema.to_json_schema_groups(),
+        )
@@ -75,6 +75,7 @@ class GetAiCostsUseCase:
                     "output_cost": total_stats["total_output_cost"],
                     "cache_cost": total_stats["total_cache_cost"]
                 },
+                "mode_breakdown": self._summarize_by_mode(usage_logs),
                 "recent_meetings": meeting_costs,
                 "last_updated": usage_logs[0].get("created_at") if usage_logs else None
             }
@@ -83,6 +84,25 @@ class GetAiCostsUseCase:
             logger.error(f"全体コスト概要取得エラー: {e}")
             raise
     
+    def _summarize_by_mode(self, usage_logs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """抽出モード（merged / per_group / per_group_cached）別のコスト・レイテンシ集計"""
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for log in usage_logs:
+            grouped.setdefault(log.get("extraction_mode") or "unknown", []).append(log)
+
+        breakdown: Dict[str, Any] = {}
+        for mode, logs in grouped.items():
+            stats = self.cost_calculator.calculate_total_costs(logs)
+            latencies = [log.get("latency_ms") or 0 for log in logs]
+            breakdown[mode] = {
+                "api_calls": len(logs),
+                "total_cost_usd": stats["total_cost"],
+                "total_prompt_tokens": stats["total_prompt_tokens"],
+                "total_cached_tokens": stats["total_cached_tokens"],
+                "average_latency_ms": round(sum(latencies) / len(latencies), 2) if latencies else 0,
+            }
+        return breakdown
+
     def get_meeting_detail(self, meeting_id: str) -> Dict[str, Any]:
         """特定会議の詳細コスト情報を取得
         
@@ -125,6 +145,7 @@ class GetAiCostsUseCase:
                 call_details.append({
                     "id": log.get("id"),
                     "group_name": log.get("group_name"),
+                    "extraction_mode": log.get("extraction_mode"),
                     "model": log.get("model"),
                     "prompt_tokens": cost.prompt_tokens,
                     "output_tokens": cost.output_tokens,
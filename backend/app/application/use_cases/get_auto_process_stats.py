@@ -6,6 +6,8 @@ from datetime import datetime, timedelta, timezone
 from app.infrastructure.supabase.repositories.meeting_repository_impl import MeetingRepositoryImpl
 from app.infrastructure.supabase.repositories.structured_repository_impl import StructuredRepositoryImpl
 from app.infrastructure.supabase.repositories.ai_usage_repository_impl import AiUsageRepositoryImpl
+from app.infrastructure.supabase.repositories.extraction_result_cache_repository_impl import ExtractionResultCacheRepositoryImpl
+from app.infrastructure.gemini.result_cache import ExtractionResultCache
 from app.infrastructure.config.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -18,6 +20,7 @@ class GetAutoProcessStatsUseCase:
         self._meeting_repo = None
         self._structured_repo = None
         self._ai_usage_repo = None
+        self._result_cache_repo = None
         self.settings = get_settings()
     
     @property
@@ -50,6 +53,16 @@ class GetAutoProcessStatsUseCase:
     def ai_usage_repo(self, value: AiUsageRepositoryImpl) -> None:
         self._ai_usage_repo = value
 
+    @property
+    def result_cache_repo(self) -> ExtractionResultCacheRepositoryImpl:
+        if self._result_cache_repo is None:
+            self._result_cache_repo = ExtractionResultCacheRepositoryImpl()
+        return self._result_cache_repo
+
+    @result_cache_repo.setter
+    def result_cache_repo(self, value: ExtractionResultCacheRepositoryImpl) -> None:
+        self._result_cache_repo = value
+
     def execute(
         self, 
         days_back: int = 7,
@@ -87,6 +100,9 @@ class GetAutoProcessStatsUseCase:
         # コスト統計を収集
         cost_metrics = self._collect_cost_metrics(start_date, end_date)
         
+        # 抽出結果キャッシュ統計
+        result_cache_stats = self._collect_result_cache_stats(start_date, end_date)
+        
         # エラー分析
         error_analysis = self._collect_error_analysis(start_date, end_date)
         
@@ -108,6 +124,7 @@ class GetAutoProcessStatsUseCase:
             "processing_stats": processing_stats,
             "performance_metrics": performance_metrics,
             "cost_metrics": cost_metrics,
+            "result_cache": result_cache_stats,
             "error_analysis": error_analysis,
             "alerts": alerts,
             "settings": {
@@ -116,7 +133,8 @@ class GetAutoProcessStatsUseCase:
                 "max_items": settings.autoproc_max_items,
                 "success_rate_threshold": settings.autoproc_success_rate_threshold,
                 "queue_alert_threshold": settings.autoproc_queue_alert_threshold,
-                "error_rate_threshold": settings.autoproc_error_rate_threshold
+                "error_rate_threshold": settings.autoproc_error_rate_threshold,
+                "extraction_result_cache_enabled": settings.extraction_result_cache_enabled
             },
             **detailed_metrics
         }
@@ -208,6 +226,19 @@ class GetAutoProcessStatsUseCase:
                 "daily_cost_trend": []
             }
     
+    def _collect_result_cache_stats(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+        """抽出結果キャッシュのヒット/ミス統計を収集
+
+        process: このインスタンス起動以降のグループ単位ヒット/ミス数
+        period: 期間内に保存された（ミス）エントリ数とヒットしたエントリ数（DB集計）
+        """
+        stats: Dict[str, Any] = {"process": ExtractionResultCache.stats(), "period": {}}
+        try:
+            stats["period"] = self.result_cache_repo.get_period_stats(start_date, end_date)
+        except Exception as e:
+            logger.error(f"[stats] error collecting result cache stats: {e}")
+        return stats
+    
     def _collect_error_analysis(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
         """エラー分析を収集"""
         try:
@@ -5,4 +5,4 @@ from app.infrastructure.supabase.repositories.meeting_repository_impl import Mee
 class GetMeetingDetailUseCase:
     async def execute(self, meeting_id: str) -> dict:
         repo = MeetingRepositoryImpl()
-        return repo.get_meeting(meeting_id)
+        return await repo.aget_meeting(meeting_id)
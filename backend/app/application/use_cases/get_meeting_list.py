@@ -6,7 +6,7 @@ from app.infrastructure.supabase.repositories.meeting_repository_impl import Mee
 class GetMeetingListUseCase:
     async def execute(self, accounts: Optional[List[str]] = None, structured: Optional[bool] = None) -> List[dict]:
         repo = MeetingRepositoryImpl()
-        meetings = repo.list_meetings(accounts)
+        meetings = await repo.alist_meetings(accounts)
         
         # 構造化フィルタが指定されている場合のみフィルタリング
         if structured is not None:
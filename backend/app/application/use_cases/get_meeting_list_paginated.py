@@ -36,7 +36,7 @@ class GetMeetingListPaginatedUseCase:
             page = 1
 
         repo = MeetingRepositoryImpl()
-        return repo.list_meetings_paginated(
+        return await repo.alist_meetings_paginated(
             page=page,
             page_size=page_size,
             accounts=accounts,
@@ -5,7 +5,7 @@ from app.infrastructure.supabase.repositories.structured_repository_impl import
 class GetStructuredDataUseCase:
     async def execute(self, meeting_id: str) -> dict:
         repo = StructuredRepositoryImpl()
-        structured_data = repo.get_structured_data(meeting_id)
+        structured_data = await repo.aget_structured_data(meeting_id)
         if not structured_data:
             return {"meeting_id": meeting_id, "data": {}, "zoho_candidate": None, "zoho_sync": None}
 
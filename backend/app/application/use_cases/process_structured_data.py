@@ -8,7 +8,8 @@ from app.infrastructure.supabase.repositories.meeting_repository_impl import Mee
 from app.infrastructure.supabase.repositories.structured_repository_impl import StructuredRepositoryImpl
 from app.infrastructure.supabase.repositories.custom_schema_repository_impl import CustomSchemaRepositoryImpl
 from app.infrastructure.supabase.repositories.ai_usage_repository_impl import AiUsageRepositoryImpl
-from app.infrastructure.gemini.structured_extractor import StructuredDataExtractor
+from app.infrastructure.gemini.structured_extractor import StructuredDataExtractor, PROMPT_TEMPLATE_VERSION
+from app.infrastructure.gemini.result_cache import ExtractionResultCache
 from app.domain.entities.structured_data import StructuredData, ZohoCandidateInfo
 from app.infrastructure.config.settings import get_settings
 from app.infrastructure.zoho.client import ZohoWriteClient, ZohoAuthError, ZohoFieldMappingError
@@ -62,7 +63,11 @@ class ProcessStructuredDataUseCase:
         extractor = StructuredDataExtractor(
             model=gemini_settings["model"],
             temperature=gemini_settings["temperature"],
-            max_tokens=settings.gemini_max_tokens
+            max_tokens=settings.gemini_max_tokens,
+            result_cache=(
+                ExtractionResultCache(PROMPT_TEMPLATE_VERSION)
+                if settings.extraction_result_cache_enabled else None
+            ),
         )
         # Extract candidate and agent names for better context
         candidate_name = zoho_candidate_name
@@ -72,14 +77,15 @@ class ProcessStructuredDataUseCase:
         if custom_schema:
             data = self._extract_with_custom_schema(
                 extractor, meeting["text_content"], custom_schema, 
-                candidate_name, agent_name
+                candidate_name, agent_name, schema_version
             )
         else:
             data = extractor.extract_all_structured_data(
                 meeting["text_content"], 
                 candidate_name=candidate_name, 
                 agent_name=agent_name,
-                use_parallel=True
+                use_parallel=True,
+                schema_version=schema_version,
             )
         
         # Create structured data with Zoho candidate info
@@ -131,6 +137,10 @@ class ProcessStructuredDataUseCase:
             "zoho_candidate": zoho_candidate,
             "custom_schema_id": custom_schema_id,
             "schema_version": schema_version,
+            "result_cache": {
+                "hits": extractor.result_cache_hits,
+                "misses": extractor.result_cache_misses,
+            },
             "zoho_write_result": zoho_result  # Zoho書き込み結果を含める
         }
     
@@ -140,31 +150,21 @@ class ProcessStructuredDataUseCase:
         text_content: str, 
         custom_schema, 
         candidate_name: Optional[str], 
-        agent_name: Optional[str]
+        agent_name: Optional[str],
+        schema_version: Optional[str] = None,
     ) -> dict:
-        """カスタムスキーマを使用した構造化データ抽出"""
-        combined_result = {}
-        
-        # カスタムスキーマのグループを取得
-        schema_groups = custom_schema.to_json_schema_groups()
-        
-        # 各グループを順次処理（並列処理は既存のextract_all_structured_dataに任せる）
-        for schema_dict, group_name in schema_groups:
-            try:
-                result = extractor.extract_structured_data_group(
-                    text_content,
-                    schema_dict,
-                    group_name,
-                    candidate_name,
-                    agent_name
-                )
-                combined_result.update(result)
-            except Exception as e:
-                # 個別グループの失敗は握りつぶし、全体の処理を継続
-                print(f"Group extraction failed for {group_name}: {e}")
-                continue
-        
-        return combined_result
+        """カスタムスキーマを使用した構造化データ抽出
+
+        デフォルトスキーマと同じ経路（並列実行・コンテキストキャッシュ共有）で抽出する。
+        """
+        return extractor.extract_all_structured_data(
+            text_content,
+            candidate_name=candidate_name,
+            agent_name=agent_name,
+            use_parallel=True,
+            schema_groups=custom_schema.to_json_schema_groups(),
+            schema_version=schema_version,
+        )
     
     def _write_to_zoho(
         self,
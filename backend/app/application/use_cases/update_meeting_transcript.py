@@ -12,7 +12,7 @@ logger = logging.getLogger(__name__)
 class UpdateMeetingTranscriptUseCase:
     """議事録本文を上書きし、必要なら既存の構造化データを削除する"""
 
-    def execute(
+    async def execute(
         self,
         meeting_id: str,
         text_content: str,
@@ -22,11 +22,11 @@ class UpdateMeetingTranscriptUseCase:
         meetings = MeetingRepositoryImpl()
         structured_repo = StructuredRepositoryImpl()
 
-        meeting = meetings.get_meeting(meeting_id)
+        meeting = await meetings.aget_meeting(meeting_id)
         if not meeting:
             raise ValueError("meeting not found")
 
-        updated = meetings.update_transcript(
+        updated = await meetings.aupdate_transcript(
             meeting_id=meeting_id,
             text_content=text_content,
             transcript_provider=transcript_provider,
@@ -34,7 +34,7 @@ class UpdateMeetingTranscriptUseCase:
 
         if delete_structured:
             try:
-                structured_repo.delete_by_meeting_id(meeting_id)
+                await structured_repo.adelete_by_meeting_id(meeting_id)
                 logger.info("構造化データを削除しました: meeting_id=%s", meeting_id)
             except Exception as e:  # pragma: no cover
                 logger.warning("構造化データ削除に失敗しました: meeting_id=%s error=%s", meeting_id, e)
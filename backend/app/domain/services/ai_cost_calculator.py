@@ -70,7 +70,7 @@ class GeminiCostCalculator:
         """単一のAPI呼び出しのコストを計算
         
         Args:
-            prompt_tokens: 入力トークン数
+            prompt_tokens: 入力トークン数（Geminiの仕様上、キャッシュ命中分を含む）
             candidates_tokens: 候補出力トークン数
             thoughts_tokens: 思考トークン数
             cached_tokens: キャッシュトークン数
@@ -95,8 +95,11 @@ class GeminiCostCalculator:
         output_rate = self.HIGH_VOLUME_OUTPUT_RATE if is_high_volume else self.STANDARD_OUTPUT_RATE
         cache_rate = self.HIGH_VOLUME_CACHE_RATE if is_high_volume else self.STANDARD_CACHE_RATE
         
+        # prompt_token_count はキャッシュ命中分を含むため、通常入力料金はその差分にのみ適用する
+        uncached_prompt_tokens = max(prompt_tokens - cached_tokens, 0)
+        
         # コスト計算（per 1M tokens）
-        input_cost = (Decimal(prompt_tokens) / Decimal("1000000")) * input_rate
+        input_cost = (Decimal(uncached_prompt_tokens) / Decimal("1000000")) * input_rate
         output_cost = (Decimal(total_output_tokens) / Decimal("1000000")) * output_rate
         cache_cost = (Decimal(cached_tokens) / Decimal("1000000")) * cache_rate
         
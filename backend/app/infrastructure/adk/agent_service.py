@@ -16,6 +16,7 @@ import asyncio
 import base64
 import json
 import logging
+import time
 import uuid
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Awaitable, Dict, List, Optional
@@ -25,6 +26,7 @@ from google.adk.agents.context_cache_config import ContextCacheConfig
 from google.adk.agents.run_config import StreamingMode
 from google.adk.apps.app import App
 from google.adk.events.event import Event
+from google.adk.events.event_actions import EventActions
 from google.adk.memory import InMemoryMemoryService
 from google.adk.runners import Runner, RunConfig
 from google.adk.sessions import InMemorySessionService
@@ -33,7 +35,12 @@ from opentelemetry import trace as otel_trace
 
 from .agents import OrchestratorAgentFactory
 from .mcp_manager import ADKMCPManager
-from .plugins import SubAgentStreamingPlugin, MCPResponseOptimizerPlugin
+from .plugins import (
+    MCPResponseOptimizerPlugin,
+    SubAgentStreamingPlugin,
+    ToolResultCachePlugin,
+    get_tool_result_cache,
+)
 from .utils import normalize_agent_name, sanitize_error
 
 if TYPE_CHECKING:
@@ -70,10 +77,24 @@ class ADKAgentService:
 
     def __init__(self, settings: "Settings"):
         self._settings = settings
-        self._session_service = InMemorySessionService()
+        self._session_service = self._create_session_service()
         self._memory_service = self._create_memory_service()
         self._mcp_manager = ADKMCPManager(settings)
         self._orchestrator_factory = OrchestratorAgentFactory(settings)
+        self._stats_logged_at = time.monotonic()
+
+    def _create_session_service(self):
+        """Create session service based on settings."""
+        if self._settings.adk_session_service_type == "supabase":
+            from .sessions import SupabaseSessionService
+            logger.info("[ADK] Using SupabaseSessionService (durable sessions)")
+            return SupabaseSessionService(self._settings)
+        logger.info("[ADK] Using InMemorySessionService (context_items replay)")
+        return InMemorySessionService()
+
+    @property
+    def _durable_sessions(self) -> bool:
+        return not isinstance(self._session_service, InMemorySessionService)
 
     def _create_memory_service(self):
         """Create memory service based on settings."""
@@ -95,12 +116,13 @@ class ADKAgentService:
         context_items: List[Dict[str, Any]],
     ) -> bool:
         """
-        Restore context_items into InMemorySessionService storage.
+        Restore context_items into a freshly created session.
 
         When a backend restarts (e.g., Cloud Run scale-to-zero), in-memory sessions
         are lost. This method re-injects the conversation history (text only) from
         the frontend-provided context_items into the freshly created session so that
-        the LLM retains awareness of prior turns.
+        the LLM retains awareness of prior turns. With durable sessions this only
+        happens once, for conversations that predate the session tables.
 
         Only text parts are replayed; function_call/function_response are skipped to
         prevent the Runner from attempting to re-execute tool calls.
@@ -114,12 +136,19 @@ class ADKAgentService:
             True if events were successfully injected.
         """
         try:
-            storage = self._session_service.sessions
-            storage_session = (
-                storage.get("marketing_ai", {})
-                .get(user_id, {})
-                .get(session_id)
-            )
+            if self._durable_sessions:
+                storage_session = await self._session_service.get_session(
+                    app_name="marketing_ai",
+                    user_id=user_id,
+                    session_id=session_id,
+                )
+            else:
+                storage = self._session_service.sessions
+                storage_session = (
+                    storage.get("marketing_ai", {})
+                    .get(user_id, {})
+                    .get(session_id)
+                )
             if not storage_session:
                 return False
 
@@ -147,7 +176,10 @@ class ADKAgentService:
                 events.append(event)
 
             if events:
-                storage_session.events = events
+                if self._durable_sessions:
+                    await self._session_service.import_events(storage_session, events)
+                else:
+                    storage_session.events = events
                 logger.info(
                     f"[ADK] Restored {len(events)} context events into session {session_id}"
                 )
@@ -221,8 +253,9 @@ class ADKAgentService:
         # Track sub-agent state
         sub_agent_states: Dict[str, dict] = {}
 
-        # Initialize MCP toolsets
-        mcp_toolsets = await self._mcp_manager.create_toolsets()
+        # Lease MCP toolsets (warm pooled servers when MCP_POOL_ENABLED=true)
+        mcp_lease = await self._mcp_manager.acquire_toolsets()
+        mcp_toolsets = mcp_lease.toolsets
 
         try:
             # Create or get session (with restored user:/app: state)
@@ -243,9 +276,24 @@ class ADKAgentService:
                     await self._restore_context_items(
                         session_id, user_id, context_items
                     )
+            elif initial_state:
+                # Resumed session: refresh per-request state (current date, user info)
+                state_delta = {
+                    k: v for k, v in initial_state.items()
+                    if session.state.get(k) != v
+                }
+                if state_delta:
+                    await self._session_service.append_event(
+                        session,
+                        Event(
+                            author="user",
+                            invocation_id=str(uuid.uuid4()),
+                            actions=EventActions(state_delta=state_delta),
+                        ),
+                    )
 
-            # Build orchestrator agent with domain-specific MCP toolsets
-            orchestrator = self._orchestrator_factory.build_agent(
+            # Orchestrator agent with domain-specific MCP toolsets (cached per asset/toolsets)
+            orchestrator = self._orchestrator_factory.get_or_build_agent(
                 asset=model_asset,
                 mcp_toolsets=mcp_toolsets,
             )
@@ -260,6 +308,12 @@ class ADKAgentService:
             # Context caching caches system_instruction + tools + conversation history
             # on Gemini's servers, so only new contents are sent on subsequent LLM calls
             app_plugins = [sub_agent_plugin, mcp_optimizer_plugin]
+            if self._settings.tool_result_cache_enabled:
+                # Must run before the optimizer: caches the compressed GA4/GSC/Meta results
+                app_plugins.insert(1, ToolResultCachePlugin(
+                    optimizer=mcp_optimizer_plugin,
+                    emit_callback=emit_event,
+                ))
             cache_config = None
             if self._settings.adk_context_cache_enabled:
                 cache_config = ContextCacheConfig(
@@ -406,8 +460,9 @@ class ADKAgentService:
                         pass
 
             # Build context items from session history for next turn
-            # ADK stores conversation history in the session
-            context_items = []
+            # ADK stores conversation history in the session.
+            # Durable sessions are resumed from the DB, so no history is sent back.
+            context_items = None if self._durable_sessions else []
             updated_session = None
             try:
                 updated_session = await self._session_service.get_session(
@@ -415,7 +470,7 @@ class ADKAgentService:
                     user_id=user_id,
                     session_id=session_id,
                 )
-                if updated_session and hasattr(updated_session, "events"):
+                if updated_session and hasattr(updated_session, "events") and context_items is not None:
                     # Convert ADK session events to serializable context items
                     for event in updated_session.events:
                         if hasattr(event, "content") and event.content:
@@ -443,7 +498,7 @@ class ADKAgentService:
                                         })
                             if parts_data:
                                 context_items.append({"role": role, "parts": parts_data})
-                logger.debug(f"[ADK] Built {len(context_items)} context items from session")
+                logger.debug(f"[ADK] Built {len(context_items or [])} context items from session")
             except Exception as ctx_err:
                 logger.warning(f"[ADK] Failed to build context items: {ctx_err}")
 
@@ -494,6 +549,84 @@ class ADKAgentService:
             logger.exception(f"[ADK] Error in stream_chat: {e}")
             yield {"type": "error", "message": sanitize_error(str(e))}
             yield {"type": "done", "conversation_id": session_id}
+        finally:
+            await self._mcp_manager.release_toolsets(mcp_lease)
+            self._maybe_log_runtime_stats()
+
+    async def warm_up_mcp_pool(self) -> None:
+        """Start pooled MCP servers ahead of the first chat request."""
+        await self._mcp_manager.warm_up()
+
+    async def close_mcp_pool(self) -> None:
+        await self._mcp_manager.close()
+
+    def invalidate_agent_cache(self, asset_id: Optional[str] = None) -> int:
+        """Drop cached orchestrator graphs after a model asset changed."""
+        removed = self._orchestrator_factory.invalidate_cache(asset_id)
+        if removed:
+            logger.info(f"[ADK] Invalidated {removed} cached agent graph(s) for asset={asset_id}")
+        return removed
+
+    def get_agent_cache_stats(self) -> Dict[str, Any]:
+        """Hit rate and build time of the orchestrator graph cache."""
+        return self._orchestrator_factory.get_cache_stats()
+
+    def get_tool_cache_stats(self) -> Dict[str, Any]:
+        """Hit rate and size of the cross-session tool result cache."""
+        return get_tool_result_cache().stats()
+
+    def get_embedding_stats(self) -> Dict[str, Any]:
+        """Hit rate, batching and API latency of the shared query-embedding cache."""
+        from app.infrastructure.gemini.embedding_service import get_embedding_service
+        return get_embedding_service().stats()
+
+    def get_zoho_store_stats(self) -> Dict[str, Any]:
+        """Freshness and row count of the APP-hc replica used by Tier 3 Zoho tools."""
+        from app.infrastructure.zoho.job_seeker_store import get_job_seeker_store
+        return get_job_seeker_store().metrics()
+
+    def get_zoho_transport_stats(self) -> Dict[str, Any]:
+        """Connection pool settings and per-endpoint latency histograms of Zoho calls."""
+        from app.infrastructure.zoho.transport import get_transport_stats
+        return get_transport_stats()
+
+    def get_mcp_pool_stats(self) -> Dict[str, Any]:
+        """Pool size, lease wait and cold-start counts of pooled MCP servers."""
+        return self._mcp_manager.get_pool_stats()
+
+    def get_runtime_stats(self) -> Dict[str, Any]:
+        """All of the above in one dict (served by GET /marketing-v2/stats and logged periodically)."""
+        sources: Dict[str, Callable[[], Dict[str, Any]]] = {
+            "mcp_pool": self.get_mcp_pool_stats,
+            "agent_cache": self.get_agent_cache_stats,
+            "tool_cache": self.get_tool_cache_stats,
+            "embedding": self.get_embedding_stats,
+            "zoho_store": self.get_zoho_store_stats,
+            "zoho_transport": self.get_zoho_transport_stats,
+        }
+        if hasattr(self._memory_service, "get_metrics"):
+            sources["memory"] = self._memory_service.get_metrics
+        stats: Dict[str, Any] = {}
+        for name, getter in sources.items():
+            # 1 つの集計元の失敗で他の統計まで見えなくならないようにする
+            try:
+                stats[name] = getter()
+            except Exception as e:
+                stats[name] = {"error": str(e)}
+        return stats
+
+    def _maybe_log_runtime_stats(self) -> None:
+        interval = self._settings.adk_stats_log_interval_seconds
+        now = time.monotonic()
+        if interval <= 0 or now - self._stats_logged_at < interval:
+            return
+        self._stats_logged_at = now
+        stats = self.get_runtime_stats()
+        # エンドポイント別ヒストグラムは大きいのでログでは省く（API では全量を返す）
+        transport = stats.get("zoho_transport")
+        if isinstance(transport, dict):
+            stats["zoho_transport"] = {k: v for k, v in transport.items() if k != "endpoints"}
+        logger.info(f"[ADK] Runtime stats: {json.dumps(stats, ensure_ascii=False, default=str)}")
 
     def _process_non_text_part(
         self,
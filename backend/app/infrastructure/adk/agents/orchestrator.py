@@ -7,8 +7,12 @@ Uses Gemini models natively without LiteLLM.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from google.adk.agents import Agent
 from google.adk.planners import BuiltInPlanner
@@ -31,6 +35,7 @@ from .slack_agent import SlackAgentFactory
 from app.infrastructure.adk.tools.chart_tools import ADK_CHART_TOOLS
 from app.infrastructure.adk.tools.ask_user_tools import ADK_ASK_USER_TOOLS
 from app.infrastructure.adk.mcp_manager import ADKMCPToolsets
+from app.infrastructure.adk.mcp_pool import PooledMcpToolset
 
 if TYPE_CHECKING:
     from app.infrastructure.config.settings import Settings
@@ -428,6 +433,16 @@ class OrchestratorAgentFactory:
             "google_workspace": GoogleWorkspaceAgentFactory(settings),
             "slack": SlackAgentFactory(settings),
         }
+        # (asset id, asset fingerprint, toolset identities) -> built orchestrator
+        self._agent_cache: "OrderedDict[Tuple[Any, ...], Agent]" = OrderedDict()
+        self._cache_stats: Dict[str, float] = {
+            "hits": 0,
+            "misses": 0,
+            "invalidations": 0,
+            "uncached": 0,
+            "build_ms_total": 0.0,
+            "build_ms_last": 0.0,
+        }
 
     @property
     def model(self) -> str:
@@ -532,6 +547,120 @@ class OrchestratorAgentFactory:
             ),
         )
 
+    # ── Built-graph cache ──
+
+    @staticmethod
+    def _cache_key(
+        asset: Dict[str, Any] | None,
+        disabled_mcp_servers: set[str] | None,
+        mcp_toolsets: ADKMCPToolsets | None,
+    ) -> Tuple[Any, ...]:
+        # 内容のハッシュも含めるので、他インスタンスでアセットが更新されても古いツリーは使われない
+        fingerprint = hashlib.sha256(
+            json.dumps(asset or {}, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+        # ツールセットはオブジェクト単位。プールの toolset だけがここに来る
+        # （プロセス内で使い回され、キャッシュされたエージェントも参照を保持するので id は再利用されない）
+        toolset_ids = tuple(
+            id(getattr(mcp_toolsets, slot, None)) if mcp_toolsets else 0
+            for slot in ("ga4", "gsc", "meta_ads", "ahrefs", "wordpress_hitocareer", "wordpress_achievehr")
+        )
+        return (
+            (asset or {}).get("id"),
+            fingerprint,
+            tuple(sorted(disabled_mcp_servers or ())),
+            toolset_ids,
+        )
+
+    def get_or_build_agent(
+        self,
+        asset: Dict[str, Any] | None = None,
+        disabled_mcp_servers: set[str] | None = None,
+        mcp_toolsets: ADKMCPToolsets | None = None,
+    ) -> Agent:
+        """
+        Return a cached orchestrator for this asset/toolset combination, building it on a miss.
+
+        ADK agents hold configuration only (per-run state lives in the session and
+        invocation context), so one built tree can serve concurrent requests.
+        Graphs built on per-request (unpooled) toolsets are never cached: they
+        could not be hit again and would pin the closed toolsets in memory.
+        """
+        max_entries = self._settings.adk_agent_cache_max_entries
+        if max_entries <= 0:
+            return self._timed_build(asset, disabled_mcp_servers, mcp_toolsets)
+        if not self._toolsets_cacheable(mcp_toolsets):
+            self._cache_stats["uncached"] += 1
+            return self._timed_build(asset, disabled_mcp_servers, mcp_toolsets)
+
+        key = self._cache_key(asset, disabled_mcp_servers, mcp_toolsets)
+        agent = self._agent_cache.get(key)
+        if agent is not None:
+            self._agent_cache.move_to_end(key)
+            self._cache_stats["hits"] += 1
+            return agent
+
+        self._cache_stats["misses"] += 1
+        agent = self._timed_build(asset, disabled_mcp_servers, mcp_toolsets)
+        self._agent_cache[key] = agent
+        while len(self._agent_cache) > max_entries:
+            self._agent_cache.popitem(last=False)
+        return agent
+
+    @staticmethod
+    def _toolsets_cacheable(mcp_toolsets: ADKMCPToolsets | None) -> bool:
+        """True when every toolset outlives the request (MCP_POOL_ENABLED=true and leased from the pool)."""
+        if mcp_toolsets is None:
+            return True
+        return all(isinstance(t, PooledMcpToolset) for t in mcp_toolsets.all())
+
+    def _timed_build(
+        self,
+        asset: Dict[str, Any] | None,
+        disabled_mcp_servers: set[str] | None,
+        mcp_toolsets: ADKMCPToolsets | None,
+    ) -> Agent:
+        started = time.perf_counter()
+        agent = self.build_agent(
+            asset=asset,
+            disabled_mcp_servers=disabled_mcp_servers,
+            mcp_toolsets=mcp_toolsets,
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._cache_stats["build_ms_total"] += elapsed_ms
+        self._cache_stats["build_ms_last"] = elapsed_ms
+        logger.info(
+            f"[ADK Orchestrator] Agent graph built in {elapsed_ms:.1f}ms "
+            f"(asset={(asset or {}).get('id')}, cached={len(self._agent_cache)})"
+        )
+        return agent
+
+    def invalidate_cache(self, asset_id: Optional[str] = None) -> int:
+        """Drop cached graphs for ``asset_id`` (all graphs when None). Returns the number removed."""
+        keys = [k for k in self._agent_cache if asset_id is None or k[0] == asset_id]
+        for key in keys:
+            del self._agent_cache[key]
+        if keys:
+            self._cache_stats["invalidations"] += 1
+        return len(keys)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit rate and build time of the orchestrator graph cache."""
+        stats = self._cache_stats
+        lookups = stats["hits"] + stats["misses"]
+        builds = stats["misses"] + stats["uncached"]
+        return {
+            "entries": len(self._agent_cache),
+            "max_entries": self._settings.adk_agent_cache_max_entries,
+            "hits": int(stats["hits"]),
+            "misses": int(stats["misses"]),
+            "invalidations": int(stats["invalidations"]),
+            "uncached": int(stats["uncached"]),
+            "hit_rate": round(stats["hits"] / lookups, 3) if lookups else 0.0,
+            "build_ms_last": round(stats["build_ms_last"], 1),
+            "build_ms_avg": round(stats["build_ms_total"] / builds, 1) if builds else 0.0,
+        }
+
     def _build_instructions(self, asset: Dict[str, Any] | None = None) -> str:
         """Build orchestrator instructions with optional additions."""
         base_instructions = ORCHESTRATOR_INSTRUCTIONS.strip()
@@ -7,18 +7,25 @@ Uses McpToolset with STDIO or SSE connections.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import os
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, List, Optional
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from google.adk.tools.mcp_tool.mcp_toolset import McpToolset, StdioConnectionParams, StdioServerParameters
 
+from .mcp_pool import MCPToolsetPool, PooledMcpToolset, _close_quietly
+
 if TYPE_CHECKING:
     from app.infrastructure.config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# inline JSON のサービスアカウントは内容ごとに1回だけ一時ファイルへ書き出す
+_sa_temp_paths: Dict[str, str] = {}
+
 # ── Tool filters to reduce input tokens ──
 # Only expose essential tools to the LLM (excludes rarely-used admin/utility tools)
 
@@ -89,6 +96,15 @@ class ADKMCPToolsets:
         ] if t is not None]
 
 
+@dataclass
+class MCPToolsetLease:
+    """Toolsets leased from the pool for one request (return with release_toolsets)."""
+    toolsets: ADKMCPToolsets
+    pooled: Dict[str, McpToolset] = field(default_factory=dict)
+    # プールが空かなかったときに、このリクエスト専用に作った toolset（返却時に閉じる）
+    unpooled: Dict[str, McpToolset] = field(default_factory=dict)
+
+
 class ADKMCPManager:
     """
     Manager for ADK MCP toolsets.
@@ -103,6 +119,7 @@ class ADKMCPManager:
 
     def __init__(self, settings: "Settings"):
         self._settings = settings
+        self._pools: Optional[Dict[str, MCPToolsetPool]] = None
 
     def _resolve_service_account_path(self) -> Optional[str]:
         """Resolve Google service account path or inline JSON."""
@@ -118,6 +135,10 @@ class ADKMCPManager:
         if sa_config.strip().startswith("{"):
             import tempfile
             import json
+            digest = hashlib.sha256(sa_config.encode("utf-8")).hexdigest()
+            cached = _sa_temp_paths.get(digest)
+            if cached and os.path.isfile(cached):
+                return cached
             try:
                 # Validate JSON
                 json.loads(sa_config)
@@ -125,6 +146,7 @@ class ADKMCPManager:
                 fd, path = tempfile.mkstemp(suffix=".json", prefix="sa_")
                 with os.fdopen(fd, "w") as f:
                     f.write(sa_config)
+                _sa_temp_paths[digest] = path
                 return path
             except json.JSONDecodeError:
                 logger.warning("[ADK MCP] Invalid inline JSON for service account")
@@ -132,7 +154,7 @@ class ADKMCPManager:
 
         return None
 
-    async def create_ga4_toolset(self) -> Optional[McpToolset]:
+    async def create_ga4_toolset(self, pooled: bool = False) -> Optional[McpToolset]:
         """Create GA4 MCP toolset using STDIO transport."""
         if not self._settings.use_local_mcp or not self._settings.local_mcp_ga4_enabled:
             logger.info("[ADK MCP] GA4: skipped (disabled)")
@@ -146,7 +168,8 @@ class ADKMCPManager:
         try:
             # Use configurable timeout (default 120s) instead of ADK's default 5s
             timeout = float(self._settings.mcp_client_timeout_seconds)
-            toolset = McpToolset(
+            toolset_cls = PooledMcpToolset if pooled else McpToolset
+            toolset = toolset_cls(
                 connection_params=StdioConnectionParams(
                     server_params=StdioServerParameters(
                         command="analytics-mcp",
@@ -166,7 +189,7 @@ class ADKMCPManager:
             logger.warning(f"[ADK MCP] GA4: failed to create toolset: {e}")
             return None
 
-    async def create_gsc_toolset(self) -> Optional[McpToolset]:
+    async def create_gsc_toolset(self, pooled: bool = False) -> Optional[McpToolset]:
         """Create GSC MCP toolset using STDIO transport."""
         if not self._settings.use_local_mcp or not self._settings.local_mcp_gsc_enabled:
             logger.info("[ADK MCP] GSC: skipped (disabled)")
@@ -192,7 +215,8 @@ class ADKMCPManager:
 
         try:
             timeout = float(self._settings.mcp_client_timeout_seconds)
-            toolset = McpToolset(
+            toolset_cls = PooledMcpToolset if pooled else McpToolset
+            toolset = toolset_cls(
                 connection_params=StdioConnectionParams(
                     server_params=StdioServerParameters(
                         command="python",
@@ -211,7 +235,7 @@ class ADKMCPManager:
             logger.warning(f"[ADK MCP] GSC: failed to create toolset: {e}")
             return None
 
-    async def create_meta_ads_toolset(self) -> Optional[McpToolset]:
+    async def create_meta_ads_toolset(self, pooled: bool = False) -> Optional[McpToolset]:
         """Create Meta Ads MCP toolset using STDIO transport."""
         if not self._settings.use_local_mcp or not self._settings.local_mcp_meta_ads_enabled:
             logger.info("[ADK MCP] Meta Ads: skipped (disabled)")
@@ -223,7 +247,8 @@ class ADKMCPManager:
 
         try:
             timeout = float(self._settings.mcp_client_timeout_seconds)
-            toolset = McpToolset(
+            toolset_cls = PooledMcpToolset if pooled else McpToolset
+            toolset = toolset_cls(
                 connection_params=StdioConnectionParams(
                     server_params=StdioServerParameters(
                         command="meta-ads-mcp",
@@ -255,3 +280,89 @@ class ADKMCPManager:
         logger.info(f"[ADK MCP] Total: {available}/3 toolsets ready")
 
         return toolsets
+
+    # ── Pooled toolsets (warm STDIO servers shared across requests) ──
+
+    def _get_pools(self) -> Dict[str, MCPToolsetPool]:
+        if self._pools is None:
+            settings = self._settings
+            factories = {
+                "ga4": settings.local_mcp_ga4_enabled and self.create_ga4_toolset,
+                "gsc": settings.local_mcp_gsc_enabled and self.create_gsc_toolset,
+                "meta_ads": settings.local_mcp_meta_ads_enabled and self.create_meta_ads_toolset,
+            }
+            self._pools = {
+                name: MCPToolsetPool(
+                    name=name,
+                    factory=lambda create=create: create(pooled=True),
+                    max_size=settings.mcp_pool_max_size,
+                    health_check_seconds=float(settings.mcp_pool_health_check_seconds),
+                    start_timeout=float(settings.mcp_client_timeout_seconds),
+                    lease_timeout=float(settings.mcp_client_timeout_seconds),
+                )
+                for name, create in factories.items()
+                if create
+            }
+        return self._pools
+
+    async def warm_up(self) -> None:
+        """Start one server per enabled toolset so the first request is warm."""
+        if not (self._settings.use_local_mcp and self._settings.mcp_pool_enabled):
+            return
+        await asyncio.gather(*(pool.warm(1) for pool in self._get_pools().values()))
+        logger.info(f"[ADK MCP Pool] Warmed up: {self.get_pool_stats()}")
+
+    async def acquire_toolsets(self) -> MCPToolsetLease:
+        """Lease toolsets for one request (pooled when MCP_POOL_ENABLED=true)."""
+        if not (self._settings.use_local_mcp and self._settings.mcp_pool_enabled):
+            return MCPToolsetLease(toolsets=await self.create_toolsets())
+
+        pools = self._get_pools()
+        names = list(pools)
+        leased = await asyncio.gather(*(pools[name].acquire() for name in names))
+        lease = MCPToolsetLease(toolsets=ADKMCPToolsets())
+        creators = {
+            "ga4": self.create_ga4_toolset,
+            "gsc": self.create_gsc_toolset,
+            "meta_ads": self.create_meta_ads_toolset,
+        }
+        for name, toolset in zip(names, leased):
+            if toolset is not None:
+                setattr(lease.toolsets, name, toolset)
+                lease.pooled[name] = toolset
+            elif not pools[name].disabled:
+                # 貸出待ちのタイムアウト等: プールを使わない toolset で続行する
+                fallback = await creators[name]()
+                if fallback is not None:
+                    setattr(lease.toolsets, name, fallback)
+                    lease.unpooled[name] = fallback
+        logger.info(
+            f"[ADK MCP Pool] Leased {len(lease.pooled)}/{len(names)} toolsets"
+            f" (unpooled fallback: {len(lease.unpooled)})"
+        )
+        return lease
+
+    async def release_toolsets(self, lease: Optional[MCPToolsetLease]) -> None:
+        """Return leased toolsets to the pool."""
+        if lease is None:
+            return
+        for toolset in lease.unpooled.values():
+            await _close_quietly(toolset)
+        lease.unpooled = {}
+        if not lease.pooled:
+            return
+        pools = self._get_pools()
+        for name, toolset in lease.pooled.items():
+            pools[name].release(toolset)
+        lease.pooled = {}
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Pool size, lease wait and cold-start/restart counts per toolset."""
+        if self._pools is None:
+            return {}
+        return {name: pool.stats() for name, pool in self._pools.items()}
+
+    async def close(self) -> None:
+        """Stop idle pooled servers."""
+        for pool in (self._pools or {}).values():
+            await pool.close()
@@ -0,0 +1,203 @@
+"""
+Process-level pool of warm MCP toolsets for ADK.
+
+STDIO MCP servers (analytics-mcp, gsc_server.py, meta-ads-mcp) pay interpreter
+startup, imports, Google auth and tool listing on their first call. The pool
+keeps those server processes alive between chat requests, leases one toolset
+per kind to each request, re-checks idle toolsets periodically and replaces
+toolsets whose server died.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from google.adk.tools.mcp_tool.mcp_toolset import McpToolset
+
+logger = logging.getLogger(__name__)
+
+
+class PooledMcpToolset(McpToolset):
+    """McpToolset that caches its tool listing between requests.
+
+    The MCPTool objects returned by ``get_tools`` reconnect through the
+    toolset's session manager on each call, so the cached list stays valid
+    after the server process is restarted.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._cached_tools: Optional[List[Any]] = None
+        self.last_checked = 0.0
+
+    async def get_tools(self, readonly_context: Any = None) -> List[Any]:
+        if self._cached_tools is None:
+            await self.refresh_tools()
+        return list(self._cached_tools or [])
+
+    async def refresh_tools(self) -> List[Any]:
+        """Round-trip list_tools to the server (health check + cache refresh)."""
+        tools = await super().get_tools()
+        self._cached_tools = tools
+        self.last_checked = time.monotonic()
+        return tools
+
+
+class MCPToolsetPool:
+    """Bounded pool of one kind of MCP toolset (e.g. GA4)."""
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[], Awaitable[Optional[PooledMcpToolset]]],
+        max_size: int,
+        health_check_seconds: float,
+        start_timeout: float,
+        lease_timeout: Optional[float] = None,
+    ):
+        self.name = name
+        self._factory = factory
+        self._max_size = max(1, max_size)
+        self._health_check_seconds = health_check_seconds
+        self._start_timeout = start_timeout
+        # 全 toolset が貸出中のときに空きを待つ上限（超えたら None を返し呼び出し側が非プールで作る）
+        self._lease_timeout = start_timeout if lease_timeout is None else lease_timeout
+        self._idle: asyncio.LifoQueue[PooledMcpToolset] = asyncio.LifoQueue()
+        self._size = 0
+        self._leased = 0
+        self._disabled = False
+        self._lock = asyncio.Lock()
+        self._stats: Dict[str, float] = {
+            "leases": 0,
+            "cold_starts": 0,
+            "restarts": 0,
+            "start_failures": 0,
+            "lease_timeouts": 0,
+            "lease_wait_ms_total": 0.0,
+            "lease_wait_ms_max": 0.0,
+        }
+
+    async def _start(self) -> Optional[PooledMcpToolset]:
+        """Create a toolset and spawn its server by listing tools once."""
+        toolset = await self._factory()
+        if toolset is None:
+            self._disabled = True
+            return None
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(toolset.refresh_tools(), timeout=self._start_timeout)
+        except Exception as e:
+            self._stats["start_failures"] += 1
+            logger.warning("[ADK MCP Pool] %s: failed to start server: %s", self.name, e)
+            await _close_quietly(toolset)
+            return None
+        self._stats["cold_starts"] += 1
+        logger.info(
+            "[ADK MCP Pool] %s: server started in %.0fms (tools=%d)",
+            self.name, (time.perf_counter() - started) * 1000, len(toolset._cached_tools or []),
+        )
+        return toolset
+
+    async def warm(self, count: int = 1) -> None:
+        """Pre-start up to ``count`` idle servers."""
+        async with self._lock:
+            while not self._disabled and self._size < min(count, self._max_size):
+                self._size += 1
+                toolset = await self._start()
+                if toolset is None:
+                    self._size -= 1
+                    return
+                self._idle.put_nowait(toolset)
+
+    @property
+    def disabled(self) -> bool:
+        return self._disabled
+
+    async def acquire(self) -> Optional[PooledMcpToolset]:
+        """Lease a healthy toolset, starting a new one while the pool has room.
+
+        Returns None when the toolset is unavailable or when every toolset stays
+        leased for longer than ``lease_timeout``.
+        """
+        if self._disabled:
+            return None
+        wait_started = time.perf_counter()
+        toolset: Optional[PooledMcpToolset] = None
+        try:
+            toolset = self._idle.get_nowait()
+        except asyncio.QueueEmpty:
+            if self._size < self._max_size:
+                self._size += 1
+                toolset = await self._start()
+                if toolset is None:
+                    self._size -= 1
+                    return None
+            else:
+                try:
+                    toolset = await asyncio.wait_for(self._idle.get(), timeout=self._lease_timeout)
+                except asyncio.TimeoutError:
+                    self._stats["lease_timeouts"] += 1
+                    logger.warning(
+                        "[ADK MCP Pool] %s: all %d toolsets leased for %.0fs, not waiting any longer",
+                        self.name, self._max_size, self._lease_timeout,
+                    )
+                    return None
+        waited_ms = (time.perf_counter() - wait_started) * 1000
+
+        if time.monotonic() - toolset.last_checked > self._health_check_seconds:
+            toolset = await self._ensure_healthy(toolset)
+            if toolset is None:
+                return None
+
+        self._leased += 1
+        self._stats["leases"] += 1
+        self._stats["lease_wait_ms_total"] += waited_ms
+        self._stats["lease_wait_ms_max"] = max(self._stats["lease_wait_ms_max"], waited_ms)
+        return toolset
+
+    async def _ensure_healthy(self, toolset: PooledMcpToolset) -> Optional[PooledMcpToolset]:
+        try:
+            await asyncio.wait_for(toolset.refresh_tools(), timeout=self._start_timeout)
+            return toolset
+        except Exception as e:
+            logger.warning("[ADK MCP Pool] %s: health check failed, restarting server: %s", self.name, e)
+        await _close_quietly(toolset)
+        self._stats["restarts"] += 1
+        replacement = await self._start()
+        if replacement is None:
+            self._size -= 1
+        return replacement
+
+    def release(self, toolset: Optional[PooledMcpToolset]) -> None:
+        if toolset is None:
+            return
+        self._leased -= 1
+        self._idle.put_nowait(toolset)
+
+    async def close(self) -> None:
+        while not self._idle.empty():
+            await _close_quietly(self._idle.get_nowait())
+            self._size -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        leases = self._stats["leases"]
+        return {
+            "size": self._size,
+            "idle": self._idle.qsize(),
+            "leased": self._leased,
+            "max_size": self._max_size,
+            "disabled": self._disabled,
+            **{k: (round(v, 1) if isinstance(v, float) else int(v)) for k, v in self._stats.items()},
+            "lease_wait_ms_avg": round(self._stats["lease_wait_ms_total"] / leases, 1) if leases else 0.0,
+        }
+
+
+async def _close_quietly(toolset: McpToolset) -> None:
+    try:
+        await toolset.close()
+    except Exception as e:
+        # 別タスクで作られたセッションの close は anyio のキャンセルスコープで失敗することがある
+        logger.debug("[ADK MCP Pool] close failed: %s", e)
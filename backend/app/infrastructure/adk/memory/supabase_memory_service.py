@@ -6,14 +6,20 @@ Provides semantic search using pgvector and Gemini embeddings.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
 from google.adk.memory import BaseMemoryService
 from google.adk.memory.base_memory_service import SearchMemoryResponse
 from google.adk.memory.memory_entry import MemoryEntry
-from google.genai import Client, types
+from google.genai import types
+
+from app.infrastructure.gemini.embedding_service import get_embedding_service
 
 if TYPE_CHECKING:
     from google.adk.sessions.session import Session
@@ -29,6 +35,10 @@ class SupabaseMemoryService(BaseMemoryService):
     Uses Gemini embeddings for vector similarity search.
     """
 
+    TABLE = "marketing_memories"
+    # high-water mark / ロックを保持するセッション数の上限（古いものから破棄）
+    _MAX_TRACKED_SESSIONS = 2048
+
     def __init__(self, settings: "Settings"):
         """
         Initialize the Supabase memory service.
@@ -42,11 +52,23 @@ class SupabaseMemoryService(BaseMemoryService):
         from app.infrastructure.supabase.client import get_supabase
         self._supabase = get_supabase()
 
-        # Create Gemini client for embeddings
-        self._genai_client = Client(api_key=settings.gemini_api_key)
+        # Shared pooled embedding client (query embeddings are cached there)
+        self._embedding_service = get_embedding_service()
         self._embedding_model = settings.memory_embedding_model
         self._embedding_dimensions = settings.memory_embedding_dimensions
         self._max_results = settings.memory_max_results
+        self._embedding_batch_size = settings.memory_embedding_batch_size
+
+        # session_id -> 処理済み最終イベントの timestamp
+        self._watermarks: "OrderedDict[str, float]" = OrderedDict()
+        self._session_locks: "OrderedDict[str, asyncio.Lock]" = OrderedDict()
+        self._metrics: dict[str, Any] = {
+            "embed_calls": 0,
+            "embedded_events": 0,
+            "last_batch_size": 0,
+            "last_embed_ms": 0.0,
+            "total_embed_ms": 0.0,
+        }
 
         logger.info(
             f"[Memory] SupabaseMemoryService initialized "
@@ -55,7 +77,9 @@ class SupabaseMemoryService(BaseMemoryService):
 
     async def _get_embedding(self, text: str) -> list[float]:
         """
-        Generate embedding vector using Gemini Embedding API.
+        Generate a query embedding using Gemini Embedding API.
+
+        Repeated queries are served from the shared EmbeddingService cache.
 
         Args:
             text: Text to embed.
@@ -63,25 +87,40 @@ class SupabaseMemoryService(BaseMemoryService):
         Returns:
             Embedding vector (list of floats).
         """
-        try:
-            # Use Gemini embedding model with Matryoshka truncation
-            result = self._genai_client.models.embed_content(
-                model=f"models/{self._embedding_model}",
-                contents=text,
-                config={"output_dimensionality": self._embedding_dimensions},
-            )
-            # Result has .embeddings list, first item has .values
-            return list(result.embeddings[0].values)
-        except Exception as e:
-            logger.error(f"[Memory] Embedding generation failed: {e}")
-            raise
+        return await self._embedding_service.aembed(
+            text,
+            model=self._embedding_model,
+            dimensions=self._embedding_dimensions,
+        )
+
+    async def _get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings for multiple texts in one API call.
+
+        Session events are one-off documents, so they bypass the embedding
+        cache but share its pooled client. The SDK call is blocking, so it
+        runs in a worker thread to keep the event loop responsive.
+
+        Args:
+            texts: Texts to embed (at most the API batch limit).
+
+        Returns:
+            Embedding vectors in the same order as ``texts``.
+        """
+        return await self._embedding_service.aembed_many(
+            texts,
+            model=self._embedding_model,
+            dimensions=self._embedding_dimensions,
+            cache=False,
+        )
 
     async def add_session_to_memory(self, session: "Session") -> None:
         """
-        Add session events to memory storage with embeddings.
+        Add new session events to memory storage with embeddings.
 
-        Filters out events without text content and generates embeddings
-        for semantic search.
+        Only events after the session's high-water mark are embedded, in
+        batched ``embed_content`` calls, and rows are upserted on
+        ``(session_id, event_id)`` so re-saving a session never duplicates turns.
 
         Args:
             session: The ADK Session object containing events.
@@ -90,67 +129,149 @@ class SupabaseMemoryService(BaseMemoryService):
             logger.debug(f"[Memory] No events in session {session.id}")
             return
 
-        entries_to_insert = []
-        event_count = 0
-
-        for event in session.events:
-            # Skip events without content
-            if not event.content or not event.content.parts:
-                continue
-
-            # Extract text from all parts
-            text_parts = []
-            for part in event.content.parts:
-                if hasattr(part, "text") and part.text:
-                    text_parts.append(part.text)
-
-            if not text_parts:
-                continue
-
-            # Combine all text parts
-            full_text = " ".join(text_parts)
-
-            # Skip very short content (likely not useful for memory)
-            if len(full_text.strip()) < 10:
-                continue
-
-            try:
-                # Generate embedding
-                embedding = await self._get_embedding(full_text)
-
-                # Prepare entry for insertion
-                entry = {
-                    "app_name": session.app_name,
-                    "user_id": session.user_id,
-                    "session_id": session.id,
-                    "event_id": getattr(event, "id", None),
-                    "author": getattr(event, "author", None),
-                    "event_timestamp": _format_timestamp(getattr(event, "timestamp", None)),
-                    "content_text": full_text,
-                    "embedding": embedding,
-                    "metadata": {
-                        "role": getattr(event.content, "role", None),
-                        "has_function_calls": _has_function_calls(event),
-                    },
-                }
-                entries_to_insert.append(entry)
-                event_count += 1
-
-            except Exception as e:
-                logger.warning(f"[Memory] Failed to process event: {e}")
-                continue
-
-        # Bulk insert to Supabase
-        if entries_to_insert:
-            try:
-                self._supabase.table("marketing_memories").insert(
-                    entries_to_insert
-                ).execute()
-                logger.info(
-                    f"[Memory] Saved {event_count} events from session {session.id}"
-                )
-            except Exception as e:
-                logger.error(f"[Memory] Failed to save session to memory: {e}")
+        async with self._session_lock(session.id):
+            watermark = await self._load_watermark(session)
+            new_events = [
+                event for event in session.events
+                if (getattr(event, "timestamp", None) or 0) > watermark
+            ]
+            if not new_events:
+                logger.debug(f"[Memory] No new events in session {session.id}")
+                return
+
+            pending = []
+            for event in new_events:
+                full_text = _event_text(event)
+                # Skip very short content (likely not useful for memory)
+                if full_text is None or len(full_text.strip()) < 10:
+                    continue
+                pending.append((event, full_text))
+
+            entries_to_upsert = []
+            batch_size = max(1, min(self._embedding_batch_size, 100))
+            for start in range(0, len(pending), batch_size):
+                batch = pending[start:start + batch_size]
+                started = time.perf_counter()
+                try:
+                    embeddings = await self._get_embeddings([text for _, text in batch])
+                except Exception as e:
+                    logger.warning(f"[Memory] Failed to embed batch of {len(batch)} events: {e}")
+                    # 失敗したバッチ以降は次回に持ち越す（high-water mark を進めない）
+                    new_events = new_events[:new_events.index(batch[0][0])]
+                    break
+                self._record_embed_metrics(len(batch), time.perf_counter() - started)
+
+                for (event, full_text), embedding in zip(batch, embeddings):
+                    entries_to_upsert.append({
+                        "app_name": session.app_name,
+                        "user_id": session.user_id,
+                        "session_id": session.id,
+                        "event_id": _event_id(event, full_text),
+                        "author": getattr(event, "author", None),
+                        "event_timestamp": _format_timestamp(getattr(event, "timestamp", None)),
+                        "content_text": full_text,
+                        "embedding": embedding,
+                        "metadata": {
+                            "role": getattr(event.content, "role", None),
+                            "has_function_calls": _has_function_calls(event),
+                        },
+                    })
+
+            if entries_to_upsert:
+                try:
+                    await asyncio.to_thread(
+                        lambda: self._supabase.table(self.TABLE).upsert(
+                            entries_to_upsert,
+                            on_conflict="session_id,event_id",
+                            returning="minimal",
+                        ).execute()
+                    )
+                except Exception as e:
+                    logger.error(f"[Memory] Failed to save session to memory: {e}")
+                    return
+
+            if new_events:
+                self._set_watermark(session.id, max(getattr(e, "timestamp", None) or 0 for e in new_events))
+            logger.info(
+                f"[Memory] Saved {len(entries_to_upsert)} new events from session {session.id} "
+                f"(examined={len(new_events)}, embed_batches={self._metrics['embed_calls']}, "
+                f"avg_embed_ms={self._avg_embed_ms():.0f})"
+            )
+
+    def _session_lock(self, session_id: str) -> asyncio.Lock:
+        lock = self._session_locks.get(session_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._session_locks[session_id] = lock
+        self._session_locks.move_to_end(session_id)
+        while len(self._session_locks) > self._MAX_TRACKED_SESSIONS:
+            self._session_locks.popitem(last=False)
+        return lock
+
+    def _set_watermark(self, session_id: str, timestamp: float) -> None:
+        self._watermarks[session_id] = timestamp
+        self._watermarks.move_to_end(session_id)
+        while len(self._watermarks) > self._MAX_TRACKED_SESSIONS:
+            self._watermarks.popitem(last=False)
+
+    async def _load_watermark(self, session: "Session") -> float:
+        """
+        Return the timestamp of the last event already handled for this session.
+
+        After a restart the mark is rebuilt from the newest row stored in
+        Supabase (one row, so long sessions are not cut off by the PostgREST
+        row limit); the upsert keeps any overlap idempotent.
+        """
+        if session.id in self._watermarks:
+            return self._watermarks[session.id]
+        try:
+            res = await asyncio.to_thread(
+                lambda: self._supabase.table(self.TABLE)
+                .select("event_id, event_timestamp")
+                .eq("session_id", session.id)
+                .not_.is_("event_timestamp", "null")
+                .order("event_timestamp", desc=True)
+                .limit(1)
+                .execute()
+            )
+            latest = (res.data or [None])[0]
+        except Exception as e:
+            logger.warning(f"[Memory] Failed to load stored events for session {session.id}: {e}")
+            latest = None
+        watermark = 0.0
+        if latest:
+            # 保存時の文字列を経由すると丸め誤差が出るので、手元のイベントが分かればその timestamp を使う
+            by_id = {_event_id(e, _event_text(e) or ""): e for e in session.events}
+            event = by_id.get(latest.get("event_id"))
+            if event is not None:
+                watermark = getattr(event, "timestamp", None) or 0.0
+            else:
+                watermark = _parse_timestamp(latest.get("event_timestamp"))
+        self._set_watermark(session.id, watermark)
+        return watermark
+
+    def _record_embed_metrics(self, batch_size: int, elapsed: float) -> None:
+        m = self._metrics
+        m["embed_calls"] += 1
+        m["embedded_events"] += batch_size
+        m["last_batch_size"] = batch_size
+        m["last_embed_ms"] = round(elapsed * 1000, 1)
+        m["total_embed_ms"] += elapsed * 1000
+
+    def _avg_embed_ms(self) -> float:
+        calls = self._metrics["embed_calls"]
+        return self._metrics["total_embed_ms"] / calls if calls else 0.0
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Embedding metrics since startup (calls, events, batch size, latency)."""
+        return {
+            **self._metrics,
+            "total_embed_ms": round(self._metrics["total_embed_ms"], 1),
+            "avg_embed_ms": round(self._avg_embed_ms(), 1),
+            "avg_batch_size": round(
+                self._metrics["embedded_events"] / self._metrics["embed_calls"], 2
+            ) if self._metrics["embed_calls"] else 0.0,
+        }
 
     async def search_memory(
         self,
@@ -177,16 +298,18 @@ class SupabaseMemoryService(BaseMemoryService):
             query_embedding = await self._get_embedding(query)
 
             # Search using Supabase RPC function
-            result = self._supabase.rpc(
-                "search_memories_by_embedding",
-                {
-                    "query_embedding": query_embedding,
-                    "match_app_name": app_name,
-                    "match_user_id": user_id,
-                    "match_count": self._max_results,
-                    "similarity_threshold": 0.55,  # Increased from 0.3 to reduce cross-conversation bleed
-                },
-            ).execute()
+            result = await asyncio.to_thread(
+                lambda: self._supabase.rpc(
+                    "search_memories_by_embedding",
+                    {
+                        "query_embedding": query_embedding,
+                        "match_app_name": app_name,
+                        "match_user_id": user_id,
+                        "match_count": self._max_results,
+                        "similarity_threshold": 0.55,  # Increased from 0.3 to reduce cross-conversation bleed
+                    },
+                ).execute()
+            )
 
             # Convert to MemoryEntry objects
             memories = []
@@ -221,6 +344,44 @@ class SupabaseMemoryService(BaseMemoryService):
             return SearchMemoryResponse(memories=[])
 
 
+def _event_text(event: Any) -> Optional[str]:
+    """Join the text parts of an event, or None when it has no text."""
+    if not event.content or not event.content.parts:
+        return None
+    text_parts = [
+        part.text for part in event.content.parts
+        if hasattr(part, "text") and part.text
+    ]
+    if not text_parts:
+        return None
+    return " ".join(text_parts)
+
+
+def _event_id(event: Any, text: str) -> str:
+    """Event id for the (session_id, event_id) upsert key.
+
+    Events without an id get a deterministic one derived from their
+    timestamp, author and text, so re-saving the session still dedupes.
+    """
+    event_id = getattr(event, "id", None)
+    if event_id:
+        return event_id
+    digest = hashlib.sha256(
+        f"{getattr(event, 'timestamp', None)}|{getattr(event, 'author', None)}|{text}".encode("utf-8")
+    ).hexdigest()[:16]
+    return f"derived-{digest}"
+
+
+def _parse_timestamp(timestamp_str: Optional[str]) -> float:
+    """Inverse of _format_timestamp (0.0 when missing or unparsable)."""
+    if not timestamp_str:
+        return 0.0
+    try:
+        return datetime.fromisoformat(str(timestamp_str).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return 0.0
+
+
 def _format_timestamp(timestamp: Optional[float]) -> Optional[str]:
     """Convert Unix timestamp to ISO 8601 string."""
     if timestamp is None:
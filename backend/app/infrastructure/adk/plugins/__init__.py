@@ -2,5 +2,11 @@
 
 from .sub_agent_streaming_plugin import SubAgentStreamingPlugin
 from .mcp_response_optimizer import MCPResponseOptimizerPlugin
+from .tool_result_cache import ToolResultCachePlugin, get_tool_result_cache
 
-__all__ = ["SubAgentStreamingPlugin", "MCPResponseOptimizerPlugin"]
+__all__ = [
+    "SubAgentStreamingPlugin",
+    "MCPResponseOptimizerPlugin",
+    "ToolResultCachePlugin",
+    "get_tool_result_cache",
+]
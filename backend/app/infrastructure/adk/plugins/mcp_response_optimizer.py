@@ -2,7 +2,8 @@
 Plugin to optimize tool interactions for LLM token savings.
 
 Four optimizations:
-1. before_model_callback: Compress verbose tool descriptions (MCP + Zoho + Meta, ~60% input token reduction)
+1. before_model_callback: Compress verbose tool descriptions (MCP + Zoho + Meta, ~60% input token reduction;
+   rewrites are memoised per tool schema and applied as a swap)
 2. before_model_callback: Inject pending ad image Parts into LLM context (multimodal)
 3. after_tool_callback: Compress GA4/Meta Ads report responses (~70% output token reduction)
 4. after_tool_callback: Intercept get_ad_image, resize to ~Full HD, convert to types.Part
@@ -14,6 +15,8 @@ import io
 import json
 import logging
 import re
+import threading
+import time
 from collections import defaultdict
 from typing import Any, Optional, TYPE_CHECKING
 
@@ -138,6 +141,21 @@ _COMPRESSED_DESCRIPTIONS: dict[str, str] = {
 }
 
 
+# ── Description rewrite memo ──
+# (tool name, original description) -> (rewritten description or None, compile cost in ms)
+# Shared by all plugin instances (one per request) so each schema version is rewritten once.
+_REWRITE_MEMO: dict[tuple[str, str], tuple[Optional[str], float]] = {}
+_REWRITE_MEMO_MAX = 4096
+_REWRITE_LOCK = threading.Lock()
+_REWRITE_STATS: dict[str, float] = {"memo_hits": 0, "memo_misses": 0, "compile_ms": 0.0, "saved_ms": 0.0}
+
+_HINTS_RE = re.compile(r'\n\s*Hints?:.*', re.DOTALL)
+_NOTES_RE = re.compile(r'\n\s*Notes?:.*', re.DOTALL)
+_EXAMPLES_RE = re.compile(r'\n\s*Examples?:.*', re.DOTALL)
+_JSON_BLOCK_RE = re.compile(r'```json.*?```', re.DOTALL)
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+
 class MCPResponseOptimizerPlugin(BasePlugin):
     """Optimizes MCP tool definitions and responses to save LLM tokens."""
 
@@ -246,7 +264,13 @@ class MCPResponseOptimizerPlugin(BasePlugin):
             llm_request.contents = [types.Content(role="user", parts=parts)]
 
     def _compress_tool_descriptions(self, llm_request: LlmRequest) -> int:
-        """Modify function declarations in the LLM request to use shorter descriptions."""
+        """Modify function declarations in the LLM request to use shorter descriptions.
+
+        Rewrites are computed once per (tool name, original description) and
+        memoised, so each call is a dict lookup + attribute swap and the
+        resulting declarations are byte-identical across calls (keeps Gemini
+        context-cache prefixes valid).
+        """
         compressed = 0
 
         config = getattr(llm_request, "config", None)
@@ -263,44 +287,74 @@ class MCPResponseOptimizerPlugin(BasePlugin):
                 continue
             for fd in fds:
                 name = getattr(fd, "name", "")
-                if not name:
+                if not name or name not in self.COMPRESSIBLE_TOOL_NAMES:
                     continue
 
-                # Strategy 1: Use pre-written compressed description
-                if name in _COMPRESSED_DESCRIPTIONS:
-                    original_len = len(getattr(fd, "description", "") or "")
-                    fd.description = _COMPRESSED_DESCRIPTIONS[name]
-                    new_len = len(fd.description)
-                    if original_len > new_len:
-                        logger.debug(
-                            f"[MCPOptimizer] {name}: {original_len} → {new_len} chars"
-                        )
-                        compressed += 1
-
-                # Strategy 2: Strip verbose sections from other tools
-                elif name in self.COMPRESSIBLE_TOOL_NAMES:
-                    original = getattr(fd, "description", "") or ""
-                    if len(original) > 200:
-                        shortened = self._strip_verbose_sections(original)
-                        if len(shortened) < len(original):
-                            fd.description = shortened
-                            compressed += 1
+                original = getattr(fd, "description", "") or ""
+                rewritten = self._rewrite_description(name, original)
+                if rewritten is not None:
+                    fd.description = rewritten
+                    compressed += 1
 
         return compressed
 
+    @classmethod
+    def _rewrite_description(cls, name: str, original: str) -> Optional[str]:
+        """Return the memoised compressed description, or None to keep the original."""
+        key = (name, original)
+        entry = _REWRITE_MEMO.get(key)
+        if entry is not None:
+            _REWRITE_STATS["memo_hits"] += 1
+            _REWRITE_STATS["saved_ms"] += entry[1]
+            return entry[0]
+
+        started = time.perf_counter()
+        # Strategy 1: Use pre-written compressed description
+        if name in _COMPRESSED_DESCRIPTIONS:
+            rewritten: Optional[str] = _COMPRESSED_DESCRIPTIONS[name]
+        # Strategy 2: Strip verbose sections from other tools
+        elif len(original) > 200:
+            rewritten = cls._strip_verbose_sections(original)
+            if len(rewritten) >= len(original):
+                rewritten = None
+        else:
+            rewritten = None
+        cost_ms = (time.perf_counter() - started) * 1000
+
+        with _REWRITE_LOCK:
+            if len(_REWRITE_MEMO) >= _REWRITE_MEMO_MAX:
+                _REWRITE_MEMO.clear()
+            _REWRITE_MEMO[key] = (rewritten, cost_ms)
+        # 書き換え後の文字列自体が渡された場合もそのまま通す（再圧縮しない）
+        if rewritten is not None:
+            _REWRITE_MEMO.setdefault((name, rewritten), (None, 0.0))
+            logger.debug(f"[MCPOptimizer] {name}: {len(original)} → {len(rewritten)} chars")
+        _REWRITE_STATS["memo_misses"] += 1
+        _REWRITE_STATS["compile_ms"] += cost_ms
+        return rewritten
+
+    @staticmethod
+    def get_rewrite_stats() -> dict[str, Any]:
+        """Memo hits/misses and estimated time saved by the description memo."""
+        return {
+            "entries": len(_REWRITE_MEMO),
+            "memo_hits": int(_REWRITE_STATS["memo_hits"]),
+            "memo_misses": int(_REWRITE_STATS["memo_misses"]),
+            "compile_ms": round(_REWRITE_STATS["compile_ms"], 3),
+            "saved_ms": round(_REWRITE_STATS["saved_ms"], 3),
+        }
+
     @staticmethod
     def _strip_verbose_sections(description: str) -> str:
         """Strip Hints, Notes, and example JSON from verbose descriptions."""
-        # Remove "Hints:" sections and everything after
-        desc = re.sub(r'\n\s*Hints?:.*', '', description, flags=re.DOTALL)
-        # Remove "Notes:" sections
-        desc = re.sub(r'\n\s*Notes?:.*', '', desc, flags=re.DOTALL)
-        # Remove "Example:" sections
-        desc = re.sub(r'\n\s*Examples?:.*', '', desc, flags=re.DOTALL)
+        # Remove "Hints:" / "Notes:" / "Example:" sections and everything after
+        desc = _HINTS_RE.sub('', description)
+        desc = _NOTES_RE.sub('', desc)
+        desc = _EXAMPLES_RE.sub('', desc)
         # Remove JSON code blocks
-        desc = re.sub(r'```json.*?```', '', desc, flags=re.DOTALL)
+        desc = _JSON_BLOCK_RE.sub('', desc)
         # Remove excessive whitespace
-        desc = re.sub(r'\n{3,}', '\n\n', desc).strip()
+        desc = _BLANK_LINES_RE.sub('\n\n', desc).strip()
         return desc
 
     # ── Output optimization: compress GA4 report responses ──
@@ -0,0 +1,400 @@
+"""
+Cross-session cache for idempotent analytics tool results.
+
+GA4 ``run_report``, the GSC search-analytics tools and Meta ``get_insights``
+return the same data for the same arguments once the queried period has
+settled. Results are keyed by tool name + normalised arguments (relative
+dates resolved to calendar dates) and stored in their *compressed* form:
+
+- closed periods (ended before the provider's settling lag) -> long TTL
+- periods that include today / recent days -> short TTL
+
+The in-process tier is a size-bounded LRU shared by all chat sessions; an
+optional Supabase tier (``tool_result_cache`` table) shares closed-period
+results across instances.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from google.adk.plugins.base_plugin import BasePlugin
+
+from ..utils import normalize_agent_name
+
+if TYPE_CHECKING:
+    from google.adk.tools.base_tool import BaseTool
+    from google.adk.tools.tool_context import ToolContext
+    from app.infrastructure.config.settings import Settings
+    from .mcp_response_optimizer import MCPResponseOptimizerPlugin
+
+logger = logging.getLogger(__name__)
+
+_JST = ZoneInfo("Asia/Tokyo")
+_DAYS_AGO_RE = re.compile(r"^(\d+)daysAgo$")
+
+# データが確定するまでの日数（終了日がこれより新しい期間は短い TTL）
+_SETTLE_DAYS = {"ga4": 2, "gsc": 2, "meta": 2}
+
+_GSC_RELATIVE_TOOLS = frozenset({"get_search_analytics", "get_performance_overview", "get_search_by_page_query"})
+
+
+@dataclass(frozen=True)
+class CacheSpec:
+    """Cache key and TTL class for one tool call."""
+    key: str
+    tool_name: str
+    closed: bool
+
+
+def _today() -> date:
+    return datetime.now(_JST).date()
+
+
+def _resolve_ga4_date(value: Any, today: date) -> Optional[date]:
+    text = str(value or "").strip()
+    if text == "today":
+        return today
+    if text == "yesterday":
+        return today - timedelta(days=1)
+    m = _DAYS_AGO_RE.match(text)
+    if m:
+        return today - timedelta(days=int(m.group(1)))
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def _resolve_meta_preset(preset: str, today: date) -> Optional[Tuple[date, date]]:
+    yesterday = today - timedelta(days=1)
+    if preset == "today":
+        return today, today
+    if preset == "yesterday":
+        return yesterday, yesterday
+    m = re.match(r"^last_(\d+)d$", preset)
+    if m:
+        return yesterday - timedelta(days=int(m.group(1)) - 1), yesterday
+    if preset == "this_month":
+        return today.replace(day=1), today
+    if preset == "last_month":
+        end = today.replace(day=1) - timedelta(days=1)
+        return end.replace(day=1), end
+    if preset == "this_week":
+        return today - timedelta(days=today.weekday()), today
+    if preset == "last_week":
+        start = today - timedelta(days=today.weekday() + 7)
+        return start, start + timedelta(days=6)
+    return None
+
+
+def _date_ranges(tool_name: str, args: Dict[str, Any], today: date) -> Optional[Tuple[str, List[Tuple[date, date]]]]:
+    """Return (provider, resolved ranges) for cacheable calls, None otherwise."""
+    if tool_name == "run_report":
+        ranges = []
+        for r in args.get("date_ranges") or []:
+            if not isinstance(r, dict):
+                return None
+            start = _resolve_ga4_date(r.get("start_date"), today)
+            end = _resolve_ga4_date(r.get("end_date"), today)
+            if start is None or end is None:
+                return None
+            ranges.append((start, end))
+        return ("ga4", ranges) if ranges else None
+
+    if tool_name in _GSC_RELATIVE_TOOLS:
+        # gsc_server.py は「今日-3日」を終了日として days 日分を遡る
+        days = args.get("days", 28)
+        try:
+            days = int(days)
+        except (TypeError, ValueError):
+            return None
+        end = today - timedelta(days=3)
+        return "gsc", [(end - timedelta(days=days), end)]
+
+    if tool_name == "get_advanced_search_analytics":
+        keys = [("start_date", "end_date")]
+    elif tool_name == "compare_search_periods":
+        keys = [("period1_start", "period1_end"), ("period2_start", "period2_end")]
+    else:
+        keys = []
+    if keys:
+        try:
+            return "gsc", [(date.fromisoformat(str(args[s])), date.fromisoformat(str(args[e]))) for s, e in keys]
+        except (KeyError, ValueError):
+            return None
+
+    if tool_name == "get_insights":
+        time_range = args.get("time_range")
+        if isinstance(time_range, str):
+            try:
+                time_range = json.loads(time_range)
+            except ValueError:
+                return None
+        if isinstance(time_range, dict) and time_range.get("since") and time_range.get("until"):
+            try:
+                return "meta", [(date.fromisoformat(time_range["since"]), date.fromisoformat(time_range["until"]))]
+            except ValueError:
+                return None
+        resolved = _resolve_meta_preset(str(args.get("date_preset") or "last_30d"), today)
+        return ("meta", [resolved]) if resolved else None
+
+    return None
+
+
+def build_cache_spec(tool_name: str, args: Dict[str, Any], today: Optional[date] = None) -> Optional[CacheSpec]:
+    """Classify a tool call; None means the call must not be cached."""
+    today = today or _today()
+    resolved = _date_ranges(tool_name, args or {}, today)
+    if resolved is None:
+        return None
+    provider, ranges = resolved
+    latest_end = max(end for _, end in ranges)
+    closed = latest_end < today - timedelta(days=_SETTLE_DAYS[provider])
+    payload = {
+        "tool": tool_name,
+        "args": args,
+        # 相対指定（7daysAgo, days=28, last_7d 等）を実日付に解決した期間をキーに含める
+        "ranges": [[s.isoformat(), e.isoformat()] for s, e in ranges],
+    }
+    digest = hashlib.sha256(
+        json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    ).hexdigest()
+    return CacheSpec(key=digest, tool_name=tool_name, closed=closed)
+
+
+def _is_error_result(result: Any) -> bool:
+    if not isinstance(result, dict):
+        return True
+    if result.get("isError") or result.get("is_error") or "error" in result:
+        return True
+    return False
+
+
+class ToolResultCache:
+    """Process-wide LRU (bounded by entries and bytes) with an optional Supabase tier."""
+
+    TABLE = "tool_result_cache"
+
+    def __init__(self, settings: "Settings"):
+        self._closed_ttl = settings.tool_result_cache_closed_ttl_seconds
+        self._open_ttl = settings.tool_result_cache_open_ttl_seconds
+        self._max_entries = max(1, settings.tool_result_cache_max_entries)
+        self._max_bytes = max(1, settings.tool_result_cache_max_bytes)
+        self._supabase_enabled = settings.tool_result_cache_supabase_enabled
+        self._lock = threading.Lock()
+        # key -> (expires_at, size, result)
+        self._entries: "OrderedDict[str, Tuple[float, int, dict]]" = OrderedDict()
+        self._bytes = 0
+        self._stats: Dict[str, int] = {"hits": 0, "remote_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def _get_local(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, size, result = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self._bytes -= size
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def _put_local(self, key: str, result: dict, ttl: float) -> None:
+        size = len(json.dumps(result, ensure_ascii=False, default=str))
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old:
+                self._bytes -= old[1]
+            self._entries[key] = (time.time() + ttl, size, result)
+            self._bytes += size
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._stats["evictions"] += 1
+
+    async def get(self, spec: CacheSpec) -> Optional[dict]:
+        result = self._get_local(spec.key)
+        if result is not None:
+            self._stats["hits"] += 1
+            return result
+        if self._supabase_enabled and spec.closed:
+            result = await self._get_remote(spec.key)
+            if result is not None:
+                self._stats["remote_hits"] += 1
+                self._put_local(spec.key, result, self._closed_ttl)
+                return result
+        self._stats["misses"] += 1
+        return None
+
+    async def put(self, spec: CacheSpec, result: dict) -> float:
+        """Store ``result`` and return the TTL used."""
+        ttl = self._closed_ttl if spec.closed else self._open_ttl
+        if ttl <= 0:
+            return 0
+        self._put_local(spec.key, result, ttl)
+        self._stats["stores"] += 1
+        if self._supabase_enabled and spec.closed:
+            await self._put_remote(spec, result, ttl)
+        return ttl
+
+    async def _get_remote(self, key: str) -> Optional[dict]:
+        try:
+            from app.infrastructure.supabase.client import get_supabase
+            now_iso = datetime.now(timezone.utc).isoformat()
+            res = await asyncio.to_thread(
+                lambda: get_supabase().table(self.TABLE)
+                .select("result")
+                .eq("cache_key", key)
+                .gt("expires_at", now_iso)
+                .limit(1)
+                .execute()
+            )
+            rows = res.data or []
+            return rows[0]["result"] if rows else None
+        except Exception as e:
+            logger.warning(f"[ToolCache] Supabase lookup failed: {e}")
+            return None
+
+    async def _put_remote(self, spec: CacheSpec, result: dict, ttl: float) -> None:
+        try:
+            from app.infrastructure.supabase.client import get_supabase
+            row = {
+                "cache_key": spec.key,
+                "tool_name": spec.tool_name,
+                "result": result,
+                "expires_at": (datetime.now(timezone.utc) + timedelta(seconds=ttl)).isoformat(),
+            }
+            await asyncio.to_thread(
+                lambda: get_supabase().table(self.TABLE)
+                .upsert(row, on_conflict="cache_key", returning="minimal")
+                .execute()
+            )
+        except Exception as e:
+            logger.warning(f"[ToolCache] Supabase store failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, size = len(self._entries), self._bytes
+        lookups = self._stats["hits"] + self._stats["remote_hits"] + self._stats["misses"]
+        hits = self._stats["hits"] + self._stats["remote_hits"]
+        return {
+            **self._stats,
+            "entries": entries,
+            "bytes": size,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+_cache: Optional[ToolResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_tool_result_cache() -> ToolResultCache:
+    """Return the process-wide tool result cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                from app.infrastructure.config.settings import get_settings
+                _cache = ToolResultCache(get_settings())
+    return _cache
+
+
+class ToolResultCachePlugin(BasePlugin):
+    """
+    Serves cached results for idempotent analytics tools.
+
+    Must be registered *before* MCPResponseOptimizerPlugin: on a miss it runs the
+    optimizer's compression itself so that the compressed form is what gets
+    cached, and it returns the final result so the optimizer does not compress
+    a cached (already compressed) result again.
+    """
+
+    def __init__(
+        self,
+        optimizer: "MCPResponseOptimizerPlugin",
+        emit_callback: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        cache: Optional[ToolResultCache] = None,
+        name: str = "tool_result_cache",
+    ):
+        super().__init__(name=name)
+        self._optimizer = optimizer
+        self._emit_callback = emit_callback
+        self._cache = cache or get_tool_result_cache()
+        # function_call_id -> CacheSpec (miss) / None (hit)
+        self._pending: Dict[str, Optional[CacheSpec]] = {}
+
+    async def _emit(self, tool_context: "ToolContext", tool_name: str, status: str, **data: Any) -> None:
+        if self._emit_callback is None:
+            return
+        try:
+            await self._emit_callback({
+                "type": "sub_agent_event",
+                "agent": normalize_agent_name(tool_context.agent_name),
+                "event_type": "tool_cache",
+                "is_running": True,
+                "data": {"tool_name": tool_name, "status": status, **data},
+            })
+        except Exception as e:
+            logger.warning(f"[ToolCache] Failed to emit event: {e}")
+
+    async def before_tool_callback(
+        self,
+        *,
+        tool: "BaseTool",
+        tool_args: dict[str, Any],
+        tool_context: "ToolContext",
+    ) -> Optional[dict]:
+        spec = build_cache_spec(tool.name, tool_args)
+        if spec is None:
+            return None
+        cached = await self._cache.get(spec)
+        call_id = tool_context.function_call_id or ""
+        if cached is not None:
+            self._pending[call_id] = None
+            logger.info(f"[ToolCache] hit: {tool.name} (closed={spec.closed})")
+            await self._emit(tool_context, tool.name, "hit", closed=spec.closed)
+            return cached
+        self._pending[call_id] = spec
+        await self._emit(tool_context, tool.name, "miss", closed=spec.closed)
+        return None
+
+    async def after_tool_callback(
+        self,
+        *,
+        tool: "BaseTool",
+        tool_args: dict[str, Any],
+        tool_context: "ToolContext",
+        result: dict,
+    ) -> Optional[dict]:
+        call_id = tool_context.function_call_id or ""
+        if call_id not in self._pending:
+            return None
+        spec = self._pending.pop(call_id)
+        if spec is None:
+            # キャッシュヒット: 圧縮済みなのでそのまま返し、後段の圧縮をスキップさせる
+            return result
+
+        optimized = await self._optimizer.after_tool_callback(
+            tool=tool, tool_args=tool_args, tool_context=tool_context, result=result,
+        )
+        final = optimized if optimized is not None else result
+        if not _is_error_result(final):
+            ttl = await self._cache.put(spec, final)
+            logger.debug(f"[ToolCache] stored: {tool.name} ttl={ttl:.0f}s")
+        return final
@@ -0,0 +1,5 @@
+"""ADK Session Service implementations."""
+
+from .supabase_session_service import SupabaseSessionService
+
+__all__ = ["SupabaseSessionService"]
@@ -0,0 +1,243 @@
+"""
+Supabase Session Service for ADK.
+
+Durable replacement for InMemorySessionService: events are appended one row
+at a time (function calls/responses included) and sessions are loaded with a
+tail window, so any instance can resume a conversation without the frontend
+replaying its history.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from google.adk.events.event import Event
+from google.adk.sessions import BaseSessionService, Session
+from google.adk.sessions.base_session_service import GetSessionConfig, ListSessionsResponse
+from google.adk.sessions.state import State
+
+if TYPE_CHECKING:
+    from app.infrastructure.config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+
+def _persistable_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """temp: キーは呼び出し中のみ有効なので保存しない"""
+    return {k: v for k, v in (state or {}).items() if not k.startswith(State.TEMP_PREFIX)}
+
+
+def _parse_timestamp(value: Optional[str]) -> float:
+    if not value:
+        return time.time()
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return time.time()
+
+
+def _serialize_event(event: Event) -> Dict[str, Any]:
+    """Event を JSON 化する。添付ファイルのバイナリはプレースホルダに置き換える。"""
+    data = event.model_dump(mode="json", exclude_none=True)
+    for part in (data.get("content") or {}).get("parts") or []:
+        blob = part.pop("inline_data", None)
+        if blob is not None:
+            part["text"] = f"[添付ファイル: {blob.get('display_name') or blob.get('mime_type', '')}]"
+    return data
+
+
+def _trim_to_turn_start(events: List[Event]) -> List[Event]:
+    """Drop leading events until a user message so the window never starts mid tool call."""
+    for i, event in enumerate(events):
+        content = event.content
+        if event.author == "user" and content and any(p.text for p in content.parts or []):
+            return events[i:]
+    return events
+
+
+class SupabaseSessionService(BaseSessionService):
+    """
+    Supabase-backed ADK session service.
+
+    Tables: ``adk_sessions`` (state) and ``adk_session_events`` (one row per event).
+    """
+
+    SESSIONS_TABLE = "adk_sessions"
+    EVENTS_TABLE = "adk_session_events"
+
+    def __init__(self, settings: "Settings"):
+        # Lazy import to avoid circular dependencies
+        from app.infrastructure.supabase.client import get_supabase
+        self._supabase = get_supabase()
+        self._tail_events = max(1, settings.adk_session_tail_events)
+
+        logger.info(f"[Session] SupabaseSessionService initialized (tail={self._tail_events})")
+
+    def _session_query(self, app_name: str, user_id: str, session_id: str, table: str, columns: str = "*"):
+        query = self._supabase.table(table).select(columns).eq("app_name", app_name).eq("user_id", user_id)
+        column = "id" if table == self.SESSIONS_TABLE else "session_id"
+        return query.eq(column, session_id)
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        session_id = (session_id or "").strip() or str(uuid.uuid4())
+        row = {
+            "app_name": app_name,
+            "user_id": user_id,
+            "id": session_id,
+            "state": _persistable_state(state or {}),
+        }
+        await asyncio.to_thread(
+            lambda: self._supabase.table(self.SESSIONS_TABLE)
+            .upsert(row, on_conflict="app_name,user_id,id", returning="minimal")
+            .execute()
+        )
+        return Session(
+            id=session_id,
+            app_name=app_name,
+            user_id=user_id,
+            state=dict(state or {}),
+            events=[],
+            last_update_time=time.time(),
+        )
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        limit = (config.num_recent_events if config and config.num_recent_events else None) or self._tail_events
+
+        def _load_session():
+            return (
+                self._session_query(app_name, user_id, session_id, self.SESSIONS_TABLE, "state, updated_at")
+                .limit(1)
+                .execute()
+            )
+
+        def _load_tail():
+            query = self._session_query(app_name, user_id, session_id, self.EVENTS_TABLE, "event")
+            if config and config.after_timestamp:
+                query = query.gte("ts", config.after_timestamp)
+            return query.order("ts", desc=True).limit(limit).execute()
+
+        session_res, events_res = await asyncio.gather(
+            asyncio.to_thread(_load_session),
+            asyncio.to_thread(_load_tail),
+        )
+        rows = session_res.data or []
+        if not rows:
+            return None
+
+        event_rows = list(reversed(events_res.data or []))
+        events = [Event.model_validate(r["event"]) for r in event_rows]
+        if len(event_rows) >= limit:
+            events = _trim_to_turn_start(events)
+
+        return Session(
+            id=session_id,
+            app_name=app_name,
+            user_id=user_id,
+            state=rows[0].get("state") or {},
+            events=events,
+            last_update_time=_parse_timestamp(rows[0].get("updated_at")),
+        )
+
+    async def list_sessions(
+        self,
+        *,
+        app_name: str,
+        user_id: Optional[str] = None,
+    ) -> ListSessionsResponse:
+        def _list():
+            query = self._supabase.table(self.SESSIONS_TABLE).select("id, user_id, state, updated_at").eq("app_name", app_name)
+            if user_id is not None:
+                query = query.eq("user_id", user_id)
+            return query.execute()
+
+        res = await asyncio.to_thread(_list)
+        sessions = [
+            Session(
+                id=row["id"],
+                app_name=app_name,
+                user_id=row["user_id"],
+                state=row.get("state") or {},
+                events=[],
+                last_update_time=_parse_timestamp(row.get("updated_at")),
+            )
+            for row in res.data or []
+        ]
+        return ListSessionsResponse(sessions=sessions)
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        # イベントは外部キーの ON DELETE CASCADE で削除される
+        await asyncio.to_thread(
+            lambda: self._session_query(app_name, user_id, session_id, self.SESSIONS_TABLE).delete().execute()
+        )
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        """Append the event in memory, then persist just that event (and state if it changed)."""
+        if event.partial:
+            return event
+        event = await super().append_event(session=session, event=event)
+        await self._persist_events(session, [event])
+        return event
+
+    async def import_events(self, session: Session, events: List[Event]) -> None:
+        """Bulk-append pre-built events (e.g. history restored from context_items)."""
+        for event in events:
+            await super().append_event(session=session, event=event)
+        await self._persist_events(session, events)
+
+    async def _persist_events(self, session: Session, events: List[Event]) -> None:
+        if not events:
+            return
+        rows = [
+            {
+                "app_name": session.app_name,
+                "user_id": session.user_id,
+                "session_id": session.id,
+                "event_id": event.id,
+                "invocation_id": event.invocation_id,
+                "author": event.author,
+                "ts": event.timestamp,
+                "event": _serialize_event(event),
+            }
+            for event in events
+        ]
+        state_changed = any(
+            event.actions and _persistable_state(event.actions.state_delta or {})
+            for event in events
+        )
+
+        def _write():
+            self._supabase.table(self.EVENTS_TABLE).upsert(
+                rows,
+                on_conflict="app_name,user_id,session_id,event_id",
+                returning="minimal",
+            ).execute()
+            if state_changed:
+                self._session_query(session.app_name, session.user_id, session.id, self.SESSIONS_TABLE).update(
+                    {"state": _persistable_state(session.state)}
+                ).execute()
+
+        try:
+            await asyncio.to_thread(_write)
+            session.last_update_time = events[-1].timestamp
+        except Exception as e:
+            # 永続化に失敗しても実行中のターンは継続させる（次回ロード時に欠落するのみ）
+            logger.warning(f"[Session] Failed to persist {len(rows)} event(s) for {session.id}: {e}")
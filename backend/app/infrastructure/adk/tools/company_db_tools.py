@@ -12,6 +12,8 @@ from typing import Any, Dict, List, Optional
 
 from google.adk.tools.tool_context import ToolContext
 
+from app.infrastructure.google.company_index import parse_int
+
 logger = logging.getLogger(__name__)
 
 # Need type definitions
@@ -46,19 +48,6 @@ def _get_sheets_service():
     return _sheets_service_instance
 
 
-def _safe_int(value: Any, default: int = 0) -> int:
-    """Safely convert value to int."""
-    if value is None or value == "":
-        return default
-    try:
-        # Handle strings like "35歳" -> 35
-        if isinstance(value, str):
-            value = value.replace("歳", "").replace("万", "").replace(",", "").strip()
-        return int(value)
-    except (ValueError, TypeError):
-        return default
-
-
 def get_company_definitions() -> Dict[str, Any]:
     """
     企業DBのマスタ定義一覧を取得。業種・勤務地・ニーズタイプ・担当者一覧を返す。
@@ -75,24 +64,18 @@ def get_company_definitions() -> Dict[str, Any]:
 
     try:
         service = _get_sheets_service()
-        all_companies = service.get_all_companies()
-
-        # Extract unique values
-        industries = sorted(set(
-            c.get("業種", "") for c in all_companies if c.get("業種")
-        ))
-        locations = sorted(set(
-            c.get("勤務地", "") for c in all_companies if c.get("勤務地")
-        ))
+        index = service.get_company_index()
+
+        # Unique values come straight from the index's inverted indexes
         pic_names = service.list_pic_sheets()
 
         return {
             "success": True,
-            "industries": industries,
-            "locations": locations,
+            "industries": index.industries(),
+            "locations": index.locations(),
             "need_types": NEED_TYPES,
             "available_pics": pic_names,
-            "total_companies": len(all_companies),
+            "total_companies": len(index),
         }
     except Exception as e:
         logger.error(f"[ADK CompanyDB] get_company_definitions error: {e}")
@@ -131,41 +114,21 @@ def search_companies(
 
     try:
         service = _get_sheets_service()
-        all_companies = service.get_all_companies()
+        index = service.get_company_index()
+
+        # Partial-match / salary / age / education / remote filters as index intersections
+        rows = index.filter(
+            industry=industry,
+            location=location,
+            min_salary=min_salary,
+            max_age=max_age,
+            education=education,
+            remote_only=bool(remote_ok),
+        )
 
         filtered = []
-        for company in all_companies:
-            # Industry filter (partial match)
-            if industry and industry not in company.get("業種", ""):
-                continue
-
-            # Location filter (partial match)
-            if location and location not in company.get("勤務地", ""):
-                continue
-
-            # Salary filter
-            if min_salary:
-                company_max = _safe_int(company.get("想定年収上限"), 0)
-                if company_max < min_salary:
-                    continue
-
-            # Age filter
-            if max_age:
-                age_limit = _safe_int(company.get("年齢上限"), 99)
-                if age_limit < max_age:
-                    continue
-
-            # Education filter (partial match)
-            if education and education not in company.get("学歴要件", ""):
-                continue
-
-            # Remote filter
-            if remote_ok is not None:
-                remote_policy = company.get("リモートワーク", "")
-                is_remote = "可" in remote_policy or "フル" in remote_policy or "相談" in remote_policy
-                if remote_ok and not is_remote:
-                    continue
-
+        for row in rows:
+            company = index.rows[row]
             # Build summary record
             filtered.append({
                 "企業名": company.get("企業名"),
@@ -235,10 +198,10 @@ def get_company_detail(company_name: str, tool_context: ToolContext = None) -> D
 
     try:
         service = _get_sheets_service()
-        all_companies = service.get_all_companies()
+        index = service.get_company_index()
 
         # Partial match search
-        matches = [c for c in all_companies if company_name in c.get("企業名", "")]
+        matches = [index.rows[i] for i in index.find_by_name(company_name)]
 
         if not matches:
             return {"success": False, "error": f"企業が見つかりません: {company_name}"}
@@ -322,9 +285,9 @@ def get_company_requirements(company_name: str) -> Dict[str, Any]:
 
     try:
         service = _get_sheets_service()
-        all_companies = service.get_all_companies()
+        index = service.get_company_index()
 
-        matches = [c for c in all_companies if company_name in c.get("企業名", "")]
+        matches = [index.rows[i] for i in index.find_by_name(company_name)]
 
         if not matches:
             return {"success": False, "error": f"企業が見つかりません: {company_name}"}
@@ -483,16 +446,16 @@ def match_candidate_to_companies(
                 if zoho_record:
                     candidate_info["name"] = zoho_record.get("Name", "不明")
                     candidate_info["channel"] = zoho_record.get("field14")
-                    candidate_info["age"] = _safe_int(zoho_record.get("field15"))
-                    candidate_info["current_salary"] = _safe_int(zoho_record.get("field17"))
-                    candidate_info["desired_salary"] = _safe_int(zoho_record.get("field20"))
+                    candidate_info["age"] = parse_int(zoho_record.get("field15"))
+                    candidate_info["current_salary"] = parse_int(zoho_record.get("field17"))
+                    candidate_info["desired_salary"] = parse_int(zoho_record.get("field20"))
 
                 structured = _get_structured_data_by_zoho_record(record_id)
                 if structured and structured.get("data"):
                     data = structured["data"]
                     candidate_info["transfer_reasons"] = data.get("transfer_reasons", [])
                     if data.get("desired_first_year_salary"):
-                        candidate_info["desired_salary"] = _safe_int(
+                        candidate_info["desired_salary"] = parse_int(
                             data.get("desired_first_year_salary")
                         )
             except Exception as e:
@@ -516,37 +479,39 @@ def match_candidate_to_companies(
 
         # Get company data
         service = _get_sheets_service()
-        all_companies = service.get_all_companies()
+        index = service.get_company_index()
         appeal_data = service.get_appeal_points()
 
+        # Age over limit = skip (critical): only rows passing the age filter are scored
+        candidate_mask = index.all_mask
+        if candidate_info.get("age"):
+            candidate_mask &= index.age_limit_at_least(candidate_info["age"])
+        location_mask = (
+            index.location_mask(candidate_info["location"])
+            if candidate_info.get("location") else 0
+        )
+
         # Calculate match scores
         scored_companies = []
-        for company in all_companies:
+        for row in index.iter_rows(candidate_mask):
+            company = index.rows[row]
             score = 0
             match_reasons = []
             disqualified = False
 
             # Age match (critical)
             if candidate_info.get("age"):
-                age_limit = _safe_int(company.get("年齢上限"), 99)
-                if candidate_info["age"] <= age_limit:
-                    score += 20
-                    match_reasons.append("年齢適合")
-                else:
-                    disqualified = True
-                    continue  # Age over limit = skip
+                score += 20
+                match_reasons.append("年齢適合")
 
             # Location match
-            if candidate_info.get("location"):
-                company_location = company.get("勤務地", "")
-                if candidate_info["location"] in company_location:
-                    score += 15
-                    match_reasons.append("勤務地適合")
+            if location_mask >> row & 1:
+                score += 15
+                match_reasons.append("勤務地適合")
 
             # Salary match
             if candidate_info.get("desired_salary"):
-                company_max = _safe_int(company.get("想定年収上限"), 0)
-                company_min = _safe_int(company.get("想定年収下限"), 0)
+                company_min, company_max = index.salary_range(row)
                 desired = candidate_info["desired_salary"]
 
                 if company_min <= desired <= company_max:
@@ -558,8 +523,7 @@ def match_candidate_to_companies(
 
             # Experience count match
             if candidate_info.get("experience_count"):
-                exp_limit = _safe_int(company.get("経験社数上限"), 99)
-                if candidate_info["experience_count"] <= exp_limit:
+                if candidate_info["experience_count"] <= index.experience_limit[row]:
                     score += 10
                     match_reasons.append("経験社数適合")
 
@@ -687,7 +651,7 @@ def compare_companies(
 
     try:
         service = _get_sheets_service()
-        all_companies = service.get_all_companies()
+        index = service.get_company_index()
         appeal_data = service.get_appeal_points()
 
         # Build lookup by name (partial match)
@@ -695,13 +659,14 @@ def compare_companies(
         not_found = []
 
         for target_name in company_names:
-            matches = [c for c in all_companies if target_name in c.get("企業名", "")]
+            matches = index.find_by_name(target_name)
 
             if not matches:
                 not_found.append(target_name)
                 continue
 
-            company = matches[0]
+            row = matches[0]
+            company = index.rows[row]
             name = company.get("企業名", target_name)
             appeal = appeal_data.get(name, {})
 
@@ -714,8 +679,8 @@ def compare_companies(
                 "業種": company.get("業種"),
                 "勤務地": company.get("勤務地"),
                 "想定年収": f"{salary_min}〜{salary_max}万",
-                "想定年収下限": _safe_int(salary_min, 0),
-                "想定年収上限": _safe_int(salary_max, 0),
+                "想定年収下限": index.salary_min[row],
+                "想定年収上限": index.salary_max[row],
                 "年齢上限": company.get("年齢上限"),
                 "学歴要件": company.get("学歴要件"),
                 "経験社数上限": company.get("経験社数上限"),
@@ -767,8 +732,8 @@ def compare_companies(
 
         # Age limit comparison
         age_items = [
-            (c["企業名"], _safe_int(c.get("年齢上限"), 0))
-            for c in comparison_table if _safe_int(c.get("年齢上限"), 0) > 0
+            (c["企業名"], parse_int(c.get("年齢上限"), 0))
+            for c in comparison_table if parse_int(c.get("年齢上限"), 0) > 0
         ]
         if age_items:
             most_flexible = max(age_items, key=lambda x: x[1])
@@ -8,14 +8,12 @@ Uses the same Gemini embedding model as agent memory for consistency.
 from __future__ import annotations
 
 import logging
-from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
-from google import genai
 from google.adk.tools.tool_context import ToolContext
 
 from app.infrastructure.supabase.client import get_supabase
-from app.infrastructure.config.settings import get_settings
+from app.infrastructure.gemini.embedding_service import get_embedding_service
 
 logger = logging.getLogger(__name__)
 
@@ -24,31 +22,20 @@ EMBEDDING_MODEL = "gemini-embedding-001"
 EMBEDDING_DIMENSIONS = 768
 
 
-@lru_cache(maxsize=256)
-def _get_cached_embedding(query: str) -> tuple:
-    """Embedding結果をキャッシュ（LRU、最大256件）。tupleで返すのはlru_cacheがhashableな戻り値を必要とするため。"""
-    settings = get_settings()
-    client = genai.Client(api_key=settings.gemini_api_key)
-
-    result = client.models.embed_content(
-        model=f"models/{EMBEDDING_MODEL}",
-        contents=query,
-        config={
-            "output_dimensionality": EMBEDDING_DIMENSIONS,
-            "task_type": "RETRIEVAL_QUERY",
-        },
-    )
-
-    return tuple(result.embeddings[0].values)
-
-
 def _get_query_embedding(query: str) -> List[float]:
     """
     Generate embedding for a search query.
 
     Uses Matryoshka truncation to match agent memory dimensions (768).
+    Served from the shared EmbeddingService cache when the same (normalised)
+    query was embedded before, on this or any other instance.
     """
-    return list(_get_cached_embedding(query))
+    return get_embedding_service().embed(
+        query,
+        model=EMBEDDING_MODEL,
+        dimensions=EMBEDDING_DIMENSIONS,
+        task_type="RETRIEVAL_QUERY",
+    )
 
 
 def semantic_search_companies(
@@ -9,11 +9,16 @@ Zoho CRM Tools for Google ADK.
 
 Tier 1/2: 全CRMモジュールに動的アクセス（フィールドやモジュールをハードコードしない）
 Tier 3: jobSeekerモジュール専用の高度なビジネス分析（ファネル・トレンド・チャネル比較）
+
+Tier 2 は1回の Zoho 呼び出しで完結するため async 実装（プール済みの非同期接続を使い、
+Zoho の応答待ちでワーカースレッドを塞がない）。
 """
 
 from __future__ import annotations
 
+import asyncio
 import functools
+import inspect
 import logging
 import time
 from datetime import datetime, timedelta
@@ -21,7 +26,9 @@ from typing import Any, Dict, List, Optional
 
 from google.adk.tools.tool_context import ToolContext
 
+from app.infrastructure.config.settings import get_settings
 from app.infrastructure.zoho.client import ZohoClient, ZohoAuthError
+from app.infrastructure.zoho.job_seeker_store import JobSeekerStore, get_job_seeker_store
 
 logger = logging.getLogger(__name__)
 
@@ -37,27 +44,58 @@ def _get_zoho_client():
     return _zoho_client_instance
 
 
-# TTL cache for all jobSeeker records (Tier 3 specialized tools用)
-_all_records_cache = None
+# TTL cache for all jobSeeker records (レプリカが使えない場合のフォールバック)
+_all_records_cache: Optional[JobSeekerStore] = None
 _all_records_cache_time = 0
 _ALL_RECORDS_CACHE_TTL = 300  # 5分
 
 
-def _get_cached_all_records():
-    """全jobSeekerレコードのTTLキャッシュ。5分間有効。"""
+def _get_cached_all_records() -> JobSeekerStore:
+    """Records API 全件取得のTTLキャッシュ（5分）。COQL が使えない場合のみ使用。"""
     global _all_records_cache, _all_records_cache_time
     now = time.time()
     if _all_records_cache is not None and (now - _all_records_cache_time) < _ALL_RECORDS_CACHE_TTL:
         return _all_records_cache
     zoho = _get_zoho_client()
-    _all_records_cache = zoho._fetch_all_records()
+    _all_records_cache = JobSeekerStore.from_records(zoho._fetch_all_records())
     _all_records_cache_time = now
     return _all_records_cache
 
 
+def _get_job_seeker_store() -> JobSeekerStore:
+    """Tier 3 分析用の jobSeeker データ。
+
+    通常は COQL 全件取得 + Modified_Time 差分同期のローカルレプリカを返し、
+    構築できない場合（COQL スコープ不足等）は従来の Records API 取得にフォールバックする。
+    """
+    if get_settings().zoho_job_seeker_store_enabled:
+        store = get_job_seeker_store()
+        if store.ensure_fresh(_get_zoho_client()):
+            return store
+    return _get_cached_all_records()
+
+
 def _retry_transient(max_retries: int = 2, delay: float = 1.0):
     """一時的エラーの自動リトライデコレータ（指数バックオフ）。"""
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                last_error = None
+                for attempt in range(max_retries + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        last_error = e
+                        error_str = str(e).lower()
+                        if any(kw in error_str for kw in ["auth", "invalid", "not found", "permission"]):
+                            raise
+                        if attempt < max_retries:
+                            await asyncio.sleep(delay * (2 ** attempt))
+                            logger.warning(f"[zoho_crm_tools] Retry {attempt+1}/{max_retries} for {func.__name__}: {e}")
+                raise last_error
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             last_error = None
@@ -374,7 +412,7 @@ def get_module_layout(
 # ============================================================
 
 @_retry_transient(max_retries=2)
-def query_crm_records(
+async def query_crm_records(
     module: str,
     fields: str,
     where: Optional[str] = None,
@@ -429,7 +467,7 @@ def query_crm_records(
             query += f" ORDER BY {order_by}"
         query += f" LIMIT {effective_limit}"
 
-        result = zoho.generic_coql_query(query, limit=effective_limit)
+        result = await zoho.ageneric_coql_query(query, limit=effective_limit)
         data = result.get("data") or []
         info = result.get("info") or {}
 
@@ -464,7 +502,7 @@ def query_crm_records(
 
 
 @_retry_transient(max_retries=2)
-def aggregate_crm_data(
+async def aggregate_crm_data(
     module: str,
     group_by: str,
     aggregate: str = "COUNT(id)",
@@ -519,7 +557,7 @@ def aggregate_crm_data(
             query += f" ORDER BY {order_by}"
         query += f" LIMIT {effective_limit}"
 
-        result = zoho.generic_coql_query(query, limit=effective_limit)
+        result = await zoho.ageneric_coql_query(query, limit=effective_limit)
         data = result.get("data") or []
 
         return {
@@ -539,7 +577,7 @@ def aggregate_crm_data(
 
 
 @_retry_transient(max_retries=2)
-def get_record_detail(
+async def get_record_detail(
     module: str,
     record_id: str,
     tool_context: ToolContext = None,
@@ -569,7 +607,7 @@ def get_record_detail(
 
     try:
         zoho = _get_zoho_client()
-        record = zoho.get_record(module, record_id)
+        record = await zoho.aget_record(module, record_id)
 
         if not record:
             return {"success": False, "error": f"レコードが見つかりません: {module}/{record_id}"}
@@ -605,7 +643,7 @@ def get_record_detail(
 
 
 @_retry_transient(max_retries=2)
-def get_related_records(
+async def get_related_records(
     module: str,
     record_id: str,
     related_list: str,
@@ -638,7 +676,7 @@ def get_related_records(
 
     try:
         zoho = _get_zoho_client()
-        records = zoho.get_related_records(module, record_id, related_list, limit=min(limit, 200))
+        records = await zoho.aget_related_records(module, record_id, related_list, limit=min(limit, 200))
 
         return {
             "success": True,
@@ -794,13 +832,9 @@ def trend_analysis_by_period(
     months_back = min(months_back, 12)
 
     try:
-        zoho = _get_zoho_client()
         today = datetime.now()
 
-        all_records = _get_cached_all_records()
-
-        if channel:
-            all_records = [r for r in all_records if r.get(zoho.CHANNEL_FIELD_API) == channel]
+        store = _get_job_seeker_store()
 
         periods = []
         for i in range(months_back - 1, -1, -1):
@@ -828,25 +862,17 @@ def trend_analysis_by_period(
                 "end": period_end.strftime("%Y-%m-%d"),
             })
 
-        trend_data = []
-        for period in periods:
-            date_from = period["start"]
-            date_to = period["end"]
-
-            count = 0
-            for record in all_records:
-                reg_date = record.get(zoho.DATE_FIELD_API)
-                if reg_date:
-                    if date_from and reg_date < date_from:
-                        continue
-                    if date_to and reg_date > date_to:
-                        continue
-                    count += 1
+        # 全期間を1回のキューブ参照でまとめて数える
+        counts = store.period_counts(
+            [(period["start"], period["end"]) for period in periods], channel=channel
+        )
 
+        trend_data = []
+        for period, count in zip(periods, counts):
             trend_data.append({
                 "period": period["label"],
-                "date_from": date_from,
-                "date_to": date_to,
+                "date_from": period["start"],
+                "date_to": period["end"],
                 "count": count,
             })
 
@@ -921,19 +947,13 @@ def compare_channels(
     try:
         zoho = _get_zoho_client()
 
-        all_records = _get_cached_all_records()
-        filtered = zoho._filter_by_date(all_records, date_from, date_to)
+        counts = _get_job_seeker_store().count_by(("channel", "status"), date_from, date_to)
 
         channel_stats: Dict[str, Dict[str, int]] = {ch: {} for ch in channels}
 
-        for record in filtered:
-            ch = record.get(zoho.CHANNEL_FIELD_API)
-            if ch not in channels:
-                continue
-
-            status = record.get(zoho.STATUS_FIELD_API)
-            if status:
-                channel_stats[ch][status] = channel_stats[ch].get(status, 0) + 1
+        for (ch, status), n in counts.items():
+            if ch in channel_stats and status:
+                channel_stats[ch][status] = n
 
         comparison_data = []
         for ch in channels:
@@ -1005,30 +1025,22 @@ def get_pic_performance(
     logger.info(f"[ADK Zoho] get_pic_performance: channel={channel}")
 
     try:
-        zoho = _get_zoho_client()
-
-        all_records = _get_cached_all_records()
-        filtered = zoho._filter_by_date(all_records, date_from, date_to)
-
-        if channel:
-            filtered = [r for r in filtered if r.get(zoho.CHANNEL_FIELD_API) == channel]
+        counts = _get_job_seeker_store().count_by(
+            ("owner", "status", "interviewed"), date_from, date_to, channel=channel
+        )
 
         pic_stats: Dict[str, Dict[str, int]] = {}
 
-        for record in filtered:
-            owner = record.get("Owner")
-            pic_name = owner.get("name") if isinstance(owner, dict) else str(owner) if owner else "未割当"
-            status = record.get(zoho.STATUS_FIELD_API)
-
+        for (pic_name, status, interviewed), n in counts.items():
             if pic_name not in pic_stats:
                 pic_stats[pic_name] = {"total": 0, "hired": 0, "interviewed": 0}
 
-            pic_stats[pic_name]["total"] += 1
+            pic_stats[pic_name]["total"] += n
             if status == "14. 入社":
-                pic_stats[pic_name]["hired"] += 1
+                pic_stats[pic_name]["hired"] += n
             # 面談日(field29)があれば面談実施としてカウント
-            if record.get(zoho.INTERVIEW_DATE_FIELD_API):
-                pic_stats[pic_name]["interviewed"] += 1
+            if interviewed:
+                pic_stats[pic_name]["interviewed"] += n
 
         performance_data = []
         for pic_name, stats in pic_stats.items():
@@ -1086,23 +1098,20 @@ def get_conversion_metrics(
 
     try:
         zoho = _get_zoho_client()
-        all_records = _get_cached_all_records()
-        filtered = zoho._filter_by_date(all_records, date_from, date_to)
+        counts = _get_job_seeker_store().count_by(("channel", "status"), date_from, date_to)
 
         # Aggregate status counts per channel
         channel_stats: Dict[str, Dict[str, int]] = {}
 
-        for record in filtered:
-            ch = record.get(zoho.CHANNEL_FIELD_API)
+        for (ch, status), n in counts.items():
             if not ch:
                 continue
 
             if ch not in channel_stats:
                 channel_stats[ch] = {}
 
-            status = record.get(zoho.STATUS_FIELD_API)
             if status:
-                channel_stats[ch][status] = channel_stats[ch].get(status, 0) + 1
+                channel_stats[ch][status] = n
 
         # 面談日(field29)ベースのチャネル別面談実施数を取得
         zoho = _get_zoho_client()
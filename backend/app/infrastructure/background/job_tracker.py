@@ -23,6 +23,9 @@ class Job:
     collected: int = 0
     stored: int = 0
     skipped: int = 0
+    failed: int = 0
+    # Per-account collection stats (listed / unchanged / exported / elapsed_sec / docs_per_sec)
+    accounts: Dict[str, Any] = field(default_factory=dict)
     message: Optional[str] = None
     error: Optional[str] = None
 
@@ -13,7 +13,7 @@ from pydantic import TypeAdapter
 
 from app.infrastructure.chatkit.context import MarketingRequestContext
 from app.infrastructure.config.settings import get_settings
-from app.infrastructure.supabase.client import get_supabase
+from app.infrastructure.supabase.client import run_supabase
 
 logger = logging.getLogger(__name__)
 
@@ -123,22 +123,17 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
         self._item_adapter = _item_adapter
         self._attachment_adapter = _attachment_adapter
 
-    def _client(self):
-        return get_supabase()
-
     def _storage_prefix(self, attachment_id: str) -> str:
         return f"attachments/{attachment_id}"
 
-    def _load_attachment_metadata(self, attachment_id: str) -> dict[str, Any]:
+    async def _load_attachment_metadata(self, attachment_id: str) -> dict[str, Any]:
         """
         Load attachment metadata from DB; fall back to Supabase Storage cache.
         """
-        sb = self._client()
-
         # 1) Try persisted row
         try:
-            res = (
-                sb.table(self.ATTACHMENT_TABLE)
+            res = await run_supabase(
+                lambda sb: sb.table(self.ATTACHMENT_TABLE)
                 .select("storage_metadata")
                 .eq("id", attachment_id)
                 .limit(1)
@@ -152,8 +147,8 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
 
         # 2) Fallback to storage meta.json
         try:
-            raw = (
-                sb.storage.from_(self.ATTACHMENT_BUCKET)
+            raw = await run_supabase(
+                lambda sb: sb.storage.from_(self.ATTACHMENT_BUCKET)
                 .download(f"{self._storage_prefix(attachment_id)}/meta.json")
             )
             return json.loads(raw) if raw else {}
@@ -207,9 +202,8 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
     async def load_thread(
         self, thread_id: str, context: MarketingRequestContext
     ) -> ThreadMetadata:
-        sb = self._client()
-        res = (
-            sb.table(self.THREAD_TABLE)
+        res = await run_supabase(
+            lambda sb: sb.table(self.THREAD_TABLE)
             .select("*")
             .eq("id", thread_id)
             .limit(1)
@@ -230,7 +224,6 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
     async def save_thread(
         self, thread: ThreadMetadata, context: MarketingRequestContext
     ) -> None:
-        sb = self._client()
         metadata = thread.metadata or {}
         # Inject model asset id from context if provided and not already set
         if context.model_asset_id and not metadata.get("model_asset_id"):
@@ -246,7 +239,7 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
             or datetime.utcnow().isoformat(),
         }
         try:
-            sb.table(self.THREAD_TABLE).upsert(payload).execute()
+            await run_supabase(lambda sb: sb.table(self.THREAD_TABLE).upsert(payload).execute())
         except Exception:
             logger.exception("Failed to upsert marketing thread id=%s", thread.id)
             raise
@@ -259,20 +252,19 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
         order: str,
         context: MarketingRequestContext,
     ) -> Page[ThreadItem]:
-        sb = self._client()
-        query = sb.table(self.ITEM_TABLE).select("*").eq("conversation_id", thread_id)
         desc = order == "desc"
+        cursor_filter: str | None = None
 
         # Cursor pagination with a tie‑breaker on id so items sharing the same timestamp
         # are not skipped or duplicated (ChatKit can emit multiple rows within the same ms).
         if after:
-            after_rows = (
-                sb.table(self.ITEM_TABLE)
+            after_rows = (await run_supabase(
+                lambda sb: sb.table(self.ITEM_TABLE)
                 .select("created_at,id")
                 .eq("id", after)
                 .limit(1)
                 .execute()
-            ).data or []
+            )).data or []
             if not after_rows:
                 raise NotFoundError(f"Thread item {after} not found")
             after_created_at = _parse_dt(after_rows[0]["created_at"]).isoformat()
@@ -281,14 +273,19 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
                 f"created_at.{comparator}.{after_created_at},"
                 f"and(created_at.eq.{after_created_at},id.{comparator}.{after})"
             )
-            query = query.or_(cursor_filter)
 
-        query = (
-            query.order("created_at", desc=desc)
-            .order("id", desc=desc)
-            .limit(limit + 1)
-        )
-        res = query.execute()
+        def _page_query(sb):
+            query = sb.table(self.ITEM_TABLE).select("*").eq("conversation_id", thread_id)
+            if cursor_filter:
+                query = query.or_(cursor_filter)
+            return (
+                query.order("created_at", desc=desc)
+                .order("id", desc=desc)
+                .limit(limit + 1)
+                .execute()
+            )
+
+        res = await run_supabase(_page_query)
         rows: list[dict[str, Any]] = res.data or []
         has_more = len(rows) > limit
         rows = rows[:limit]
@@ -320,7 +317,6 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
     async def save_attachment(
         self, attachment: Attachment, context: MarketingRequestContext
     ) -> None:
-        sb = self._client()
         thread_id = getattr(attachment, "thread_id", None)
         if not thread_id and context.scope:
             thread_id = context.scope.get("thread_id")
@@ -337,12 +333,12 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
             "size_bytes": getattr(attachment, "size", None),
             "storage_metadata": attachment.model_dump(mode="json"),
         }
-        sb.table(self.ATTACHMENT_TABLE).upsert(payload).execute()
+        await run_supabase(lambda sb: sb.table(self.ATTACHMENT_TABLE).upsert(payload).execute())
 
     async def load_attachment(
         self, attachment_id: str, context: MarketingRequestContext
     ) -> Attachment:
-        metadata = self._load_attachment_metadata(attachment_id)
+        metadata = await self._load_attachment_metadata(attachment_id)
         if not metadata:
             raise NotFoundError(f"Attachment {attachment_id} not found")
 
@@ -365,18 +361,17 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
     async def delete_attachment(
         self, attachment_id: str, context: MarketingRequestContext
     ) -> None:
-        sb = self._client()
         try:
-            sb.table(self.ATTACHMENT_TABLE).delete().eq("id", attachment_id).execute()
+            await run_supabase(lambda sb: sb.table(self.ATTACHMENT_TABLE).delete().eq("id", attachment_id).execute())
         except Exception:
             logger.exception("Failed to delete attachment row for %s", attachment_id)
 
         try:
             prefix = self._storage_prefix(attachment_id)
-            objects = sb.storage.from_(self.ATTACHMENT_BUCKET).list(path=prefix) or []
+            objects = await run_supabase(lambda sb: sb.storage.from_(self.ATTACHMENT_BUCKET).list(path=prefix)) or []
             targets = [f"{prefix}/{obj['name']}" for obj in objects]
             if targets:
-                sb.storage.from_(self.ATTACHMENT_BUCKET).remove(targets)
+                await run_supabase(lambda sb: sb.storage.from_(self.ATTACHMENT_BUCKET).remove(targets))
         except Exception:
             logger.exception("Failed to delete attachment storage objects for %s", attachment_id)
 
@@ -387,21 +382,16 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
         order: str,
         context: MarketingRequestContext,
     ) -> Page[ThreadMetadata]:
-        sb = self._client()
-        query = (
-            sb.table(self.THREAD_TABLE)
-            .select("*")
-            .eq("owner_clerk_id", context.user_id)
-        )
         desc = order == "desc"
+        cursor_filter: str | None = None
         if after:
-            after_rows = (
-                sb.table(self.THREAD_TABLE)
+            after_rows = (await run_supabase(
+                lambda sb: sb.table(self.THREAD_TABLE)
                 .select("created_at,id")
                 .eq("id", after)
                 .limit(1)
                 .execute()
-            ).data or []
+            )).data or []
             if not after_rows:
                 raise NotFoundError(f"Thread {after} not found")
             after_ts = _parse_dt(after_rows[0]["created_at"]).isoformat()
@@ -410,14 +400,23 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
                 f"created_at.{comparator}.{after_ts},"
                 f"and(created_at.eq.{after_ts},id.{comparator}.{after})"
             )
-            query = query.or_(cursor_filter)
 
-        query = (
-            query.order("created_at", desc=desc)
-            .order("id", desc=desc)
-            .limit(limit + 1)
-        )
-        res = query.execute()
+        def _page_query(sb):
+            query = (
+                sb.table(self.THREAD_TABLE)
+                .select("*")
+                .eq("owner_clerk_id", context.user_id)
+            )
+            if cursor_filter:
+                query = query.or_(cursor_filter)
+            return (
+                query.order("created_at", desc=desc)
+                .order("id", desc=desc)
+                .limit(limit + 1)
+                .execute()
+            )
+
+        res = await run_supabase(_page_query)
         rows = res.data or []
         has_more = len(rows) > limit
         rows = rows[:limit]
@@ -434,7 +433,6 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
     async def add_thread_item(
         self, thread_id: str, item: ThreadItem, context: MarketingRequestContext
     ) -> None:
-        sb = self._client()
         plain_text = _plain_text_from_item(item)
         payload = {
             "id": item.id,
@@ -447,11 +445,13 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
             "created_at": getattr(item, "created_at", datetime.utcnow()).isoformat(),
         }
         logger.info(f"Saving thread item to Supabase: type={item.type}, id={item.id[:8]}..., thread={thread_id[:8]}...")
-        sb.table(self.ITEM_TABLE).upsert(payload, returning="minimal").execute()
+        await run_supabase(lambda sb: sb.table(self.ITEM_TABLE).upsert(payload, returning="minimal").execute())
         logger.info(f"Successfully saved thread item: type={item.type}, id={item.id[:8]}...")
-        sb.table(self.THREAD_TABLE).update(
-            {"last_message_at": payload["created_at"]}, returning="minimal"
-        ).eq("id", thread_id).execute()
+        await run_supabase(
+            lambda sb: sb.table(self.THREAD_TABLE).update(
+                {"last_message_at": payload["created_at"]}, returning="minimal"
+            ).eq("id", thread_id).execute()
+        )
 
         # Generate title for first user message if thread has default title
         if item.type == "user_message" and plain_text:
@@ -462,21 +462,21 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
     async def save_item(
         self, thread_id: str, item: ThreadItem, context: MarketingRequestContext
     ) -> None:
-        sb = self._client()
         payload = {
             "role": self._infer_role(item),
             "message_type": item.type,
             "plain_text": _plain_text_from_item(item),
             "content": item.model_dump(mode="json"),
         }
-        sb.table(self.ITEM_TABLE).update(payload, returning="minimal").eq("id", item.id).execute()
+        await run_supabase(
+            lambda sb: sb.table(self.ITEM_TABLE).update(payload, returning="minimal").eq("id", item.id).execute()
+        )
 
     async def load_item(
         self, thread_id: str, item_id: str, context: MarketingRequestContext
     ) -> ThreadItem:
-        sb = self._client()
-        res = (
-            sb.table(self.ITEM_TABLE)
+        res = await run_supabase(
+            lambda sb: sb.table(self.ITEM_TABLE)
             .select("content")
             .eq("id", item_id)
             .limit(1)
@@ -488,24 +488,21 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
         return self._item_adapter.validate_python(rows[0]["content"])
 
     async def delete_thread(self, thread_id: str, context: MarketingRequestContext) -> None:
-        sb = self._client()
-        sb.table(self.THREAD_TABLE).delete().eq("id", thread_id).execute()
+        await run_supabase(lambda sb: sb.table(self.THREAD_TABLE).delete().eq("id", thread_id).execute())
 
     async def delete_thread_item(
         self, thread_id: str, item_id: str, context: MarketingRequestContext
     ) -> None:
-        sb = self._client()
-        sb.table(self.ITEM_TABLE).delete().eq("id", item_id).execute()
+        await run_supabase(lambda sb: sb.table(self.ITEM_TABLE).delete().eq("id", item_id).execute())
 
     async def _maybe_generate_title(
         self, thread_id: str, user_message: str, context: MarketingRequestContext
     ) -> None:
         """Generate a title for the thread if it still has the default title."""
         try:
-            sb = self._client()
             # Check current title
-            res = (
-                sb.table(self.THREAD_TABLE)
+            res = await run_supabase(
+                lambda sb: sb.table(self.THREAD_TABLE)
                 .select("title")
                 .eq("id", thread_id)
                 .limit(1)
@@ -530,7 +527,9 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
                 return
 
             # Update thread title
-            sb.table(self.THREAD_TABLE).update({"title": new_title}).eq("id", thread_id).execute()
+            await run_supabase(
+                lambda sb: sb.table(self.THREAD_TABLE).update({"title": new_title}).eq("id", thread_id).execute()
+            )
             logger.info("Updated thread %s title to: %s", thread_id[:8], new_title)
 
         except Exception as e:
@@ -561,9 +560,8 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
 
     async def _is_owner(self, thread_id: str, context: MarketingRequestContext) -> bool:
         """Check if the current user owns the thread."""
-        sb = self._client()
-        res = (
-            sb.table(self.THREAD_TABLE)
+        res = await run_supabase(
+            lambda sb: sb.table(self.THREAD_TABLE)
             .select("owner_clerk_id")
             .eq("id", thread_id)
             .limit(1)
@@ -577,11 +575,9 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
         self, thread_id: str, is_shared: bool, context: MarketingRequestContext
     ) -> dict[str, Any]:
         """Toggle sharing status. Only owner can do this."""
-        sb = self._client()
-
         # Verify ownership
-        res = (
-            sb.table(self.THREAD_TABLE)
+        res = await run_supabase(
+            lambda sb: sb.table(self.THREAD_TABLE)
             .select("owner_clerk_id, is_shared")
             .eq("id", thread_id)
             .limit(1)
@@ -602,7 +598,9 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
             update_payload["shared_by_email"] = context.user_email
             update_payload["shared_by_clerk_id"] = context.user_id
 
-        sb.table(self.THREAD_TABLE).update(update_payload).eq("id", thread_id).execute()
+        await run_supabase(
+            lambda sb: sb.table(self.THREAD_TABLE).update(update_payload).eq("id", thread_id).execute()
+        )
         logger.info(
             "Thread %s sharing toggled to %s by %s",
             thread_id,
@@ -620,9 +618,8 @@ class SupabaseChatStore(Store[MarketingRequestContext]):
         self, thread_id: str, context: MarketingRequestContext
     ) -> dict[str, Any]:
         """Get current sharing status for a thread."""
-        sb = self._client()
-        res = (
-            sb.table(self.THREAD_TABLE)
+        res = await run_supabase(
+            lambda sb: sb.table(self.THREAD_TABLE)
             .select("id, is_shared, shared_at, shared_by_email, owner_clerk_id")
             .eq("id", thread_id)
             .limit(1)
@@ -43,9 +43,26 @@ class Settings:
     notta_impersonate_subject: str = os.getenv("NOTTA_IMPERSONATE_SUBJECT", "")
     notta_organizer_email: str = os.getenv("NOTTA_ORGANIZER_EMAIL", "notta_shared_drive")
 
+    # Drive collection: use the Changes API with per-subject page tokens (full rescan on demand)
+    drive_incremental_sync: bool = os.getenv("DRIVE_INCREMENTAL_SYNC", "true").lower() == "true"
+    # Per-account export/permissions worker pool and process-wide cap on in-flight Drive requests
+    drive_export_workers: int = int(os.getenv("DRIVE_EXPORT_WORKERS", "4"))
+    drive_global_concurrency: int = int(os.getenv("DRIVE_GLOBAL_CONCURRENCY", "16"))
+    drive_max_retries: int = int(os.getenv("DRIVE_MAX_RETRIES", "5"))
+    # Streaming collect: documents buffered between collectors and the store, and upsert batch size
+    collect_queue_size: int = int(os.getenv("COLLECT_QUEUE_SIZE", "20"))
+    collect_store_batch_size: int = int(os.getenv("COLLECT_STORE_BATCH_SIZE", "50"))
+
     # Supabase
     supabase_url: str = os.getenv("SUPABASE_URL", "")
     supabase_key: str = os.getenv("SUPABASE_SERVICE_ROLE_KEY", os.getenv("SUPABASE_ANON_KEY", ""))
+    # Async client for the request path (routers / ChatKit store); false = sync client in a worker thread
+    supabase_async_enabled: bool = os.getenv("SUPABASE_ASYNC_ENABLED", "true").lower() == "true"
+    # Shared HTTP/2 keep-alive pool of the async client (per event loop)
+    supabase_http_pool_size: int = int(os.getenv("SUPABASE_HTTP_POOL_SIZE", "50"))
+    supabase_http2: bool = os.getenv("SUPABASE_HTTP2", "true").lower() == "true"
+    supabase_http_keepalive_seconds: float = float(os.getenv("SUPABASE_HTTP_KEEPALIVE_SECONDS", "60"))
+    supabase_http_timeout_seconds: float = float(os.getenv("SUPABASE_HTTP_TIMEOUT_SECONDS", "120"))
 
     # Runtime
     environment: str = os.getenv("ENV", os.getenv("ENVIRONMENT", "local"))
@@ -61,6 +78,16 @@ class Settings:
     gemini_fallback_model: str = os.getenv("GEMINI_FALLBACK_MODEL", "gemini-2.5-flash")
     gemini_temperature: float = float(os.getenv("GEMINI_TEMPERATURE", "0.1"))
     gemini_max_tokens: int = int(os.getenv("GEMINI_MAX_TOKENS", "20000"))
+    # Structured extraction: cache the transcript once and run every schema group against it
+    gemini_context_cache_enabled: bool = os.getenv("GEMINI_CONTEXT_CACHE_ENABLED", "true").lower() == "true"
+    gemini_context_cache_min_chars: int = int(os.getenv("GEMINI_CONTEXT_CACHE_MIN_CHARS", "4000"))
+    gemini_context_cache_ttl_seconds: int = int(os.getenv("GEMINI_CONTEXT_CACHE_TTL_SECONDS", "600"))
+    # Structured extraction mode: per_group | merged | adaptive (merged when under the token budget)
+    gemini_extraction_mode: str = os.getenv("GEMINI_EXTRACTION_MODE", "adaptive")
+    gemini_merged_token_budget: int = int(os.getenv("GEMINI_MERGED_TOKEN_BUDGET", "20000"))
+    gemini_extraction_workers: int = int(os.getenv("GEMINI_EXTRACTION_WORKERS", "3"))
+    # Reuse group results when transcript/schema/model/prompt are unchanged (extraction_result_cache table)
+    extraction_result_cache_enabled: bool = os.getenv("EXTRACTION_RESULT_CACHE_ENABLED", "true").lower() == "true"
 
     # Zoho CRM (read-only)
     zoho_accounts_base_url: str = os.getenv("ZOHO_ACCOUNTS_BASE_URL", "https://accounts.zoho.jp")
@@ -73,6 +100,23 @@ class Settings:
     # If not set, field API names will be auto-discovered by display label lookup
     zoho_app_hc_name_field_api: str | None = os.getenv("ZOHO_APP_HC_NAME_FIELD_API") or None
     zoho_app_hc_id_field_api: str | None = os.getenv("ZOHO_APP_HC_ID_FIELD_API") or None
+    zoho_app_hc_email_field_api: str | None = os.getenv("ZOHO_APP_HC_EMAIL_FIELD_API") or None
+    # Process-wide cap on in-flight Zoho requests (org concurrency limit), 429 retries, and pages prefetched per walk
+    zoho_max_concurrency: int = int(os.getenv("ZOHO_MAX_CONCURRENCY", "8"))
+    zoho_max_retries: int = int(os.getenv("ZOHO_MAX_RETRIES", "4"))
+    zoho_page_prefetch: int = int(os.getenv("ZOHO_PAGE_PREFETCH", "4"))
+    # Pooled keep-alive transport for Zoho calls (HTTP/2 only when the h2 package is installed)
+    zoho_http_pool_size: int = int(os.getenv("ZOHO_HTTP_POOL_SIZE", "10"))
+    zoho_http2: bool = os.getenv("ZOHO_HTTP2", "true").lower() == "true"
+    zoho_http_keepalive_seconds: float = float(os.getenv("ZOHO_HTTP_KEEPALIVE_SECONDS", "60"))
+    # Auto-process: in-memory APP-hc name index (COQL export + Modified_Time delta) instead of per-meeting search
+    zoho_candidate_index_enabled: bool = os.getenv("ZOHO_CANDIDATE_INDEX_ENABLED", "true").lower() == "true"
+    zoho_candidate_index_refresh_seconds: int = int(os.getenv("ZOHO_CANDIDATE_INDEX_REFRESH_SECONDS", "300"))
+    zoho_candidate_index_rebuild_seconds: int = int(os.getenv("ZOHO_CANDIDATE_INDEX_REBUILD_SECONDS", "86400"))
+    # Tier 3 分析ツール用 APP-hc レプリカ（差分同期間隔 / 削除反映のための全件再構築間隔）
+    zoho_job_seeker_store_enabled: bool = os.getenv("ZOHO_JOB_SEEKER_STORE_ENABLED", "true").lower() == "true"
+    zoho_job_seeker_store_refresh_seconds: int = int(os.getenv("ZOHO_JOB_SEEKER_STORE_REFRESH_SECONDS", "60"))
+    zoho_job_seeker_store_rebuild_seconds: int = int(os.getenv("ZOHO_JOB_SEEKER_STORE_REBUILD_SECONDS", "21600"))
 
     # Cloud Tasks / Cloud Run
     gcp_project: str = os.getenv("GCP_PROJECT", os.getenv("GOOGLE_CLOUD_PROJECT", ""))
@@ -128,6 +172,10 @@ class Settings:
     local_mcp_gsc_enabled: bool = os.getenv("LOCAL_MCP_GSC_ENABLED", "true").lower() == "true"
     local_mcp_meta_ads_enabled: bool = os.getenv("LOCAL_MCP_META_ADS_ENABLED", "true").lower() == "true"
     mcp_client_timeout_seconds: int = int(os.getenv("MCP_CLIENT_TIMEOUT_SECONDS", "120"))
+    # ADK: keep STDIO MCP servers warm and lease them per request
+    mcp_pool_enabled: bool = os.getenv("MCP_POOL_ENABLED", "true").lower() == "true"
+    mcp_pool_max_size: int = int(os.getenv("MCP_POOL_MAX_SIZE", "4"))
+    mcp_pool_health_check_seconds: int = int(os.getenv("MCP_POOL_HEALTH_CHECK_SECONDS", "60"))
     # Meta Ads MCP authentication (long-lived access token)
     meta_access_token: str = os.getenv("META_ACCESS_TOKEN", "")
 
@@ -167,6 +215,22 @@ class Settings:
     adk_cache_ttl_seconds: int = int(os.getenv("ADK_CACHE_TTL_SECONDS", "1800"))  # 30分
     adk_cache_min_tokens: int = int(os.getenv("ADK_CACHE_MIN_TOKENS", "2048"))
     adk_cache_intervals: int = int(os.getenv("ADK_CACHE_INTERVALS", "10"))
+    # Built orchestrator graphs cached per (model asset, MCP toolsets); 0 disables
+    adk_agent_cache_max_entries: int = int(os.getenv("ADK_AGENT_CACHE_MAX_ENTRIES", "32"))
+    # Log MCP pool / graph cache / tool cache / embedding / Zoho stats at most this often (0 disables)
+    adk_stats_log_interval_seconds: int = int(os.getenv("ADK_STATS_LOG_INTERVAL_SECONDS", "300"))
+    # Cross-session cache of compressed GA4/GSC/Meta insights results
+    tool_result_cache_enabled: bool = os.getenv("TOOL_RESULT_CACHE_ENABLED", "true").lower() == "true"
+    tool_result_cache_closed_ttl_seconds: int = int(os.getenv("TOOL_RESULT_CACHE_CLOSED_TTL_SECONDS", "86400"))
+    tool_result_cache_open_ttl_seconds: int = int(os.getenv("TOOL_RESULT_CACHE_OPEN_TTL_SECONDS", "300"))
+    tool_result_cache_max_entries: int = int(os.getenv("TOOL_RESULT_CACHE_MAX_ENTRIES", "1000"))
+    tool_result_cache_max_bytes: int = int(os.getenv("TOOL_RESULT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    tool_result_cache_supabase_enabled: bool = os.getenv("TOOL_RESULT_CACHE_SUPABASE_ENABLED", "false").lower() == "true"
+
+    # ADK Session Service settings ("supabase" = durable, "memory" = in-process + context_items replay)
+    adk_session_service_type: str = os.getenv("ADK_SESSION_SERVICE_TYPE", "supabase")
+    # Events loaded per turn (tail window; older turns stay in DB)
+    adk_session_tail_events: int = int(os.getenv("ADK_SESSION_TAIL_EVENTS", "200"))
 
     # ADK Memory Service settings
     memory_service_type: str = os.getenv("MEMORY_SERVICE_TYPE", "supabase")
@@ -175,10 +239,27 @@ class Settings:
     memory_max_results: int = int(os.getenv("MEMORY_MAX_RESULTS", "3"))
     memory_embedding_model: str = os.getenv("MEMORY_EMBEDDING_MODEL", "gemini-embedding-001")
     memory_embedding_dimensions: int = int(os.getenv("MEMORY_EMBEDDING_DIMENSIONS", "768"))
+    # Texts per embed_content call when saving sessions (Gemini batch limit is 100)
+    memory_embedding_batch_size: int = int(os.getenv("MEMORY_EMBEDDING_BATCH_SIZE", "50"))
+
+    # Shared query-embedding cache (app/infrastructure/gemini/embedding_service.py)
+    embedding_cache_max_entries: int = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "2048"))
+    # L2 キャッシュ: "supabase" / "sqlite" / "none"
+    embedding_cache_backend: str = os.getenv("EMBEDDING_CACHE_BACKEND", "supabase")
+    embedding_cache_sqlite_path: str = os.getenv("EMBEDDING_CACHE_SQLITE_PATH", "/tmp/embedding_cache.sqlite3")
+    # 同時に来たキャッシュミスを1回の embed_content にまとめる待ち合わせ時間
+    embedding_batch_window_ms: int = int(os.getenv("EMBEDDING_BATCH_WINDOW_MS", "10"))
 
     # Company Database (Google Sheets)
     company_db_spreadsheet_id: str = os.getenv("COMPANY_DB_SPREADSHEET_ID", "")
     company_db_cache_ttl: int = int(os.getenv("COMPANY_DB_CACHE_TTL", "300"))
+    # TTL 経過後もこの秒数までは古いデータを即返し、裏で再取得する（stale-while-revalidate）
+    company_db_cache_stale_ttl: int = int(os.getenv("COMPANY_DB_CACHE_STALE_TTL", "3600"))
+    # Drive の version が変わっていなければ再ダウンロードしない（drive.metadata.readonly が必要）
+    company_db_revision_check: bool = os.getenv("COMPANY_DB_REVISION_CHECK", "true").lower() == "true"
+    # インスタンス間共有キャッシュ: "" (無効) / "supabase" / "file"
+    company_db_shared_cache: str = os.getenv("COMPANY_DB_SHARED_CACHE", "")
+    company_db_shared_cache_path: str = os.getenv("COMPANY_DB_SHARED_CACHE_PATH", "/tmp/company_db_cache")
 
     # LP流入スプレッドシート (SSoT for LP CV data)
     # デフォルトIDはLP申込フォーム用スプシ（SAアクセス: bandq-dx@bandq-dx.iam.gserviceaccount.com）。
@@ -76,6 +76,7 @@ class GeminiClient:
         response_mime_type: str = "application/json",
         return_usage: bool = False,
         model_override: Optional[str] = None,
+        cached_content: Optional[str] = None,
     ) -> Union[Optional[str], GeminiResult]:
         """
         Pro優先。429/5xx/403/404など一部エラー時にFlashへ自動フォールバック。
@@ -87,6 +88,8 @@ class GeminiClient:
             response_mime_type: レスポンスMIMEタイプ
             return_usage: 使用量情報を含む詳細な結果を返すか
             model_override: 使用するモデルの指定（テスト用）
+            cached_content: create_cached_content() で作成したキャッシュ名。
+                キャッシュはモデル固有のため、指定時はフォールバックしない
             
         Returns:
             return_usage=Falseの場合: 生成されたテキスト
@@ -114,10 +117,12 @@ class GeminiClient:
                     max_output_tokens=max_tokens_capped,
                     response_mime_type=response_mime_type,
                     response_schema=schema,
+                    cached_content=cached_content,
                 )
             return types.GenerateContentConfig(
                 temperature=self.temperature,
                 max_output_tokens=max_tokens_capped,
+                cached_content=cached_content,
             )
 
         # --- モデル試行リストを作る ---
@@ -138,7 +143,7 @@ class GeminiClient:
             fallback_model = settings.gemini_fallback_model
             
         models_to_try = [primary]
-        if fallback_model and fallback_model != primary:
+        if fallback_model and fallback_model != primary and not cached_content:
             models_to_try.append(fallback_model)
 
         last_exc: Exception | None = None
@@ -253,6 +258,47 @@ class GeminiClient:
             logger.error("All Gemini API attempts failed, raising last exception: %s", type(last_exc).__name__)
             raise last_exc
     
+    def create_cached_content(
+        self,
+        text: str,
+        system_instruction: Optional[str] = None,
+        ttl_seconds: int = 600,
+        model: Optional[str] = None,
+        display_name: Optional[str] = None,
+    ) -> str:
+        """テキストをGeminiのコンテキストキャッシュに登録し、キャッシュ名を返す
+
+        同じ議事録に対して複数回 generate_content を呼ぶ場合に、入力トークンを
+        1回分のキャッシュ料金に抑えるために使う。
+
+        Args:
+            text: キャッシュする本文（議事録など）
+            system_instruction: キャッシュに含める共通指示
+            ttl_seconds: キャッシュの有効期間（秒）
+            model: キャッシュ対象モデル（未指定時は self.model）
+            display_name: 管理用の表示名
+
+        Returns:
+            generate_content(cached_content=...) に渡すキャッシュ名
+        """
+        cache = self.client.caches.create(
+            model=model or self.model,
+            config=types.CreateCachedContentConfig(
+                display_name=display_name,
+                system_instruction=system_instruction,
+                contents=[types.Content(role="user", parts=[types.Part.from_text(text=text)])],
+                ttl=f"{ttl_seconds}s",
+            ),
+        )
+        return cache.name
+
+    def delete_cached_content(self, name: str) -> None:
+        """コンテキストキャッシュを削除する（失敗してもTTLで消えるため例外は出さない）"""
+        try:
+            self.client.caches.delete(name=name)
+        except Exception as e:
+            logging.getLogger(__name__).warning("Failed to delete Gemini cache name=%s error=%s", name, e)
+
     def read_text_file(self, file_path: str) -> str:
         """テキストファイルを読み込む（文字エンコーディング自動判定）
         
@@ -0,0 +1,383 @@
+"""
+Gemini 埋め込みサービス（共有クライアント + 2層キャッシュ + リクエスト集約）
+
+semantic_company_tools と SupabaseMemoryService が個別に genai.Client を作り、
+同じ検索クエリを毎回埋め込んでいたのを一本化する。
+
+- genai.Client はプロセスで1つだけ生成して使い回す
+- キャッシュキーは (モデル, 次元数, task_type, 正規化済みテキスト)
+- L1: プロセス内 LRU / L2: Supabase テーブルまたはローカル SQLite（デプロイを跨いで残る）
+- 同時に来たキャッシュミスは短い待ち合わせ窓でまとめて1回の embed_content にする
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from google import genai
+
+if TYPE_CHECKING:
+    from app.infrastructure.config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# embed_content の1リクエストあたり上限
+MAX_BATCH = 100
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """全角/半角・連続空白の揺れを吸収する（"リモート可能　WLB" == "リモート可能 WLB"）"""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text or "")).strip()
+
+
+def cache_key(model: str, dimensions: int, task_type: Optional[str], text: str) -> str:
+    payload = json.dumps([model, dimensions, task_type or "", text], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _SupabaseEmbeddingStore:
+    """L2: public.embedding_cache"""
+
+    TABLE = "embedding_cache"
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        from app.infrastructure.supabase.client import get_supabase
+        res = get_supabase().table(self.TABLE).select("cache_key, embedding").in_("cache_key", keys).execute()
+        return {row["cache_key"]: row["embedding"] for row in res.data or []}
+
+    def put_many(self, rows: List[Tuple[str, str, int, Optional[str], List[float]]]) -> None:
+        from app.infrastructure.supabase.client import get_supabase
+        payload = [
+            {"cache_key": key, "model": model, "dimensions": dims, "task_type": task_type, "embedding": vector}
+            for key, model, dims, task_type, vector in rows
+        ]
+        get_supabase().table(self.TABLE).upsert(payload, on_conflict="cache_key", returning="minimal").execute()
+
+
+class _SqliteEmbeddingStore:
+    """L2: ローカル SQLite（Supabase を使わない環境・ローカル開発用）"""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embedding_cache ("
+                "cache_key TEXT PRIMARY KEY, model TEXT, dimensions INTEGER, task_type TEXT, embedding TEXT)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._path, timeout=5)
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        placeholders = ",".join("?" * len(keys))
+        with self._lock, self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT cache_key, embedding FROM embedding_cache WHERE cache_key IN ({placeholders})", keys
+            ).fetchall()
+        return {key: json.loads(vector) for key, vector in rows}
+
+    def put_many(self, rows: List[Tuple[str, str, int, Optional[str], List[float]]]) -> None:
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache VALUES (?, ?, ?, ?, ?)",
+                [(key, model, dims, task_type, json.dumps(vector)) for key, model, dims, task_type, vector in rows],
+            )
+
+
+class _Pending:
+    __slots__ = ("key", "text", "done", "vector", "error")
+
+    def __init__(self, key: str, text: str):
+        self.key = key
+        self.text = text
+        self.done = threading.Event()
+        self.vector: Optional[List[float]] = None
+        self.error: Optional[BaseException] = None
+
+
+class EmbeddingService:
+    """共有埋め込みサービス（スレッドセーフ。async 呼び出し側は aembed / aembed_many を使う）"""
+
+    def __init__(self, settings: "Settings"):
+        self._client = genai.Client(api_key=settings.gemini_api_key)
+        self._max_entries = max(0, settings.embedding_cache_max_entries)
+        self._window = max(0, settings.embedding_batch_window_ms) / 1000
+        self._l1: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # (model, dims, task_type) -> 未送信のキャッシュミス / 送信担当スレッドの有無
+        self._queues: Dict[Tuple[str, int, Optional[str]], List[_Pending]] = {}
+        self._inflight: Dict[str, _Pending] = {}
+        self._flushing: set = set()
+        self._store = self._build_store(settings)
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embed-cache") if self._store else None
+        self._stats: Dict[str, Any] = {
+            "requests": 0,
+            "l1_hits": 0,
+            "l2_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "api_calls": 0,
+            "api_texts": 0,
+            "api_errors": 0,
+            "last_api_ms": 0.0,
+            "total_api_ms": 0.0,
+        }
+        logger.info(
+            f"[Embedding] EmbeddingService initialized "
+            f"(l1={self._max_entries}, l2={settings.embedding_cache_backend or 'none'}, window={self._window * 1000:.0f}ms)"
+        )
+
+    @staticmethod
+    def _build_store(settings: "Settings"):
+        backend = (settings.embedding_cache_backend or "").strip().lower()
+        try:
+            if backend == "supabase":
+                return _SupabaseEmbeddingStore()
+            if backend == "sqlite":
+                return _SqliteEmbeddingStore(settings.embedding_cache_sqlite_path)
+        except Exception as e:
+            logger.warning(f"[Embedding] L2 cache disabled ({backend}): {e}")
+            return None
+        if backend not in ("", "none"):
+            logger.warning(f"[Embedding] Unknown embedding cache backend: {backend}")
+        return None
+
+    # ── public API ──
+
+    def embed(self, text: str, *, model: str, dimensions: int, task_type: Optional[str] = None) -> List[float]:
+        return self.embed_many([text], model=model, dimensions=dimensions, task_type=task_type)[0]
+
+    def embed_many(
+        self,
+        texts: Iterable[str],
+        *,
+        model: str,
+        dimensions: int,
+        task_type: Optional[str] = None,
+        cache: bool = True,
+    ) -> List[List[float]]:
+        """
+        Embed texts, serving repeats from the caches.
+
+        ``cache=False`` skips both cache tiers (for one-off documents such as
+        memory events) but still uses the pooled client.
+        """
+        if not cache:
+            return self._call_api(list(texts), model, dimensions, task_type)
+        texts = [normalize_text(t) for t in texts]
+
+        keys = [cache_key(model, dimensions, task_type, t) for t in texts]
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            self._stats["requests"] += len(keys)
+            for key in keys:
+                vector = self._l1.get(key)
+                if vector is not None:
+                    self._l1.move_to_end(key)
+                    found[key] = vector
+            self._stats["l1_hits"] += len(found)
+
+        missing = list(dict.fromkeys(k for k in keys if k not in found))
+        if missing and self._store is not None:
+            try:
+                remote = self._store.get_many(missing)
+            except Exception as e:
+                logger.warning(f"[Embedding] L2 lookup failed: {e}")
+                remote = {}
+            if remote:
+                with self._lock:
+                    self._stats["l2_hits"] += len(remote)
+                    for key, vector in remote.items():
+                        self._remember(key, vector)
+                found.update(remote)
+                missing = [k for k in missing if k not in remote]
+
+        if missing:
+            text_by_key = dict(zip(keys, texts))
+            found.update(self._fetch(missing, text_by_key, model, dimensions, task_type))
+        return [found[key] for key in keys]
+
+    async def aembed(self, text: str, *, model: str, dimensions: int, task_type: Optional[str] = None) -> List[float]:
+        return await asyncio.to_thread(self.embed, text, model=model, dimensions=dimensions, task_type=task_type)
+
+    async def aembed_many(self, texts: List[str], **kwargs: Any) -> List[List[float]]:
+        return await asyncio.to_thread(self.embed_many, texts, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            s = dict(self._stats)
+            entries = len(self._l1)
+        hits = s["l1_hits"] + s["l2_hits"]
+        return {
+            **s,
+            "l1_entries": entries,
+            "hit_rate": round(hits / s["requests"], 3) if s["requests"] else 0.0,
+            "total_api_ms": round(s["total_api_ms"], 1),
+            "avg_api_ms": round(s["total_api_ms"] / s["api_calls"], 1) if s["api_calls"] else 0.0,
+            "avg_batch_size": round(s["api_texts"] / s["api_calls"], 2) if s["api_calls"] else 0.0,
+        }
+
+    # ── internals ──
+
+    def _remember(self, key: str, vector: List[float]) -> None:
+        """L1 に追加（self._lock 保持中に呼ぶ）"""
+        if not self._max_entries:
+            return
+        self._l1[key] = vector
+        self._l1.move_to_end(key)
+        while len(self._l1) > self._max_entries:
+            self._l1.popitem(last=False)
+
+    def _fetch(
+        self,
+        keys: List[str],
+        text_by_key: Dict[str, str],
+        model: str,
+        dimensions: int,
+        task_type: Optional[str],
+    ) -> Dict[str, List[float]]:
+        """Queue cache misses; one caller per group flushes the queue in batched API calls."""
+        group = (model, dimensions, task_type)
+        waiting: List[_Pending] = []
+        with self._lock:
+            self._stats["misses"] += len(keys)
+            for key in keys:
+                pending = self._inflight.get(key)
+                if pending is not None:
+                    # 別スレッドが同じテキストを埋め込み中
+                    self._stats["coalesced"] += 1
+                else:
+                    pending = self._inflight[key] = _Pending(key, text_by_key[key])
+                    self._queues.setdefault(group, []).append(pending)
+                waiting.append(pending)
+            flusher = group not in self._flushing
+            if flusher:
+                self._flushing.add(group)
+
+        if flusher:
+            self._flush(group)
+
+        result: Dict[str, List[float]] = {}
+        for pending in waiting:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            result[pending.key] = pending.vector
+        return result
+
+    def _flush(self, group: Tuple[str, int, Optional[str]]) -> None:
+        model, dimensions, task_type = group
+        batch: List[_Pending] = []
+        try:
+            if self._window:
+                # 同時に来たミスを同じリクエストに載せるための待ち合わせ
+                time.sleep(self._window)
+            while True:
+                with self._lock:
+                    queue = self._queues.get(group) or []
+                    batch, rest = queue[:MAX_BATCH], queue[MAX_BATCH:]
+                    if rest:
+                        self._queues[group] = rest
+                    else:
+                        self._queues.pop(group, None)
+                    if not batch:
+                        self._flushing.discard(group)
+                        return
+
+                try:
+                    vectors = self._call_api([p.text for p in batch], model, dimensions, task_type)
+                    if len(vectors) != len(batch):
+                        raise RuntimeError(
+                            f"embed_content returned {len(vectors)} vectors for {len(batch)} texts"
+                        )
+                    error = None
+                except Exception as e:
+                    vectors, error = [], e
+
+                with self._lock:
+                    for i, pending in enumerate(batch):
+                        if error is None:
+                            pending.vector = vectors[i]
+                            self._remember(pending.key, pending.vector)
+                        else:
+                            pending.error = error
+                        self._inflight.pop(pending.key, None)
+                for pending in batch:
+                    pending.done.set()
+                done, batch = batch, []
+
+                if error is None and self._writer is not None:
+                    rows = [(p.key, model, dimensions, task_type, p.vector) for p in done]
+                    self._writer.submit(self._write_l2, rows)
+        except BaseException as e:
+            # 想定外の例外でも待機中の呼び出し元を必ず起こし、グループの flush 権を手放す
+            with self._lock:
+                stranded = batch + self._queues.pop(group, [])
+                self._flushing.discard(group)
+                for pending in stranded:
+                    if pending.vector is None and pending.error is None:
+                        pending.error = e
+                    self._inflight.pop(pending.key, None)
+            for pending in stranded:
+                pending.done.set()
+            raise
+
+    def _write_l2(self, rows: List[Tuple[str, str, int, Optional[str], List[float]]]) -> None:
+        try:
+            self._store.put_many(rows)
+        except Exception as e:
+            logger.warning(f"[Embedding] L2 store failed: {e}")
+
+    def _call_api(
+        self, texts: List[str], model: str, dimensions: int, task_type: Optional[str]
+    ) -> List[List[float]]:
+        config: Dict[str, Any] = {"output_dimensionality": dimensions}
+        if task_type:
+            config["task_type"] = task_type
+        started = time.perf_counter()
+        try:
+            result = self._client.models.embed_content(
+                model=f"models/{model}",
+                contents=texts,
+                config=config,
+            )
+        except Exception as e:
+            with self._lock:
+                self._stats["api_errors"] += 1
+            logger.error(f"[Embedding] embed_content failed ({len(texts)} texts): {e}")
+            raise
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self._stats["api_calls"] += 1
+            self._stats["api_texts"] += len(texts)
+            self._stats["last_api_ms"] = round(elapsed_ms, 1)
+            self._stats["total_api_ms"] += elapsed_ms
+        return [list(e.values) for e in result.embeddings]
+
+
+_service: Optional[EmbeddingService] = None
+_service_lock = threading.Lock()
+
+
+def get_embedding_service() -> EmbeddingService:
+    """プロセス共有の EmbeddingService を返す"""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                from app.infrastructure.config.settings import get_settings
+                _service = EmbeddingService(get_settings())
+    return _service
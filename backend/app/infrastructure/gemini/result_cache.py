@@ -0,0 +1,115 @@
+"""
+構造化抽出結果キャッシュ
+
+議事録本文・スキーマ版・グループ（スキーマ本体）・モデル・プロンプトテンプレート版が
+すべて同一であれば抽出結果も同一とみなし、Supabase に保存したグループ単位の結果を再利用する。
+"""
+from __future__ import annotations
+import hashlib
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.infrastructure.supabase.repositories.extraction_result_cache_repository_impl import (
+    ExtractionResultCacheRepositoryImpl,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionResultCache:
+    """グループ単位の抽出結果キャッシュ（ヒット/ミス数はプロセス内で集計）"""
+
+    _lock = threading.Lock()
+    _hits = 0
+    _misses = 0
+    _since = datetime.now(timezone.utc)
+
+    def __init__(self, prompt_version: str, repo: Optional[ExtractionResultCacheRepositoryImpl] = None):
+        self.prompt_version = prompt_version
+        self.repo = repo or ExtractionResultCacheRepositoryImpl()
+
+    def make_key(
+        self,
+        text_content: str,
+        schema_version: str,
+        group_name: str,
+        schema: Dict[str, Any],
+        model: str,
+        candidate_name: Optional[str] = None,
+        agent_name: Optional[str] = None,
+    ) -> str:
+        # 候補者名・エージェント名もプロンプトに埋め込まれるためキーに含める
+        payload = json.dumps(
+            [
+                hashlib.sha256(text_content.encode("utf-8")).hexdigest(),
+                schema_version,
+                group_name,
+                schema,
+                model,
+                self.prompt_version,
+                candidate_name or "",
+                agent_name or "",
+            ],
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def lookup(self, keys: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """グループ名 -> cache_key から、ヒットしたグループの結果を返す"""
+        found = self.repo.get_many(keys.values())
+        hits = {name: found[key] for name, key in keys.items() if key in found}
+        self._record(len(hits), len(keys) - len(hits))
+        if hits:
+            self.repo.touch([keys[name] for name in hits])
+        return hits
+
+    def store(
+        self,
+        keys: Dict[str, str],
+        schema_groups: List[Tuple[Dict[str, Any], str]],
+        result: Dict[str, Any],
+        schema_version: str,
+        models: Dict[str, str],
+    ) -> int:
+        """結果をグループ単位に分割して保存する（抽出できなかったグループは保存しない）
+
+        ``keys`` / ``models`` はグループごとに実際に応答したモデルで作ったものを渡す。
+        """
+        rows = []
+        for schema, name in schema_groups:
+            key = keys.get(name)
+            props = (schema.get("properties") or {}).keys()
+            group_result = {k: result[k] for k in props if k in result}
+            if not key or not group_result:
+                continue
+            rows.append({
+                "cache_key": key,
+                "schema_version": schema_version,
+                "group_name": name,
+                "model": models.get(name),
+                "prompt_version": self.prompt_version,
+                "result": group_result,
+            })
+        self.repo.upsert_many(rows)
+        return len(rows)
+
+    @classmethod
+    def _record(cls, hits: int, misses: int) -> None:
+        with cls._lock:
+            cls._hits += hits
+            cls._misses += misses
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        with cls._lock:
+            total = cls._hits + cls._misses
+            return {
+                "hits": cls._hits,
+                "misses": cls._misses,
+                "hit_rate": round(cls._hits / total, 3) if total else 0.0,
+                "since": cls._since.isoformat(),
+            }
@@ -13,15 +13,116 @@ DDD/オニオンアーキテクチャに従い、以下のように責任を分
 from __future__ import annotations
 import json
 import time
+import hashlib
 import concurrent.futures
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from functools import partial
 from dataclasses import dataclass, asdict
 
 from app.domain.schemas.structured_extraction_schema import StructuredExtractionSchema
+from app.infrastructure.config.settings import get_settings
 from app.infrastructure.gemini.client import GeminiClient
+from app.infrastructure.gemini.result_cache import ExtractionResultCache
+
+
+# 全グループ共通の抽出ルール（コンテキストキャッシュ時は system_instruction として1回だけ送る）
+EXTRACTION_RULES = """【抽出ルール】
+1. テキストに明確に記載されている情報のみを抽出してください。
+2. すべての前提として、推測や補完は行わず、記載がない項目はnullとしてください。不明な情報は必ずnullとしてください。
+3. 複数選択可能な項目は配列形式で記載してください。
+4. 選択リストの場合は、提供された選択肢の中から最も適切なものを選んでください。
+5. 数値項目は適切な型（整数・小数）で記載してください。
+6. 年収などの数値は数字のみを抽出してください（「万円」などの単位は除く）。
+7. 話者情報を参考に、求職者とエージェントの発言を適切に区別して情報を抽出してください。
+"""
+
+# グループ別抽出のプロンプト
+GROUP_PROMPT_TEMPLATE = """
+現在の日付：{current_date}
+
+以下の議事録テキストから、{group_name}に関する情報を構造化して抽出してください。
+{speaker_info}
+【テキスト内容】
+{text_content}
+
+{rules}
+{group_name}の情報のみを構造化されたJSONで回答してください。
+"""
+
+# コンテキストキャッシュ利用時のグループ別プロンプト（本文・話者情報・ルールはキャッシュ側）
+CACHED_GROUP_PROMPT_TEMPLATE = """
+現在の日付：{current_date}
+
+キャッシュ済みの議事録テキストから、{group_name}に関する情報を抽出ルールに従って構造化して抽出してください。
+{group_name}の情報のみを構造化されたJSONで回答してください。
+"""
+
+# 全グループを1回で抽出する merged モードのプロンプト
+MERGED_PROMPT_TEMPLATE = """
+現在の日付：{current_date}
+
+以下の議事録テキストから、次の項目グループに関する情報をまとめて構造化して抽出してください。
+{group_names}
+{speaker_info}
+【テキスト内容】
+{text_content}
+
+{rules}
+すべての項目グループの情報を1つの構造化されたJSONで回答してください。
+"""
+
+# コンテキストキャッシュに登録する system_instruction
+CACHE_SYSTEM_INSTRUCTION_TEMPLATE = (
+    "あなたは議事録から指定された項目を構造化して抽出するアシスタントです。\n"
+    "{speaker_info}\n{rules}"
+)
+
+# 話者情報（候補者名・エージェント名の有無で切り替え）
+SPEAKER_INFO_TEMPLATES = {
+    "both": """
+【話者情報】
+- 求職者名: {candidate_name} (注意: Google Meetでの表示名のため、議事録内では異なる名前で表記されている可能性があります)
+- エージェント名: {agent_name} (注意: 議事録内では異なる名前で表記されている可能性があります)
+- 基本的にエージェント以外の発言は求職者によるものです
+- エージェントの発言は、主催者({agent_name})の発言として識別してください
+""",
+    "candidate": """
+【話者情報】
+- 求職者名: {candidate_name} (注意: Google Meetでの表示名のため、議事録内では異なる名前で表記されている可能性があります)
+- 基本的にエージェント以外の発言は求職者によるものです
+""",
+    "agent": """
+【話者情報】  
+- エージェント名: {agent_name} (注意: 議事録内では異なる名前で表記されている可能性があります)
+- エージェントの発言は、主催者({agent_name})の発言として識別してください
+- 基本的にエージェント以外の発言は求職者によるものです
+""",
+}
+
+# 意味的な変更（テンプレート以外の抽出ロジック変更など）で古い結果を捨てたいときに上げる
+PROMPT_TEMPLATE_REVISION = 1
+# 抽出結果キャッシュのキーに含まれる。上のテンプレート・抽出ルール・既定スキーマの
+# どれかが変われば値が変わり、古い結果は自動的に使われなくなる
+# （グループ個別のスキーマ本体もキャッシュキーに含まれる）
+PROMPT_TEMPLATE_VERSION = f"r{PROMPT_TEMPLATE_REVISION}-" + hashlib.sha256(
+    json.dumps(
+        {
+            "rules": EXTRACTION_RULES,
+            "templates": [
+                GROUP_PROMPT_TEMPLATE,
+                CACHED_GROUP_PROMPT_TEMPLATE,
+                MERGED_PROMPT_TEMPLATE,
+                CACHE_SYSTEM_INSTRUCTION_TEMPLATE,
+            ],
+            "speaker_info": SPEAKER_INFO_TEMPLATES,
+            "schema": StructuredExtractionSchema.get_all_schema_groups(),
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+    ).encode("utf-8")
+).hexdigest()[:12]
 
 
 @dataclass
@@ -37,6 +138,8 @@ class UsageEvent:
     response_chars: Optional[int]
     latency_ms: int
     usage_raw: Optional[Dict[str, Any]]
+    # merged | per_group | per_group_cached
+    extraction_mode: Optional[str] = None
 
 
 class StructuredDataExtractor:
@@ -47,7 +150,8 @@ class StructuredDataExtractor:
         api_key: Optional[str] = None,
         model: Optional[str] = None, 
         temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        result_cache: Optional[ExtractionResultCache] = None,
     ):
         """
         Args:
@@ -55,6 +159,7 @@ class StructuredDataExtractor:
             model: 使用するGeminiモデル
             temperature: 温度パラメータ
             max_tokens: 最大出力トークン数
+            result_cache: 抽出結果キャッシュ（未指定時はキャッシュを使わない）
         """
         self.logger = logging.getLogger(__name__)
         self.gemini_client = GeminiClient(
@@ -64,6 +169,11 @@ class StructuredDataExtractor:
             max_tokens=max_tokens
         )
         self.usage_events: List[UsageEvent] = []
+        self.result_cache = result_cache
+        self.result_cache_hits = 0
+        self.result_cache_misses = 0
+        # グループ名 -> 実際に応答したモデル（フォールバック時はプライマリと異なる）
+        self.answered_models: Dict[str, str] = {}
     
     def extract_structured_data_group(
         self,
@@ -73,6 +183,7 @@ class StructuredDataExtractor:
         candidate_name: Optional[str] = None,
         agent_name: Optional[str] = None,
         max_retries: int = 3,
+        cached_content: Optional[str] = None,
     ) -> Dict[str, Any]:
         """特定のグループのスキーマを使用して構造化データを抽出する
         
@@ -83,6 +194,8 @@ class StructuredDataExtractor:
             candidate_name: 候補者名
             agent_name: エージェント名
             max_retries: 最大リトライ回数
+            cached_content: 議事録を登録したコンテキストキャッシュ名。
+                キャッシュ経由の呼び出しが失敗した場合は通常のプロンプトで再試行する
             
         Returns:
             抽出された構造化データ
@@ -93,25 +206,18 @@ class StructuredDataExtractor:
         # 現在の日付を取得
         current_date = datetime.now().strftime("%Y/%m/%d")
         
-        prompt = f"""
-現在の日付：{current_date}
-
-以下の議事録テキストから、{group_name}に関する情報を構造化して抽出してください。
-{speaker_info}
-【テキスト内容】
-{text_content}
-
-【抽出ルール】
-1. テキストに明確に記載されている情報のみを抽出してください。
-2. すべての前提として、推測や補完は行わず、記載がない項目はnullとしてください。不明な情報は必ずnullとしてください。
-3. 複数選択可能な項目は配列形式で記載してください。
-4. 選択リストの場合は、提供された選択肢の中から最も適切なものを選んでください。
-5. 数値項目は適切な型（整数・小数）で記載してください。
-6. 年収などの数値は数字のみを抽出してください（「万円」などの単位は除く）。
-7. 話者情報を参考に、求職者とエージェントの発言を適切に区別して情報を抽出してください。
-
-{group_name}の情報のみを構造化されたJSONで回答してください。
-"""
+        prompt = GROUP_PROMPT_TEMPLATE.format(
+            current_date=current_date,
+            group_name=group_name,
+            speaker_info=speaker_info,
+            text_content=text_content,
+            rules=EXTRACTION_RULES,
+        )
+        # キャッシュ利用時は議事録本文・話者情報・ルールはキャッシュ側にあるため、グループ指示のみ送る
+        cached_prompt = CACHED_GROUP_PROMPT_TEMPLATE.format(
+            current_date=current_date,
+            group_name=group_name,
+        )
         
         # リトライロジック
         for attempt in range(max_retries):
@@ -119,9 +225,10 @@ class StructuredDataExtractor:
                 self.logger.info(f"Starting Gemini extraction for group: {group_name}, attempt: {attempt + 1}/{max_retries}")
                 # usage 情報を取得するため return_usage=True を指定
                 result = self.gemini_client.generate_content(
-                    prompt=prompt,
+                    prompt=cached_prompt if cached_content else prompt,
                     schema=schema,
-                    return_usage=True
+                    return_usage=True,
+                    cached_content=cached_content,
                 )
                 
                 if result and result.text:
@@ -137,12 +244,15 @@ class StructuredDataExtractor:
                         finish_reason=result.finish_reason,
                         response_chars=len(result.text) if result.text else 0,
                         latency_ms=result.latency_ms,
-                        usage_raw=usage_dict
+                        usage_raw=usage_dict,
+                        extraction_mode="per_group_cached" if cached_content else "per_group",
                     )
                     self.usage_events.append(event)
                     
                     self.logger.info(f"Gemini extraction successful for group: {group_name}, model: {result.model}, tokens: {usage_dict.get('total_token_count')}, latency: {result.latency_ms}ms")
-                    return json.loads(result.text)
+                    data = json.loads(result.text)
+                    self.answered_models[group_name] = result.model
+                    return data
                 else:
                     self.logger.warning(f"Gemini extraction returned empty result for group: {group_name}, attempt: {attempt + 1}")
                     if attempt < max_retries - 1:
@@ -156,6 +266,10 @@ class StructuredDataExtractor:
                     continue
             except Exception as e:
                 self.logger.error(f"Unexpected error for group: {group_name}, attempt: {attempt + 1}, error: {str(e)}")
+                if cached_content:
+                    # キャッシュ失効やキャッシュ非対応エラーの場合に備え、以降は通常プロンプトで再試行
+                    self.logger.warning(f"Disable context cache for group: {group_name} after error")
+                    cached_content = None
                 if attempt < max_retries - 1:
                     time.sleep(2)
                     continue
@@ -167,7 +281,9 @@ class StructuredDataExtractor:
         text_content: str, 
         candidate_name: Optional[str] = None,
         agent_name: Optional[str] = None, 
-        use_parallel: bool = True
+        use_parallel: bool = True,
+        schema_groups: Optional[List[Tuple[Dict[str, Any], str]]] = None,
+        schema_version: Optional[str] = None,
     ) -> Dict[str, Any]:
         """全グループのスキーマを使用して構造化データを抽出する
         
@@ -176,60 +292,297 @@ class StructuredDataExtractor:
             candidate_name: 候補者名
             agent_name: エージェント名
             use_parallel: 並列処理を使用するか
+            schema_groups: (スキーマ, グループ名) のリスト（未指定時はデフォルトスキーマ）
+            schema_version: スキーマ版（指定時かつ result_cache 設定時は抽出結果キャッシュを使う）
             
         Returns:
             すべてのグループから抽出された構造化データ
             
         Note:
-            使用量情報は self.usage_events に記録される
+            使用量情報は self.usage_events に記録される。
+            議事録が十分に長い場合は本文と共通ルールをコンテキストキャッシュに1回だけ登録し、
+            各グループはキャッシュを参照して抽出する（入力トークンの重複課金を回避）。
+            抽出結果キャッシュにヒットしたグループは Gemini を呼ばずに前回の結果を使い、
+            ヒット/ミス数は self.result_cache_hits / self.result_cache_misses に記録される。
         """
-        schema_groups = StructuredExtractionSchema.get_all_schema_groups()
-        combined_result: Dict[str, Any] = {}
+        if schema_groups is None:
+            schema_groups = StructuredExtractionSchema.get_all_schema_groups()
         
         self.logger.info(f"Starting structured data extraction with {len(schema_groups)} groups, parallel={use_parallel}, text_length={len(text_content)}")
         
-        # 使用量イベントをリセット（新しい抽出処理の開始）
+        # 使用量イベント・キャッシュ集計をリセット（新しい抽出処理の開始）
         self.usage_events.clear()
+        self.result_cache_hits = 0
+        self.result_cache_misses = 0
+        self.answered_models = {}
         
-        if use_parallel:
-            extract_func = partial(
-                self._extract_group_wrapper, 
-                text_content, 
-                candidate_name, 
-                agent_name
+        if self.result_cache is None or not schema_version:
+            return self._extract_groups(
+                text_content, schema_groups, candidate_name, agent_name, use_parallel
             )
-            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                futures = [
-                    executor.submit(extract_func, schema, name)
-                    for schema, name in schema_groups
-                ]
-                for fut in concurrent.futures.as_completed(futures):
+        
+        def _keys(groups, models: Dict[str, str]) -> Dict[str, str]:
+            return {
+                name: self.result_cache.make_key(
+                    text_content, schema_version, name, schema, models[name], candidate_name, agent_name
+                )
+                for schema, name in groups
+                if name in models
+            }
+
+        # 参照はプライマリモデルの結果のみ（フォールバックモデルの結果で置き換えない）
+        primary = self.gemini_client.model
+        cache_keys = _keys(schema_groups, {name: primary for _, name in schema_groups})
+        combined_result: Dict[str, Any] = {}
+        cached = self.result_cache.lookup(cache_keys)
+        for group_result in cached.values():
+            combined_result.update(group_result)
+        self.result_cache_hits = len(cached)
+        remaining = [(schema, name) for schema, name in schema_groups if name not in cached]
+        self.result_cache_misses = len(remaining)
+        self.logger.info(
+            f"Extraction result cache: hits={len(cached)} misses={len(remaining)} schema_version={schema_version}"
+        )
+        if not remaining:
+            return combined_result
+        
+        extracted = self._extract_groups(
+            text_content, remaining, candidate_name, agent_name, use_parallel
+        )
+        # 保存は実際に応答したモデルのキーで行う（フォールバックの結果がプライマリのキーに載らないように）
+        self.result_cache.store(
+            _keys(remaining, self.answered_models), remaining, extracted, schema_version, self.answered_models
+        )
+        combined_result.update(extracted)
+        return combined_result
+
+    def _extract_groups(
+        self,
+        text_content: str,
+        schema_groups: List[Tuple[Dict[str, Any], str]],
+        candidate_name: Optional[str],
+        agent_name: Optional[str],
+        use_parallel: bool,
+    ) -> Dict[str, Any]:
+        """merged / グループ別（コンテキストキャッシュ共有）で Gemini から抽出する"""
+        combined_result: Dict[str, Any] = {}
+        if self._should_try_merged(text_content, schema_groups):
+            merged_result = self._extract_merged(
+                text_content, schema_groups, candidate_name, agent_name
+            )
+            if merged_result is not None:
+                return merged_result
+            self.logger.info(f"Merged extraction fell back to per-group fan-out: groups={len(schema_groups)}")
+        
+        cache_name = self._create_transcript_cache(
+            text_content, candidate_name, agent_name, len(schema_groups)
+        )
+        try:
+            if use_parallel:
+                extract_func = partial(
+                    self._extract_group_wrapper, 
+                    text_content, 
+                    candidate_name, 
+                    agent_name,
+                    cache_name,
+                )
+                workers = max(1, get_settings().gemini_extraction_workers)
+                with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(extract_func, schema, name)
+                        for schema, name in schema_groups
+                    ]
+                    for fut in concurrent.futures.as_completed(futures):
+                        try:
+                            combined_result.update(fut.result())
+                        except Exception:
+                            # 個別グループの失敗は握りつぶし、全体の処理を継続
+                            pass
+            else:
+                for schema, group_name in schema_groups:
                     try:
-                        combined_result.update(fut.result())
-                    except Exception:
+                        combined_result.update(
+                            self.extract_structured_data_group(
+                                text_content, schema, group_name, candidate_name, agent_name,
+                                cached_content=cache_name,
+                            )
+                        )
+                    except Exception as e:
                         # 個別グループの失敗は握りつぶし、全体の処理を継続
-                        pass
-        else:
-            for schema, group_name in schema_groups:
-                combined_result.update(
-                    self.extract_structured_data_group(
-                        text_content, schema, group_name, candidate_name, agent_name
-                    )
-                )
+                        self.logger.warning(f"Group extraction failed for {group_name}: {e}")
+        finally:
+            if cache_name:
+                self.gemini_client.delete_cached_content(cache_name)
         
         return combined_result
+
+    @staticmethod
+    def build_merged_schema(schema_groups: List[Tuple[Dict[str, Any], str]]) -> Dict[str, Any]:
+        """全グループのスキーマを1つのレスポンススキーマに統合する
+
+        各グループの結果は元々フラットにマージされるため、properties/required の和集合でよい。
+        """
+        properties: Dict[str, Any] = {}
+        required: List[str] = []
+        for schema, _ in schema_groups:
+            properties.update(schema.get("properties") or {})
+            for key in schema.get("required") or []:
+                if key not in required:
+                    required.append(key)
+        return {"type": "object", "properties": properties, "required": required}
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        # 日本語は概ね1文字1トークン以下のため、文字数を保守的な見積もりとして使う
+        return len(text)
+
+    def _should_try_merged(
+        self,
+        text_content: str,
+        schema_groups: List[Tuple[Dict[str, Any], str]],
+    ) -> bool:
+        """merged（1回呼び出し）モードを試すかどうか
+
+        GEMINI_EXTRACTION_MODE:
+            per_group: 常にグループごとに呼び出す
+            merged: 常に1回呼び出しを試す（失敗時はグループごとにフォールバック）
+            adaptive: 議事録+統合スキーマの見積もりトークンが予算内のときだけ1回呼び出しを試す
+        """
+        settings = get_settings()
+        mode = (settings.gemini_extraction_mode or "per_group").strip().lower()
+        if len(schema_groups) < 2 or mode == "per_group":
+            return False
+        if mode == "merged":
+            return True
+        merged_schema = self.build_merged_schema(schema_groups)
+        estimated = self._estimate_tokens(text_content) + self._estimate_tokens(
+            json.dumps(merged_schema, ensure_ascii=False)
+        )
+        fits = estimated <= settings.gemini_merged_token_budget
+        self.logger.debug(
+            f"Merged extraction budget check: estimated_tokens={estimated}, "
+            f"budget={settings.gemini_merged_token_budget}, fits={fits}"
+        )
+        return fits
+
+    def _extract_merged(
+        self,
+        text_content: str,
+        schema_groups: List[Tuple[Dict[str, Any], str]],
+        candidate_name: Optional[str],
+        agent_name: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        """全グループを1回の構造化出力呼び出しで抽出する
+
+        出力が MAX_TOKENS で打ち切られた場合や JSON として不完全な場合は None を返し、
+        呼び出し側でグループごとの抽出にフォールバックさせる。
+        """
+        group_names = [name for _, name in schema_groups]
+        merged_schema = self.build_merged_schema(schema_groups)
+        speaker_info = self._build_speaker_info(candidate_name, agent_name)
+        current_date = datetime.now().strftime("%Y/%m/%d")
+        prompt = MERGED_PROMPT_TEMPLATE.format(
+            current_date=current_date,
+            group_names="、".join(group_names),
+            speaker_info=speaker_info,
+            text_content=text_content,
+            rules=EXTRACTION_RULES,
+        )
+        try:
+            result = self.gemini_client.generate_content(
+                prompt=prompt,
+                schema=merged_schema,
+                return_usage=True,
+            )
+        except Exception as e:
+            self.logger.warning(f"Merged extraction failed: {e}")
+            return None
+
+        usage_dict = result.usage or {}
+        self.usage_events.append(UsageEvent(
+            group_name=f"merged({len(group_names)} groups)",
+            model=result.model,
+            prompt_token_count=usage_dict.get("prompt_token_count"),
+            candidates_token_count=usage_dict.get("candidates_token_count"),
+            cached_content_token_count=usage_dict.get("cached_content_token_count"),
+            total_token_count=usage_dict.get("total_token_count"),
+            finish_reason=result.finish_reason,
+            response_chars=len(result.text) if result.text else 0,
+            latency_ms=result.latency_ms,
+            usage_raw=usage_dict,
+            extraction_mode="merged",
+        ))
+
+        if "MAX_TOKENS" in str(result.finish_reason or ""):
+            self.logger.warning(f"Merged extraction truncated (finish_reason={result.finish_reason})")
+            return None
+        if not result.text:
+            self.logger.warning("Merged extraction returned empty result")
+            return None
+        try:
+            data = json.loads(result.text)
+        except json.JSONDecodeError as e:
+            self.logger.warning(f"Merged extraction returned incomplete JSON: {e}")
+            return None
+        if not isinstance(data, dict):
+            return None
+        for name in group_names:
+            self.answered_models[name] = result.model
+        self.logger.info(
+            f"Merged extraction successful: groups={len(group_names)}, model={result.model}, "
+            f"tokens={usage_dict.get('total_token_count')}, latency={result.latency_ms}ms"
+        )
+        return data
+
+    def _create_transcript_cache(
+        self,
+        text_content: str,
+        candidate_name: Optional[str],
+        agent_name: Optional[str],
+        group_count: int,
+    ) -> Optional[str]:
+        """議事録・話者情報・共通ルールをコンテキストキャッシュに登録する
+
+        グループが1つしかない場合や、議事録がキャッシュ最小トークン数に満たない
+        可能性が高い場合はキャッシュしない（作成コストの方が高くつくため）。
+        作成に失敗した場合も None を返し、通常のプロンプトで抽出する。
+        """
+        settings = get_settings()
+        if not settings.gemini_context_cache_enabled or group_count < 2:
+            return None
+        if len(text_content) < settings.gemini_context_cache_min_chars:
+            return None
+        speaker_info = self._build_speaker_info(candidate_name, agent_name)
+        system_instruction = CACHE_SYSTEM_INSTRUCTION_TEMPLATE.format(
+            speaker_info=speaker_info,
+            rules=EXTRACTION_RULES,
+        )
+        try:
+            name = self.gemini_client.create_cached_content(
+                text=f"【テキスト内容】\n{text_content}",
+                system_instruction=system_instruction,
+                ttl_seconds=settings.gemini_context_cache_ttl_seconds,
+                display_name="structured-extraction",
+            )
+            self.logger.info(f"Created context cache for extraction: groups={group_count}, text_length={len(text_content)}")
+            return name
+        except Exception as e:
+            self.logger.warning(f"Context cache creation failed, falling back to per-group prompts: {e}")
+            return None
     
     def _extract_group_wrapper(
         self, 
         text_content: str, 
         candidate_name: Optional[str], 
         agent_name: Optional[str], 
+        cached_content: Optional[str],
         schema: Dict[str, Any], 
         group_name: str
     ) -> Dict[str, Any]:
         """並列処理用のラッパー関数"""
         return self.extract_structured_data_group(
-            text_content, schema, group_name, candidate_name, agent_name
+            text_content, schema, group_name, candidate_name, agent_name,
+            cached_content=cached_content,
         )
     
     def _build_speaker_info(
@@ -247,26 +600,13 @@ class StructuredDataExtractor:
             話者情報の文字列
         """
         if candidate_name and agent_name:
-            return f"""
-【話者情報】
-- 求職者名: {candidate_name} (注意: Google Meetでの表示名のため、議事録内では異なる名前で表記されている可能性があります)
-- エージェント名: {agent_name} (注意: 議事録内では異なる名前で表記されている可能性があります)
-- 基本的にエージェント以外の発言は求職者によるものです
-- エージェントの発言は、主催者({agent_name})の発言として識別してください
-"""
+            template = SPEAKER_INFO_TEMPLATES["both"]
         elif candidate_name:
-            return f"""
-【話者情報】
-- 求職者名: {candidate_name} (注意: Google Meetでの表示名のため、議事録内では異なる名前で表記されている可能性があります)
-- 基本的にエージェント以外の発言は求職者によるものです
-"""
+            template = SPEAKER_INFO_TEMPLATES["candidate"]
         elif agent_name:
-            return f"""
-【話者情報】  
-- エージェント名: {agent_name} (注意: 議事録内では異なる名前で表記されている可能性があります)
-- エージェントの発言は、主催者({agent_name})の発言として識別してください
-- 基本的にエージェント以外の発言は求職者によるものです
-"""
-        return ""
+            template = SPEAKER_INFO_TEMPLATES["agent"]
+        else:
+            return ""
+        return template.format(candidate_name=candidate_name, agent_name=agent_name)
 
 
@@ -0,0 +1,185 @@
+"""
+Columnar in-memory index over the company DB sheet.
+
+Built once per cache refresh of ``CompanyDatabaseSheetsService.get_all_companies``
+so agent tools no longer re-parse "35歳" / "600万" strings or substring-scan
+every row on each call. Row sets are Python int bitmasks (bit i = row i), so a
+multi-filter search is a handful of AND operations:
+
+- numeric columns (年収上限/下限, 年齢上限, 経験社数上限) are pre-parsed; range
+  filters are a bisect into a sorted column plus a precomputed suffix mask
+- 業種 / 勤務地 / 学歴要件 / 企業名 keep the tools' partial-match semantics via
+  value-level inverted indexes: a query is tested against the distinct values
+  (far fewer than rows) once and the resulting mask is memoised
+- the remote-work flag is a precomputed mask
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# 年齢上限・経験社数上限が空欄の企業は「上限なし」として扱う
+NO_LIMIT = 99
+
+_REMOTE_MARKERS = ("可", "フル", "相談")
+
+
+def parse_int(value: Any, default: int = 0) -> int:
+    """Parse sheet numbers like "35歳" / "600万" / "1,200" (shared with the company DB tools)."""
+    if value is None or value == "":
+        return default
+    try:
+        if isinstance(value, str):
+            value = value.replace("歳", "").replace("万", "").replace(",", "").strip()
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def is_remote_policy(policy: Any) -> bool:
+    text = str(policy or "")
+    return any(marker in text for marker in _REMOTE_MARKERS)
+
+
+class _ThresholdColumn:
+    """Sorted numeric column answering ``value >= threshold`` as a row mask."""
+
+    def __init__(self, values: List[int]):
+        order = sorted(range(len(values)), key=values.__getitem__)
+        self._sorted = [values[i] for i in order]
+        # _suffix[k] = rows whose value is among the largest len-k values
+        self._suffix = [0] * (len(order) + 1)
+        for k in range(len(order) - 1, -1, -1):
+            self._suffix[k] = self._suffix[k + 1] | (1 << order[k])
+
+    def at_least(self, threshold: int) -> int:
+        return self._suffix[bisect.bisect_left(self._sorted, threshold)]
+
+
+class _SubstringIndex:
+    """Distinct value -> row mask, answering ``query in value`` without a row scan."""
+
+    _MAX_MEMO = 1024
+
+    def __init__(self, values: List[str]):
+        self._by_value: Dict[str, int] = {}
+        for i, value in enumerate(values):
+            self._by_value[value] = self._by_value.get(value, 0) | (1 << i)
+        self._memo: Dict[str, int] = {}
+
+    @property
+    def distinct_values(self) -> List[str]:
+        return [v for v in self._by_value if v]
+
+    def containing(self, query: str) -> int:
+        mask = self._memo.get(query)
+        if mask is None:
+            mask = 0
+            for value, rows in self._by_value.items():
+                if query in value:
+                    mask |= rows
+            if len(self._memo) >= self._MAX_MEMO:
+                self._memo.clear()
+            self._memo[query] = mask
+        return mask
+
+
+class CompanyIndex:
+    """Typed, columnar view of the DB sheet rows (row order is preserved)."""
+
+    def __init__(self, companies: List[Dict[str, Any]]):
+        self.rows = companies
+        n = len(companies)
+        self.all_mask = (1 << n) - 1
+
+        self.names: List[str] = [c.get("企業名", "") or "" for c in companies]
+        self.salary_min: List[int] = [parse_int(c.get("想定年収下限"), 0) for c in companies]
+        self.salary_max: List[int] = [parse_int(c.get("想定年収上限"), 0) for c in companies]
+        self.age_limit: List[int] = [parse_int(c.get("年齢上限"), NO_LIMIT) for c in companies]
+        self.experience_limit: List[int] = [parse_int(c.get("経験社数上限"), NO_LIMIT) for c in companies]
+        self.remote: List[bool] = [is_remote_policy(c.get("リモートワーク")) for c in companies]
+
+        self._salary_max_col = _ThresholdColumn(self.salary_max)
+        self._age_limit_col = _ThresholdColumn(self.age_limit)
+        self.remote_mask = sum(1 << i for i, flag in enumerate(self.remote) if flag)
+
+        self._industry = _SubstringIndex([c.get("業種", "") or "" for c in companies])
+        self._location = _SubstringIndex([c.get("勤務地", "") or "" for c in companies])
+        self._education = _SubstringIndex([c.get("学歴要件", "") or "" for c in companies])
+        self._name = _SubstringIndex(self.names)
+        self._by_exact_name: Dict[str, int] = {}
+        for i, name in enumerate(self.names):
+            self._by_exact_name.setdefault(name, i)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    # ── Row-set primitives ──
+
+    @staticmethod
+    def iter_rows(mask: int) -> Iterator[int]:
+        """Row numbers in ``mask`` in ascending (sheet) order."""
+        # 1ビットずつ落とすと行数に対して二乗になるため、2進文字列を一度だけ走査する
+        for row, bit in enumerate(reversed(bin(mask)[2:])):
+            if bit == "1":
+                yield row
+
+    def industry_mask(self, query: str) -> int:
+        return self._industry.containing(query)
+
+    def location_mask(self, query: str) -> int:
+        return self._location.containing(query)
+
+    def education_mask(self, query: str) -> int:
+        return self._education.containing(query)
+
+    def salary_max_at_least(self, amount: int) -> int:
+        return self._salary_max_col.at_least(amount)
+
+    def age_limit_at_least(self, age: int) -> int:
+        return self._age_limit_col.at_least(age)
+
+    # ── Lookups used by the tools ──
+
+    def filter(
+        self,
+        industry: Optional[str] = None,
+        location: Optional[str] = None,
+        min_salary: Optional[int] = None,
+        max_age: Optional[int] = None,
+        education: Optional[str] = None,
+        remote_only: bool = False,
+    ) -> List[int]:
+        """Rows matching all given filters (same semantics as the former linear scan)."""
+        mask = self.all_mask
+        if industry:
+            mask &= self.industry_mask(industry)
+        if location and mask:
+            mask &= self.location_mask(location)
+        if min_salary and mask:
+            mask &= self.salary_max_at_least(min_salary)
+        if max_age and mask:
+            mask &= self.age_limit_at_least(max_age)
+        if education and mask:
+            mask &= self.education_mask(education)
+        if remote_only and mask:
+            mask &= self.remote_mask
+        return list(self.iter_rows(mask))
+
+    def find_by_name(self, query: str) -> List[int]:
+        """Rows whose 企業名 contains ``query`` (partial match, sheet order)."""
+        return list(self.iter_rows(self._name.containing(query)))
+
+    def get_by_exact_name(self, name: str) -> Optional[Dict[str, Any]]:
+        row = self._by_exact_name.get(name)
+        return self.rows[row] if row is not None else None
+
+    def industries(self) -> List[str]:
+        return sorted(self._industry.distinct_values)
+
+    def locations(self) -> List[str]:
+        return sorted(self._location.distinct_values)
+
+    def salary_range(self, row: int) -> Tuple[int, int]:
+        return self.salary_min[row], self.salary_max[row]
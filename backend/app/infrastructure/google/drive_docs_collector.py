@@ -1,9 +1,11 @@
 from __future__ import annotations
-from typing import List, Optional, Dict, Any, Tuple
+from typing import AsyncIterator, Callable, Iterable, List, Optional, Dict, Any, Tuple
 import re
 import os
 import json
 import logging
+import threading
+import time
 import httplib2
 from google.oauth2.service_account import Credentials
 from google_auth_httplib2 import AuthorizedHttp
@@ -13,7 +15,14 @@ from google.auth.exceptions import RefreshError
 import google.auth
 
 from app.infrastructure.config.settings import get_settings
+from app.infrastructure.google.drive_throttle import (
+    StreamClosed,
+    call_with_backoff,
+    iter_bounded,
+    stream_from_threads,
+)
 from app.domain.entities.meeting_document import MeetingDocument
+from app.infrastructure.supabase.repositories.drive_sync_state_repository_impl import DriveSyncStateRepositoryImpl
 MEETING_RE = re.compile(r"^(?P<title>.+?)\s*-\s*(?P<date>\d{4}/\d{2}/\d{2})\s*(?P<time>\d{1,2}:\d{2})")
 
 SCOPES = [
@@ -21,100 +30,191 @@ SCOPES = [
     "https://www.googleapis.com/auth/documents.readonly",
 ]
 
+GOOGLE_DOC_MIME = "application/vnd.google-apps.document"
+MEET_FOLDER_NAME = "meet recordings"
+CHANGE_FILE_FIELDS = "id,name,mimeType,parents,trashed,createdTime,modifiedTime,owners(emailAddress,displayName),webViewLink"
+
 class DriveDocsCollector:
     def __init__(self) -> None:
         self.settings = get_settings()
         self.logger = logging.getLogger(__name__)
+        self.sync_state_repo = DriveSyncStateRepositoryImpl()
+        # subject -> Changes API token captured during the current run (saved via commit_sync_state)
+        self._pending_page_tokens: Dict[str, str] = {}
+        # subject -> per-run counters (listed / unchanged / exported / throughput)
+        self.stats: Dict[str, Dict[str, Any]] = {}
+
+    async def collect_meeting_docs(
+        self,
+        accounts: Optional[List[str]] = None,
+        include_structure: bool = False,
+        skip_failed_exports: bool = False,
+        full_rescan: bool = False,
+        known_modified_times: Optional[Callable[[str], Dict[str, Optional[str]]]] = None,
+    ) -> List[MeetingDocument]:
+        """Collect meeting docs for each subject into a list (see ``iter_meeting_docs``)."""
+        return [
+            meeting
+            async for meeting in self.iter_meeting_docs(
+                accounts,
+                include_structure=include_structure,
+                skip_failed_exports=skip_failed_exports,
+                full_rescan=full_rescan,
+                known_modified_times=known_modified_times,
+            )
+        ]
+
+    async def iter_meeting_docs(
+        self,
+        accounts: Optional[List[str]] = None,
+        include_structure: bool = False,
+        skip_failed_exports: bool = False,
+        full_rescan: bool = False,
+        known_modified_times: Optional[Callable[[str], Dict[str, Optional[str]]]] = None,
+    ) -> AsyncIterator[MeetingDocument]:
+        """Stream meeting docs for each subject as soon as they are exported.
 
-    async def collect_meeting_docs(self, accounts: Optional[List[str]] = None, include_structure: bool = False, skip_failed_exports: bool = False) -> List[MeetingDocument]:
+        Subjects are collected concurrently in worker threads and documents flow
+        through a bounded queue (``COLLECT_QUEUE_SIZE``), so only a handful of
+        transcripts are held in memory at any time.
+
+        When ``known_modified_times`` is given it is called once per subject and
+        must return the stored ``doc_id -> modifiedTime`` map; docs whose
+        modifiedTime is unchanged are skipped before their body is exported.
+        """
         subjects = accounts or self.settings.impersonate_subjects
-        self.logger.debug("collect_meeting_docs: subjects=%s include_structure=%s", subjects, include_structure)
-        results: List[MeetingDocument] = []
+        self.logger.debug(
+            "iter_meeting_docs: subjects=%s include_structure=%s full_rescan=%s",
+            subjects,
+            include_structure,
+            full_rescan,
+        )
         skipped_accounts: List[str] = []
 
-        # Run each account collection in a separate thread to avoid blocking the event loop
-        import asyncio
-        async def _run_one(subject: str) -> Tuple[str, List[MeetingDocument] | Exception]:
-            try:
-                return subject, await asyncio.to_thread(self._collect_for_account_sync, subject, skip_failed_exports)
-            except Exception as e:
-                return subject, e
-
-        task_results = await asyncio.gather(*[_run_one(s) for s in subjects])
+        def _producer(subject: str) -> Callable[[Callable[[MeetingDocument], None]], None]:
+            def _run(emit: Callable[[MeetingDocument], None]) -> None:
+                try:
+                    self._collect_for_account_sync(
+                        subject,
+                        emit,
+                        skip_failed_exports,
+                        full_rescan,
+                        known_modified_times,
+                    )
+                except StreamClosed:
+                    raise
+                except Exception as e:
+                    skipped_accounts.append(subject)
+                    self.logger.warning("Skip subject due to error: subject=%s error=%s", subject, e)
+            return _run
 
-        for subject, account_result in task_results:
-            if isinstance(account_result, list):
-                results.extend(account_result)
-            else:
-                skipped_accounts.append(subject)
-                self.logger.warning("Skip subject due to error: subject=%s error=%s", subject, account_result)
+        async for meeting in stream_from_threads(
+            [_producer(s) for s in subjects], self.settings.collect_queue_size
+        ):
+            yield meeting
 
         if skipped_accounts:
             self.logger.warning("Skipped accounts: %s", ", ".join(skipped_accounts))
-        return results
 
-    def _collect_for_account_sync(self, subject: str, skip_failed_exports: bool = False) -> List[MeetingDocument]:
-        """Blocking collection logic for a single account, safe to run in a thread."""
-        self.logger.debug("Start collecting for subject=%s (sync)", subject)
+    def commit_sync_state(self, skip_subjects: Iterable[str] = ()) -> None:
+        """Persist the page tokens captured during the last collection.
+
+        Call this only after the collected documents have been stored; subjects
+        whose documents failed to store are left on their previous token so the
+        next incremental run picks the same changes up again.
+        """
+        skip = set(skip_subjects)
+        for subject, token in list(self._pending_page_tokens.items()):
+            if subject in skip:
+                self.logger.info("Keep previous page token for subject=%s (store failures)", subject)
+                continue
+            try:
+                self.sync_state_repo.save_page_token(subject, token)
+                self.logger.debug("Saved page token subject=%s token=%s", subject, token)
+            except Exception as e:
+                self.logger.warning("Failed to save page token subject=%s error=%s", subject, e)
+        self._pending_page_tokens.clear()
+
+    def _collect_for_account_sync(
+        self,
+        subject: str,
+        emit: Callable[[MeetingDocument], None],
+        skip_failed_exports: bool = False,
+        full_rescan: bool = False,
+        known_modified_times: Optional[Callable[[str], Dict[str, Optional[str]]]] = None,
+    ) -> int:
+        """Blocking collection logic for a single account, safe to run in a thread.
+
+        Phase 1 lists file metadata only; phase 2 exports bodies of new or
+        changed docs and hands each one to ``emit``. Returns the emitted count.
+        """
+        self.logger.debug("Start collecting for subject=%s (sync) full_rescan=%s", subject, full_rescan)
         try:
-            drive = self._build_drive(subject)
-            _ = self._build_docs(subject)  # reserved for future use
-            folders = self._list_all_folders(drive)
-            self.logger.debug("Total folders found=%d", len(folders))
-            meet_folders = [fid for fid, meta in folders.items() if meta.get("name", "").lower() == "meet recordings".lower()]
-            if not meet_folders:
-                self.logger.warning("No 'Meet Recordings' folder found for subject=%s", subject)
-                return []
-
-            results: List[MeetingDocument] = []
-            for fid in meet_folders:
-                self.logger.debug("Scanning folder id=%s name=%s", fid, folders.get(fid, {}).get("name"))
-                files = self._list_files_in_folder(drive, fid)
-                self.logger.debug("Files in folder=%d", len(files))
-                for f in files:
-                    mime = f.get("mimeType")
-                    self.logger.debug("File id=%s name=%s mime=%s", f.get("id"), f.get("name"), mime)
-                    if mime != "application/vnd.google-apps.document":
-                        self.logger.debug("Skip non-Google Doc id=%s", f.get("id"))
-                        continue
-                    
-                    # テキスト取得を試行
-                    text = self._export_doc_as_text(drive, f["id"])
-                    if text is None:  # エラーが発生した場合はNoneが返される
-                        self.logger.warning("Failed to export doc as text id=%s name=%s", f.get("id"), f.get("name"))
-                        if skip_failed_exports:
-                            self.logger.info("Skipping document due to text export failure id=%s name=%s", f.get("id"), f.get("name"))
-                            continue
-                        text = ""  # スキップしない場合は空文字列で継続
-                    
-                    self.logger.debug("Exported text length id=%s len=%d", f.get("id"), len(text))
-                    invited = self._get_invited_emails(drive, f["id"]) or []
-                    self.logger.debug("Invited emails count id=%s count=%d", f.get("id"), len(invited))
-                    organizer_name = None
-                    if isinstance(f.get("owners"), list) and f["owners"]:
-                        owner = f["owners"][0]
-                        organizer_name = owner.get("displayName")
-                    title = f.get("name")
-                    meeting_dt = self._parse_meeting_datetime(title) or f.get("modifiedTime")
-                    if meeting_dt == f.get("modifiedTime"):
-                        self.logger.debug("Datetime parsed from modifiedTime id=%s", f.get("id"))
-                    else:
-                        self.logger.debug("Datetime parsed from title id=%s", f.get("id"))
-                    meeting = MeetingDocument(
-                        id=None,
-                        doc_id=f["id"],
-                        title=title,
-                        meeting_datetime=meeting_dt,
-                        organizer_email=subject,
-                        organizer_name=organizer_name,
-                        document_url=f.get("webViewLink"),
-                        invited_emails=invited,
-                        text_content=text,
-                        metadata=f,
-                    )
-                    results.append(meeting)
-            self.logger.debug("Finished subject=%s collected=%d", subject, len(results))
-            return results
+            started = time.monotonic()
+            creds = self._build_credentials(subject)
+            drive = self._build_drive(subject, creds=creds)
+
+            files: Optional[List[Dict[str, Any]]] = None
+            new_token: Optional[str] = None
+            if self.settings.drive_incremental_sync and not full_rescan:
+                token = self.sync_state_repo.get_page_token(subject)
+                if token:
+                    try:
+                        files, new_token = self._list_changed_meet_files(drive, token)
+                        self.logger.info(
+                            "Incremental sync subject=%s changed_docs=%d", subject, len(files)
+                        )
+                    except HttpError as e:
+                        # 期限切れ/不正なトークンなどはフルスキャンで復旧する
+                        self.logger.warning(
+                            "Changes API failed, falling back to full scan subject=%s error=%s",
+                            subject,
+                            e,
+                        )
+                        files = None
+
+            if files is None:
+                # スキャン開始前にトークンを取得し、スキャン中の変更を次回拾えるようにする
+                new_token = self._get_start_page_token(drive)
+                files = self._list_meet_files_full(drive, subject)
+
+            listed = len(files)
+            if known_modified_times is not None:
+                files = self._filter_changed_files(files, subject, known_modified_times)
+            self.stats[subject] = {"listed": listed, "unchanged": listed - len(files)}
+
+            # httplib2.Http はスレッドセーフではないため、ワーカースレッドごとに Drive クライアントを持つ
+            local = threading.local()
+
+            def _export_one(f: Dict[str, Any]) -> Optional[MeetingDocument]:
+                worker_drive = getattr(local, "drive", None)
+                if worker_drive is None:
+                    worker_drive = local.drive = self._build_drive(subject, creds=creds)
+                return self._build_meeting(worker_drive, subject, f, skip_failed_exports)
+
+            exported = 0
+            for meeting in iter_bounded(_export_one, files, self.settings.drive_export_workers):
+                if meeting is not None:
+                    emit(meeting)
+                    exported += 1
+            if new_token:
+                self._pending_page_tokens[subject] = new_token
+            elapsed = time.monotonic() - started
+            self.stats[subject].update(
+                exported=exported,
+                elapsed_sec=round(elapsed, 2),
+                docs_per_sec=round(len(files) / elapsed, 2) if elapsed > 0 else 0.0,
+            )
+            self.logger.info(
+                "Finished subject=%s collected=%d elapsed=%.1fs workers=%d",
+                subject,
+                exported,
+                elapsed,
+                self.settings.drive_export_workers,
+            )
+            return exported
+        except StreamClosed:
+            raise
         except (RefreshError, HttpError) as e:
             self.logger.warning("Auth/API error for subject=%s: %s", subject, e)
             raise
@@ -122,8 +222,94 @@ class DriveDocsCollector:
             self.logger.error("Unexpected error for subject=%s: %s", subject, e)
             raise
 
-    def _build_drive(self, subject: Optional[str]):
-        creds = self._build_credentials(subject)
+    def _list_meet_files_full(self, drive, subject: str) -> List[Dict[str, Any]]:
+        folders = self._list_all_folders(drive)
+        self.logger.debug("Total folders found=%d", len(folders))
+        meet_folders = [fid for fid, meta in folders.items() if meta.get("name", "").lower() == MEET_FOLDER_NAME]
+        if not meet_folders:
+            self.logger.warning("No 'Meet Recordings' folder found for subject=%s", subject)
+            return []
+        files: List[Dict[str, Any]] = []
+        for fid in meet_folders:
+            self.logger.debug("Scanning folder id=%s name=%s", fid, folders.get(fid, {}).get("name"))
+            folder_files = self._list_files_in_folder(drive, fid)
+            self.logger.debug("Files in folder=%d", len(folder_files))
+            files.extend(folder_files)
+        return files
+
+    def _filter_changed_files(
+        self,
+        files: List[Dict[str, Any]],
+        subject: str,
+        known_modified_times: Callable[[str], Dict[str, Optional[str]]],
+    ) -> List[Dict[str, Any]]:
+        try:
+            known = known_modified_times(subject)
+        except Exception as e:
+            # 既存マップが取れない場合は全件を変更ありとして扱う
+            self.logger.warning("Failed to load known modifiedTime map subject=%s error=%s", subject, e)
+            return files
+        changed = [
+            f for f in files
+            if not f.get("modifiedTime") or known.get(f.get("id")) != f.get("modifiedTime")
+        ]
+        self.logger.info(
+            "Metadata diff subject=%s listed=%d changed=%d", subject, len(files), len(changed)
+        )
+        return changed
+
+    def _build_meeting(
+        self,
+        drive,
+        subject: str,
+        f: Dict[str, Any],
+        skip_failed_exports: bool,
+    ) -> Optional[MeetingDocument]:
+        mime = f.get("mimeType")
+        self.logger.debug("File id=%s name=%s mime=%s", f.get("id"), f.get("name"), mime)
+        if mime != GOOGLE_DOC_MIME:
+            self.logger.debug("Skip non-Google Doc id=%s", f.get("id"))
+            return None
+
+        # テキスト取得を試行
+        text = self._export_doc_as_text(drive, f["id"])
+        if text is None:  # エラーが発生した場合はNoneが返される
+            self.logger.warning("Failed to export doc as text id=%s name=%s", f.get("id"), f.get("name"))
+            if skip_failed_exports:
+                self.logger.info("Skipping document due to text export failure id=%s name=%s", f.get("id"), f.get("name"))
+                return None
+            text = ""  # スキップしない場合は空文字列で継続
+
+        self.logger.debug("Exported text length id=%s len=%d", f.get("id"), len(text))
+        invited = self._get_invited_emails(drive, f["id"]) or []
+        self.logger.debug("Invited emails count id=%s count=%d", f.get("id"), len(invited))
+        organizer_name = None
+        if isinstance(f.get("owners"), list) and f["owners"]:
+            owner = f["owners"][0]
+            organizer_name = owner.get("displayName")
+        title = f.get("name")
+        meeting_dt = self._parse_meeting_datetime(title) or f.get("modifiedTime")
+        if meeting_dt == f.get("modifiedTime"):
+            self.logger.debug("Datetime parsed from modifiedTime id=%s", f.get("id"))
+        else:
+            self.logger.debug("Datetime parsed from title id=%s", f.get("id"))
+        # 変更検知用の parents はメタデータに保存しない（フルスキャン時と形を揃える）
+        metadata = {k: v for k, v in f.items() if k not in ("parents", "trashed")}
+        return MeetingDocument(
+            id=None,
+            doc_id=f["id"],
+            title=title,
+            meeting_datetime=meeting_dt,
+            organizer_email=subject,
+            organizer_name=organizer_name,
+            document_url=f.get("webViewLink"),
+            invited_emails=invited,
+            text_content=text,
+            metadata=metadata,
+        )
+
+    def _build_drive(self, subject: Optional[str], creds=None):
+        creds = creds or self._build_credentials(subject)
         http = httplib2.Http(timeout=300)
         authorized_http = AuthorizedHttp(creds, http=http)
         return build("drive", "v3", http=authorized_http, cache_discovery=False)
@@ -196,9 +382,75 @@ class DriveDocsCollector:
                 break
         return files
 
+    def _get_start_page_token(self, drive) -> Optional[str]:
+        try:
+            resp = drive.changes().getStartPageToken(supportsAllDrives=True).execute()
+            return resp.get("startPageToken")
+        except Exception as e:
+            # トークンが取れなくても収集自体は継続する（次回もフルスキャン）
+            self.logger.warning("Failed to get start page token error=%s", e)
+            return None
+
+    def _list_changed_meet_files(self, drive, page_token: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """List Google Docs in 'Meet Recordings' folders changed since ``page_token``.
+
+        Returns the changed file metadata and the token for the next run.
+        """
+        changed: Dict[str, Dict[str, Any]] = {}
+        new_start_token: Optional[str] = None
+        token: Optional[str] = page_token
+        while token:
+            resp = (
+                drive.changes().list(
+                    pageToken=token,
+                    fields=f"nextPageToken, newStartPageToken, changes(fileId,removed,file({CHANGE_FILE_FIELDS}))",
+                    pageSize=1000,
+                    spaces="drive",
+                    includeItemsFromAllDrives=True,
+                    supportsAllDrives=True,
+                ).execute()
+            )
+            for change in resp.get("changes", []):
+                f = change.get("file")
+                if change.get("removed") or not f:
+                    continue
+                if f.get("trashed") or f.get("mimeType") != GOOGLE_DOC_MIME:
+                    continue
+                # 同じファイルが複数回変更された場合は最後の状態を採用
+                changed[f["id"]] = f
+            token = resp.get("nextPageToken")
+            new_start_token = resp.get("newStartPageToken") or new_start_token
+
+        folder_names: Dict[str, Optional[str]] = {}
+        files: List[Dict[str, Any]] = []
+        for f in changed.values():
+            for parent_id in f.get("parents") or []:
+                if parent_id not in folder_names:
+                    folder_names[parent_id] = self._get_folder_name(drive, parent_id)
+                if (folder_names[parent_id] or "").lower() == MEET_FOLDER_NAME:
+                    files.append(f)
+                    break
+        self.logger.debug(
+            "Changes API: changed_docs=%d meet_docs=%d parent_lookups=%d",
+            len(changed),
+            len(files),
+            len(folder_names),
+        )
+        return files, new_start_token
+
+    def _get_folder_name(self, drive, folder_id: str) -> Optional[str]:
+        try:
+            meta = drive.files().get(fileId=folder_id, fields="id,name", supportsAllDrives=True).execute()
+            return meta.get("name")
+        except Exception as e:
+            self.logger.debug("Failed to fetch folder name id=%s error=%s", folder_id, e)
+            return None
+
     def _export_doc_as_text(self, drive, file_id: str) -> Optional[str]:
         try:
-            data = drive.files().export(fileId=file_id, mimeType="text/plain").execute()
+            data = call_with_backoff(
+                lambda: drive.files().export(fileId=file_id, mimeType="text/plain").execute()
+            )
             return data.decode("utf-8")
         except Exception as e:
             self.logger.error("Failed to export doc as text id=%s error=%s", file_id, e)
@@ -206,7 +458,9 @@ class DriveDocsCollector:
 
     def _get_invited_emails(self, drive, file_id: str) -> list[str]:
         try:
-            perms = drive.permissions().list(fileId=file_id, fields="permissions(emailAddress)" ,supportsAllDrives=True).execute()
+            perms = call_with_backoff(
+                lambda: drive.permissions().list(fileId=file_id, fields="permissions(emailAddress)", supportsAllDrives=True).execute()
+            )
             emails = [p.get("emailAddress") for p in perms.get("permissions", []) if p.get("emailAddress")]
             return list(sorted(set(emails)))
         except Exception as e:
@@ -0,0 +1,187 @@
+"""
+Bounded concurrency, rate-limit backoff and streaming helpers for Drive collectors.
+
+Collectors fan export/permission calls out over a small per-account worker
+pool. A process-wide semaphore caps the number of in-flight Drive requests
+across all accounts, and 429 / ``userRateLimitExceeded`` responses are retried
+with exponential backoff (the slot is released while sleeping). Documents are
+handed from the blocking worker threads to the event loop through a bounded
+queue so that callers can store them while collection is still running.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import AsyncIterator, Callable, Iterable, Iterator, Optional, Sequence, Set, TypeVar
+
+from googleapiclient.errors import HttpError
+
+from app.infrastructure.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_RATE_LIMIT_REASONS = {"userRateLimitExceeded", "rateLimitExceeded", "backendError"}
+_RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+_global_slots: Optional[threading.BoundedSemaphore] = None
+_global_slots_lock = threading.Lock()
+
+
+def _get_global_slots() -> threading.BoundedSemaphore:
+    global _global_slots
+    if _global_slots is None:
+        with _global_slots_lock:
+            if _global_slots is None:
+                limit = max(1, get_settings().drive_global_concurrency)
+                _global_slots = threading.BoundedSemaphore(limit)
+    return _global_slots
+
+
+def _error_reason(error: HttpError) -> Optional[str]:
+    try:
+        content = json.loads(error.content.decode("utf-8"))
+        errors = content.get("error", {}).get("errors") or []
+        if errors:
+            return errors[0].get("reason")
+    except Exception:
+        pass
+    return None
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """Return True for Drive errors that should be retried with backoff."""
+    if not isinstance(error, HttpError):
+        return False
+    status = getattr(error.resp, "status", None)
+    if status in _RETRYABLE_STATUSES:
+        return True
+    return status == 403 and _error_reason(error) in _RATE_LIMIT_REASONS
+
+
+def call_with_backoff(
+    fn: Callable[[], T],
+    *,
+    max_retries: Optional[int] = None,
+    base_delay: float = 1.0,
+    max_delay: float = 32.0,
+) -> T:
+    """Run ``fn`` under the global concurrency cap, retrying rate-limit errors."""
+    retries = get_settings().drive_max_retries if max_retries is None else max_retries
+    slots = _get_global_slots()
+    attempt = 0
+    while True:
+        with slots:
+            try:
+                return fn()
+            except Exception as e:
+                if attempt >= retries or not is_rate_limited(e):
+                    raise
+                error = e
+        delay = min(max_delay, base_delay * (2 ** attempt)) + random.uniform(0, 1)
+        attempt += 1
+        logger.info(
+            "Drive rate limited, retrying in %.1fs (attempt %d/%d): %s",
+            delay,
+            attempt,
+            retries,
+            error,
+        )
+        time.sleep(delay)
+
+
+def iter_bounded(fn: Callable[[T], R], items: Iterable[T], max_workers: int) -> Iterator[R]:
+    """Apply ``fn`` to ``items`` on a bounded thread pool, yielding results as they complete.
+
+    At most ``2 * max_workers`` calls are in flight, so finished results do not
+    pile up in memory when the consumer is slower than the workers.
+    """
+    workers = max(1, max_workers)
+    if workers == 1:
+        for item in items:
+            yield fn(item)
+        return
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="drive-export")
+    pending: Set[Future] = set()
+    try:
+        for item in items:
+            pending.add(pool.submit(fn, item))
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+class StreamClosed(Exception):
+    """Raised inside a producer thread when the consumer stopped reading."""
+
+
+async def stream_from_threads(
+    producers: Sequence[Callable[[Callable[[T], None]], None]],
+    queue_size: int,
+) -> AsyncIterator[T]:
+    """Run blocking ``producers`` in threads and yield what they emit.
+
+    Each producer receives an ``emit`` callback; ``emit`` blocks while the
+    bounded queue is full, which keeps the number of buffered items constant.
+    The first producer exception is re-raised after the queue is drained.
+
+    Producers get their own thread per producer rather than the loop's default
+    executor: a producer blocked in ``emit`` must never take the thread the
+    consumer needs (e.g. ``asyncio.to_thread`` for storing a batch) to drain
+    the queue.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, queue_size))
+    stop = threading.Event()
+    sentinel = object()
+
+    def emit(item: T) -> None:
+        if stop.is_set():
+            raise StreamClosed()
+        asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+    pool = ThreadPoolExecutor(max_workers=max(1, len(producers)), thread_name_prefix="drive-producer")
+
+    async def _run_all():
+        try:
+            return await asyncio.gather(
+                *[loop.run_in_executor(pool, p, emit) for p in producers], return_exceptions=True
+            )
+        finally:
+            pool.shutdown(wait=False)
+            await queue.put(sentinel)
+
+    runner = asyncio.create_task(_run_all())
+    finished = False
+    try:
+        while True:
+            item = await queue.get()
+            if item is sentinel:
+                finished = True
+                break
+            yield item
+    finally:
+        if not finished:
+            # 呼び出し側が途中で抜けた: 生産者を止め、ブロック中の put を解放するまで読み捨てる
+            stop.set()
+            while await queue.get() is not sentinel:
+                pass
+    results = await runner
+    errors = [r for r in results if isinstance(r, BaseException) and not isinstance(r, StreamClosed)]
+    if errors:
+        raise errors[0]
@@ -3,19 +3,33 @@ Google Sheets Service for Company Database.
 
 Provides read-only access to the company information spreadsheet
 with in-memory caching for performance.
+
+The cache serves stale data while a background thread revalidates it
+(stale-while-revalidate), dedups concurrent refreshes of the same key,
+skips re-downloading when the spreadsheet's Drive ``version`` is unchanged,
+and can share payloads across instances via Supabase or a local file so
+cold instances start warm.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
 
+from app.infrastructure.google.company_index import CompanyIndex
+
 if TYPE_CHECKING:
     from app.infrastructure.config.settings import Settings
 
@@ -23,36 +37,168 @@ logger = logging.getLogger(__name__)
 
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets.readonly",
+    # modifiedTime / version の確認のみ（ファイル内容は読まない）
+    "https://www.googleapis.com/auth/drive.metadata.readonly",
 ]
 
+# 失敗したバックグラウンド更新を再試行するまでの待ち時間（秒）
+_REFRESH_RETRY_SECONDS = 30
+# 同一リフレッシュ周期内の Drive バージョン確認をまとめる時間（秒）
+_VERSION_MEMO_SECONDS = 5
+
+_refresh_pool: Optional[ThreadPoolExecutor] = None
+_refresh_pool_lock = threading.Lock()
+
+
+def _get_refresh_pool() -> ThreadPoolExecutor:
+    global _refresh_pool
+    if _refresh_pool is None:
+        with _refresh_pool_lock:
+            if _refresh_pool is None:
+                _refresh_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sheets-refresh")
+    return _refresh_pool
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    fetched_at: float  # time.time() of the last download or revalidation
+    version: Optional[str] = None  # Drive version the value was downloaded at
+    retry_after: float = 0.0
+
+
+class SheetsSharedCacheStore(ABC):
+    """Cross-instance tier for SheetsDataCache (payload + Drive version per key)."""
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[_CacheEntry]:
+        """Return the stored entry for ``key`` (None when missing or unreadable)."""
+
+    @abstractmethod
+    def save(self, key: str, entry: _CacheEntry) -> None:
+        """Store ``entry`` under ``key``; failures are logged, not raised."""
+
+
+class SupabaseSheetsCacheStore(SheetsSharedCacheStore):
+    """Stores payloads in the ``sheets_data_cache`` table."""
+
+    TABLE = "sheets_data_cache"
+
+    def load(self, key: str) -> Optional[_CacheEntry]:
+        try:
+            from app.infrastructure.supabase.client import get_supabase
+            res = (
+                get_supabase().table(self.TABLE)
+                .select("payload, version, fetched_at")
+                .eq("cache_key", key)
+                .limit(1)
+                .execute()
+            )
+            rows = res.data or []
+            if not rows:
+                return None
+            fetched_at = datetime.fromisoformat(rows[0]["fetched_at"].replace("Z", "+00:00")).timestamp()
+            return _CacheEntry(rows[0]["payload"], fetched_at, rows[0].get("version"))
+        except Exception as e:
+            logger.warning(f"[SheetsCache] Supabase shared cache lookup failed: {e}")
+            return None
+
+    def save(self, key: str, entry: _CacheEntry) -> None:
+        try:
+            from app.infrastructure.supabase.client import get_supabase
+            row = {
+                "cache_key": key,
+                "payload": entry.value,
+                "version": entry.version,
+                "fetched_at": datetime.fromtimestamp(entry.fetched_at, timezone.utc).isoformat(),
+            }
+            get_supabase().table(self.TABLE).upsert(row, on_conflict="cache_key", returning="minimal").execute()
+        except Exception as e:
+            logger.warning(f"[SheetsCache] Supabase shared cache store failed: {e}")
+
+
+class FileSheetsCacheStore(SheetsSharedCacheStore):
+    """Stores payloads as JSON files (e.g. a volume shared by instances on one host)."""
+
+    def __init__(self, directory: str):
+        self._dir = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._dir, hashlib.sha256(key.encode()).hexdigest()[:32] + ".json")
+
+    def load(self, key: str) -> Optional[_CacheEntry]:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                data = json.load(f)
+            return _CacheEntry(data["payload"], data["fetched_at"], data.get("version"))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"[SheetsCache] File shared cache lookup failed: {e}")
+            return None
+
+    def save(self, key: str, entry: _CacheEntry) -> None:
+        try:
+            os.makedirs(self._dir, exist_ok=True)
+            path = self._path(key)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"payload": entry.value, "fetched_at": entry.fetched_at, "version": entry.version}, f, ensure_ascii=False)
+            os.replace(tmp, path)  # 読み手が書きかけのファイルを見ないようにする
+        except Exception as e:
+            logger.warning(f"[SheetsCache] File shared cache store failed: {e}")
+
 
 class SheetsDataCache:
-    """TTL-based in-memory cache for spreadsheet data."""
+    """
+    TTL-based in-memory cache for spreadsheet data.
+
+    ``get``/``set`` keep plain TTL semantics. ``get_or_load`` adds
+    stale-while-revalidate, single-flight loading, Drive version checks and
+    the optional shared tier.
+    """
 
-    def __init__(self, ttl_seconds: int = 300):
+    def __init__(
+        self,
+        ttl_seconds: int = 300,
+        stale_seconds: int = 0,
+        shared_store: Optional[SheetsSharedCacheStore] = None,
+        shared_namespace: str = "",
+    ):
         """
         Initialize cache.
 
         Args:
             ttl_seconds: Cache TTL in seconds (default 5 minutes).
+            stale_seconds: How long past the TTL ``get_or_load`` may serve a
+                stale value while refreshing it in the background.
+            shared_store: Optional cross-instance tier.
+            shared_namespace: Prefix for shared keys (e.g. the spreadsheet ID).
         """
-        self._cache: Dict[str, tuple[Any, datetime]] = {}
-        self._ttl = timedelta(seconds=ttl_seconds)
+        self._cache: Dict[str, _CacheEntry] = {}
+        self._ttl = ttl_seconds
+        self._stale = max(0, stale_seconds)
+        self._shared = shared_store
+        self._namespace = shared_namespace
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, threading.Event] = {}
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "shared_hits": 0,
+                       "downloads": 0, "revalidated": 0, "refresh_errors": 0}
 
     def get(self, key: str) -> Optional[Any]:
         """Get cached value if not expired."""
-        if key in self._cache:
-            data, timestamp = self._cache[key]
-            if datetime.now() - timestamp < self._ttl:
+        entry = self._cache.get(key)
+        if entry is not None:
+            if time.time() - entry.fetched_at < self._ttl:
                 logger.debug(f"[SheetsCache] Cache hit: {key}")
-                return data
-            del self._cache[key]
+                return entry.value
+            self._cache.pop(key, None)
             logger.debug(f"[SheetsCache] Cache expired: {key}")
         return None
 
     def set(self, key: str, value: Any) -> None:
         """Set cache value with current timestamp."""
-        self._cache[key] = (value, datetime.now())
+        self._cache[key] = _CacheEntry(value, time.time())
         logger.debug(f"[SheetsCache] Cache set: {key}")
 
     def invalidate(self, key: Optional[str] = None) -> None:
@@ -64,6 +210,160 @@ class SheetsDataCache:
             self._cache.clear()
             logger.debug("[SheetsCache] All cache invalidated")
 
+    def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        version: Optional[Callable[[], Optional[str]]] = None,
+        force_refresh: bool = False,
+    ) -> Any:
+        """
+        Return the cached value, loading it if needed.
+
+        - fresh: returned as-is
+        - stale (within ``stale_seconds`` past the TTL): returned immediately,
+          and one background refresh is scheduled
+        - missing/expired: the shared tier is consulted, then the value is
+          loaded synchronously; concurrent callers wait for the same load
+
+        ``version`` returns the spreadsheet's current Drive version; when it
+        matches the cached entry's, the entry is revalidated without calling
+        ``loader``. Loader errors propagate only when nothing can be served.
+        """
+        now = time.time()
+        entry = self._cache.get(key)
+        if entry is None and self._shared is not None and not force_refresh:
+            entry = self._load_shared(key)
+
+        if entry is not None and not force_refresh:
+            age = now - entry.fetched_at
+            if age < self._ttl:
+                self._count("hits")
+                return entry.value
+            if age < self._ttl + self._stale:
+                self._count("stale_hits")
+                if now >= entry.retry_after:
+                    self._schedule_refresh(key, loader, version)
+                return entry.value
+
+        self._count("misses")
+        return self._refresh(key, loader, version, force=force_refresh, wait=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "entries": len(self._cache)}
+
+    # ── internals ──
+
+    def _count(self, name: str) -> None:
+        # バックグラウンド更新スレッドからも呼ばれるのでロック下で加算する
+        with self._lock:
+            self._stats[name] += 1
+
+    def _shared_key(self, key: str) -> str:
+        return f"{self._namespace}:{key}" if self._namespace else key
+
+    def _load_shared(self, key: str) -> Optional[_CacheEntry]:
+        entry = self._shared.load(self._shared_key(key))
+        if entry is not None:
+            self._count("shared_hits")
+            self._cache.setdefault(key, entry)
+            logger.debug(f"[SheetsCache] Shared cache hit: {key}")
+        return self._cache.get(key)
+
+    def _schedule_refresh(self, key: str, loader: Callable[[], Any], version) -> None:
+        with self._lock:
+            if key in self._inflight:
+                return
+            self._inflight[key] = threading.Event()
+        try:
+            _get_refresh_pool().submit(self._refresh, key, loader, version, False, False, True)
+        except RuntimeError:
+            # インタプリタ終了中などで投入できない場合は次回アクセス時に再試行
+            self._finish(key)
+
+    def _refresh(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        version,
+        force: bool,
+        wait: bool,
+        owned: bool = False,
+    ) -> Any:
+        """Single-flight revalidate/download of ``key``; returns the resulting value."""
+        if not owned:
+            with self._lock:
+                event = self._inflight.get(key)
+                if event is None:
+                    self._inflight[key] = threading.Event()
+                    owned = True
+            if not owned:
+                if not wait:
+                    return None
+                event.wait()
+                entry = self._cache.get(key)
+                if entry is not None and not force:
+                    return entry.value
+                # 先行ロードが失敗した（または強制更新）場合は自分でロードする
+                return self._refresh(key, loader, version, force, wait)
+
+        try:
+            return self._revalidate_or_download(key, loader, version, force)
+        except Exception as e:
+            self._count("refresh_errors")
+            entry = self._cache.get(key)
+            if entry is None or (wait and force):
+                raise
+            entry.retry_after = time.time() + _REFRESH_RETRY_SECONDS
+            logger.warning(f"[SheetsCache] Refresh failed for {key}, serving stale data: {e}")
+            return entry.value
+        finally:
+            self._finish(key)
+
+    def _revalidate_or_download(self, key: str, loader, version, force: bool) -> Any:
+        current = None
+        if version is not None:
+            try:
+                current = version()
+            except Exception as e:
+                logger.debug(f"[SheetsCache] Version check failed for {key}: {e}")
+
+        entry = self._cache.get(key)
+        if not force and entry is not None and current and entry.version == current:
+            entry.fetched_at = time.time()
+            entry.retry_after = 0.0
+            self._count("revalidated")
+            logger.debug(f"[SheetsCache] Unchanged (version {current}), revalidated: {key}")
+            return entry.value
+
+        value = loader()
+        new_entry = _CacheEntry(value, time.time(), current)
+        self._cache[key] = new_entry
+        self._count("downloads")
+        logger.debug(f"[SheetsCache] Cache set: {key} (version {current})")
+        if self._shared is not None:
+            self._shared.save(self._shared_key(key), new_entry)
+        return value
+
+    def _finish(self, key: str) -> None:
+        with self._lock:
+            event = self._inflight.pop(key, None)
+        if event is not None:
+            event.set()
+
+
+def build_shared_cache_store(kind: str, path: str) -> Optional[SheetsSharedCacheStore]:
+    """Build the shared tier selected by COMPANY_DB_SHARED_CACHE ("supabase" / "file" / "")."""
+    kind = (kind or "").strip().lower()
+    if kind == "supabase":
+        return SupabaseSheetsCacheStore()
+    if kind == "file":
+        return FileSheetsCacheStore(path)
+    if kind not in ("", "none"):
+        logger.warning(f"[SheetsCache] Unknown shared cache type: {kind}")
+    return None
+
 
 class CompanyDatabaseSheetsService:
     """
@@ -88,9 +388,22 @@ class CompanyDatabaseSheetsService:
             settings: Application settings with SERVICE_ACCOUNT_JSON and spreadsheet config.
         """
         self._settings = settings
-        self._cache = SheetsDataCache(ttl_seconds=settings.company_db_cache_ttl)
-        self._sheets = None
         self._spreadsheet_id = settings.company_db_spreadsheet_id
+        self._cache = SheetsDataCache(
+            ttl_seconds=settings.company_db_cache_ttl,
+            stale_seconds=settings.company_db_cache_stale_ttl,
+            shared_store=build_shared_cache_store(
+                settings.company_db_shared_cache, settings.company_db_shared_cache_path
+            ),
+            shared_namespace=self._spreadsheet_id,
+        )
+        self._creds: Optional[Credentials] = None
+        # httplib2.Http はスレッドセーフではないため、スレッドごとに API クライアントを持つ
+        # （バックグラウンド更新スレッドとツール呼び出しスレッドが同時に使うため）
+        self._local = threading.local()
+        self._version_memo: Optional[tuple[float, Optional[str]]] = None
+        # Columnar index over the cached DB rows (rebuilt when the cached list changes)
+        self._company_index: Optional[CompanyIndex] = None
 
         if not self._spreadsheet_id:
             logger.warning("[SheetsService] COMPANY_DB_SPREADSHEET_ID is not set")
@@ -134,14 +447,69 @@ class CompanyDatabaseSheetsService:
             raise
 
     def _build_service(self):
-        """Build or return cached Sheets API service."""
-        if self._sheets:
-            return self._sheets
-
-        creds = self._build_credentials()
-        self._sheets = build("sheets", "v4", credentials=creds, cache_discovery=False)
+        """Build or return this thread's Sheets API service."""
+        sheets = getattr(self._local, "sheets", None)
+        if sheets is not None:
+            return sheets
+
+        if self._creds is None:
+            self._creds = self._build_credentials()
+        sheets = self._local.sheets = build("sheets", "v4", credentials=self._creds, cache_discovery=False)
         logger.info("[SheetsService] Sheets API service initialized")
-        return self._sheets
+        return sheets
+
+    def _build_drive(self):
+        """Build or return this thread's Drive API service (metadata only)."""
+        drive = getattr(self._local, "drive", None)
+        if drive is not None:
+            return drive
+
+        if self._creds is None:
+            self._creds = self._build_credentials()
+        drive = self._local.drive = build("drive", "v3", credentials=self._creds, cache_discovery=False)
+        return drive
+
+    def _spreadsheet_version(self) -> Optional[str]:
+        """
+        Current Drive version of the spreadsheet (changes on every edit).
+
+        Memoised briefly so refreshing several sheets in one cycle costs a
+        single metadata call. Returns None when the check is disabled or the
+        service account lacks Drive metadata access (callers then download).
+        """
+        if not self._settings.company_db_revision_check:
+            return None
+        memo = self._version_memo
+        if memo is not None and time.time() - memo[0] < _VERSION_MEMO_SECONDS:
+            return memo[1]
+        try:
+            meta = (
+                self._build_drive()
+                .files()
+                .get(fileId=self._spreadsheet_id, fields="version,modifiedTime", supportsAllDrives=True)
+                .execute()
+            )
+            version = f"{meta.get('version', '')}@{meta.get('modifiedTime', '')}"
+        except Exception as e:
+            logger.debug(f"[SheetsService] Drive version check unavailable: {e}")
+            version = None
+        self._version_memo = (time.time(), version)
+        return version
+
+    def _get_values(self, range_: str) -> List[List[str]]:
+        result = (
+            self._build_service()
+            .spreadsheets()
+            .values()
+            .get(spreadsheetId=self._spreadsheet_id, range=range_)
+            .execute()
+        )
+        return result.get("values", [])
+
+    def _cached(self, cache_key: str, loader: Callable[[], Any], force_refresh: bool = False) -> Any:
+        return self._cache.get_or_load(
+            cache_key, loader, version=self._spreadsheet_version, force_refresh=force_refresh
+        )
 
     def _parse_sheet_to_dicts(
         self, rows: List[List[str]], skip_empty: bool = True
@@ -189,35 +557,39 @@ class CompanyDatabaseSheetsService:
             logger.error("[SheetsService] Spreadsheet ID not configured")
             return []
 
-        cache_key = "db_all_companies"
-        if not force_refresh:
-            cached = self._cache.get(cache_key)
-            if cached is not None:
-                return cached
-
-        try:
-            sheets = self._build_service()
-            result = (
-                sheets.spreadsheets()
-                .values()
-                .get(
-                    spreadsheetId=self._spreadsheet_id,
-                    range=f"'{self.SHEET_DB}'!A:BZ",  # Cover all 52+ columns
-                )
-                .execute()
-            )
-
-            rows = result.get("values", [])
+        def _load() -> List[Dict[str, Any]]:
+            rows = self._get_values(f"'{self.SHEET_DB}'!A:BZ")  # Cover all 52+ columns
             companies = self._parse_sheet_to_dicts(rows)
-
             logger.info(f"[SheetsService] Loaded {len(companies)} companies from DB sheet")
-            self._cache.set(cache_key, companies)
             return companies
 
+        try:
+            return self._cached("db_all_companies", _load, force_refresh)
         except Exception as e:
             logger.error(f"[SheetsService] Failed to fetch companies: {e}")
             return []
 
+    def get_company_index(self, force_refresh: bool = False) -> CompanyIndex:
+        """
+        Get the columnar index over the DB sheet.
+
+        Built once per cache refresh of get_all_companies(); later calls with the
+        same cached rows return the same index.
+
+        Args:
+            force_refresh: Bypass cache and fetch fresh data.
+
+        Returns:
+            CompanyIndex over the current company rows.
+        """
+        companies = self.get_all_companies(force_refresh=force_refresh)
+        index = self._company_index
+        if index is None or index.rows is not companies:
+            index = CompanyIndex(companies)
+            self._company_index = index
+            logger.debug(f"[SheetsService] Built company index ({len(index)} rows)")
+        return index
+
     def get_appeal_points(self, force_refresh: bool = False) -> Dict[str, Dict[str, Any]]:
         """
         Get need-based appeal points from import sheet.
@@ -231,25 +603,8 @@ class CompanyDatabaseSheetsService:
         if not self._spreadsheet_id:
             return {}
 
-        cache_key = "appeal_points"
-        if not force_refresh:
-            cached = self._cache.get(cache_key)
-            if cached is not None:
-                return cached
-
-        try:
-            sheets = self._build_service()
-            result = (
-                sheets.spreadsheets()
-                .values()
-                .get(
-                    spreadsheetId=self._spreadsheet_id,
-                    range=f"'{self.SHEET_IMPORT}'!A:Z",
-                )
-                .execute()
-            )
-
-            rows = result.get("values", [])
+        def _load() -> Dict[str, Dict[str, Any]]:
+            rows = self._get_values(f"'{self.SHEET_IMPORT}'!A:Z")
             if len(rows) < 2:
                 return {}
 
@@ -270,9 +625,10 @@ class CompanyDatabaseSheetsService:
             logger.info(
                 f"[SheetsService] Loaded appeal points for {len(appeal_data)} companies"
             )
-            self._cache.set(cache_key, appeal_data)
             return appeal_data
 
+        try:
+            return self._cached("appeal_points", _load, force_refresh)
         except Exception as e:
             logger.error(f"[SheetsService] Failed to fetch appeal points: {e}")
             return {}
@@ -294,34 +650,16 @@ class CompanyDatabaseSheetsService:
             return []
 
         sheet_name = f"{self.PIC_SHEETS_PREFIX}{pic_name}"
-        cache_key = f"pic_ranking_{pic_name}"
-
-        if not force_refresh:
-            cached = self._cache.get(cache_key)
-            if cached is not None:
-                return cached
-
-        try:
-            sheets = self._build_service()
-            result = (
-                sheets.spreadsheets()
-                .values()
-                .get(
-                    spreadsheetId=self._spreadsheet_id,
-                    range=f"'{sheet_name}'!A:Z",
-                )
-                .execute()
-            )
-
-            rows = result.get("values", [])
+        def _load() -> List[Dict[str, Any]]:
+            rows = self._get_values(f"'{sheet_name}'!A:Z")
             rankings = self._parse_sheet_to_dicts(rows)
-
             logger.info(
                 f"[SheetsService] Loaded {len(rankings)} rankings for PIC: {pic_name}"
             )
-            self._cache.set(cache_key, rankings)
             return rankings
 
+        try:
+            return self._cached(f"pic_ranking_{pic_name}", _load, force_refresh)
         except Exception as e:
             logger.warning(f"[SheetsService] PIC sheet not found: {sheet_name}, error: {e}")
             return []
@@ -336,15 +674,10 @@ class CompanyDatabaseSheetsService:
         if not self._spreadsheet_id:
             return []
 
-        cache_key = "pic_sheets_list"
-        cached = self._cache.get(cache_key)
-        if cached is not None:
-            return cached
-
-        try:
-            sheets = self._build_service()
+        def _load() -> List[str]:
             metadata = (
-                sheets.spreadsheets()
+                self._build_service()
+                .spreadsheets()
                 .get(
                     spreadsheetId=self._spreadsheet_id,
                     fields="sheets.properties.title",
@@ -360,9 +693,10 @@ class CompanyDatabaseSheetsService:
                     pic_names.append(pic_name)
 
             logger.info(f"[SheetsService] Found {len(pic_names)} PIC sheets")
-            self._cache.set(cache_key, pic_names)
             return pic_names
 
+        try:
+            return self._cached("pic_sheets_list", _load)
         except Exception as e:
             logger.error(f"[SheetsService] Failed to list PIC sheets: {e}")
             return []
@@ -375,3 +709,7 @@ class CompanyDatabaseSheetsService:
             key: Specific cache key to invalidate, or None for all.
         """
         self._cache.invalidate(key)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Cache hit / stale-serve / download / revalidation counters."""
+        return self._cache.stats()
@@ -540,3 +540,9 @@ def get_marketing_agent_service() -> "MarketingAgentService | ADKAgentService":
             mcp_manager=mcp_manager,
         )
     return _service_instance
+
+
+def invalidate_model_asset_cache(asset_id: str | None = None) -> None:
+    """Drop cached ADK agent graphs built for a model asset that was updated or deleted."""
+    if _adk_service_instance is not None:
+        _adk_service_instance.invalidate_agent_cache(asset_id)
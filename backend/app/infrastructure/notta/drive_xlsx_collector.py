@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, Callable, List, Optional, Dict, Any
 import io
 import json
 import logging
 import os
+import threading
+import time
 import httplib2
 from google.oauth2.service_account import Credentials
 from google_auth_httplib2 import AuthorizedHttp
@@ -12,6 +14,7 @@ from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
 
 from app.infrastructure.config.settings import get_settings
+from app.infrastructure.google.drive_throttle import call_with_backoff, iter_bounded, stream_from_threads
 from app.domain.entities.meeting_document import MeetingDocument
 from app.infrastructure.notta.xlsx_parser import NottaXlsxParser
 
@@ -31,20 +34,47 @@ class NottaDriveXlsxCollector:
         self.settings = get_settings()
         self.logger = logging.getLogger(__name__)
         self.parser = NottaXlsxParser()
+        # organizer -> per-run counters (listed / unchanged / exported / throughput)
+        self.stats: Dict[str, Dict[str, Any]] = {}
 
     async def collect_meeting_docs(
         self,
         accounts: Optional[List[str]] = None,
         include_structure: bool = False,
         skip_failed_exports: bool = False,
+        full_rescan: bool = False,
+        known_modified_times: Optional[Callable[[str], Dict[str, Optional[str]]]] = None,
     ) -> List[MeetingDocument]:
+        return [
+            meeting
+            async for meeting in self.iter_meeting_docs(
+                accounts,
+                include_structure=include_structure,
+                skip_failed_exports=skip_failed_exports,
+                full_rescan=full_rescan,
+                known_modified_times=known_modified_times,
+            )
+        ]
+
+    async def iter_meeting_docs(
+        self,
+        accounts: Optional[List[str]] = None,
+        include_structure: bool = False,
+        skip_failed_exports: bool = False,
+        full_rescan: bool = False,
+        known_modified_times: Optional[Callable[[str], Dict[str, Optional[str]]]] = None,
+    ) -> AsyncIterator[MeetingDocument]:
+        """Stream parsed Notta transcripts through a bounded queue."""
+        # Notta は単一フォルダを毎回一覧するため full_rescan は受け付けるだけ
         subject = self._resolve_subject(accounts)
         if not subject:
             raise RuntimeError("No impersonation subject available for Notta collection")
 
-        import asyncio
+        def _producer(emit: Callable[[MeetingDocument], None]) -> None:
+            self._collect_for_subject_sync(subject, emit, skip_failed_exports, known_modified_times)
 
-        return await asyncio.to_thread(self._collect_for_subject_sync, subject, skip_failed_exports)
+        async for meeting in stream_from_threads([_producer], self.settings.collect_queue_size):
+            yield meeting
 
     def list_shared_drives(self) -> List[Dict[str, Any]]:
         subject = self._resolve_subject(None)
@@ -100,9 +130,16 @@ class NottaDriveXlsxCollector:
                 break
         return folders
 
-    def _collect_for_subject_sync(self, subject: str, skip_failed_exports: bool) -> List[MeetingDocument]:
+    def _collect_for_subject_sync(
+        self,
+        subject: str,
+        emit: Callable[[MeetingDocument], None],
+        skip_failed_exports: bool,
+        known_modified_times: Optional[Callable[[str], Dict[str, Optional[str]]]] = None,
+    ) -> int:
         self.logger.debug("Start Notta collection subject=%s", subject)
-        drive = self._build_drive(subject)
+        creds = self._build_credentials(subject)
+        drive = self._build_drive(subject, creds=creds)
 
         folder_id = self.settings.notta_folder_id
         if not folder_id and self.settings.notta_folder_name:
@@ -130,31 +167,79 @@ class NottaDriveXlsxCollector:
             )
 
         files = self._list_xlsx_files(drive, folder_id)
-        results: List[MeetingDocument] = []
-        for f in files:
-            try:
-                data = self._download_xlsx(drive, f)
-                parsed = self.parser.parse(data, f.get("name"))
-                meeting = MeetingDocument(
-                    id=None,
-                    doc_id=f["id"],
-                    title=parsed.title or f.get("name"),
-                    meeting_datetime=parsed.meeting_datetime or f.get("modifiedTime"),
-                    organizer_email=self.settings.notta_organizer_email,
-                    organizer_name=None,
-                    document_url=f.get("webViewLink"),
-                    invited_emails=[],
-                    text_content=parsed.text_content,
-                    metadata=self._build_metadata(f, parsed),
-                )
-                results.append(meeting)
-            except Exception as e:
-                self.logger.error("Failed to parse Notta xlsx id=%s name=%s error=%s", f.get("id"), f.get("name"), e)
-                if skip_failed_exports:
-                    continue
-                raise
-        self.logger.debug("Finished Notta collection total=%d", len(results))
-        return results
+        listed = len(files)
+        if known_modified_times is not None:
+            files = self._filter_changed_files(files, known_modified_times)
+        organizer = self.settings.notta_organizer_email
+        self.stats[organizer] = {"listed": listed, "unchanged": listed - len(files)}
+        # httplib2.Http はスレッドセーフではないため、ワーカースレッドごとに Drive クライアントを持つ
+        local = threading.local()
+
+        def _download_one(f: Dict[str, Any]) -> Optional[MeetingDocument]:
+            worker_drive = getattr(local, "drive", None)
+            if worker_drive is None:
+                worker_drive = local.drive = self._build_drive(subject, creds=creds)
+            return self._build_meeting(worker_drive, f, skip_failed_exports)
+
+        started = time.monotonic()
+        exported = 0
+        for meeting in iter_bounded(_download_one, files, self.settings.drive_export_workers):
+            if meeting is not None:
+                emit(meeting)
+                exported += 1
+        elapsed = time.monotonic() - started
+        self.stats[organizer].update(
+            exported=exported,
+            elapsed_sec=round(elapsed, 2),
+            docs_per_sec=round(len(files) / elapsed, 2) if elapsed > 0 else 0.0,
+        )
+        self.logger.debug("Finished Notta collection total=%d elapsed=%.1fs", exported, elapsed)
+        return exported
+
+    def _build_meeting(
+        self,
+        drive,
+        f: Dict[str, Any],
+        skip_failed_exports: bool,
+    ) -> Optional[MeetingDocument]:
+        try:
+            data = call_with_backoff(lambda: self._download_xlsx(drive, f))
+            parsed = self.parser.parse(data, f.get("name"))
+            return MeetingDocument(
+                id=None,
+                doc_id=f["id"],
+                title=parsed.title or f.get("name"),
+                meeting_datetime=parsed.meeting_datetime or f.get("modifiedTime"),
+                organizer_email=self.settings.notta_organizer_email,
+                organizer_name=None,
+                document_url=f.get("webViewLink"),
+                invited_emails=[],
+                text_content=parsed.text_content,
+                metadata=self._build_metadata(f, parsed),
+            )
+        except Exception as e:
+            self.logger.error("Failed to parse Notta xlsx id=%s name=%s error=%s", f.get("id"), f.get("name"), e)
+            if skip_failed_exports:
+                return None
+            raise
+
+    def _filter_changed_files(
+        self,
+        files: List[Dict[str, Any]],
+        known_modified_times: Callable[[str], Dict[str, Optional[str]]],
+    ) -> List[Dict[str, Any]]:
+        organizer = self.settings.notta_organizer_email
+        try:
+            known = known_modified_times(organizer)
+        except Exception as e:
+            self.logger.warning("Failed to load known modifiedTime map organizer=%s error=%s", organizer, e)
+            return files
+        changed = [
+            f for f in files
+            if not f.get("modifiedTime") or known.get(f.get("id")) != f.get("modifiedTime")
+        ]
+        self.logger.info("Notta metadata diff listed=%d changed=%d", len(files), len(changed))
+        return changed
 
     def _find_folder_by_name(
         self,
@@ -257,8 +342,8 @@ class NottaDriveXlsxCollector:
             return self.settings.impersonate_subjects[0]
         return None
 
-    def _build_drive(self, subject: Optional[str]):
-        creds = self._build_credentials(subject)
+    def _build_drive(self, subject: Optional[str], creds=None):
+        creds = creds or self._build_credentials(subject)
         http = httplib2.Http(timeout=300)
         authorized_http = AuthorizedHttp(creds, http=http)
         return build("drive", "v3", http=authorized_http, cache_discovery=False)
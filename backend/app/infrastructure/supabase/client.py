@@ -1,13 +1,25 @@
 from __future__ import annotations
-from typing import Any
-from supabase import create_client, Client
+import asyncio
 import logging
+import weakref
+from typing import Any, Callable
+
+import httpx
+from supabase import AsyncClient, AsyncClientOptions, Client, acreate_client, create_client
+
 from app.infrastructure.config.settings import get_settings
 
 _client: Client | None = None
 logger = logging.getLogger(__name__)
 
+# FastAPI のリクエスト経路用: イベントループごとに 1 つの AsyncClient
+# （httpx.AsyncClient はループをまたいで使えないため）
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncClient]" = weakref.WeakKeyDictionary()
+_async_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+
 def get_supabase() -> Client:
+    """同期クライアント（バックグラウンドワーカー・Cloud Tasks・スクリプト用）"""
     global _client
     if _client is None:
         settings = get_settings()
@@ -16,3 +28,57 @@ def get_supabase() -> Client:
         logger.debug("Creating Supabase client url=%s", settings.supabase_url)
         _client = create_client(settings.supabase_url, settings.supabase_key)
     return _client
+
+
+async def get_async_supabase() -> AsyncClient:
+    """非同期クライアント（async ルーター・ChatKit ストア用）
+
+    PostgREST / Storage は 1 つの httpx.AsyncClient（HTTP/2・keep-alive プール）を
+    共有するので、同時に走る SSE ストリームのクエリは同じ接続上に多重化される。
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is not None:
+        return client
+    lock = _async_locks.setdefault(loop, asyncio.Lock())
+    async with lock:
+        client = _async_clients.get(loop)
+        if client is None:
+            settings = get_settings()
+            if not settings.supabase_url or not settings.supabase_key:
+                raise RuntimeError("Supabase URL and Key are required")
+            pool_size = max(1, settings.supabase_http_pool_size)
+            http_client = httpx.AsyncClient(
+                http2=settings.supabase_http2,
+                limits=httpx.Limits(
+                    max_connections=pool_size,
+                    max_keepalive_connections=pool_size,
+                    keepalive_expiry=settings.supabase_http_keepalive_seconds,
+                ),
+                timeout=settings.supabase_http_timeout_seconds,
+                follow_redirects=True,
+            )
+            logger.debug(
+                "Creating async Supabase client url=%s http2=%s pool=%d",
+                settings.supabase_url, settings.supabase_http2, pool_size,
+            )
+            client = await acreate_client(
+                settings.supabase_url,
+                settings.supabase_key,
+                options=AsyncClientOptions(httpx_client=http_client),
+            )
+            _async_clients[loop] = client
+    return client
+
+
+async def run_supabase(call: Callable[[Any], Any]) -> Any:
+    """クライアントを受け取る呼び出しを、イベントループを塞がずに実行する
+
+    ``call`` は ``lambda sb: sb.table(...).select(...).execute()`` のように書く。
+    クエリビルダ / Storage の API は同期・非同期クライアントで共通なので、
+    SUPABASE_ASYNC_ENABLED=false の場合は同じ ``call`` を同期クライアントで
+    スレッド実行する（非同期クライアントに問題が出たときの切り戻し用）。
+    """
+    if get_settings().supabase_async_enabled:
+        return await call(await get_async_supabase())
+    return await asyncio.to_thread(call, get_supabase())
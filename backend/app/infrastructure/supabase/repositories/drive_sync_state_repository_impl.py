@@ -0,0 +1,53 @@
+"""
+Drive同期状態リポジトリ実装
+
+Drive Changes API の startPageToken を subject ごとに保存し、
+議事録収集を差分モードで再開できるようにする。
+"""
+from __future__ import annotations
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+from app.infrastructure.supabase.client import get_supabase
+
+logger = logging.getLogger(__name__)
+
+
+class DriveSyncStateRepositoryImpl:
+    """Drive同期状態リポジトリ実装"""
+
+    TABLE = "drive_sync_state"
+
+    def get_page_token(self, subject: str, source: str = "google_docs") -> Optional[str]:
+        """保存済みの startPageToken を取得する（未保存・取得失敗時は None）"""
+        try:
+            sb = get_supabase()
+            res = (
+                sb.table(self.TABLE)
+                .select("start_page_token")
+                .eq("subject", subject)
+                .eq("source", source)
+                .limit(1)
+                .execute()
+            )
+            data = getattr(res, "data", None)
+            if isinstance(data, list) and data:
+                return data[0].get("start_page_token") or None
+            return None
+        except Exception as e:
+            # 取得できない場合はフルスキャンにフォールバックさせる
+            logger.warning("Failed to load drive page token subject=%s error=%s", subject, e)
+            return None
+
+    def save_page_token(self, subject: str, token: str, source: str = "google_docs") -> None:
+        """startPageToken を保存する"""
+        sb = get_supabase()
+        payload = {
+            "subject": subject,
+            "source": source,
+            "start_page_token": token,
+            "last_synced_at": datetime.now(timezone.utc).isoformat(),
+        }
+        sb.table(self.TABLE).upsert(
+            payload, on_conflict="subject,source", returning="minimal"
+        ).execute()
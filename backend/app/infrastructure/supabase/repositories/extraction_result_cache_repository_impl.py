@@ -0,0 +1,90 @@
+"""
+構造化抽出結果キャッシュリポジトリ実装
+
+抽出入力のハッシュ（cache_key）ごとにグループ単位の抽出結果を保存し、
+同一入力の再処理で Gemini 呼び出しを省略できるようにする。
+"""
+from __future__ import annotations
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+from app.infrastructure.supabase.client import get_supabase
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionResultCacheRepositoryImpl:
+    """構造化抽出結果キャッシュリポジトリ実装"""
+
+    TABLE = "extraction_result_cache"
+
+    def get_many(self, cache_keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """cache_key -> 抽出結果 の辞書を返す（取得失敗時は空 = 全件ミス扱い）"""
+        keys = list(dict.fromkeys(k for k in cache_keys if k))
+        if not keys:
+            return {}
+        try:
+            sb = get_supabase()
+            res = (
+                sb.table(self.TABLE)
+                .select("cache_key,result")
+                .in_("cache_key", keys)
+                .execute()
+            )
+            data = getattr(res, "data", None) or []
+            return {
+                row["cache_key"]: row["result"]
+                for row in data
+                if isinstance(row, dict) and isinstance(row.get("result"), dict)
+            }
+        except Exception as e:
+            logger.warning("Failed to load extraction result cache keys=%d error=%s", len(keys), e)
+            return {}
+
+    def upsert_many(self, rows: List[Dict[str, Any]]) -> None:
+        """抽出結果を保存する（cache_key で上書き）"""
+        if not rows:
+            return
+        try:
+            sb = get_supabase()
+            sb.table(self.TABLE).upsert(
+                rows, on_conflict="cache_key", returning="minimal"
+            ).execute()
+        except Exception as e:
+            # キャッシュ保存の失敗は抽出処理自体には影響させない
+            logger.warning("Failed to store extraction result cache rows=%d error=%s", len(rows), e)
+
+    def touch(self, cache_keys: List[str]) -> None:
+        """ヒットしたエントリの hit_count / last_hit_at を更新する"""
+        if not cache_keys:
+            return
+        try:
+            sb = get_supabase()
+            sb.rpc("touch_extraction_result_cache", {"p_keys": cache_keys}).execute()
+        except Exception as e:
+            logger.debug("Failed to touch extraction result cache keys=%d error=%s", len(cache_keys), e)
+
+    def get_period_stats(self, start_date: datetime, end_date: datetime) -> Dict[str, int]:
+        """期間内に作成された（=ミスで保存された）エントリ数と、期間内にヒットしたエントリ数・ヒット数"""
+        sb = get_supabase()
+        created = (
+            sb.table(self.TABLE)
+            .select("cache_key", count="exact")
+            .gte("created_at", start_date.isoformat())
+            .lte("created_at", end_date.isoformat())
+            .limit(1)
+            .execute()
+        )
+        hit_rows = (
+            sb.table(self.TABLE)
+            .select("hit_count")
+            .gte("last_hit_at", start_date.isoformat())
+            .lte("last_hit_at", end_date.isoformat())
+            .execute()
+        )
+        rows = getattr(hit_rows, "data", None) or []
+        return {
+            "entries_created": getattr(created, "count", None) or 0,
+            "entries_hit": len(rows),
+            "total_hits": sum(int(r.get("hit_count") or 0) for r in rows if isinstance(r, dict)),
+        }
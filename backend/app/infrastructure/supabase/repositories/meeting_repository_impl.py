@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import List, Optional, Dict, Any
-from app.infrastructure.supabase.client import get_supabase
+from app.infrastructure.supabase.client import get_supabase, run_supabase
+import asyncio
+import json
 import logging
 from app.domain.entities.meeting_document import MeetingDocument
 
@@ -22,9 +24,37 @@ class MeetingRepositoryImpl:
             return data
         return {}
 
-    def upsert_meeting(self, meeting: MeetingDocument) -> Dict[str, Any]:
+    def get_modified_time_map(self, organizer_email: str, page_size: int = 1000) -> Dict[str, Optional[str]]:
+        """organizer_email 配下の doc_id -> metadata.modifiedTime を一括取得する
+
+        収集時の変更判定用。text_content は取得せず、PostgRESTの上限に合わせて
+        range でページングする。
+        """
         sb = get_supabase()
-        payload = {
+        result: Dict[str, Optional[str]] = {}
+        start = 0
+        while True:
+            res = (
+                sb.table(self.TABLE)
+                .select("doc_id,modified_time:metadata->>modifiedTime")
+                .eq("organizer_email", organizer_email)
+                .order("doc_id")
+                .range(start, start + page_size - 1)
+                .execute()
+            )
+            data = getattr(res, "data", None) or []
+            for item in data:
+                if item.get("doc_id"):
+                    result[item["doc_id"]] = item.get("modified_time")
+            if len(data) < page_size:
+                break
+            start += page_size
+        logger.debug("Loaded modifiedTime map organizer=%s count=%d", organizer_email, len(result))
+        return result
+
+    @staticmethod
+    def _to_payload(meeting: MeetingDocument) -> Dict[str, Any]:
+        return {
             "doc_id": meeting.doc_id,
             "title": meeting.title,
             "meeting_datetime": meeting.meeting_datetime,
@@ -35,6 +65,10 @@ class MeetingRepositoryImpl:
             "text_content": meeting.text_content,
             "metadata": meeting.metadata,
         }
+
+    def upsert_meeting(self, meeting: MeetingDocument) -> Dict[str, Any]:
+        sb = get_supabase()
+        payload = self._to_payload(meeting)
         # dedupe by doc_id + organizer_email
         logger.debug("Supabase upsert doc_id=%s organizer=%s", meeting.doc_id, meeting.organizer_email)
         # returning="minimal" でレスポンスからtext_content等を除外（エグレス削減）
@@ -43,38 +77,198 @@ class MeetingRepositoryImpl:
         ).execute()
         return {}
 
-    def list_meetings(self, accounts: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    def upsert_meetings_bulk(
+        self,
+        meetings: List[MeetingDocument],
+        max_rows: int = 50,
+        max_bytes: int = 4_000_000,
+    ) -> Dict[str, Any]:
+        """複数の議事録を multi-row upsert で一括保存する
+
+        議事録本文は大きいため、行数（max_rows）と JSON サイズ（max_bytes）の両方で
+        チャンク分割する。1行で max_bytes を超える場合はその行単独のチャンクになる。
+
+        Returns:
+            {"stored": 保存件数, "chunks": チャンク数,
+             "failed_chunks": [{"index", "meetings", "error"}, ...]}
+            failed_chunks の meetings をそのまま再送すればリトライできる。
+        """
+        if not meetings:
+            return {"stored": 0, "chunks": 0, "failed_chunks": []}
+
+        # 同一バッチ内で (doc_id, organizer_email) が重複すると ON CONFLICT が失敗するため後勝ちで除外
+        unique: Dict[tuple, MeetingDocument] = {}
+        for meeting in meetings:
+            unique[(meeting.doc_id, meeting.organizer_email)] = meeting
+
+        chunks: List[List[MeetingDocument]] = []
+        payload_chunks: List[List[Dict[str, Any]]] = []
+        current: List[MeetingDocument] = []
+        current_payload: List[Dict[str, Any]] = []
+        current_bytes = 0
+        for meeting in unique.values():
+            payload = self._to_payload(meeting)
+            size = len(json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8"))
+            if current and (len(current) >= max_rows or current_bytes + size > max_bytes):
+                chunks.append(current)
+                payload_chunks.append(current_payload)
+                current, current_payload, current_bytes = [], [], 0
+            current.append(meeting)
+            current_payload.append(payload)
+            current_bytes += size
+        if current:
+            chunks.append(current)
+            payload_chunks.append(current_payload)
+
         sb = get_supabase()
+        stored = 0
+        failed_chunks: List[Dict[str, Any]] = []
+        for index, (chunk, payload) in enumerate(zip(chunks, payload_chunks)):
+            try:
+                # returning="minimal" でレスポンスからtext_content等を除外（エグレス削減）
+                sb.table(self.TABLE).upsert(
+                    payload, on_conflict="doc_id,organizer_email", returning="minimal"
+                ).execute()
+                stored += len(chunk)
+            except Exception as e:
+                logger.error(
+                    "Supabase bulk upsert chunk failed: index=%d rows=%d error=%s",
+                    index,
+                    len(chunk),
+                    e,
+                )
+                failed_chunks.append({"index": index, "meetings": chunk, "error": str(e)})
+        logger.debug(
+            "Supabase bulk upsert rows=%d chunks=%d failed_chunks=%d",
+            len(unique),
+            len(chunks),
+            len(failed_chunks),
+        )
+        return {"stored": stored, "chunks": len(chunks), "failed_chunks": failed_chunks}
+
+    # 同期メソッド（バックグラウンドワーカー用）と a 接頭辞の非同期メソッド（API 用）は
+    # 下の _*_query ビルダを共有し、クエリ内容が食い違わないようにする
+
+    LIST_FIELDS = "id,doc_id,title,meeting_datetime,organizer_email,organizer_name,document_url,invited_emails,created_at,updated_at"
+
+    def _list_query(self, sb, accounts: Optional[List[str]]):
         # text_contentを除外した軽量フィールドのみ取得（エグレス削減）
-        select_fields = "id,doc_id,title,meeting_datetime,organizer_email,organizer_name,document_url,invited_emails,created_at,updated_at"
-        query = sb.table(self.TABLE).select(select_fields)
+        query = sb.table(self.TABLE).select(self.LIST_FIELDS)
         if accounts:
             query = query.in_("organizer_email", accounts)
-        res = query.order("meeting_datetime", desc=True).execute()
+        return query.order("meeting_datetime", desc=True)
+
+    @staticmethod
+    def _structured_ids_query(sb, meeting_ids: List[str]):
+        return sb.table("structured_outputs").select("meeting_id").in_("meeting_id", meeting_ids)
+
+    @staticmethod
+    def _mark_structured(data: List[Dict[str, Any]], structured_res: Any) -> List[Dict[str, Any]]:
+        structured_data = getattr(structured_res, "data", None)
+        structured_meetings = set()
+        if isinstance(structured_data, list):
+            structured_meetings = {item['meeting_id'] for item in structured_data}
+        # is_structuredフィールドを追加
+        for item in data:
+            item['is_structured'] = item.get('id') in structured_meetings
+        return data
+
+    def list_meetings(self, accounts: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        sb = get_supabase()
+        res = self._list_query(sb, accounts).execute()
         data = getattr(res, "data", None)
-        
-        if isinstance(data, list):
-            # 各meeting_idに対してstructured_outputsの存在をチェック
-            meeting_ids = [item.get('id') for item in data if item.get('id')]
-            structured_meetings = set()
-            
-            if meeting_ids:
-                # 構造化データが存在するmeeting_idを取得
-                structured_res = sb.table("structured_outputs").select("meeting_id").in_("meeting_id", meeting_ids).execute()
-                structured_data = getattr(structured_res, "data", None)
-                if isinstance(structured_data, list):
-                    structured_meetings = {item['meeting_id'] for item in structured_data}
-            
-            # is_structuredフィールドを追加
-            for item in data:
-                item['is_structured'] = item.get('id') in structured_meetings
-            return data
-        return []
-    
+        if not isinstance(data, list):
+            return []
+        # 構造化データが存在するmeeting_idを取得
+        meeting_ids = [item.get('id') for item in data if item.get('id')]
+        structured_res = self._structured_ids_query(sb, meeting_ids).execute() if meeting_ids else None
+        return self._mark_structured(data, structured_res)
+
+    async def alist_meetings(self, accounts: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        res = await run_supabase(lambda sb: self._list_query(sb, accounts).execute())
+        data = getattr(res, "data", None)
+        if not isinstance(data, list):
+            return []
+        meeting_ids = [item.get('id') for item in data if item.get('id')]
+        structured_res = None
+        if meeting_ids:
+            structured_res = await run_supabase(lambda sb: self._structured_ids_query(sb, meeting_ids).execute())
+        return self._mark_structured(data, structured_res)
+
     # ビュー名: meeting_documents_enriched
     # is_structured (bool), zoho_sync_status (text) を持つ計算済みビュー
     VIEW = "meeting_documents_enriched"
 
+    PAGE_FIELDS = "id,doc_id,title,meeting_datetime,organizer_email,organizer_name,document_url,invited_emails,created_at,updated_at,is_structured,zoho_sync_status"
+
+    def _paginated_query(
+        self,
+        sb,
+        page: int,
+        page_size: int,
+        accounts: Optional[List[str]],
+        structured: Optional[bool],
+        search_query: Optional[str],
+        zoho_sync_failed: Optional[bool],
+        include_text_length: bool,
+    ):
+        start = (page - 1) * page_size
+        end = start + page_size - 1
+
+        select_fields = self.PAGE_FIELDS
+        if include_text_length:
+            select_fields += ",text_length"
+
+        # ビューに対して 1 クエリ (count + page)
+        query = sb.table(self.VIEW).select(select_fields, count="exact")
+
+        # 共通フィルタ: アカウント・検索
+        if accounts:
+            query = query.in_("organizer_email", accounts)
+        if search_query and search_query.strip():
+            query_term = f"%{search_query.strip()}%"
+            query = query.or_(
+                f"title.ilike.{query_term},"
+                f"organizer_email.ilike.{query_term},"
+                f"organizer_name.ilike.{query_term}"
+            )
+
+        # タブ固有フィルタ
+        if zoho_sync_failed is True:
+            query = query.in_(
+                "zoho_sync_status",
+                ["failed", "auth_error", "field_mapping_error", "error"]
+            )
+        elif structured is True:
+            query = query.eq("is_structured", True)
+        elif structured is False:
+            query = query.eq("is_structured", False)
+
+        return query.order("meeting_datetime", desc=True).range(start, end)
+
+    @staticmethod
+    def _to_page(res: Any, page: int, page_size: int) -> Dict[str, Any]:
+        total = getattr(res, "count", 0) or 0
+        items = getattr(res, "data", []) or []
+
+        if total == 0:
+            return {
+                "items": [], "total": 0, "page": page,
+                "page_size": page_size, "total_pages": 1,
+                "has_next": False, "has_previous": False,
+            }
+
+        total_pages = max(1, (total + page_size - 1) // page_size)
+        return {
+            "items": items,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": total_pages,
+            "has_next": page < total_pages,
+            "has_previous": page > 1,
+        }
+
     def list_meetings_paginated(
         self,
         page: int = 1,
@@ -82,75 +276,59 @@ class MeetingRepositoryImpl:
         accounts: Optional[List[str]] = None,
         structured: Optional[bool] = None,
         search_query: Optional[str] = None,
-        zoho_sync_failed: Optional[bool] = None
+        zoho_sync_failed: Optional[bool] = None,
+        include_text_length: bool = False,
     ) -> Dict[str, Any]:
         """ページネーション付きの軽量な議事録一覧取得
 
         meeting_documents_enriched ビューを使用し、全タブ 1 クエリで
         正確な total + page_size 件のデータを返す。
+        include_text_length=True の場合は本文を転送せずに text_length（文字数）を含める。
         """
         try:
-            sb = get_supabase()
-            start = (page - 1) * page_size
-            end = start + page_size - 1
-
-            select_fields = "id,doc_id,title,meeting_datetime,organizer_email,organizer_name,document_url,invited_emails,created_at,updated_at,is_structured,zoho_sync_status"
-
-            empty_response = {
-                "items": [], "total": 0, "page": page,
-                "page_size": page_size, "total_pages": 1,
-                "has_next": False, "has_previous": False,
-            }
-
-            # ビューに対して 1 クエリ (count + page)
-            query = sb.table(self.VIEW).select(select_fields, count="exact")
-
-            # 共通フィルタ: アカウント・検索
-            if accounts:
-                query = query.in_("organizer_email", accounts)
-            if search_query and search_query.strip():
-                query_term = f"%{search_query.strip()}%"
-                query = query.or_(
-                    f"title.ilike.{query_term},"
-                    f"organizer_email.ilike.{query_term},"
-                    f"organizer_name.ilike.{query_term}"
-                )
-
-            # タブ固有フィルタ
-            if zoho_sync_failed is True:
-                query = query.in_(
-                    "zoho_sync_status",
-                    ["failed", "auth_error", "field_mapping_error", "error"]
-                )
-            elif structured is True:
-                query = query.eq("is_structured", True)
-            elif structured is False:
-                query = query.eq("is_structured", False)
-
-            res = query.order("meeting_datetime", desc=True).range(start, end).execute()
-            total = getattr(res, "count", 0) or 0
-            items = getattr(res, "data", []) or []
-
-            if total == 0:
-                return empty_response
-
-            total_pages = max(1, (total + page_size - 1) // page_size)
-            return {
-                "items": items,
-                "total": total,
-                "page": page,
-                "page_size": page_size,
-                "total_pages": total_pages,
-                "has_next": page < total_pages,
-                "has_previous": page > 1,
-            }
+            res = self._paginated_query(
+                get_supabase(), page, page_size, accounts, structured,
+                search_query, zoho_sync_failed, include_text_length,
+            ).execute()
+            return self._to_page(res, page, page_size)
         except Exception as e:
             logger.exception("list_meetings_paginated failed: %s", e)
             raise RuntimeError("failed to fetch meetings")
 
-    def get_meetings_core_batch(self, meeting_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    async def alist_meetings_paginated(
+        self,
+        page: int = 1,
+        page_size: int = 40,
+        accounts: Optional[List[str]] = None,
+        structured: Optional[bool] = None,
+        search_query: Optional[str] = None,
+        zoho_sync_failed: Optional[bool] = None,
+        include_text_length: bool = False,
+    ) -> Dict[str, Any]:
+        """list_meetings_paginated の非同期版"""
+        try:
+            res = await run_supabase(lambda sb: self._paginated_query(
+                sb, page, page_size, accounts, structured,
+                search_query, zoho_sync_failed, include_text_length,
+            ).execute())
+            return self._to_page(res, page, page_size)
+        except Exception as e:
+            logger.exception("alist_meetings_paginated failed: %s", e)
+            raise RuntimeError("failed to fetch meetings")
+
+    CORE_BATCH_SIZE = 50
+
+    def get_meetings_core_batch(
+        self,
+        meeting_ids: List[str],
+        errors: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
         """複数会議のコアデータを一括取得（text_content含む）
 
+        CORE_BATCH_SIZE 件ずつ in_ で取得し、失敗したチャンクは 1 件ずつ取り直す。
+        個別に失敗した会議は結果に含めず、``errors`` が渡されていれば
+        meeting_id -> エラーメッセージを記録する（他の会議の結果はそのまま返す）。
+
         Returns:
             meeting_id -> meeting data の辞書
         """
@@ -158,11 +336,28 @@ class MeetingRepositoryImpl:
             return {}
         sb = get_supabase()
         select_fields = "id,doc_id,title,meeting_datetime,organizer_email,organizer_name,document_url,invited_emails,text_content,created_at,updated_at"
-        res = sb.table(self.TABLE).select(select_fields).in_("id", meeting_ids).execute()
-        data = getattr(res, "data", None)
-        if isinstance(data, list):
-            return {item["id"]: item for item in data if item.get("id")}
-        return {}
+        found: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(meeting_ids), self.CORE_BATCH_SIZE):
+            chunk = meeting_ids[start:start + self.CORE_BATCH_SIZE]
+            try:
+                res = sb.table(self.TABLE).select(select_fields).in_("id", chunk).execute()
+                data = getattr(res, "data", None)
+                if isinstance(data, list):
+                    found.update({item["id"]: item for item in data if item.get("id")})
+                continue
+            except Exception as e:
+                logger.warning("get_meetings_core_batch chunk failed (%d ids), retrying per item: %s", len(chunk), e)
+            for meeting_id in chunk:
+                try:
+                    row = self.get_meeting_core(meeting_id)
+                except Exception as e:
+                    logger.warning("get_meeting_core failed for %s: %s", meeting_id, e)
+                    if errors is not None:
+                        errors[meeting_id] = str(e)
+                    continue
+                if row:
+                    found[meeting_id] = row
+        return found
 
     def get_meeting_core(self, meeting_id: str) -> Dict[str, Any]:
         sb = get_supabase()
@@ -175,24 +370,61 @@ class MeetingRepositoryImpl:
             return data
         return {}
 
-    def get_meeting(self, meeting_id: str) -> Dict[str, Any]:
-        sb = get_supabase()
-        # 明示的カラム指定で取得（エグレス削減）
-        select_fields = "id,doc_id,title,meeting_datetime,organizer_email,organizer_name,document_url,invited_emails,text_content,metadata,created_at,updated_at"
-        res = sb.table(self.TABLE).select(select_fields).eq("id", meeting_id).limit(1).execute()
-        data = getattr(res, "data", None)
+    # 明示的カラム指定で取得（エグレス削減）
+    DETAIL_FIELDS = "id,doc_id,title,meeting_datetime,organizer_email,organizer_name,document_url,invited_emails,text_content,metadata,created_at,updated_at"
+
+    def _detail_query(self, sb, meeting_id: str):
+        return sb.table(self.TABLE).select(self.DETAIL_FIELDS).eq("id", meeting_id).limit(1)
 
-        item = None
+    @staticmethod
+    def _structured_exists_query(sb, meeting_id: str):
+        return sb.table("structured_outputs").select("meeting_id").eq("meeting_id", meeting_id).limit(1)
+
+    def _metadata_query(self, sb, meeting_id: str):
+        return sb.table(self.TABLE).select("id,metadata").eq("id", meeting_id).limit(1)
+
+    @staticmethod
+    def _first_row(res: Any) -> Optional[Dict[str, Any]]:
+        data = getattr(res, "data", None)
         if isinstance(data, list) and data:
-            item = data[0]
-        elif isinstance(data, dict):
-            item = data
+            return data[0]
+        if isinstance(data, dict):
+            return data
+        return None
+
+    @staticmethod
+    def _transcript_payload(
+        existing: Dict[str, Any], text_content: str, transcript_provider: Optional[str]
+    ) -> Dict[str, Any]:
+        metadata = existing.get("metadata") or {}
+        if transcript_provider:
+            metadata = {**metadata, "transcript_provider": transcript_provider}
+        return {
+            "text_content": text_content,
+            "metadata": metadata,
+        }
 
+    def get_meeting(self, meeting_id: str) -> Dict[str, Any]:
+        sb = get_supabase()
+        item = self._first_row(self._detail_query(sb, meeting_id).execute())
         if not item:
             return {}
 
         # 構造化データの存在をチェック（1回のみ）
-        structured_res = sb.table("structured_outputs").select("meeting_id").eq("meeting_id", meeting_id).limit(1).execute()
+        structured_res = self._structured_exists_query(sb, meeting_id).execute()
+        structured_data = getattr(structured_res, "data", None)
+        item['is_structured'] = bool(structured_data and len(structured_data) > 0)
+        return item
+
+    async def aget_meeting(self, meeting_id: str) -> Dict[str, Any]:
+        """get_meeting の非同期版（本体と構造化有無の 2 クエリを並行実行）"""
+        res, structured_res = await asyncio.gather(
+            run_supabase(lambda sb: self._detail_query(sb, meeting_id).execute()),
+            run_supabase(lambda sb: self._structured_exists_query(sb, meeting_id).execute()),
+        )
+        item = self._first_row(res)
+        if not item:
+            return {}
         structured_data = getattr(structured_res, "data", None)
         item['is_structured'] = bool(structured_data and len(structured_data) > 0)
         return item
@@ -208,22 +440,29 @@ class MeetingRepositoryImpl:
         sb = get_supabase()
 
         # 既存metadataのみ軽量取得（get_meeting()の重いstructuredチェックを回避）
-        meta_res = sb.table(self.TABLE).select("id,metadata").eq("id", meeting_id).limit(1).execute()
-        meta_data = getattr(meta_res, "data", None)
-        existing = (meta_data[0] if isinstance(meta_data, list) and meta_data
-                    else meta_data if isinstance(meta_data, dict) else None)
+        existing = self._first_row(self._metadata_query(sb, meeting_id).execute())
         if not existing:
             return {}
 
-        metadata = existing.get("metadata") or {}
-        if transcript_provider:
-            metadata = {**metadata, "transcript_provider": transcript_provider}
-
-        payload = {
-            "text_content": text_content,
-            "metadata": metadata,
-        }
-
+        payload = self._transcript_payload(existing, text_content, transcript_provider)
         sb.table(self.TABLE).update(payload, returning="minimal").eq("id", meeting_id).execute()
         # 更新後のデータを返す
         return self.get_meeting(meeting_id)
+
+    async def aupdate_transcript(
+        self,
+        meeting_id: str,
+        text_content: str,
+        transcript_provider: Optional[str] = None,
+        transcript_source: str = "manual_edit",
+    ) -> Dict[str, Any]:
+        """update_transcript の非同期版"""
+        existing = self._first_row(await run_supabase(lambda sb: self._metadata_query(sb, meeting_id).execute()))
+        if not existing:
+            return {}
+
+        payload = self._transcript_payload(existing, text_content, transcript_provider)
+        await run_supabase(
+            lambda sb: sb.table(self.TABLE).update(payload, returning="minimal").eq("id", meeting_id).execute()
+        )
+        return await self.aget_meeting(meeting_id)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from typing import Dict, Any, Optional
 from datetime import datetime
-from app.infrastructure.supabase.client import get_supabase
+from app.infrastructure.supabase.client import get_supabase, run_supabase
 from app.domain.entities.structured_data import StructuredData, ZohoCandidateInfo, ZohoSyncInfo
 
 class StructuredRepositoryImpl:
@@ -52,10 +52,28 @@ class StructuredRepositoryImpl:
                 return (res.data[0] if res.data else {})
             except Exception:
                 return {}
-    
+
+    async def aget_by_meeting_id(self, meeting_id: str) -> Dict[str, Any]:
+        """get_by_meeting_id の非同期版（API 経路用）"""
+        try:
+            # maybe_single は 0 件で None を返すことがあるため limit(1) で取得する
+            res = await run_supabase(
+                lambda sb: sb.table(self.TABLE).select("*").eq("meeting_id", meeting_id).limit(1).execute()
+            )
+            return (res.data[0] if res.data else {})
+        except Exception:
+            return {}
+
     def get_structured_data(self, meeting_id: str) -> Optional[StructuredData]:
         """Get StructuredData entity with Zoho candidate info and sync status"""
-        data = self.get_by_meeting_id(meeting_id)
+        return self._to_entity(self.get_by_meeting_id(meeting_id))
+
+    async def aget_structured_data(self, meeting_id: str) -> Optional[StructuredData]:
+        """Async variant of get_structured_data for the request path"""
+        return self._to_entity(await self.aget_by_meeting_id(meeting_id))
+
+    @staticmethod
+    def _to_entity(data: Dict[str, Any]) -> Optional[StructuredData]:
         if not data:
             return None
 
@@ -98,6 +116,10 @@ class StructuredRepositoryImpl:
         sb = get_supabase()
         sb.table(self.TABLE).delete().eq("meeting_id", meeting_id).execute()
 
+    async def adelete_by_meeting_id(self, meeting_id: str) -> None:
+        """delete_by_meeting_id の非同期版"""
+        await run_supabase(lambda sb: sb.table(self.TABLE).delete().eq("meeting_id", meeting_id).execute())
+
     def update_zoho_sync_status(
         self,
         meeting_id: str,
@@ -0,0 +1,148 @@
+"""
+APP-hc 求職者名インデックス（自動処理用）
+
+会議ごとに Zoho Search API を呼ぶ代わりに、APP-hc の id / 求職者名 / 求職者ID / メールを
+COQL で一括取得してメモリ上に保持し、CandidateTitleMatcher と同じ正規化キーで照合する。
+以降は Modified_Time による差分取得で更新し、削除レコードを落とすため定期的に全件再構築する。
+"""
+from __future__ import annotations
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set
+
+from app.domain.services.candidate_title_matcher import CandidateTitleMatcher
+from app.infrastructure.config.settings import get_settings
+from app.infrastructure.zoho.client import ZohoClient
+
+logger = logging.getLogger(__name__)
+
+# 構築に失敗した場合、この秒数は再試行せず Search API へフォールバックさせる
+_FAILURE_BACKOFF_SECONDS = 60.0
+
+
+class ZohoCandidateIndex:
+    """正規化済み求職者名 -> APP-hc レコードのインメモリインデックス"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._by_key: Dict[str, Set[str]] = {}
+        self._keys_of: Dict[str, Set[str]] = {}
+        self._watermark: Optional[str] = None
+        self._built_at = 0.0
+        self._refreshed_at = 0.0
+        self._failed_at = 0.0
+
+    @property
+    def ready(self) -> bool:
+        return self._built_at > 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @staticmethod
+    def _name_keys(name: Optional[str]) -> Set[str]:
+        # is_exact_match と同じ2段階（通常正規化 / スペース無視）で引けるよう両方のキーを持つ
+        keys = {
+            "n:" + CandidateTitleMatcher._normalize(name),
+            "s:" + CandidateTitleMatcher._normalize_spaceless(name),
+        }
+        return {k for k in keys if len(k) > 2}
+
+    def ensure_fresh(self, zoho: Optional[ZohoClient] = None) -> bool:
+        """必要に応じて全件構築・差分更新を行い、インデックスが利用可能かを返す"""
+        settings = get_settings()
+        now = time.time()
+        if self.ready and now - self._refreshed_at < settings.zoho_candidate_index_refresh_seconds:
+            return True
+        if now - self._failed_at < _FAILURE_BACKOFF_SECONDS:
+            return self.ready
+
+        with self._lock:
+            now = time.time()
+            if self.ready and now - self._refreshed_at < settings.zoho_candidate_index_refresh_seconds:
+                return True
+            zoho = zoho or ZohoClient()
+            full = not self.ready or now - self._built_at >= settings.zoho_candidate_index_rebuild_seconds
+            try:
+                if full:
+                    self._rebuild(zoho)
+                else:
+                    self._apply_delta(zoho)
+                self._refreshed_at = time.time()
+                return True
+            except Exception as e:
+                self._failed_at = time.time()
+                logger.warning("[zoho-index] refresh failed (full=%s): %s", full, e)
+                return self.ready
+
+    def _rebuild(self, zoho: ZohoClient) -> None:
+        started = time.time()
+        fresh = ZohoCandidateIndex()
+        for row in zoho.iter_app_hc_candidates():
+            fresh._put(row)
+        self._records = fresh._records
+        self._by_key = fresh._by_key
+        self._keys_of = fresh._keys_of
+        self._watermark = fresh._watermark
+        self._built_at = time.time()
+        logger.info(
+            "[zoho-index] rebuilt: records=%d keys=%d elapsed=%.2fs",
+            len(self._records), len(self._by_key), self._built_at - started,
+        )
+
+    def _apply_delta(self, zoho: ZohoClient) -> None:
+        changed = 0
+        for row in zoho.iter_app_hc_candidates(modified_since=self._watermark):
+            self._put(row)
+            changed += 1
+        logger.info("[zoho-index] delta applied: changed=%d records=%d", changed, len(self._records))
+
+    def _put(self, row: Dict[str, Any]) -> None:
+        record_id = row.get("record_id")
+        if not record_id:
+            return
+        # 名前が変わった場合に備えて古いキーを外してから登録する
+        for key in self._keys_of.pop(record_id, set()):
+            ids = self._by_key.get(key)
+            if ids:
+                ids.discard(record_id)
+                if not ids:
+                    del self._by_key[key]
+        self._records[record_id] = {
+            "record_id": record_id,
+            "candidate_name": row.get("candidate_name"),
+            "candidate_id": row.get("candidate_id"),
+            "candidate_email": row.get("candidate_email"),
+        }
+        keys = self._name_keys(row.get("candidate_name"))
+        self._keys_of[record_id] = keys
+        for key in keys:
+            self._by_key.setdefault(key, set()).add(record_id)
+        modified = row.get("modified_time")
+        if modified and (self._watermark is None or modified > self._watermark):
+            self._watermark = modified
+
+    def lookup(self, name: Optional[str]) -> List[Dict[str, Any]]:
+        """抽出済み候補者名に正規化一致する APP-hc レコードを返す（0件/複数件の判断は呼び出し側）"""
+        keys = self._name_keys(name)
+        with self._lock:
+            ids: Set[str] = set()
+            for key in keys:
+                ids |= self._by_key.get(key, set())
+            return [dict(self._records[i]) for i in sorted(ids) if i in self._records]
+
+
+_index: Optional[ZohoCandidateIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_candidate_index() -> ZohoCandidateIndex:
+    """プロセス共有の求職者名インデックスを返す"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = ZohoCandidateIndex()
+    return _index
@@ -1,11 +1,14 @@
 from __future__ import annotations
+import asyncio
 import time
 import json
 import threading
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib import request, parse, error
 
 from app.infrastructure.config.settings import get_settings
+from app.infrastructure.zoho.paging import acall_with_budget, call_with_budget, has_more, iter_pages
+from app.infrastructure.zoho.transport import azoho_urlopen, zoho_urlopen
 import logging
 
 logger = logging.getLogger(__name__)
@@ -34,9 +37,14 @@ def _refresh_access_token(settings) -> Tuple[str, int]:
             "grant_type": "refresh_token",
         }
     ).encode("utf-8")
-    req = request.Request(token_url, data=data, method="POST")
+    req = request.Request(
+        token_url,
+        data=data,
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        method="POST",
+    )
     try:
-        with request.urlopen(req, timeout=30) as resp:
+        with zoho_urlopen(req, timeout=30) as resp:
             payload = json.loads(resp.read().decode("utf-8"))
     except error.HTTPError as e:
         raise ZohoAuthError(f"Failed to refresh token: {e.read().decode('utf-8', 'ignore')}") from e
@@ -104,9 +112,7 @@ class ZohoClient:
         data = json.dumps(body).encode("utf-8")
         req = request.Request(url, data=data, headers=headers, method="POST")
         try:
-            with request.urlopen(req, timeout=30) as resp:
-                text = resp.read().decode("utf-8")
-                return json.loads(text) if text else {}
+            return call_with_budget(lambda: self._send(req))
         except error.HTTPError as e:
             if e.code == 204:
                 return {}
@@ -166,6 +172,29 @@ class ZohoClient:
                 logger.warning("[zoho] COQL query failed (scope/syntax issue): %s", e)
             raise
 
+    def _iter_coql_pages(
+        self,
+        select_query: str,
+        page_size: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """LIMIT/OFFSET で COQL をページングし、レスポンスをページ順に返す（先読みあり）。
+
+        select_query には LIMIT/OFFSET を含めないこと（ページ順を安定させるため ORDER BY を推奨）。
+        OFFSET + LIMIT が COQL_MAX_OFFSET に収まる範囲まで、more_records が偽になるまで取得する。
+        """
+        size = min(page_size or self.COQL_PAGE_SIZE, self.COQL_PAGE_SIZE)
+
+        def _fetch(index: int) -> Dict[str, Any]:
+            return self._coql_query(f"{select_query} LIMIT {size} OFFSET {index * size}")
+
+        for _, page in iter_pages(_fetch, max_pages=self.COQL_MAX_OFFSET // size, label="COQL"):
+            yield page
+
+    def iter_coql(self, select_query: str, page_size: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """COQL の結果レコードを OFFSET 上限まで順に返す（後続ページの取得中に集計を始められる）"""
+        for page in self._iter_coql_pages(select_query, page_size):
+            yield from page.get("data", []) or []
+
     def _coql_aggregate(
         self,
         module: str,
@@ -257,6 +286,12 @@ class ZohoClient:
                 return fallback_func()
             raise
 
+    @staticmethod
+    def _send(req: request.Request) -> Dict[str, Any]:
+        with zoho_urlopen(req, timeout=30) as resp:
+            text = resp.read().decode("utf-8")
+            return json.loads(text) if text else {}
+
     def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         base = self.settings.zoho_api_base_url.rstrip("/")
         url = f"{base}{path}"
@@ -265,9 +300,7 @@ class ZohoClient:
         headers = {"Authorization": f"Zoho-oauthtoken {self._get_access_token()}"}
         req = request.Request(url, headers=headers, method="GET")
         try:
-            with request.urlopen(req, timeout=30) as resp:
-                text = resp.read().decode("utf-8")
-                return json.loads(text) if text else {}
+            return call_with_budget(lambda: self._send(req))
         except error.HTTPError as e:
             # 204 No Content → treat as empty
             if e.code == 204:
@@ -275,6 +308,63 @@ class ZohoClient:
             body = e.read().decode("utf-8", "ignore")
             raise RuntimeError(f"Zoho GET {path} failed: {e.code} {body}") from e
 
+    # --- Async variants (ADK tools: Zoho I/O を待つ間ワーカースレッドを塞がない) ---
+
+    async def _aget_access_token(self) -> str:
+        if _token_valid_shared():
+            return self._get_access_token()
+        # トークン更新は1時間に1回程度なのでスレッドで行う
+        return await asyncio.to_thread(self._get_access_token)
+
+    @staticmethod
+    async def _asend(req: request.Request) -> Dict[str, Any]:
+        with await azoho_urlopen(req, timeout=30) as resp:
+            text = resp.read().decode("utf-8")
+            return json.loads(text) if text else {}
+
+    async def _aget(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        base = self.settings.zoho_api_base_url.rstrip("/")
+        url = f"{base}{path}"
+        if params:
+            url += ("?" + parse.urlencode(params))
+        headers = {"Authorization": f"Zoho-oauthtoken {await self._aget_access_token()}"}
+        req = request.Request(url, headers=headers, method="GET")
+        try:
+            return await acall_with_budget(lambda: self._asend(req))
+        except error.HTTPError as e:
+            if e.code == 204:
+                return {}
+            body = e.read().decode("utf-8", "ignore")
+            raise RuntimeError(f"Zoho GET {path} failed: {e.code} {body}") from e
+
+    async def _apost(self, path: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        base = self.settings.zoho_api_base_url.rstrip("/")
+        url = f"{base}{path}"
+        headers = {
+            "Authorization": f"Zoho-oauthtoken {await self._aget_access_token()}",
+            "Content-Type": "application/json",
+        }
+        req = request.Request(url, data=json.dumps(body).encode("utf-8"), headers=headers, method="POST")
+        try:
+            return await acall_with_budget(lambda: self._asend(req))
+        except error.HTTPError as e:
+            if e.code == 204:
+                return {}
+            body = e.read().decode("utf-8", "ignore")
+            raise RuntimeError(f"Zoho POST {path} failed: {e.code} {body}") from e
+
+    async def _acoql_query(self, select_query: str) -> Dict[str, Any]:
+        """``_coql_query`` の非同期版"""
+        logger.debug("[zoho] COQL query: %s", select_query)
+        try:
+            result = await self._apost("/crm/v7/coql", {"select_query": select_query})
+            logger.info("[zoho] COQL query success: %d records", len(result.get("data", []) or []))
+            return result
+        except RuntimeError as e:
+            if "INVALID_QUERY" in str(e) or "scope" in str(e).lower():
+                logger.warning("[zoho] COQL query failed (scope/syntax issue): %s", e)
+            raise
+
     # --- Metadata helpers (with 24h TTL cache) ---
 
     _modules_cache: Optional[List[Dict[str, Any]]] = None
@@ -415,6 +505,12 @@ class ZohoClient:
         items = data.get("data") or []
         return items[0] if items else {}
 
+    async def aget_record(self, module_api_name: str, record_id: str) -> Dict[str, Any]:
+        """``get_record`` の非同期版"""
+        data = await self._aget(f"/crm/v7/{module_api_name}/{record_id}") or {}
+        items = data.get("data") or []
+        return items[0] if items else {}
+
     def get_related_records(
         self,
         module_api_name: str,
@@ -431,6 +527,20 @@ class ZohoClient:
         ) or {}
         return data.get("data") or []
 
+    async def aget_related_records(
+        self,
+        module_api_name: str,
+        record_id: str,
+        related_list_api_name: str,
+        limit: int = 200,
+    ) -> List[Dict[str, Any]]:
+        """``get_related_records`` の非同期版"""
+        data = await self._aget(
+            f"/crm/v2/{module_api_name}/{record_id}/{related_list_api_name}",
+            {"per_page": min(limit, 200)},
+        ) or {}
+        return data.get("data") or []
+
     def generic_coql_query(
         self,
         select_query: str,
@@ -441,6 +551,18 @@ class ZohoClient:
         ツールレイヤーから安全に呼び出すためのラッパー。
         SELECTのみ許可、LIMIT強制、危険パターン除去。
         """
+        return self._coql_query(self._sanitize_coql(select_query, limit))
+
+    async def ageneric_coql_query(
+        self,
+        select_query: str,
+        limit: int = 200,
+    ) -> Dict[str, Any]:
+        """``generic_coql_query`` の非同期版"""
+        return await self._acoql_query(self._sanitize_coql(select_query, limit))
+
+    @staticmethod
+    def _sanitize_coql(select_query: str, limit: int) -> str:
         # 安全性チェック
         q_upper = select_query.strip().upper()
         if not q_upper.startswith("SELECT"):
@@ -454,8 +576,7 @@ class ZohoClient:
         effective_limit = min(limit, 2000)
         if "LIMIT" not in clean.upper():
             clean += f" LIMIT {effective_limit}"
-
-        return self._coql_query(clean)
+        return clean
 
     # --- APP-hc (CustomModule1) helpers ---
     def search_app_hc_by_name(self, name: str, limit: int = 5) -> List[Dict[str, Any]]:
@@ -642,6 +763,107 @@ class ZohoClient:
         logger.info("[zoho] search exact results: count=%s", len(records))
         return records
 
+    # COQL は1回あたり最大2000件、OFFSET は 100,000 件まで
+    COQL_PAGE_SIZE = 2000
+    COQL_MAX_OFFSET = 100_000
+
+    def iter_app_hc_candidates(self, modified_since: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """APP-hc の求職者名インデックス用レコードを COQL でページングしながら返す。
+
+        Modified_Time 昇順で取得し、OFFSET 上限に達したら最後の Modified_Time から
+        取り直す（同一時刻のレコードは重複し得るため、呼び出し側で record_id 単位に上書きする）。
+
+        Args:
+            modified_since: 指定時はこの Modified_Time 以降に更新されたレコードのみ（差分取得）
+
+        Yields:
+            record_id, candidate_name, candidate_id, candidate_email, modified_time を持つ辞書
+        """
+        module_api = self.settings.zoho_app_hc_module
+        name_field = self.settings.zoho_app_hc_name_field_api or self.get_field_api_name(module_api, "求職者名")
+        id_field = self.settings.zoho_app_hc_id_field_api or self.get_field_api_name(module_api, "求職者ID")
+        email_field = self.settings.zoho_app_hc_email_field_api
+        if not name_field:
+            raise RuntimeError("APP-hc name field API not resolvable. Set ZOHO_APP_HC_NAME_FIELD_API explicitly.")
+
+        fields = ["id", name_field, "Modified_Time"]
+        for extra in (id_field, email_field):
+            if extra and extra not in fields:
+                fields.append(extra)
+        for r in self._iter_coql_by_modified_time(module_api, fields, modified_since):
+            yield {
+                "record_id": r.get("id"),
+                "candidate_name": r.get(name_field),
+                "candidate_id": (r.get(id_field) if id_field else None),
+                "candidate_email": (r.get(email_field) if email_field else None),
+                "modified_time": r.get("Modified_Time"),
+            }
+
+    def _iter_coql_by_modified_time(
+        self,
+        module_api: str,
+        fields: List[str],
+        modified_since: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Modified_Time 昇順で COQL をページングし、生レコードを返す。
+
+        OFFSET 上限に達したら最後の Modified_Time から取り直す
+        （同一時刻のレコードは重複し得るため、呼び出し側で id 単位に上書きする）。
+        """
+        select = ", ".join(fields)
+        watermark = modified_since
+        while True:
+            where = f"Modified_Time >= '{watermark}'" if watermark else "id is not null"
+            query = f"SELECT {select} FROM {module_api} WHERE {where} ORDER BY Modified_Time ASC"
+            page: Dict[str, Any] = {}
+            last: Optional[Dict[str, Any]] = None
+            for page in self._iter_coql_pages(query):
+                data = page.get("data", []) or []
+                yield from data
+                if data:
+                    last = data[-1]
+            if not has_more(page):
+                return
+            # OFFSET 上限に達した: 最後の Modified_Time から取り直す
+            last_modified = (last or {}).get("Modified_Time")
+            if not last_modified or last_modified == watermark:
+                logger.warning("[zoho] %s export stopped at OFFSET limit (Modified_Time=%s)", module_api, last_modified)
+                return
+            watermark = last_modified
+
+    def iter_app_hc_analytics_rows(self, modified_since: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Tier 3 分析ツール用の APP-hc レコード（流入経路・ステータス・登録日・面談日・PIC）を返す。
+
+        Args:
+            modified_since: 指定時はこの Modified_Time 以降に更新されたレコードのみ（差分取得）
+
+        Yields:
+            id, field14, customer_status, field18, field29, Owner, Modified_Time を持つ生レコード
+        """
+        fields = [
+            "id",
+            self.CHANNEL_FIELD_API,
+            self.STATUS_FIELD_API,
+            self.DATE_FIELD_API,
+            self.INTERVIEW_DATE_FIELD_API,
+            "Owner",
+            "Modified_Time",
+        ]
+        yield from self._iter_coql_by_modified_time(self.settings.zoho_app_hc_module, fields, modified_since)
+
+    def list_users(self) -> Dict[str, str]:
+        """CRM ユーザー ID -> 氏名（COQL の Owner は id のみ返るため PIC 名の解決に使う）"""
+        names: Dict[str, str] = {}
+        page = 1
+        while True:
+            result = self._get("/crm/v2/users", {"type": "AllUsers", "per_page": 200, "page": page}) or {}
+            for user in result.get("users", []) or []:
+                if user.get("id"):
+                    names[str(user["id"])] = user.get("full_name") or user.get("email") or str(user["id"])
+            if not (result.get("info") or {}).get("more_records"):
+                return names
+            page += 1
+
     # --- 流入経路検索・集計メソッド (Marketing ChatKit用) ---
 
     # Zoho CRM APP-hc フィールドのAPIマッピング
@@ -666,30 +888,38 @@ class ZohoClient:
             max_pages: 最大ページ数（200件/ページ、デフォルト10ページ=2000件）
 
         Returns:
-            全レコードのリスト
+            全レコードのリスト（途中のページで失敗した場合は取得済みの分）
         """
-        module_api = self.settings.zoho_app_hc_module
         all_records: List[Dict[str, Any]] = []
-        page = 1
+        try:
+            for record in self.iter_records(max_pages=max_pages):
+                all_records.append(record)
+        except Exception as e:
+            logger.warning("[zoho] _fetch_all_records failed after %d records: %s", len(all_records), e)
 
-        while page <= max_pages:
-            params = {"per_page": 200, "page": page}
-            try:
-                result = self._get(f"/crm/v2/{module_api}", params) or {}
-                data = result.get("data", []) or []
-                info = result.get("info", {}) or {}
+        logger.info("[zoho] _fetch_all_records: total=%d", len(all_records))
+        return all_records
 
-                all_records.extend(data)
+    def iter_records(
+        self,
+        module_api: Optional[str] = None,
+        max_pages: int = 10,
+        per_page: int = 200,
+    ) -> Iterator[Dict[str, Any]]:
+        """Records API のレコードをページ順に返す（後続ページは先読みで並行取得）
 
-                if not info.get("more_records"):
-                    break
-                page += 1
-            except Exception as e:
-                logger.warning("[zoho] _fetch_all_records page %d failed: %s", page, e)
-                break
+        Args:
+            module_api: モジュールAPI名（省略時は APP-hc）
+            max_pages: 最大ページ数
+            per_page: 1ページの件数（Records API の上限は200）
+        """
+        module_api = module_api or self.settings.zoho_app_hc_module
 
-        logger.info("[zoho] _fetch_all_records: total=%d pages=%d", len(all_records), page)
-        return all_records
+        def _fetch(index: int) -> Dict[str, Any]:
+            return self._get(f"/crm/v2/{module_api}", {"per_page": per_page, "page": index + 1}) or {}
+
+        for _, page in iter_pages(_fetch, max_pages=max_pages, label=f"records/{module_api}"):
+            yield from page.get("data", []) or []
 
     def _filter_by_date(
         self,
@@ -1075,19 +1305,15 @@ class ZohoClient:
                 query += f" WHERE {where_clause}"
             else:
                 query += " WHERE id is not null"
-            query += " LIMIT 2000"
+            # 2000件で打ち切らず OFFSET でページングし、届いたページから集計する
+            query += " ORDER BY id ASC"
 
             logger.debug("[zoho] count_by_status COQL: %s", query)
-            result = self._coql_query(query)
-            data = result.get("data", []) or []
-
-            # チャネルフィルタ（メモリ内）
-            if channel:
-                data = [r for r in data if r.get(self.CHANNEL_FIELD_API) == channel]
-
-            # ステータス別に集計
             counts: Dict[str, int] = {}
-            for r in data:
+            for r in self.iter_coql(query):
+                # チャネルフィルタ（メモリ内）
+                if channel and r.get(self.CHANNEL_FIELD_API) != channel:
+                    continue
                 st = r.get(self.STATUS_FIELD_API)
                 if st:
                     counts[st] = counts.get(st, 0) + 1
@@ -1703,7 +1929,7 @@ class ZohoWriteClient:
         logger.debug(f"🌐 API URL: {url}")
         
         try:
-            with request.urlopen(req, timeout=30) as resp:
+            with zoho_urlopen(req, timeout=30) as resp:
                 response_data = json.loads(resp.read().decode("utf-8"))
 
                 logger.info(f"📜 Zoho応答詳細: {response_data}")
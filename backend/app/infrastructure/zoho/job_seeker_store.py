@@ -0,0 +1,403 @@
+"""
+APP-hc (jobSeeker) 分析用ローカルレプリカ（Tier 3 Zoho ツール用）
+
+Records API を 200件×最大10ページ取得する5分 TTL キャッシュの代わりに、
+分析に必要な列（流入経路・ステータス・登録日・面談日・PIC）だけを COQL で全件取得して
+列指向で保持し、以降は Modified_Time による差分取得で更新する。削除レコードを落とすため
+定期的に全件再構築する。
+
+- 文字列列は辞書エンコード（値 -> 整数コード）した array、登録日は通日（toordinal）で保持する
+- 集計用に (登録日, 流入経路, ステータス, PIC, 面談有無) ごとの件数キューブを1パスで作り、
+  登録日順に並べて世代（データ更新回数）ごとにメモ化する。各ツールはキューブを bisect で
+  期間に切り出すだけで、レコードを走査しない（期間件数は累積件数の差、列ごとの集計は
+  切り出し範囲単位でさらにメモ化）
+"""
+from __future__ import annotations
+import bisect
+import logging
+import threading
+import time
+from array import array
+from collections import Counter
+from datetime import date
+from itertools import accumulate
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.infrastructure.config.settings import get_settings
+from app.infrastructure.zoho.client import ZohoClient
+
+logger = logging.getLogger(__name__)
+
+# 構築に失敗した場合、この秒数は再試行せず従来の Records API 取得へフォールバックさせる
+_FAILURE_BACKOFF_SECONDS = 60.0
+
+UNASSIGNED_PIC = "未割当"
+
+# 登録日なし（または解釈できない）行の通日
+NO_DATE = -1
+
+# キューブのセル列（登録日は先頭固定）
+_CUBE_COLUMNS = ("channel", "status", "owner", "interviewed")
+
+
+def day_number(value: Optional[str]) -> int:
+    """"YYYY-MM-DD"（日時でも可）を通日に変換する。空・不正値は NO_DATE。"""
+    if not value:
+        return NO_DATE
+    try:
+        return date.fromisoformat(value[:10]).toordinal()
+    except ValueError:
+        return NO_DATE
+
+
+class _Cube:
+    """
+    登録日順に並べた件数キューブ。
+
+    セルは (流入経路, ステータス, PIC, 面談有無) のコードを1つの整数（rest）に詰めたもので、
+    キーは 通日 * radix + rest。タプルではなく整数のまま数え・並べるため構築が軽い。
+    """
+
+    _MAX_MEMO = 256
+
+    def __init__(self, counts: Counter, sizes: Sequence[int]):
+        # sizes: 各セル列のコード数（_CUBE_COLUMNS 順）
+        self._sizes = tuple(sizes)
+        self._strides = []
+        stride = 1
+        for size in reversed(self._sizes):
+            self._strides.append(stride)
+            stride *= size
+        self._strides.reverse()
+        keys = sorted(counts)
+        self.days = array("l", (key // stride for key in keys))
+        self.rest = array("l", (key % stride for key in keys))
+        self.counts = array("l", (counts[key] for key in keys))
+        # 累積件数（全体 / 流入経路別は必要になった時に作る）
+        self._prefix: Dict[Optional[int], List[int]] = {
+            None: [0, *accumulate(self.counts)],
+        }
+        self._first_dated = bisect.bisect_left(self.days, 0)
+        self._memo: Dict[tuple, Dict[tuple, int]] = {}
+
+    def group(self, lo: int, hi: int, positions: Sequence[int], channel_code: Optional[int]) -> Dict[tuple, int]:
+        """セル範囲 [lo, hi) を列位置 positions のコードの組ごとに合計する（世代内でメモ化）"""
+        memo_key = (lo, hi, tuple(positions), channel_code)
+        grouped = self._memo.get(memo_key)
+        if grouped is None:
+            specs = [(self._strides[pos], self._sizes[pos]) for pos in positions]
+            grouped = {}
+            for rest, n in self.totals(lo, hi, channel_code).items():
+                key = tuple(rest // stride % size for stride, size in specs)
+                grouped[key] = grouped.get(key, 0) + n
+            if len(self._memo) >= self._MAX_MEMO:
+                self._memo.clear()
+            self._memo[memo_key] = grouped
+        return grouped
+
+    def channel_range(self, channel_code: int) -> Tuple[int, int]:
+        """流入経路コードに対応する rest の範囲 [lo, hi)（流入経路は rest の最上位桁）"""
+        stride = self._strides[0]
+        return channel_code * stride, (channel_code + 1) * stride
+
+    def span(self, date_from: Optional[str], date_to: Optional[str]) -> Tuple[int, int]:
+        """登録日が範囲内のセル範囲 [lo, hi)（範囲指定なしなら登録日なしのセルも含む）"""
+        if not date_from and not date_to:
+            return 0, len(self.days)
+        lo = bisect.bisect_left(self.days, day_number(date_from)) if date_from else self._first_dated
+        hi = bisect.bisect_right(self.days, day_number(date_to)) if date_to else len(self.days)
+        return max(lo, self._first_dated), hi
+
+    def totals(self, lo: int, hi: int, channel_code: Optional[int] = None) -> Dict[int, int]:
+        """セル範囲 [lo, hi) の rest ごとの件数"""
+        totals: Dict[int, int] = {}
+        get = totals.get
+        if channel_code is None:
+            for rest, n in zip(self.rest[lo:hi], self.counts[lo:hi]):
+                totals[rest] = get(rest, 0) + n
+        else:
+            r_lo, r_hi = self.channel_range(channel_code)
+            for rest, n in zip(self.rest[lo:hi], self.counts[lo:hi]):
+                if r_lo <= rest < r_hi:
+                    totals[rest] = get(rest, 0) + n
+        return totals
+
+    def prefix(self, channel_code: Optional[int]) -> List[int]:
+        prefix = self._prefix.get(channel_code)
+        if prefix is None:
+            r_lo, r_hi = self.channel_range(channel_code)
+            prefix = self._prefix[channel_code] = [0, *accumulate(
+                n if r_lo <= rest < r_hi else 0 for rest, n in zip(self.rest, self.counts)
+            )]
+        return prefix
+
+
+class _Dictionary:
+    """文字列値 <-> 整数コード（コード0は None / 空）"""
+
+    def __init__(self) -> None:
+        self.values: List[Optional[str]] = [None]
+        self._codes: Dict[Optional[str], int] = {None: 0}
+
+    def encode(self, value: Optional[str]) -> int:
+        value = value or None
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def code_of(self, value: Optional[str]) -> Optional[int]:
+        return self._codes.get(value or None)
+
+
+class JobSeekerStore:
+    """APP-hc 分析列の列指向インメモリレプリカ"""
+
+    def __init__(self) -> None:
+        # _sync_lock: 全件構築・差分取得の直列化 / _lock: 列データの読み書き
+        self._sync_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._row_of: Dict[str, int] = {}
+        self._reg_day = array("l")
+        self._channel = array("l")
+        self._status = array("l")
+        self._owner = array("l")
+        self._interviewed = bytearray()
+        self._dicts = {name: _Dictionary() for name in ("channel", "status", "owner")}
+        self._user_names: Dict[str, str] = {}
+        # データ更新ごとに進む世代。キューブは世代が変わった時だけ作り直す
+        self._generation = 0
+        self._cube: Optional[_Cube] = None
+        self._cube_generation = -1
+        self._cube_builds = 0
+        self._watermark: Optional[str] = None
+        self._built_at = 0.0
+        self._refreshed_at = 0.0
+        self._failed_at = 0.0
+        self._last_changed = 0
+        self._last_refresh_ms = 0.0
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "JobSeekerStore":
+        """Records API の生レコードから構築する（COQL が使えない場合のフォールバック用）"""
+        store = cls()
+        for record in records:
+            store._put(record)
+        store._built_at = store._refreshed_at = time.time()
+        return store
+
+    @property
+    def ready(self) -> bool:
+        return self._built_at > 0
+
+    def __len__(self) -> int:
+        return len(self._reg_day)
+
+    # ── 同期 ──
+
+    def ensure_fresh(self, zoho: Optional[ZohoClient] = None) -> bool:
+        """必要に応じて全件構築・差分更新を行い、レプリカが利用可能かを返す"""
+        settings = get_settings()
+        now = time.time()
+        if self.ready and now - self._refreshed_at < settings.zoho_job_seeker_store_refresh_seconds:
+            return True
+        if now - self._failed_at < _FAILURE_BACKOFF_SECONDS:
+            return self.ready
+
+        with self._sync_lock:
+            now = time.time()
+            if self.ready and now - self._refreshed_at < settings.zoho_job_seeker_store_refresh_seconds:
+                return True
+            zoho = zoho or ZohoClient()
+            full = not self.ready or now - self._built_at >= settings.zoho_job_seeker_store_rebuild_seconds
+            try:
+                started = time.perf_counter()
+                if full:
+                    self._rebuild(zoho)
+                else:
+                    self._apply_delta(zoho)
+                self._last_refresh_ms = round((time.perf_counter() - started) * 1000, 1)
+                self._refreshed_at = time.time()
+                return True
+            except Exception as e:
+                self._failed_at = time.time()
+                logger.warning("[zoho-store] refresh failed (full=%s): %s", full, e)
+                return self.ready
+
+    def _rebuild(self, zoho: ZohoClient) -> None:
+        fresh = JobSeekerStore()
+        try:
+            fresh._user_names = zoho.list_users()
+        except Exception as e:
+            # users スコープが無い場合は Owner の id をそのまま PIC 名として使う
+            logger.info("[zoho-store] user names unavailable: %s", e)
+        for row in zoho.iter_app_hc_analytics_rows():
+            fresh._put(row)
+        # 取得中も旧データで集計できるよう、構築し終えてから差し替える
+        with self._lock:
+            for name in ("_row_of", "_reg_day", "_channel", "_status", "_owner", "_interviewed",
+                         "_dicts", "_user_names", "_watermark"):
+                setattr(self, name, getattr(fresh, name))
+            self._generation += 1
+        self._last_changed = len(self)
+        self._built_at = time.time()
+        logger.info("[zoho-store] rebuilt: records=%d watermark=%s", len(self), self._watermark)
+
+    def _apply_delta(self, zoho: ZohoClient) -> None:
+        rows = list(zoho.iter_app_hc_analytics_rows(modified_since=self._watermark))
+        with self._lock:
+            for row in rows:
+                self._put(row)
+        self._last_changed = len(rows)
+        logger.info("[zoho-store] delta applied: changed=%d records=%d", len(rows), len(self))
+
+    def _owner_name(self, owner: Any) -> str:
+        if isinstance(owner, dict):
+            owner_id = str(owner.get("id") or "")
+            return owner.get("name") or self._user_names.get(owner_id) or owner_id or UNASSIGNED_PIC
+        return str(owner) if owner else UNASSIGNED_PIC
+
+    def _put(self, record: Dict[str, Any]) -> None:
+        record_id = record.get("id")
+        if not record_id:
+            return
+        reg_day = day_number(record.get(ZohoClient.DATE_FIELD_API))
+        channel = self._dicts["channel"].encode(record.get(ZohoClient.CHANNEL_FIELD_API))
+        status = self._dicts["status"].encode(record.get(ZohoClient.STATUS_FIELD_API))
+        owner = self._dicts["owner"].encode(self._owner_name(record.get("Owner")))
+        interviewed = 1 if record.get(ZohoClient.INTERVIEW_DATE_FIELD_API) else 0
+
+        row = self._row_of.get(record_id)
+        if row is None:
+            self._row_of[record_id] = len(self._reg_day)
+            self._reg_day.append(reg_day)
+            self._channel.append(channel)
+            self._status.append(status)
+            self._owner.append(owner)
+            self._interviewed.append(interviewed)
+        else:
+            self._reg_day[row] = reg_day
+            self._channel[row] = channel
+            self._status[row] = status
+            self._owner[row] = owner
+            self._interviewed[row] = interviewed
+
+        self._generation += 1
+
+        modified = record.get("Modified_Time")
+        if modified and (self._watermark is None or modified > self._watermark):
+            self._watermark = modified
+
+    # ── 集計 ──
+
+    def _get_cube(self) -> _Cube:
+        """現在の世代のキューブ（self._lock 保持中に呼ぶ）"""
+        if self._cube is None or self._cube_generation != self._generation:
+            sizes = [len(self._dicts[name].values) for name in _CUBE_COLUMNS[:-1]] + [2]
+            _, status_size, owner_size, _ = sizes
+            radix = sizes[0] * status_size * owner_size * 2
+            # 行ごとに 通日 * radix + rest を整数のまま数える
+            counts = Counter(
+                day * radix + ((ch * status_size + st) * owner_size + ow) * 2 + iv
+                for day, ch, st, ow, iv in zip(
+                    self._reg_day, self._channel, self._status, self._owner, self._interviewed,
+                )
+            )
+            self._cube = _Cube(counts, sizes)
+            self._cube_generation = self._generation
+            self._cube_builds += 1
+        return self._cube
+
+    def count_by(
+        self,
+        columns: Sequence[str],
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        channel: Optional[str] = None,
+    ) -> Counter:
+        """
+        登録日範囲（・流入経路）で絞った件数を列の組み合わせごとに返す。
+
+        Args:
+            columns: "channel" / "status" / "owner" / "interviewed" の組み合わせ
+
+        Returns:
+            Counter: 列値のタプル -> 件数（None は未設定。interviewed は 0/1）
+        """
+        with self._lock:
+            code = None
+            if channel:
+                code = self._dicts["channel"].code_of(channel)
+                if code is None:
+                    return Counter()
+            cube = self._get_cube()
+            lo, hi = cube.span(date_from, date_to)
+            grouped = cube.group(lo, hi, [_CUBE_COLUMNS.index(name) for name in columns], code)
+            decoders = [self._dicts[name].values if name in self._dicts else None for name in columns]
+
+        return Counter({
+            tuple(dec[c] if dec is not None else c for dec, c in zip(decoders, key)): n
+            for key, n in grouped.items()
+        })
+
+    def count(
+        self,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        channel: Optional[str] = None,
+    ) -> int:
+        """登録日範囲（・流入経路）に入る件数"""
+        return self.period_counts([(date_from, date_to)], channel=channel)[0]
+
+    def period_counts(
+        self,
+        periods: Sequence[Tuple[Optional[str], Optional[str]]],
+        channel: Optional[str] = None,
+    ) -> List[int]:
+        """期間 (date_from, date_to) ごとの件数（累積件数の差で求めるため期間数に対して O(log n)）"""
+        with self._lock:
+            code = None
+            if channel:
+                code = self._dicts["channel"].code_of(channel)
+                if code is None:
+                    return [0] * len(periods)
+            cube = self._get_cube()
+            prefix = cube.prefix(code)
+            result = []
+            for date_from, date_to in periods:
+                lo, hi = cube.span(date_from, date_to)
+                result.append(prefix[hi] - prefix[lo] if hi > lo else 0)
+            return result
+
+    def metrics(self) -> Dict[str, Any]:
+        """鮮度・件数メトリクス"""
+        now = time.time()
+        return {
+            "ready": self.ready,
+            "records": len(self),
+            "channels": len(self._dicts["channel"].values) - 1,
+            "owners": len(self._dicts["owner"].values) - 1,
+            "watermark": self._watermark,
+            "age_seconds": round(now - self._refreshed_at, 1) if self.ready else None,
+            "since_rebuild_seconds": round(now - self._built_at, 1) if self.ready else None,
+            "last_changed": self._last_changed,
+            "last_refresh_ms": self._last_refresh_ms,
+            "generation": self._generation,
+            "cube_cells": len(self._cube.counts) if self._cube is not None else None,
+            "cube_builds": self._cube_builds,
+        }
+
+
+_store: Optional[JobSeekerStore] = None
+_store_lock = threading.Lock()
+
+
+def get_job_seeker_store() -> JobSeekerStore:
+    """プロセス共有の APP-hc 分析レプリカを返す"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = JobSeekerStore()
+    return _store
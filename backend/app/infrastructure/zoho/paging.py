@@ -0,0 +1,219 @@
+"""
+Request budget and prefetching pager for Zoho CRM list / COQL endpoints.
+
+Every Zoho request made by ZohoClient (sync or async) runs under a process-wide
+semaphore so that concurrent page fetches (and other tools running at the same
+time) stay within the org's concurrency limit. 429 ``TOO_MANY_REQUESTS`` responses are
+retried with exponential backoff, releasing the slot while sleeping.
+
+``iter_pages`` walks a paged endpoint with up to ``prefetch`` pages in flight
+and yields the responses in page order, so a full-module load takes roughly the
+time of its slowest pages rather than the sum of all of them, and callers can
+aggregate while later pages are still being fetched.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, Optional, Tuple, TypeVar
+from urllib import error
+
+from app.infrastructure.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_RETRYABLE_STATUSES = {429}
+
+_global_slots: Optional[threading.BoundedSemaphore] = None
+_global_slots_lock = threading.Lock()
+
+# 非同期呼び出しの待ち行列（ループごと、FIFO）と、共有枠の空き待ちに使う専用スレッド
+_loop_gates: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+_slot_waiter: Optional[ThreadPoolExecutor] = None
+
+
+def _get_global_slots() -> threading.BoundedSemaphore:
+    global _global_slots
+    if _global_slots is None:
+        with _global_slots_lock:
+            if _global_slots is None:
+                limit = max(1, get_settings().zoho_max_concurrency)
+                _global_slots = threading.BoundedSemaphore(limit)
+    return _global_slots
+
+
+def _get_loop_gate() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    gate = _loop_gates.get(loop)
+    if gate is None:
+        gate = _loop_gates[loop] = asyncio.Semaphore(max(1, get_settings().zoho_max_concurrency))
+    return gate
+
+
+def _get_slot_waiter() -> ThreadPoolExecutor:
+    global _slot_waiter
+    if _slot_waiter is None:
+        with _global_slots_lock:
+            if _slot_waiter is None:
+                _slot_waiter = ThreadPoolExecutor(
+                    max_workers=max(1, get_settings().zoho_max_concurrency),
+                    thread_name_prefix="zoho-slot",
+                )
+    return _slot_waiter
+
+
+async def _acquire_slot(slots: threading.BoundedSemaphore) -> None:
+    """プロセス共通の枠を取る。空きが無ければ専用スレッドで待つ（ループは塞がない）"""
+    if slots.acquire(blocking=False):
+        return
+    waiting = asyncio.get_running_loop().run_in_executor(_get_slot_waiter(), slots.acquire)
+    try:
+        await asyncio.shield(waiting)
+    except asyncio.CancelledError:
+        # キャンセルされてもスレッド側の acquire は完了しうるので、取れた枠は返す
+        waiting.add_done_callback(
+            lambda f: slots.release() if not f.cancelled() and f.exception() is None else None
+        )
+        raise
+
+
+def is_rate_limited(e: Exception) -> bool:
+    """Return True for Zoho responses that should be retried with backoff."""
+    return isinstance(e, error.HTTPError) and e.code in _RETRYABLE_STATUSES
+
+
+def call_with_budget(
+    fn: Callable[[], T],
+    *,
+    max_retries: Optional[int] = None,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+) -> T:
+    """Run ``fn`` under the Zoho concurrency budget, retrying 429 responses."""
+    retries = get_settings().zoho_max_retries if max_retries is None else max_retries
+    slots = _get_global_slots()
+    attempt = 0
+    while True:
+        with slots:
+            try:
+                return fn()
+            except Exception as e:
+                if attempt >= retries or not is_rate_limited(e):
+                    raise
+        delay = min(max_delay, base_delay * (2 ** attempt)) + random.uniform(0, 1)
+        attempt += 1
+        logger.info("[zoho] rate limited, retrying in %.1fs (attempt %d/%d)", delay, attempt, retries)
+        time.sleep(delay)
+
+
+async def acall_with_budget(
+    fn: Callable[[], Awaitable[T]],
+    *,
+    max_retries: Optional[int] = None,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+) -> T:
+    """``call_with_budget`` の非同期版
+
+    ループ内のコルーチンは asyncio.Semaphore で到着順に並び、先頭だけが
+    同期呼び出しと共有するプロセス共通の枠を待つ（ポーリングしない）。
+    """
+    retries = get_settings().zoho_max_retries if max_retries is None else max_retries
+    slots = _get_global_slots()
+    gate = _get_loop_gate()
+    attempt = 0
+    while True:
+        async with gate:
+            await _acquire_slot(slots)
+            try:
+                return await fn()
+            except Exception as e:
+                if attempt >= retries or not is_rate_limited(e):
+                    raise
+            finally:
+                slots.release()
+        delay = min(max_delay, base_delay * (2 ** attempt)) + random.uniform(0, 1)
+        attempt += 1
+        logger.info("[zoho] rate limited, retrying in %.1fs (attempt %d/%d)", delay, attempt, retries)
+        await asyncio.sleep(delay)
+
+
+def has_more(page: Dict[str, Any]) -> bool:
+    """Records API / COQL 共通: データがあり info.more_records が真なら次ページがある"""
+    return bool(page.get("data")) and bool((page.get("info") or {}).get("more_records"))
+
+
+def iter_pages(
+    fetch: Callable[[int], Dict[str, Any]],
+    *,
+    max_pages: int,
+    prefetch: Optional[int] = None,
+    label: str = "pages",
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield ``(page_index, response)`` for pages 0.. in order until a page has no more records.
+
+    Page 0 is fetched alone (most queries fit in one page); after that up to
+    ``prefetch`` pages are kept in flight. Pages requested past the end are
+    discarded, so at most ``prefetch - 1`` requests are wasted per walk.
+    A failing page raises from the generator at its position in the sequence.
+    """
+    workers = max(1, get_settings().zoho_page_prefetch if prefetch is None else prefetch)
+    started = time.perf_counter()
+    fetched_ms = 0.0
+    pages = 0
+
+    def _timed(index: int) -> Tuple[Dict[str, Any], float]:
+        page_started = time.perf_counter()
+        page = fetch(index) or {}
+        elapsed_ms = (time.perf_counter() - page_started) * 1000
+        logger.info(
+            "[zoho] %s page %d: %d records in %.0fms",
+            label, index, len(page.get("data") or []), elapsed_ms,
+        )
+        return page, elapsed_ms
+
+    def _summary() -> None:
+        logger.info(
+            "[zoho] %s: %d pages in %.0fms (sum of page latencies %.0fms, prefetch=%d)",
+            label, pages, (time.perf_counter() - started) * 1000, fetched_ms, workers,
+        )
+
+    page, elapsed_ms = _timed(0)
+    pages, fetched_ms = 1, elapsed_ms
+    yield 0, page
+    if not has_more(page) or max_pages <= 1:
+        _summary()
+        return
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zoho-page")
+    pending: Deque[Tuple[int, Future]] = deque()
+    next_index = 1
+    try:
+        while True:
+            while len(pending) < workers and next_index < max_pages:
+                pending.append((next_index, pool.submit(_timed, next_index)))
+                next_index += 1
+            if not pending:
+                break
+            index, future = pending.popleft()
+            page, elapsed_ms = future.result()
+            pages += 1
+            fetched_ms += elapsed_ms
+            yield index, page
+            if not has_more(page):
+                break
+        if has_more(page) and next_index >= max_pages:
+            logger.info("[zoho] %s: stopped at max_pages=%d with more records remaining", label, max_pages)
+        _summary()
+    finally:
+        # 末尾を越えて先読みした分・途中で抜けた場合の残りは捨てる
+        pool.shutdown(wait=False, cancel_futures=True)
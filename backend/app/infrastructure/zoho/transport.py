@@ -0,0 +1,272 @@
+"""
+Pooled keep-alive HTTP transport for the Zoho clients.
+
+``zoho_urlopen`` / ``azoho_urlopen`` are drop-in replacements for
+``urllib.request.urlopen`` on a ``urllib.request.Request``. They send it over
+a shared httpx connection pool instead of a fresh connection per call, so
+DNS / TCP / TLS handshakes to zohoapis / accounts.zoho are paid once per
+connection rather than once per request:
+
+- keep-alive pool sized by ZOHO_HTTP_POOL_SIZE, HTTP/2 when ``h2`` is installed
+- gzip / deflate responses are requested and decoded by httpx
+- HTTP errors are raised as ``urllib.error.HTTPError`` (``e.code`` / ``e.read()``)
+  and connection errors as ``urllib.error.URLError``, so callers keep their
+  existing error handling
+- per-endpoint latency histograms (``get_transport_stats``)
+
+The async variant keeps one ``httpx.AsyncClient`` per event loop; clients of
+loops that have been closed are dropped, and ``aclose_zoho_transport`` closes
+the current loop's client at application shutdown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import email.message
+import io
+import logging
+import re
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional, Tuple
+from urllib import error, parse, request
+
+import httpx
+
+from app.infrastructure.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# ヒストグラムのバケット上限（ms）。最後のバケットはそれ以上
+_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# レコードID等の数値セグメントはエンドポイント名から外す
+_ID_SEGMENT = re.compile(r"/\d{6,}(?=/|$)")
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def endpoint_key(method: str, url: str) -> str:
+    """ "GET /crm/v2/CustomModule1/{id}" のような集計キー"""
+    path = parse.urlsplit(url).path or "/"
+    return f"{method} {_ID_SEGMENT.sub('/{id}', path)}"
+
+
+class _LatencyHistogram:
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(_BUCKETS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms: float, ok: bool) -> None:
+        self.buckets[bisect.bisect_left(_BUCKETS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        if not ok:
+            self.errors += 1
+
+    def quantile(self, q: float) -> Optional[int]:
+        """バケット上限で近似した分位点（ms）。最終バケットなら最大値"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return _BUCKETS_MS[i] if i < len(_BUCKETS_MS) else round(self.max_ms)
+        return round(self.max_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else None,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "max_ms": round(self.max_ms, 1),
+            "buckets_ms": dict(zip([*map(str, _BUCKETS_MS), "inf"], self.buckets)),
+        }
+
+
+class _Response:
+    """urlopen の戻り値と同じ使い方（with / read / getcode）ができるレスポンス"""
+
+    def __init__(self, response: httpx.Response):
+        self.status = response.status_code
+        self.headers = response.headers
+        self.http_version = response.http_version
+        self._body = response.content
+
+    def __enter__(self) -> "_Response":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def read(self) -> bytes:
+        return self._body
+
+    def getcode(self) -> int:
+        return self.status
+
+
+class ZohoTransport:
+    """Shared sync/async httpx pools plus per-endpoint latency statistics."""
+
+    def __init__(self) -> None:
+        settings = get_settings()
+        self.pool_size = max(1, settings.zoho_http_pool_size)
+        self.http2 = settings.zoho_http2 and _http2_available()
+        self._limits = httpx.Limits(
+            max_connections=self.pool_size,
+            max_keepalive_connections=self.pool_size,
+            keepalive_expiry=settings.zoho_http_keepalive_seconds,
+        )
+        self._client = httpx.Client(http2=self.http2, limits=self._limits)
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, _LatencyHistogram] = {}
+        self._http_versions: Dict[str, int] = {}
+
+    @staticmethod
+    def _unpack(req: request.Request) -> Tuple[str, str, Dict[str, str], Optional[bytes]]:
+        headers = dict(req.header_items())
+        # urllib は do_request_ で本文付きリクエストにフォーム形式の Content-Type を補うので、同じ既定値にする
+        if req.data is not None and not any(name.lower() == "content-type" for name in headers):
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        return req.get_method(), req.full_url, headers, req.data
+
+    def _observe(self, method: str, url: str, started: float, response: Optional[httpx.Response]) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        ok = response is not None and response.status_code < 400
+        with self._lock:
+            key = endpoint_key(method, url)
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _LatencyHistogram()
+            histogram.observe(elapsed_ms, ok)
+            if response is not None:
+                version = response.http_version
+                self._http_versions[version] = self._http_versions.get(version, 0) + 1
+        logger.debug("[zoho] %s %s -> %s in %.0fms", method, endpoint_key(method, url),
+                     response.status_code if response is not None else "error", elapsed_ms)
+
+    @staticmethod
+    def _to_urllib(url: str, response: httpx.Response) -> _Response:
+        if response.status_code >= 400:
+            headers = email.message.Message()
+            for name, value in response.headers.items():
+                headers[name] = value
+            raise error.HTTPError(
+                url, response.status_code, response.reason_phrase, headers, io.BytesIO(response.content)
+            )
+        return _Response(response)
+
+    def urlopen(self, req: request.Request, timeout: float = 30) -> _Response:
+        method, url, headers, data = self._unpack(req)
+        started = time.perf_counter()
+        response = None
+        try:
+            response = self._client.request(method, url, headers=headers, content=data, timeout=timeout)
+        except httpx.TransportError as e:
+            raise error.URLError(e) from e
+        finally:
+            self._observe(method, url, started, response)
+        return self._to_urllib(url, response)
+
+    def _async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            with self._lock:
+                # 閉じたループ（asyncio.run 済みのワーカー等）のクライアントは使えないので捨てる
+                for stale in [other for other in self._async_clients if other.is_closed()]:
+                    self._async_clients.pop(stale, None)
+            client = self._async_clients[loop] = httpx.AsyncClient(http2=self.http2, limits=self._limits)
+        return client
+
+    async def aclose(self) -> None:
+        """現在のループの AsyncClient を閉じる（次の呼び出しで作り直される）"""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def close(self) -> None:
+        self._client.close()
+
+    async def aurlopen(self, req: request.Request, timeout: float = 30) -> _Response:
+        method, url, headers, data = self._unpack(req)
+        started = time.perf_counter()
+        response = None
+        try:
+            response = await self._async_client().request(method, url, headers=headers, content=data, timeout=timeout)
+        except httpx.TransportError as e:
+            raise error.URLError(e) from e
+        finally:
+            self._observe(method, url, started, response)
+        return self._to_urllib(url, response)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            endpoints = {key: h.snapshot() for key, h in sorted(self._histograms.items())}
+            versions = dict(self._http_versions)
+        return {
+            "pool_size": self.pool_size,
+            "http2": self.http2,
+            "http_versions": versions,
+            "async_clients": len(self._async_clients),
+            "endpoints": endpoints,
+        }
+
+
+_transport: Optional[ZohoTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_zoho_transport() -> ZohoTransport:
+    """プロセス共有の Zoho 用コネクションプールを返す"""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = ZohoTransport()
+    return _transport
+
+
+def zoho_urlopen(req: request.Request, timeout: float = 30) -> _Response:
+    """``urllib.request.urlopen`` と同じ呼び出し方でプール済み接続を使う"""
+    return get_zoho_transport().urlopen(req, timeout=timeout)
+
+
+async def azoho_urlopen(req: request.Request, timeout: float = 30) -> _Response:
+    """``zoho_urlopen`` の非同期版（イベントループごとの AsyncClient を使う）"""
+    return await get_zoho_transport().aurlopen(req, timeout=timeout)
+
+
+async def aclose_zoho_transport() -> None:
+    """アプリ終了時に呼ぶ: 接続プールを閉じる"""
+    global _transport
+    with _transport_lock:
+        transport, _transport = _transport, None
+    if transport is not None:
+        await transport.aclose()
+        transport.close()
+
+
+def get_transport_stats() -> Dict[str, Any]:
+    """プール設定・HTTP バージョン・エンドポイント別レイテンシ"""
+    return get_zoho_transport().stats()
@@ -45,6 +45,34 @@ logger.info("🎯 Zoho書き込みログが有効です")
 def health():
     return {"status": "ok"}
 
+
+@app.on_event("startup")
+async def warm_up_mcp_pool():
+    # ADK モードでは STDIO MCP サーバーを起動時に温めておき、初回チャットのコールドスタートを避ける
+    from app.infrastructure.config.settings import get_settings
+    settings = get_settings()
+    if not (settings.use_adk and settings.use_local_mcp and settings.mcp_pool_enabled):
+        return
+    try:
+        from app.infrastructure.marketing.agent_service import get_marketing_agent_service
+        await get_marketing_agent_service().warm_up_mcp_pool()
+    except Exception as e:
+        logger.warning(f"MCP pool warm-up failed: {e}")
+
+
+@app.on_event("shutdown")
+async def close_mcp_pool():
+    from app.infrastructure.marketing import agent_service as marketing_agent_service
+    service = marketing_agent_service._adk_service_instance
+    if service is not None:
+        await service.close_mcp_pool()
+
+
+@app.on_event("shutdown")
+async def close_zoho_transport():
+    from app.infrastructure.zoho.transport import aclose_zoho_transport
+    await aclose_zoho_transport()
+
 # CORS (社内ドメインのみ許可、本番では明示的な設定必須)
 _cors_origins_env = os.getenv("CORS_ALLOW_ORIGINS", "")
 _cors_origins = [o.strip() for o in _cors_origins_env.split(",") if o.strip()]
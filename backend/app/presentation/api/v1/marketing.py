@@ -36,6 +36,7 @@ from app.infrastructure.chatkit.model_assets import (
     delete_model_asset,
 )
 from app.infrastructure.chatkit.marketing_server import get_marketing_chat_server
+from app.infrastructure.marketing.agent_service import invalidate_model_asset_cache
 from app.infrastructure.chatkit.supabase_store import SupabaseChatStore, PermissionDeniedError
 from app.infrastructure.config.settings import get_settings
 from app.infrastructure.supabase.client import get_supabase
@@ -711,6 +712,7 @@ async def create_or_update_model_asset(
         )
 
     result = upsert_model_asset(data, context=context)
+    invalidate_model_asset_cache(result.get("id"))
     result["verbosity"] = _normalize_verbosity_to_client(result.get("verbosity"))
     return {"data": result}
 
@@ -782,6 +784,7 @@ async def update_model_asset(
         )
 
     result = upsert_model_asset(data, context=context)
+    invalidate_model_asset_cache(result.get("id"))
     result["verbosity"] = _normalize_verbosity_to_client(result.get("verbosity"))
     return {"data": result}
 
@@ -800,6 +803,7 @@ async def delete_model_asset_by_id(
         raise HTTPException(status_code=404, detail="Model asset not found")
 
     success = delete_model_asset(asset_id)
+    invalidate_model_asset_cache(asset_id)
     if not success:
         raise HTTPException(status_code=404, detail="Model asset not found")
 
@@ -12,6 +12,7 @@ This V2 module (/marketing-v2) provides the new ADK-based implementation.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from datetime import datetime
@@ -34,7 +35,7 @@ from app.infrastructure.chatkit.context import MarketingRequestContext
 from app.infrastructure.chatkit.model_assets import get_model_asset
 from app.infrastructure.chatkit.supabase_store import generate_thread_title
 from app.infrastructure.config.settings import get_settings
-from app.infrastructure.supabase.client import get_supabase
+from app.infrastructure.supabase.client import run_supabase
 from app.infrastructure.security.marketing_token_service import (
     MarketingTokenError,
     MarketingTokenService,
@@ -153,7 +154,6 @@ async def chat_stream(
     - error: Error event
     """
     agent_service = get_marketing_agent_service()
-    sb = get_supabase()
 
     # Validate attachments
     attachments_data: list[dict] | None = None
@@ -198,10 +198,9 @@ async def chat_stream(
 
     # Read-only check: non-owners of shared conversations cannot send messages
     if body.conversation_id:
-        sb_check = get_supabase()
         try:
-            conv_check = (
-                sb_check.table("marketing_conversations")
+            conv_check = await run_supabase(
+                lambda sb: sb.table("marketing_conversations")
                 .select("owner_clerk_id, is_shared")
                 .eq("id", body.conversation_id)
                 .limit(1)
@@ -238,62 +237,72 @@ async def chat_stream(
 
         # --- DB: Save user message before streaming ---
         user_msg_id = str(uuid.uuid4())
-        try:
-            # Ensure conversation exists
-            if is_new_conversation:
-                # Generate title asynchronously
-                title = await generate_thread_title(body.message) or "新しい会話"
-                sb.table("marketing_conversations").insert({
-                    "id": conversation_id,
-                    "title": title,
-                    "owner_email": context.user_email,
-                    "owner_clerk_id": context.user_id,
-                    "status": "active",
-                    "metadata": {
-                        "engine": "adk",  # Mark as V2/ADK conversation
-                        "context_items": body.context_items,
-                    } if body.context_items else {"engine": "adk"},
-                }).execute()
-                logger.info(f"[DB] Created V2 conversation: {conversation_id}")
-            else:
-                # Update last_message_at for existing conversation
-                sb.table("marketing_conversations").update({
-                    "last_message_at": datetime.utcnow().isoformat(),
-                }).eq("id", conversation_id).execute()
-
-            # Save user message
-            sb.table("marketing_messages").insert({
-                "id": user_msg_id,
-                "conversation_id": conversation_id,
-                "role": "user",
-                "message_type": "content",
-                "content": {"text": body.message},
-                "plain_text": body.message,
-                "created_by": context.user_email,
-            }).execute()
-            logger.info(f"[DB] Saved user message: {user_msg_id}")
-        except Exception as e:
-            logger.exception(f"[DB] Failed to save user message: {e}")
-            # Continue streaming even if DB save fails
+
+        async def save_user_message() -> None:
+            try:
+                # Ensure conversation exists
+                if is_new_conversation:
+                    # Generate title asynchronously
+                    title = await generate_thread_title(body.message) or "新しい会話"
+                    conversation = {
+                        "id": conversation_id,
+                        "title": title,
+                        "owner_email": context.user_email,
+                        "owner_clerk_id": context.user_id,
+                        "status": "active",
+                        "metadata": {
+                            "engine": "adk",  # Mark as V2/ADK conversation
+                            "context_items": body.context_items,
+                        } if body.context_items else {"engine": "adk"},
+                    }
+                    await run_supabase(lambda sb: sb.table("marketing_conversations").insert(conversation).execute())
+                    logger.info(f"[DB] Created V2 conversation: {conversation_id}")
+                else:
+                    # Update last_message_at for existing conversation
+                    await run_supabase(lambda sb: sb.table("marketing_conversations").update({
+                        "last_message_at": datetime.utcnow().isoformat(),
+                    }).eq("id", conversation_id).execute())
+
+                # Save user message
+                await run_supabase(lambda sb: sb.table("marketing_messages").insert({
+                    "id": user_msg_id,
+                    "conversation_id": conversation_id,
+                    "role": "user",
+                    "message_type": "content",
+                    "content": {"text": body.message},
+                    "plain_text": body.message,
+                    "created_by": context.user_email,
+                }).execute())
+                logger.info(f"[DB] Saved user message: {user_msg_id}")
+            except Exception as e:
+                logger.exception(f"[DB] Failed to save user message: {e}")
+                # Continue streaming even if DB save fails
 
         # --- Load user: state from latest conversation for cross-session persistence ---
-        initial_state: dict = {}
-        try:
-            latest = sb.table("marketing_conversations") \
-                .select("metadata") \
-                .eq("owner_email", context.user_email) \
-                .neq("id", conversation_id) \
-                .order("last_message_at", desc=True) \
-                .limit(1) \
-                .execute()
-            if latest.data:
-                meta = latest.data[0].get("metadata") or {}
-                if meta.get("engine") == "adk":
-                    initial_state = meta.get("user_state", {})
-                    if initial_state:
-                        logger.info(f"[State] Loaded {len(initial_state)} user state keys")
-        except Exception as e:
-            logger.warning(f"[State] Failed to load user_state: {e}")
+        async def load_user_state() -> dict:
+            try:
+                latest = await run_supabase(
+                    lambda sb: sb.table("marketing_conversations")
+                    .select("metadata")
+                    .eq("owner_email", context.user_email)
+                    .neq("id", conversation_id)
+                    .order("last_message_at", desc=True)
+                    .limit(1)
+                    .execute()
+                )
+                if latest.data:
+                    meta = latest.data[0].get("metadata") or {}
+                    if meta.get("engine") == "adk":
+                        user_state = meta.get("user_state", {})
+                        if user_state:
+                            logger.info(f"[State] Loaded {len(user_state)} user state keys")
+                        return user_state
+            except Exception as e:
+                logger.warning(f"[State] Failed to load user_state: {e}")
+            return {}
+
+        # 保存と user_state 読み込みは独立しているので並行して待つ
+        _, initial_state = await asyncio.gather(save_user_message(), load_user_state())
 
         # Inject current date/time (JST) for accurate date reasoning
         from zoneinfo import ZoneInfo
@@ -468,10 +477,10 @@ async def chat_stream(
                 elif event_type == "_context_items":
                     # Save context_items + user:/app: state to conversation metadata
                     try:
-                        metadata_update = {
-                            "engine": "adk",
-                            "context_items": event.get("items"),
-                        }
+                        metadata_update = {"engine": "adk"}
+                        # Durable ADK sessions return None: history lives in adk_session_events
+                        if event.get("items") is not None:
+                            metadata_update["context_items"] = event.get("items")
                         # Persist user:/app: state for cross-conversation restoration
                         us = event.get("user_state")
                         if us:
@@ -479,9 +488,9 @@ async def chat_stream(
                         aps = event.get("app_state")
                         if aps:
                             metadata_update["app_state"] = aps
-                        sb.table("marketing_conversations").update({
+                        await run_supabase(lambda sb: sb.table("marketing_conversations").update({
                             "metadata": metadata_update,
-                        }).eq("id", conversation_id).execute()
+                        }).eq("id", conversation_id).execute())
                         logger.info(f"[DB] Saved context_items + state for: {conversation_id}")
                     except Exception as e:
                         logger.warning(f"[DB] Failed to save context_items: {e}")
@@ -526,7 +535,7 @@ async def chat_stream(
             # --- DB: Save assistant message with activity_items ---
             if full_text_content or activity_items:
                 try:
-                    sb.table("marketing_messages").insert({
+                    await run_supabase(lambda sb: sb.table("marketing_messages").insert({
                         "id": assistant_msg_id,
                         "conversation_id": conversation_id,
                         "role": "assistant",
@@ -537,13 +546,13 @@ async def chat_stream(
                         },
                         "plain_text": full_text_content[:10000] if full_text_content else None,
                         "created_by": "assistant",
-                    }).execute()
+                    }).execute())
                     logger.info(f"[DB] Saved assistant message: {assistant_msg_id}")
 
                     # Update conversation last_message_at
-                    sb.table("marketing_conversations").update({
+                    await run_supabase(lambda sb: sb.table("marketing_conversations").update({
                         "last_message_at": datetime.utcnow().isoformat(),
-                    }).eq("id", conversation_id).execute()
+                    }).eq("id", conversation_id).execute())
                 except Exception as e:
                     logger.exception(f"[DB] Failed to save assistant message: {e}")
 
@@ -562,6 +571,28 @@ async def chat_stream(
     )
 
 
+# ============================================================
+# Runtime Stats (ADK)
+# ============================================================
+
+@router.get("/stats")
+async def get_runtime_stats(
+    context: MarketingRequestContext = Depends(require_marketing_context),
+):
+    """
+    Cache and pool statistics of this instance's ADK agent service.
+
+    MCP pool (size, lease wait, cold starts), agent graph cache (hit rate,
+    build time), tool result / embedding caches and Zoho store / transport.
+    Counters are per process since startup.
+    """
+    service = get_marketing_agent_service()
+    get_stats = getattr(service, "get_runtime_stats", None)
+    if get_stats is None:
+        raise HTTPException(status_code=404, detail="Runtime stats are only available with USE_ADK=true")
+    return {"stats": get_stats()}
+
+
 # ============================================================
 # Thread Management Endpoints (V2)
 # ============================================================
@@ -577,12 +608,10 @@ async def list_threads(
     Returns conversations sorted by last_message_at (newest first).
     Filters to ADK-engine conversations only.
     """
-    sb = get_supabase()
-
     try:
         # Get user's own conversations (V2 only)
-        result = (
-            sb.table("marketing_conversations")
+        result = await run_supabase(
+            lambda sb: sb.table("marketing_conversations")
             .select("id, title, status, created_at, last_message_at, updated_at, metadata")
             .eq("owner_email", context.user_email)
             .order("last_message_at", desc=True)
@@ -619,12 +648,10 @@ async def delete_thread(
     """
     Delete a V2 conversation and its messages.
     """
-    sb = get_supabase()
-
     try:
         # Verify ownership
-        conv_result = (
-            sb.table("marketing_conversations")
+        conv_result = await run_supabase(
+            lambda sb: sb.table("marketing_conversations")
             .select("owner_email")
             .eq("id", thread_id)
             .limit(1)
@@ -637,10 +664,10 @@ async def delete_thread(
             raise HTTPException(status_code=403, detail="Access denied")
 
         # Delete messages first (foreign key constraint)
-        sb.table("marketing_messages").delete().eq("conversation_id", thread_id).execute()
+        await run_supabase(lambda sb: sb.table("marketing_messages").delete().eq("conversation_id", thread_id).execute())
 
         # Delete conversation
-        sb.table("marketing_conversations").delete().eq("id", thread_id).execute()
+        await run_supabase(lambda sb: sb.table("marketing_conversations").delete().eq("id", thread_id).execute())
 
         return {"success": True}
     except HTTPException:
@@ -660,12 +687,10 @@ async def get_thread_detail(
 
     Returns conversation metadata and messages with activity_items for UI restoration.
     """
-    sb = get_supabase()
-
     try:
         # Get conversation
-        conv_result = (
-            sb.table("marketing_conversations")
+        conv_result = await run_supabase(
+            lambda sb: sb.table("marketing_conversations")
             .select("*")
             .eq("id", thread_id)
             .limit(1)
@@ -683,8 +708,8 @@ async def get_thread_detail(
             raise HTTPException(status_code=403, detail="Access denied")
 
         # Get messages
-        messages_result = (
-            sb.table("marketing_messages")
+        messages_result = await run_supabase(
+            lambda sb: sb.table("marketing_messages")
             .select("id, role, message_type, content, plain_text, created_at")
             .eq("conversation_id", thread_id)
             .order("created_at", desc=False)
@@ -748,12 +773,10 @@ async def toggle_thread_share(
 
     Returns: { "thread_id", "is_shared", "share_url" }
     """
-    sb = get_supabase()
-
     try:
         # Verify ownership
-        conv_result = (
-            sb.table("marketing_conversations")
+        conv_result = await run_supabase(
+            lambda sb: sb.table("marketing_conversations")
             .select("owner_clerk_id, is_shared")
             .eq("id", thread_id)
             .limit(1)
@@ -775,7 +798,9 @@ async def toggle_thread_share(
             update_payload["shared_by_email"] = context.user_email
             update_payload["shared_by_clerk_id"] = context.user_id
 
-        sb.table("marketing_conversations").update(update_payload).eq("id", thread_id).execute()
+        await run_supabase(
+            lambda sb: sb.table("marketing_conversations").update(update_payload).eq("id", thread_id).execute()
+        )
         logger.info("Thread %s sharing toggled to %s by %s", thread_id, body.is_shared, context.user_email)
 
         return {
@@ -800,11 +825,9 @@ async def get_thread_share_status(
 
     Returns: { "thread_id", "is_shared", "shared_at", "is_owner", "can_toggle", "share_url" }
     """
-    sb = get_supabase()
-
     try:
-        conv_result = (
-            sb.table("marketing_conversations")
+        conv_result = await run_supabase(
+            lambda sb: sb.table("marketing_conversations")
             .select("id, is_shared, shared_at, shared_by_email, owner_clerk_id, owner_email")
             .eq("id", thread_id)
             .limit(1)
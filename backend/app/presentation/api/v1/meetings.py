@@ -24,15 +24,17 @@ async def collect_meetings(
     accounts: Optional[List[str]] = Query(default=None),
     include_structure: bool = Query(default=False),
     force_update: bool = Query(default=False),
+    full_rescan: bool = Query(default=False, description="Changes APIの差分ではなく全フォルダを再スキャン"),
 ):
     """Kick off meeting collection in the background and return immediately."""
     use_case = CollectMeetingsUseCase()
     try:
         logger.info(
-            "POST /api/v1/meetings/collect queued: accounts=%s include_structure=%s force_update=%s",
+            "POST /api/v1/meetings/collect queued: accounts=%s include_structure=%s force_update=%s full_rescan=%s",
             accounts,
             include_structure,
             force_update,
+            full_rescan,
         )
         job_id = JobTracker.create_job(
             name="collect_meetings",
@@ -40,6 +42,7 @@ async def collect_meetings(
                 "accounts": accounts or [],
                 "include_structure": include_structure,
                 "force_update": force_update,
+                "full_rescan": full_rescan,
             },
         )
         JobTracker.mark_running(job_id, message="Collecting from Google Drive")
@@ -53,6 +56,7 @@ async def collect_meetings(
                     include_structure=include_structure,
                     force_update=force_update,
                     job_id=job_id,
+                    full_rescan=full_rescan,
                 )
             except Exception as e:  # pragma: no cover
                 logger.exception("Background collect failed: %s", e)
@@ -149,7 +153,7 @@ async def update_meeting_transcript(meeting_id: str, body: TranscriptUpdateIn =
     """議事録テキストを上書きし、必要なら既存の構造化データをクリア"""
     use_case = UpdateMeetingTranscriptUseCase()
     try:
-        updated = use_case.execute(
+        updated = await use_case.execute(
             meeting_id=meeting_id,
             text_content=body.text_content,
             transcript_provider=body.transcript_provider,
@@ -169,6 +173,7 @@ async def enqueue_collect_meetings(
     accounts: Optional[List[str]] = Query(default=None),
     include_structure: bool = Query(default=False),
     force_update: bool = Query(default=False),
+    full_rescan: bool = Query(default=False, description="Changes APIの差分ではなく全フォルダを再スキャン"),
 ):
     """
     収集処理をCloud Tasksへエンキューする新エンドポイント。
@@ -181,6 +186,7 @@ async def enqueue_collect_meetings(
             "accounts": accounts or [],
             "include_structure": include_structure,
             "force_update": force_update,
+            "full_rescan": full_rescan,
         },
     )
     JobTracker.mark_running(job_id, message="Queued to Cloud Tasks")
@@ -191,6 +197,7 @@ async def enqueue_collect_meetings(
         "accounts": accounts or [],
         "include_structure": include_structure,
         "force_update": force_update,
+        "full_rescan": full_rescan,
     }
 
     task_name = None  # 連続実行の重複を抑止したい場合は日付ベースのnameを付ける
@@ -213,6 +220,7 @@ class CollectWorkerIn(BaseModel):
     accounts: Optional[List[str]] = None
     include_structure: bool = False
     force_update: bool = False
+    full_rescan: bool = False
 
 @router.post("/collect/worker", status_code=204)
 async def collect_worker(request: Request, body: CollectWorkerIn = Body(...)):
@@ -240,6 +248,7 @@ async def collect_worker(request: Request, body: CollectWorkerIn = Body(...)):
             include_structure=body.include_structure,
             force_update=body.force_update,
             job_id=body.job_id,
+            full_rescan=body.full_rescan,
         )
         # UseCase 側で JobTracker.mark_success/failed まで面倒をみてくれる
         # （途中メトリクス更新もUseCase内で済む）
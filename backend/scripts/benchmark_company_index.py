@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Company DB Search Micro-benchmark.
+
+Compares the columnar CompanyIndex (app/infrastructure/google/company_index.py)
+against the former per-call linear scan over get_all_companies() rows, on
+synthetic DB-sheet rows. Results of both paths are checked for equality.
+
+Usage:
+    cd backend
+    uv run python scripts/benchmark_company_index.py [--rows 100 1000 5000] [--repeat 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.infrastructure.google.company_index import CompanyIndex, parse_int
+
+INDUSTRIES = ["IT・通信", "コンサル", "メーカー", "人材", "金融", "不動産", "広告・マーケティング", "SaaS"]
+LOCATIONS = ["東京都港区", "東京都渋谷区", "大阪府大阪市", "愛知県名古屋市", "福岡県福岡市", "フルリモート"]
+EDUCATION = ["不問", "大卒以上", "MARCH以上", "高卒以上"]
+REMOTE = ["可", "不可", "フルリモート", "週2出社", "相談", ""]
+
+QUERIES: List[Dict[str, Any]] = [
+    {"industry": "IT"},
+    {"location": "東京"},
+    {"industry": "コンサル", "min_salary": 700},
+    {"location": "東京", "max_age": 35, "remote_ok": True},
+    {"min_salary": 600, "max_age": 30, "education": "大卒"},
+    {"industry": "メーカー", "location": "大阪", "min_salary": 500, "max_age": 40},
+]
+
+
+def make_companies(n: int, seed: int = 42) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    companies = []
+    for i in range(n):
+        low = rng.randrange(350, 900, 50)
+        companies.append({
+            "企業名": f"株式会社サンプル{i:05d}",
+            "業種": rng.choice(INDUSTRIES),
+            "勤務地": rng.choice(LOCATIONS),
+            "想定年収下限": f"{low}万",
+            "想定年収上限": f"{low + rng.randrange(100, 500, 50):,}万",
+            "年齢上限": rng.choice(["", "30歳", "35歳", "40歳", "45"]),
+            "学歴要件": rng.choice(EDUCATION),
+            "経験社数上限": rng.choice(["", "2", "3", "4"]),
+            "リモートワーク": rng.choice(REMOTE),
+        })
+    return companies
+
+
+def linear_search(
+    companies: List[Dict[str, Any]],
+    industry: Optional[str] = None,
+    location: Optional[str] = None,
+    min_salary: Optional[int] = None,
+    max_age: Optional[int] = None,
+    education: Optional[str] = None,
+    remote_ok: Optional[bool] = None,
+) -> List[str]:
+    """The per-call scan search_companies used before the index."""
+    names = []
+    for company in companies:
+        if industry and industry not in company.get("業種", ""):
+            continue
+        if location and location not in company.get("勤務地", ""):
+            continue
+        if min_salary and parse_int(company.get("想定年収上限"), 0) < min_salary:
+            continue
+        if max_age and parse_int(company.get("年齢上限"), 99) < max_age:
+            continue
+        if education and education not in company.get("学歴要件", ""):
+            continue
+        if remote_ok is not None:
+            policy = company.get("リモートワーク", "")
+            if remote_ok and not ("可" in policy or "フル" in policy or "相談" in policy):
+                continue
+        names.append(company.get("企業名"))
+    return names
+
+
+def indexed_search(index: CompanyIndex, remote_ok: Optional[bool] = None, **filters: Any) -> List[str]:
+    return [index.names[row] for row in index.filter(remote_only=bool(remote_ok), **filters)]
+
+
+def timeit(fn: Callable[[], Any], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1e6  # µs per call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'rows':>6} {'build ms':>9} {'query':<48} {'scan µs':>9} {'index µs':>9} {'speedup':>8}")
+    for n in args.rows:
+        companies = make_companies(n)
+        started = time.perf_counter()
+        index = CompanyIndex(companies)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        for query in QUERIES:
+            expected = linear_search(companies, **query)
+            actual = indexed_search(index, **query)
+            assert actual == expected, f"result mismatch for {query}"
+
+            scan_us = timeit(lambda: linear_search(companies, **query), args.repeat)
+            index_us = timeit(lambda: indexed_search(index, **query), args.repeat)
+            label = ", ".join(f"{k}={v}" for k, v in query.items())
+            print(
+                f"{n:>6} {build_ms:>9.2f} {label:<48} {scan_us:>9.1f} {index_us:>9.1f} "
+                f"{scan_us / index_us if index_us else float('inf'):>7.1f}x"
+            )
+
+        name = companies[n // 2]["企業名"]
+        scan_us = timeit(lambda: [c for c in companies if name in c.get("企業名", "")], args.repeat)
+        index_us = timeit(lambda: index.find_by_name(name), args.repeat)
+        print(f"{n:>6} {build_ms:>9.2f} {'find_by_name':<48} {scan_us:>9.1f} {index_us:>9.1f} {scan_us / index_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
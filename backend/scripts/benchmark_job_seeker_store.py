@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Tier 3 Zoho Analytics Micro-benchmark.
+
+Compares the JobSeekerStore count cube (app/infrastructure/zoho/job_seeker_store.py)
+against the former per-tool loops over the cached list of jobSeeker record dicts
+(trend_analysis_by_period: one pass per period; compare_channels /
+get_pic_performance / get_conversion_metrics: channel x status dicts rebuilt
+per call), on synthetic records. Results of both paths are checked for equality.
+
+"cube" is the first query after a data change (includes building the cube);
+"warm" is a repeated call within the same data generation (memoised cube and
+per-slice group totals). The legacy loops pay the full scan on every call.
+
+Usage:
+    cd backend
+    uv run python scripts/benchmark_job_seeker_store.py [--records 2000 20000 100000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.infrastructure.zoho.job_seeker_store import JobSeekerStore
+
+CHANNELS = [
+    "sco_bizreach", "sco_dodaX", "sco_ambi", "sco_rikunavi", "paid_google", "paid_meta",
+    "org_hitocareer", "org_jobs", "feed_indeed", "referral",
+]
+STATUSES = [
+    "1. リード", "2. コンタクト", "3. 面談待ち", "4. 面談済み", "5. 提案中", "6. 応募意思獲得",
+    "7. 打診済み", "8. 一次面接待ち", "9. 一次面接済み", "10. 最終面接待ち", "11. 最終面接済み",
+    "12. 内定", "13. 内定承諾", "14. 入社", "15. 保留", "16. クローズ",
+]
+OWNERS = [f"担当者{i:02d}" for i in range(20)]
+TODAY = date(2026, 6, 15)
+
+
+def make_records(n: int, seed: int = 7) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    records = []
+    for i in range(n):
+        reg = TODAY - timedelta(days=rng.randrange(0, 3 * 365))
+        owner = rng.choice(OWNERS)
+        records.append({
+            "id": str(10_000_000 + i),
+            "field14": rng.choice(CHANNELS),
+            "customer_status": rng.choice(STATUSES) if rng.random() > 0.02 else None,
+            "field18": reg.isoformat() if rng.random() > 0.01 else None,
+            "field29": (reg + timedelta(days=7)).isoformat() if rng.random() < 0.3 else None,
+            "Owner": {"id": owner, "name": owner},
+            "Modified_Time": f"{reg.isoformat()}T10:00:00+09:00",
+        })
+    return records
+
+
+def monthly_periods(months: int = 12) -> List[Tuple[str, str]]:
+    periods = []
+    for i in range(months - 1, -1, -1):
+        year, month = TODAY.year, TODAY.month - i
+        while month <= 0:
+            month += 12
+            year -= 1
+        start = date(year, month, 1)
+        end = (date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)) - timedelta(days=1)
+        periods.append((start.isoformat(), end.isoformat()))
+    return periods
+
+
+# ── The per-call loops the tools used before the store ──
+
+def _filter_by_date(records, date_from, date_to):
+    if not date_from and not date_to:
+        return records
+    filtered = []
+    for r in records:
+        reg_date = r.get("field18", "")
+        if not reg_date:
+            continue
+        if date_from and reg_date < date_from:
+            continue
+        if date_to and reg_date > date_to:
+            continue
+        filtered.append(r)
+    return filtered
+
+
+def legacy_trend(records, periods, channel=None):
+    if channel:
+        records = [r for r in records if r.get("field14") == channel]
+    counts = []
+    for date_from, date_to in periods:
+        count = 0
+        for record in records:
+            reg_date = record.get("field18")
+            if reg_date:
+                if date_from and reg_date < date_from:
+                    continue
+                if date_to and reg_date > date_to:
+                    continue
+                count += 1
+        counts.append(count)
+    return counts
+
+
+def legacy_channel_status(records, date_from, date_to):
+    stats: Dict[str, Dict[str, int]] = {}
+    for record in _filter_by_date(records, date_from, date_to):
+        ch = record.get("field14")
+        if not ch:
+            continue
+        stats.setdefault(ch, {})
+        status = record.get("customer_status")
+        if status:
+            stats[ch][status] = stats[ch].get(status, 0) + 1
+    return stats
+
+
+def legacy_pic(records, date_from, date_to, channel=None):
+    filtered = _filter_by_date(records, date_from, date_to)
+    if channel:
+        filtered = [r for r in filtered if r.get("field14") == channel]
+    stats: Dict[str, Dict[str, int]] = {}
+    for record in filtered:
+        owner = record.get("Owner")
+        pic = owner.get("name") if isinstance(owner, dict) else str(owner) if owner else "未割当"
+        s = stats.setdefault(pic, {"total": 0, "hired": 0, "interviewed": 0})
+        s["total"] += 1
+        if record.get("customer_status") == "14. 入社":
+            s["hired"] += 1
+        if record.get("field29"):
+            s["interviewed"] += 1
+    return stats
+
+
+# ── The same results sliced from the store's cube ──
+
+def store_channel_status(store: JobSeekerStore, date_from, date_to):
+    stats: Dict[str, Dict[str, int]] = {}
+    for (ch, status), n in store.count_by(("channel", "status"), date_from, date_to).items():
+        if not ch:
+            continue
+        stats.setdefault(ch, {})
+        if status:
+            stats[ch][status] = n
+    return stats
+
+
+def store_pic(store: JobSeekerStore, date_from, date_to, channel=None):
+    stats: Dict[str, Dict[str, int]] = {}
+    for (pic, status, interviewed), n in store.count_by(
+        ("owner", "status", "interviewed"), date_from, date_to, channel=channel
+    ).items():
+        s = stats.setdefault(pic, {"total": 0, "hired": 0, "interviewed": 0})
+        s["total"] += n
+        if status == "14. 入社":
+            s["hired"] += n
+        if interviewed:
+            s["interviewed"] += n
+    return stats
+
+
+def timeit(fn: Callable[[], Any], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000  # ms per call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, nargs="+", default=[2_000, 20_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    periods = monthly_periods(12)
+    window = (periods[0][0], periods[-1][1])
+    queries: List[Tuple[str, Callable[[List[Dict[str, Any]]], Any], Callable[[JobSeekerStore], Any]]] = [
+        ("trend (12 months)", lambda r: legacy_trend(r, periods), lambda s: s.period_counts(periods)),
+        ("trend (12 months, channel)", lambda r: legacy_trend(r, periods, "paid_meta"),
+         lambda s: s.period_counts(periods, channel="paid_meta")),
+        ("channel x status (1 year)", lambda r: legacy_channel_status(r, *window),
+         lambda s: store_channel_status(s, *window)),
+        ("channel x status (all)", lambda r: legacy_channel_status(r, None, None),
+         lambda s: store_channel_status(s, None, None)),
+        ("pic (1 year)", lambda r: legacy_pic(r, *window), lambda s: store_pic(s, *window)),
+        ("pic (1 year, channel)", lambda r: legacy_pic(r, *window, "sco_bizreach"),
+         lambda s: store_pic(s, *window, "sco_bizreach")),
+    ]
+
+    print(f"{'records':>8} {'load ms':>8} {'query':<28} {'loop ms':>9} {'cube ms':>9} {'warm ms':>9} {'speedup':>8}")
+    for n in args.records:
+        records = make_records(n)
+        started = time.perf_counter()
+        store = JobSeekerStore.from_records(records)
+        load_ms = (time.perf_counter() - started) * 1000
+
+        for label, legacy, indexed in queries:
+            expected = legacy(records)
+            store._generation += 1  # 直前のキューブを捨てて構築込みで測る
+            cold_started = time.perf_counter()
+            actual = indexed(store)
+            cold_ms = (time.perf_counter() - cold_started) * 1000
+            assert actual == expected, f"result mismatch for {label}"
+
+            loop_ms = timeit(lambda: legacy(records), args.repeat)
+            warm_ms = timeit(lambda: indexed(store), args.repeat)
+            print(
+                f"{n:>8} {load_ms:>8.1f} {label:<28} {loop_ms:>9.2f} {cold_ms:>9.2f} {warm_ms:>9.3f} "
+                f"{loop_ms / warm_ms if warm_ms else float('inf'):>7.0f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Marketing AI V2 SSE Load Test.
+
+Opens N concurrent chats against POST /api/v1/marketing-v2/chat/stream on a
+running backend and measures, per ``text_delta`` event:
+
+- time to first token (request sent -> first text_delta)
+- inter-token gap (text_delta -> next text_delta of the same stream)
+
+and prints p50 / p95 / p99 / max over all streams. A Supabase round trip that
+blocks the event loop shows up as a gap spike on every concurrent stream, so
+p99 inter-token gap is the number to compare between builds (e.g. before and
+after the async Supabase access layer, or SUPABASE_ASYNC_ENABLED=true/false).
+
+The token is minted from MARKETING_CHATKIT_TOKEN_SECRET unless --token is given.
+Conversations created by the run are deleted afterwards (--keep to skip).
+
+Usage:
+    cd backend
+    uv run python scripts/loadtest_marketing_sse.py [--base-url http://localhost:8000] \\
+        [--concurrency 50] [--rounds 1] [--max-p99-gap-ms 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import httpx
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+DEFAULT_MESSAGE = "マーケティング施策のアイデアを5つ、それぞれ3行で説明してください。"
+
+
+@dataclass
+class StreamResult:
+    ttft_ms: Optional[float] = None
+    gaps_ms: List[float] = field(default_factory=list)
+    tokens: int = 0
+    total_ms: float = 0.0
+    conversation_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+def mint_token(email: str, ttl: int = 3600) -> str:
+    from app.infrastructure.config.settings import get_settings
+    from app.infrastructure.security.marketing_token_service import MarketingTokenService
+
+    now = int(time.time())
+    svc = MarketingTokenService(get_settings().marketing_chatkit_token_secret)
+    return svc.sign({"sub": f"loadtest:{email}", "email": email, "name": "loadtest", "iat": now, "exp": now + ttl})
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """nearest-rank の分位点"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), math.ceil(q * len(ordered))))
+    return ordered[rank - 1]
+
+
+async def run_chat(client: httpx.AsyncClient, url: str, headers: dict, message: str) -> StreamResult:
+    result = StreamResult()
+    started = time.perf_counter()
+    last_token: Optional[float] = None
+    try:
+        async with client.stream("POST", url, json={"message": message}, headers=headers) as response:
+            if response.status_code != 200:
+                result.error = f"HTTP {response.status_code}: {(await response.aread())[:200]!r}"
+                return result
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                event = json.loads(line[6:])
+                now = time.perf_counter()
+                event_type = event.get("type")
+                if event_type == "text_delta":
+                    if last_token is None:
+                        result.ttft_ms = (now - started) * 1000
+                    else:
+                        result.gaps_ms.append((now - last_token) * 1000)
+                    last_token = now
+                    result.tokens += 1
+                elif event_type == "done":
+                    result.conversation_id = event.get("conversation_id")
+                elif event_type == "error":
+                    result.error = str(event.get("message"))[:200]
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    finally:
+        result.total_ms = (time.perf_counter() - started) * 1000
+    return result
+
+
+def summarize(label: str, values: List[float]) -> str:
+    if not values:
+        return f"{label:<18} (no samples)"
+    p50, p95, p99 = (percentile(values, q) for q in (0.5, 0.95, 0.99))
+    return (
+        f"{label:<18} n={len(values):>6}  p50={p50:>8.1f}ms  p95={p95:>8.1f}ms  "
+        f"p99={p99:>8.1f}ms  max={max(values):>8.1f}ms"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    token = args.token or mint_token(args.email)
+    headers = {"Authorization": f"Bearer {token}"}
+    base = args.base_url.rstrip("/") + "/api/v1/marketing-v2"
+    limits = httpx.Limits(max_connections=args.concurrency + 4, max_keepalive_connections=args.concurrency + 4)
+
+    results: List[StreamResult] = []
+    async with httpx.AsyncClient(timeout=httpx.Timeout(args.timeout, connect=10), limits=limits) as client:
+        for round_index in range(args.rounds):
+            started = time.perf_counter()
+
+            async def _delayed(i: int) -> StreamResult:
+                # 同時刻に全リクエストが届かないよう ramp 秒に分散させる
+                await asyncio.sleep(args.ramp * i / max(1, args.concurrency))
+                return await run_chat(client, f"{base}/chat/stream", headers, args.message)
+
+            batch = await asyncio.gather(*(_delayed(i) for i in range(args.concurrency)))
+            results.extend(batch)
+            print(
+                f"round {round_index + 1}/{args.rounds}: {args.concurrency} chats in "
+                f"{time.perf_counter() - started:.1f}s, errors={sum(1 for r in batch if r.error)}"
+            )
+
+        if not args.keep:
+            for r in results:
+                if r.conversation_id:
+                    try:
+                        await client.delete(f"{base}/threads/{r.conversation_id}", headers=headers)
+                    except Exception as e:
+                        print(f"cleanup failed for {r.conversation_id}: {e}")
+
+    gaps = [g for r in results for g in r.gaps_ms]
+    print()
+    print(f"chats={len(results)} concurrency={args.concurrency} tokens={sum(r.tokens for r in results)}")
+    print(summarize("inter-token gap", gaps))
+    print(summarize("time to 1st token", [r.ttft_ms for r in results if r.ttft_ms is not None]))
+    print(summarize("stream total", [r.total_ms for r in results if not r.error]))
+    errors = [r.error for r in results if r.error]
+    if errors:
+        print(f"errors={len(errors)} e.g. {errors[0]}")
+
+    p99 = percentile(gaps, 0.99)
+    if args.max_p99_gap_ms is not None and (p99 is None or p99 > args.max_p99_gap_ms):
+        print(f"FAIL: p99 inter-token gap {p99}ms exceeds {args.max_p99_gap_ms}ms")
+        return 1
+    return 1 if errors and len(errors) == len(results) else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=1)
+    parser.add_argument("--ramp", type=float, default=2.0, help="seconds over which each round's chats start")
+    parser.add_argument("--message", default=DEFAULT_MESSAGE)
+    parser.add_argument("--email", default="loadtest@bandq.jp", help="owner email of the minted token")
+    parser.add_argument("--token", default=None, help="marketing client token (minted from the secret if omitted)")
+    parser.add_argument("--timeout", type=float, default=300.0)
+    parser.add_argument("--keep", action="store_true", help="do not delete the conversations afterwards")
+    parser.add_argument("--max-p99-gap-ms", type=float, default=None, help="exit 1 if p99 inter-token gap exceeds this")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
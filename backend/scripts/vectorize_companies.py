@@ -5,9 +5,14 @@ Company Data Vectorization Script.
 Reads company data from Google Sheets and creates vector embeddings
 for semantic search using Gemini Embedding API.
 
+Incremental by default: existing content hashes are loaded from Supabase in
+one pass, only new/changed chunks are embedded (batched, concurrent, rate
+limited) and bulk-upserted, and chunks of companies no longer in the sheet
+are deleted.
+
 Usage:
     cd backend
-    uv run python scripts/vectorize_companies.py
+    uv run python scripts/vectorize_companies.py [--full] [--workers 4] [--batch-size 50] [--rpm 120] [--no-delete]
 
 Requirements:
     - COMPANY_DB_SPREADSHEET_ID set in .env
@@ -18,12 +23,15 @@ Requirements:
 
 from __future__ import annotations
 
+import argparse
 import hashlib
 import logging
 import os
 import sys
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple
 
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -58,6 +66,15 @@ CHUNK_TYPES = [
     "culture",       # Atmosphere/culture appeal
 ]
 
+CHUNKS_TABLE = "company_chunks"
+# embed_content の1リクエストあたり上限は100テキスト
+MAX_EMBED_BATCH = 100
+# PostgREST のデフォルト max-rows に合わせたページサイズ
+SELECT_PAGE_SIZE = 1000
+# 1行 ≒ 768次元ベクトル + テキストのため、1リクエストのペイロードを抑える
+UPSERT_BATCH_SIZE = 50
+DELETE_BATCH_SIZE = 100
+
 # Need type to column mapping (same as company_db_tools.py)
 NEED_COLUMN_MAP = {
     "salary": "給与訴求",
@@ -260,87 +277,232 @@ def compute_content_hash(text: str) -> str:
     return hashlib.sha256(text.encode()).hexdigest()[:16]
 
 
-def get_embedding(text: str, model: str = EMBEDDING_MODEL) -> List[float]:
+class RateLimiter:
+    """Spaces calls evenly across threads to stay under a requests-per-minute budget."""
+
+    def __init__(self, per_minute: int):
+        self._interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+def get_embeddings(
+    texts: List[str],
+    limiter: Optional[RateLimiter] = None,
+    model: str = EMBEDDING_MODEL,
+    max_attempts: int = 3,
+) -> List[List[float]]:
     """
-    Get embedding vector from Gemini API.
+    Get embedding vectors for a batch of texts from Gemini API (one request).
 
     Uses Matryoshka truncation to get 768 dimensions (same as agent memory).
 
     Args:
-        text: Text to embed
+        texts: Texts to embed (at most MAX_EMBED_BATCH)
+        limiter: Optional rate limiter shared by worker threads
         model: Embedding model name
+        max_attempts: Attempts before giving up (exponential backoff)
 
     Returns:
-        List of floats (768 dimensions)
+        One list of floats (768 dimensions) per text, in input order
     """
-    result = genai.embed_content(
-        model=model,
-        content=text,
-        task_type="retrieval_document",
-        output_dimensionality=EMBEDDING_DIMENSIONS,  # Matryoshka truncation to 768
-    )
-    return result["embedding"]
-
-
-def upsert_chunk(
-    supabase: Client,
-    company_name: str,
-    chunk_type: str,
-    chunk_text: str,
-    embedding: List[float],
-    metadata: Dict[str, Any],
-    content_hash: str,
-) -> bool:
+    for attempt in range(1, max_attempts + 1):
+        if limiter:
+            limiter.acquire()
+        try:
+            result = genai.embed_content(
+                model=model,
+                content=texts,
+                task_type="retrieval_document",
+                output_dimensionality=EMBEDDING_DIMENSIONS,  # Matryoshka truncation to 768
+            )
+            embeddings = result["embedding"]
+            if len(embeddings) != len(texts):
+                raise RuntimeError(f"expected {len(texts)} embeddings, got {len(embeddings)}")
+            return embeddings
+        except Exception as e:
+            if attempt == max_attempts:
+                raise
+            backoff = 2 ** attempt
+            logger.warning(f"  Embedding batch failed ({e}), retrying in {backoff}s...")
+            time.sleep(backoff)
+    return []
+
+
+def load_existing_hashes(supabase: Client) -> Dict[Tuple[str, str], str]:
     """
-    Upsert a chunk into Supabase.
+    Load the (company_name, chunk_type) -> content_hash map of stored chunks.
 
     Args:
         supabase: Supabase client
-        company_name: Company name
-        chunk_type: Chunk type
-        chunk_text: Text content
-        embedding: Vector embedding
-        metadata: Metadata for filtering
-        content_hash: Hash for change detection
 
     Returns:
-        True if successful
+        Mapping used to skip unchanged chunks
     """
-    try:
-        # Check if chunk exists and has same hash
-        existing = supabase.table("company_chunks").select(
-            "id, content_hash"
-        ).eq("company_name", company_name).eq("chunk_type", chunk_type).execute()
-
-        if existing.data and existing.data[0].get("content_hash") == content_hash:
-            logger.debug(f"  Skipping {company_name}/{chunk_type} (unchanged)")
-            return True
-
-        # Upsert the chunk
-        data = {
-            "company_name": company_name,
-            "chunk_type": chunk_type,
-            "chunk_text": chunk_text,
-            "embedding": embedding,
-            "metadata": metadata,
-            "content_hash": content_hash,
-            "source_sheet": "DB",
-        }
-
-        supabase.table("company_chunks").upsert(
-            data,
-            on_conflict="company_name,chunk_type",
-        ).execute()
-
-        return True
-
-    except Exception as e:
-        logger.error(f"  Error upserting {company_name}/{chunk_type}: {e}")
-        return False
+    existing: Dict[Tuple[str, str], str] = {}
+    offset = 0
+    while True:
+        res = (
+            supabase.table(CHUNKS_TABLE)
+            .select("company_name, chunk_type, content_hash")
+            .order("company_name")
+            .order("chunk_type")
+            .range(offset, offset + SELECT_PAGE_SIZE - 1)
+            .execute()
+        )
+        rows = res.data or []
+        for row in rows:
+            existing[(row["company_name"], row["chunk_type"])] = row.get("content_hash") or ""
+        if len(rows) < SELECT_PAGE_SIZE:
+            return existing
+        offset += SELECT_PAGE_SIZE
+
+
+def upsert_chunks(supabase: Client, rows: List[Dict[str, Any]]) -> int:
+    """
+    Bulk-upsert chunk rows into Supabase.
+
+    Args:
+        supabase: Supabase client
+        rows: Rows with company_name, chunk_type, chunk_text, embedding, metadata, content_hash
+
+    Returns:
+        Number of rows written
+    """
+    written = 0
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        batch = rows[start:start + UPSERT_BATCH_SIZE]
+        try:
+            supabase.table(CHUNKS_TABLE).upsert(
+                batch,
+                on_conflict="company_name,chunk_type",
+                returning="minimal",
+            ).execute()
+            written += len(batch)
+        except Exception as e:
+            logger.error(f"  Error upserting {len(batch)} chunks: {e}")
+    return written
+
+
+def delete_companies(supabase: Client, company_names: List[str]) -> int:
+    """
+    Delete all chunks of companies that are no longer in the sheet.
+
+    Args:
+        supabase: Supabase client
+        company_names: Company names to remove
+
+    Returns:
+        Number of companies whose chunks were deleted
+    """
+    deleted = 0
+    for start in range(0, len(company_names), DELETE_BATCH_SIZE):
+        batch = company_names[start:start + DELETE_BATCH_SIZE]
+        try:
+            supabase.table(CHUNKS_TABLE).delete().in_("company_name", batch).execute()
+            deleted += len(batch)
+        except Exception as e:
+            logger.error(f"  Error deleting chunks for {len(batch)} companies: {e}")
+    return deleted
+
+
+def build_chunks(
+    companies: List[Dict[str, Any]],
+    appeal_data: Dict[str, Any],
+) -> Tuple[Dict[Tuple[str, str], Dict[str, Any]], int]:
+    """
+    Generate chunk rows (without embeddings) for all companies.
+
+    Returns:
+        ((company_name, chunk_type) -> row, number of chunks skipped for insufficient content).
+        Duplicate company names keep the last row, as sequential upserts did.
+    """
+    chunks: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    skipped = 0
+    for i, company in enumerate(companies, 1):
+        company_name = _get_col(company, "企業名")
+        if not company_name:
+            logger.warning(f"Skipping company #{i}: no name")
+            continue
+
+        # Extract metadata (shared across all chunks)
+        metadata = extract_metadata(company)
+
+        for chunk_type in CHUNK_TYPES:
+            chunk_text = generate_chunk_text(company, appeal_data, chunk_type)
+            if not chunk_text or len(chunk_text) < 20:
+                logger.debug(f"  Skipping {company_name}/{chunk_type}: insufficient content")
+                skipped += 1
+                continue
+
+            chunks[(company_name, chunk_type)] = {
+                "company_name": company_name,
+                "chunk_type": chunk_type,
+                "chunk_text": chunk_text,
+                "metadata": metadata,
+                "content_hash": compute_content_hash(chunk_text),
+                "source_sheet": "DB",
+            }
+    return chunks, skipped
+
+
+def embed_rows(
+    rows: List[Dict[str, Any]],
+    workers: int,
+    batch_size: int,
+    limiter: RateLimiter,
+) -> List[Dict[str, Any]]:
+    """
+    Embed chunk rows in batches on a bounded worker pool.
+
+    Returns:
+        Rows that received an embedding (failed batches are logged and dropped)
+    """
+    batches = [rows[i:i + batch_size] for i in range(0, len(rows), batch_size)]
+    embedded: List[Dict[str, Any]] = []
+
+    def _embed(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        vectors = get_embeddings([row["chunk_text"] for row in batch], limiter)
+        return [{**row, "embedding": vector} for row, vector in zip(batch, vectors)]
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="embed") as pool:
+        futures = {pool.submit(_embed, batch): batch for batch in batches}
+        for done, future in enumerate(as_completed(futures), 1):
+            batch = futures[future]
+            try:
+                embedded.extend(future.result())
+            except Exception as e:
+                logger.error(f"  Error embedding batch of {len(batch)} chunks: {e}")
+            if done % 10 == 0 or done == len(batches):
+                logger.info(f"Embedded batches: {done}/{len(batches)}")
+    return embedded
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Vectorize company data into company_chunks")
+    parser.add_argument("--full", action="store_true", help="Re-embed every chunk, ignoring stored content hashes")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent embedding requests")
+    parser.add_argument("--batch-size", type=int, default=50, help=f"Texts per embedding request (max {MAX_EMBED_BATCH})")
+    parser.add_argument("--rpm", type=int, default=120, help="Embedding requests per minute (0 = unlimited)")
+    parser.add_argument("--no-delete", action="store_true", help="Keep chunks of companies no longer in the sheet")
+    return parser.parse_args()
 
 
 def main():
     """Main vectorization function."""
+    args = parse_args()
+    batch_size = max(1, min(args.batch_size, MAX_EMBED_BATCH))
+
     logger.info("=" * 60)
     logger.info("Company Data Vectorization Script")
     logger.info("=" * 60)
@@ -376,78 +538,41 @@ def main():
     logger.info("Loading companies from Google Sheets...")
     companies = sheets_service.get_all_companies(force_refresh=True)
     logger.info(f"Loaded {len(companies)} companies")
+    if not companies:
+        # シート取得失敗時に全チャンクを「消えた企業」として削除しないよう中断する
+        logger.error("No companies loaded from the sheet; aborting")
+        sys.exit(1)
 
     # Load appeal points
     logger.info("Loading appeal points...")
     appeal_data = sheets_service.get_appeal_points(force_refresh=True)
     logger.info(f"Loaded appeal points for {len(appeal_data)} companies")
 
-    # Process each company
-    total_chunks = 0
-    success_chunks = 0
-    skipped_chunks = 0
-    error_chunks = 0
-
     start_time = time.time()
 
-    for i, company in enumerate(companies, 1):
-        company_name = _get_col(company, "企業名")
-        if not company_name:
-            logger.warning(f"Skipping company #{i}: no name")
-            continue
+    chunks, skipped_chunks = build_chunks(companies, appeal_data)
 
-        logger.info(f"[{i}/{len(companies)}] Processing: {company_name}")
+    existing = load_existing_hashes(supabase)
+    logger.info(f"Loaded {len(existing)} stored chunk hashes")
 
-        # Extract metadata (shared across all chunks)
-        metadata = extract_metadata(company)
-
-        # Generate and vectorize each chunk
-        for chunk_type in CHUNK_TYPES:
-            total_chunks += 1
+    if args.full:
+        changed = list(chunks.values())
+    else:
+        changed = [row for key, row in chunks.items() if existing.get(key) != row["content_hash"]]
+    unchanged_chunks = len(chunks) - len(changed)
+    logger.info(f"Chunks: {len(chunks)} total, {len(changed)} to embed, {unchanged_chunks} unchanged")
 
-            # Generate chunk text
-            chunk_text = generate_chunk_text(company, appeal_data, chunk_type)
-            if not chunk_text or len(chunk_text) < 20:
-                logger.debug(f"  Skipping {chunk_type}: insufficient content")
-                skipped_chunks += 1
-                continue
-
-            # Compute content hash
-            content_hash = compute_content_hash(chunk_text)
-
-            try:
-                # Get embedding
-                embedding = get_embedding(chunk_text)
-
-                # Upsert to Supabase
-                if upsert_chunk(
-                    supabase,
-                    company_name,
-                    chunk_type,
-                    chunk_text,
-                    embedding,
-                    metadata,
-                    content_hash,
-                ):
-                    success_chunks += 1
-                    logger.debug(f"  {chunk_type}: OK ({len(chunk_text)} chars)")
-                else:
-                    error_chunks += 1
-
-                # Rate limiting (Gemini free tier: 1500 RPM)
-                time.sleep(0.05)
-
-            except Exception as e:
-                logger.error(f"  Error processing {chunk_type}: {e}")
-                error_chunks += 1
-                # Back off on error
-                time.sleep(1)
+    embedded = embed_rows(changed, args.workers, batch_size, RateLimiter(args.rpm)) if changed else []
+    success_chunks = upsert_chunks(supabase, embedded)
+    error_chunks = len(changed) - success_chunks
 
-        # Progress checkpoint
-        if i % 50 == 0:
-            elapsed = time.time() - start_time
-            rate = i / elapsed * 60
-            logger.info(f"Progress: {i}/{len(companies)} ({rate:.1f} companies/min)")
+    deleted_companies = 0
+    if not args.no_delete:
+        current_names = {name for name, _ in chunks}
+        gone = sorted({name for name, _ in existing} - current_names)
+        if gone:
+            logger.info(f"Deleting chunks for {len(gone)} companies no longer in the sheet")
+            deleted_companies = delete_companies(supabase, gone)
 
     # Summary
     elapsed = time.time() - start_time
@@ -455,10 +580,12 @@ def main():
     logger.info("Vectorization Complete!")
     logger.info(f"Time elapsed: {elapsed:.1f} seconds")
     logger.info(f"Companies processed: {len(companies)}")
-    logger.info(f"Total chunks: {total_chunks}")
-    logger.info(f"  Success: {success_chunks}")
+    logger.info(f"Total chunks: {len(chunks) + skipped_chunks}")
+    logger.info(f"  Embedded: {success_chunks}")
+    logger.info(f"  Unchanged: {unchanged_chunks}")
     logger.info(f"  Skipped: {skipped_chunks}")
     logger.info(f"  Errors: {error_chunks}")
+    logger.info(f"Companies deleted: {deleted_companies}")
     logger.info("=" * 60)
 
 
@@ -185,7 +185,7 @@ class TestAutoProcessMeetingsUseCase:
             "items": [{"id": "meeting-123", "title": "初回面談 - 田中太郎"}],
             "has_next": False
         }
-        deps['meeting_repo'].get_meeting_core.return_value = sample_meeting_data
+        deps['meeting_repo'].get_meetings_core_batch.return_value = {"meeting-123": sample_meeting_data}
         deps['title_matcher'].extract_from_title.return_value = "田中太郎"
         deps['zoho_client'].search_app_hc_by_exact_name.return_value = [sample_zoho_match]
         deps['title_matcher'].is_exact_match.return_value = True
@@ -206,6 +206,55 @@ class TestAutoProcessMeetingsUseCase:
         assert candidates[0].title == "初回面談 - 田中太郎さん"
         assert candidates[0].priority_score > 0
 
+    @pytest.mark.asyncio
+    async def test_collect_processing_candidates_uses_candidate_index(self, use_case, mock_dependencies, sample_meeting_data, sample_zoho_match):
+        """Index lookup replaces per-meeting Zoho search calls"""
+        deps = mock_dependencies
+        deps['settings'].zoho_candidate_index_enabled = True
+        deps['meeting_repo'].list_meetings_paginated.return_value = {
+            "items": [{"id": "meeting-123", "title": "初回面談 - 田中太郎"}],
+            "has_next": False
+        }
+        deps['meeting_repo'].get_meetings_core_batch.return_value = {"meeting-123": sample_meeting_data}
+        deps['title_matcher'].extract_from_title.return_value = "田中太郎"
+        index = Mock()
+        index.ensure_fresh.return_value = True
+        index.lookup.return_value = [sample_zoho_match]
+        
+        with patch('app.application.use_cases.auto_process_meetings.get_candidate_index', return_value=index):
+            candidates = await use_case._collect_processing_candidates(
+                deps['meeting_repo'], deps['title_matcher'], None, 5, None
+            )
+        
+        assert len(candidates) == 1
+        assert candidates[0].zoho_match == sample_zoho_match
+        index.lookup.assert_called_once_with("田中太郎")
+        deps['zoho_client'].search_app_hc_by_exact_name.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_collect_processing_candidates_index_unavailable_falls_back(self, use_case, mock_dependencies, sample_meeting_data, sample_zoho_match):
+        """Search API is used when the candidate index cannot be built"""
+        deps = mock_dependencies
+        deps['settings'].zoho_candidate_index_enabled = True
+        deps['meeting_repo'].list_meetings_paginated.return_value = {
+            "items": [{"id": "meeting-123", "title": "初回面談 - 田中太郎"}],
+            "has_next": False
+        }
+        deps['meeting_repo'].get_meetings_core_batch.return_value = {"meeting-123": sample_meeting_data}
+        deps['title_matcher'].extract_from_title.return_value = "田中太郎"
+        deps['zoho_client'].search_app_hc_by_exact_name.return_value = [sample_zoho_match]
+        index = Mock()
+        index.ensure_fresh.return_value = False
+        
+        with patch('app.application.use_cases.auto_process_meetings.get_candidate_index', return_value=index):
+            candidates = await use_case._collect_processing_candidates(
+                deps['meeting_repo'], deps['title_matcher'], None, 5, None
+            )
+        
+        assert len(candidates) == 1
+        index.lookup.assert_not_called()
+        deps['zoho_client'].search_app_hc_by_exact_name.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_collect_processing_candidates_accepts_free_career_consultation(self, use_case, mock_dependencies, sample_meeting_data, sample_zoho_match):
         """Meetings titled with 無料キャリア相談 should also be processed"""
@@ -217,7 +266,7 @@ class TestAutoProcessMeetingsUseCase:
             "items": [{"id": "meeting-free", "title": "無料キャリア相談 - 田中太郎さん"}],
             "has_next": False
         }
-        deps['meeting_repo'].get_meeting_core.return_value = free_meeting
+        deps['meeting_repo'].get_meetings_core_batch.return_value = {"meeting-free": free_meeting}
         deps['title_matcher'].extract_from_title.return_value = "田中太郎"
         deps['zoho_client'].search_app_hc_by_exact_name.return_value = [sample_zoho_match]
         deps['title_matcher'].is_exact_match.return_value = True
@@ -252,14 +301,11 @@ class TestAutoProcessMeetingsUseCase:
             "has_next": False
         }
         
-        def get_meeting_side_effect(meeting_id):
-            if meeting_id == "meeting-1":
-                return sample_meeting_data
-            elif meeting_id == "meeting-2":
-                return meeting_without_first
-            return None
+        def get_meetings_batch_side_effect(meeting_ids, errors=None):
+            cores = {"meeting-1": sample_meeting_data, "meeting-2": meeting_without_first}
+            return {mid: cores[mid] for mid in meeting_ids if mid in cores}
         
-        deps['meeting_repo'].get_meeting_core.side_effect = get_meeting_side_effect
+        deps['meeting_repo'].get_meetings_core_batch.side_effect = get_meetings_batch_side_effect
         deps['title_matcher'].extract_from_title.return_value = "田中太郎"
         deps['zoho_client'].search_app_hc_by_exact_name.return_value = [{"record_id": "zoho-1", "candidate_name": "田中太郎"}]
         deps['title_matcher'].is_exact_match.return_value = True
@@ -282,6 +328,75 @@ class TestAutoProcessMeetingsUseCase:
         assert skip_candidates
         assert all(getattr(c, 'skip_reason', None) == 'not_first' for c in skip_candidates)
 
+    @pytest.mark.asyncio
+    async def test_collect_processing_candidates_fetches_text_for_top_k_only(self, use_case, mock_dependencies, sample_meeting_data, sample_zoho_match):
+        """Text is fetched in one batch for the top-scored meetings; empty ones are backfilled"""
+        deps = mock_dependencies
+        now = datetime.now(timezone.utc).isoformat()
+        old = "2020-01-01T00:00:00+00:00"
+        deps['meeting_repo'].list_meetings_paginated.return_value = {
+            "items": [
+                {"id": "m-old", "title": "初回面談 - 田中太郎", "created_at": old, "text_length": 5000},
+                {"id": "m-new", "title": "初回面談 - 田中太郎", "created_at": now, "text_length": 5000},
+                {"id": "m-mid", "title": "初回面談 - 田中太郎", "created_at": now, "text_length": 100},
+                {"id": "m-empty", "title": "初回面談 - 田中太郎", "created_at": now, "text_length": 0},
+            ],
+            "has_next": False
+        }
+        deps['title_matcher'].extract_from_title.return_value = "田中太郎"
+        deps['zoho_client'].search_app_hc_by_exact_name.return_value = [sample_zoho_match]
+        # m-new の本文は一覧取得後に消えた想定 → 次点の m-mid で補充される
+        cores = {
+            "m-new": {**sample_meeting_data, "id": "m-new", "text_content": ""},
+            "m-mid": {**sample_meeting_data, "id": "m-mid"},
+            "m-old": {**sample_meeting_data, "id": "m-old"},
+        }
+        deps['meeting_repo'].get_meetings_core_batch.side_effect = (
+            lambda ids, errors=None: {mid: cores[mid] for mid in ids if mid in cores}
+        )
+        
+        candidates = await use_case._collect_processing_candidates(
+            deps['meeting_repo'], deps['title_matcher'], None, 1, None
+        )
+        
+        valid = [c for c in candidates if isinstance(c, ProcessingCandidate)]
+        assert [c.meeting_id for c in valid] == ["m-mid"]
+        calls = [c.args[0] for c in deps['meeting_repo'].get_meetings_core_batch.call_args_list]
+        assert calls == [["m-new"], ["m-mid"]]
+        no_text = {c.meeting_id for c in candidates if getattr(c, 'skip_reason', None) == 'no_text'}
+        assert no_text == {"m-empty", "m-new"}
+        deps['meeting_repo'].get_meeting_core.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_collect_processing_candidates_isolates_text_fetch_errors(self, use_case, mock_dependencies, sample_meeting_data, sample_zoho_match):
+        """A meeting whose text cannot be fetched is skipped as fetch_error; the others are still selected"""
+        deps = mock_dependencies
+        now = datetime.now(timezone.utc).isoformat()
+        deps['meeting_repo'].list_meetings_paginated.return_value = {
+            "items": [
+                {"id": "m-broken", "title": "初回面談 - 田中太郎", "created_at": now, "text_length": 5000},
+                {"id": "m-ok", "title": "初回面談 - 田中太郎", "created_at": now, "text_length": 4000},
+            ],
+            "has_next": False
+        }
+        deps['title_matcher'].extract_from_title.return_value = "田中太郎"
+        deps['zoho_client'].search_app_hc_by_exact_name.return_value = [sample_zoho_match]
+
+        def get_meetings_batch_side_effect(meeting_ids, errors=None):
+            errors["m-broken"] = "statement timeout"
+            return {mid: {**sample_meeting_data, "id": mid} for mid in meeting_ids if mid != "m-broken"}
+
+        deps['meeting_repo'].get_meetings_core_batch.side_effect = get_meetings_batch_side_effect
+
+        candidates = await use_case._collect_processing_candidates(
+            deps['meeting_repo'], deps['title_matcher'], None, 2, None
+        )
+
+        valid = [c for c in candidates if isinstance(c, ProcessingCandidate)]
+        assert [c.meeting_id for c in valid] == ["m-ok"]
+        failed = [c.meeting_id for c in candidates if getattr(c, 'skip_reason', None) == 'fetch_error']
+        assert failed == ["m-broken"]
+
     @pytest.mark.asyncio
     async def test_process_candidates_parallel(self, use_case, sample_processing_candidates):
         """Test parallel processing of candidates"""
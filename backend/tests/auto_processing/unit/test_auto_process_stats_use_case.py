@@ -22,10 +22,18 @@ class TestGetAutoProcessStatsUseCase:
         meeting_repo = Mock()
         structured_repo = Mock()
         
+        result_cache_repo = Mock()
+        result_cache_repo.get_period_stats.return_value = {
+            "entries_created": 0,
+            "entries_hit": 0,
+            "total_hits": 0,
+        }
+        
         return {
             'meeting_repo': meeting_repo,
             'structured_repo': structured_repo,
-            'ai_usage_repo': mock_ai_usage_repository
+            'ai_usage_repo': mock_ai_usage_repository,
+            'result_cache_repo': result_cache_repo
         }
     
     @pytest.fixture
@@ -37,6 +45,8 @@ class TestGetAutoProcessStatsUseCase:
                   return_value=mock_repositories['structured_repo']), \
              patch('app.application.use_cases.get_auto_process_stats.AiUsageRepositoryImpl', 
                   return_value=mock_repositories['ai_usage_repo']), \
+             patch('app.application.use_cases.get_auto_process_stats.ExtractionResultCacheRepositoryImpl', 
+                  return_value=mock_repositories['result_cache_repo']), \
              patch('app.application.use_cases.get_auto_process_stats.get_settings', 
                   return_value=mock_settings):
             yield mock_repositories
@@ -191,6 +201,35 @@ class TestGetAutoProcessStatsUseCase:
         
         assert summary["estimated_cost"] == pro_cost_per_token + flash_cost_per_token
 
+    def test_collect_result_cache_stats(self, use_case, mock_dependencies):
+        """Test extraction result cache hit/miss stats"""
+        end_date = datetime.now(timezone.utc)
+        start_date = end_date - timedelta(days=7)
+        mock_dependencies['result_cache_repo'].get_period_stats.return_value = {
+            "entries_created": 4,
+            "entries_hit": 2,
+            "total_hits": 3,
+        }
+        
+        stats = use_case._collect_result_cache_stats(start_date, end_date)
+        
+        assert stats["period"]["entries_created"] == 4
+        assert stats["period"]["total_hits"] == 3
+        assert "hits" in stats["process"]
+        assert "misses" in stats["process"]
+        assert "hit_rate" in stats["process"]
+
+    def test_collect_result_cache_stats_repository_error(self, use_case, mock_dependencies):
+        """Test result cache stats fall back to process counters on DB errors"""
+        end_date = datetime.now(timezone.utc)
+        start_date = end_date - timedelta(days=7)
+        mock_dependencies['result_cache_repo'].get_period_stats.side_effect = Exception("db down")
+        
+        stats = use_case._collect_result_cache_stats(start_date, end_date)
+        
+        assert stats["period"] == {}
+        assert "hits" in stats["process"]
+
     def test_collect_error_analysis(self, use_case, mock_dependencies):
         """Test error analysis collection"""
         end_date = datetime.now(timezone.utc)
@@ -0,0 +1,43 @@
+"""
+Unit tests for the Drive collector streaming helper
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.infrastructure.google.drive_throttle import stream_from_threads
+
+
+class TestStreamFromThreads:
+    """Test cases for stream_from_threads"""
+
+    @pytest.mark.asyncio
+    async def test_producers_outnumbering_default_executor_do_not_starve_consumer(self):
+        """Producers blocked on a full queue must not hold the threads the consumer's to_thread needs"""
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=2)
+        loop.set_default_executor(executor)
+
+        def producer(index):
+            def run(emit):
+                for n in range(10):
+                    emit((index, n))
+            return run
+
+        async def consume():
+            received = []
+            async for item in stream_from_threads([producer(i) for i in range(8)], queue_size=2):
+                # 保存処理と同じく既定の executor を使う
+                await asyncio.to_thread(time.sleep, 0.001)
+                received.append(item)
+            return received
+
+        try:
+            received = await asyncio.wait_for(consume(), timeout=10)
+        finally:
+            executor.shutdown(wait=False)
+
+        assert len(received) == 80
+        assert sorted(received) == [(i, n) for i in range(8) for n in range(10)]
@@ -0,0 +1,82 @@
+"""
+Unit tests for the async Supabase access path (run_supabase / repository a* methods)
+"""
+import threading
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+from app.infrastructure.supabase.client import run_supabase
+from app.infrastructure.supabase.repositories.meeting_repository_impl import MeetingRepositoryImpl
+
+
+def _builder(rows, count=None):
+    """Chainable PostgREST builder whose execute() is awaitable like the async client's"""
+    builder = MagicMock()
+    for method in ("select", "eq", "in_", "or_", "order", "range", "limit"):
+        getattr(builder, method).return_value = builder
+    builder.execute = AsyncMock(return_value=Mock(data=rows, count=count))
+    return builder
+
+
+class TestSupabaseAsyncAccess:
+    """Test cases for the async request-path data access layer"""
+
+    @pytest.fixture
+    def settings(self):
+        settings = Mock()
+        settings.supabase_async_enabled = True
+        return settings
+
+    @pytest.mark.asyncio
+    async def test_aget_meeting_runs_both_queries_on_async_client(self, settings):
+        """Meeting row and structured flag are fetched through the async client"""
+        tables = {
+            "meeting_documents": _builder([{"id": "m1", "title": "面談"}]),
+            "structured_outputs": _builder([{"meeting_id": "m1"}]),
+        }
+        sb = Mock()
+        sb.table.side_effect = lambda name: tables[name]
+
+        with patch('app.infrastructure.supabase.client.get_settings', return_value=settings), \
+                patch('app.infrastructure.supabase.client.get_async_supabase', AsyncMock(return_value=sb)), \
+                patch('app.infrastructure.supabase.repositories.meeting_repository_impl.get_supabase') as sync_client:
+            meeting = await MeetingRepositoryImpl().aget_meeting("m1")
+
+        assert meeting == {"id": "m1", "title": "面談", "is_structured": True}
+        tables["meeting_documents"].execute.assert_awaited_once()
+        tables["structured_outputs"].execute.assert_awaited_once()
+        sync_client.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_alist_meetings_paginated_keeps_page_shape(self, settings):
+        """The async list returns the same pagination envelope as the sync one"""
+        view = _builder([{"id": "m41"}], count=41)
+        sb = Mock()
+        sb.table.return_value = view
+
+        with patch('app.infrastructure.supabase.client.get_settings', return_value=settings), \
+                patch('app.infrastructure.supabase.client.get_async_supabase', AsyncMock(return_value=sb)):
+            page = await MeetingRepositoryImpl().alist_meetings_paginated(page=2, page_size=40, structured=True)
+
+        sb.table.assert_called_once_with("meeting_documents_enriched")
+        view.eq.assert_called_with("is_structured", True)
+        view.range.assert_called_once_with(40, 79)
+        assert page["items"] == [{"id": "m41"}]
+        assert (page["total"], page["total_pages"], page["has_next"], page["has_previous"]) == (41, 2, False, True)
+
+    @pytest.mark.asyncio
+    async def test_run_supabase_falls_back_to_sync_client_in_worker_thread(self, settings):
+        """With the async client disabled the same call runs on the sync client off the event loop"""
+        settings.supabase_async_enabled = False
+        sync_client = Mock()
+        loop_thread = threading.current_thread()
+
+        with patch('app.infrastructure.supabase.client.get_settings', return_value=settings), \
+                patch('app.infrastructure.supabase.client.get_supabase', return_value=sync_client), \
+                patch('app.infrastructure.supabase.client.get_async_supabase') as async_client:
+            sb, thread = await run_supabase(lambda sb: (sb, threading.current_thread()))
+
+        assert sb is sync_client
+        assert thread is not loop_thread
+        async_client.assert_not_called()
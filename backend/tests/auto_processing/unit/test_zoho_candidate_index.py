@@ -0,0 +1,80 @@
+"""
+Unit tests for ZohoCandidateIndex
+"""
+import pytest
+from unittest.mock import Mock, patch
+
+from app.infrastructure.zoho.candidate_index import ZohoCandidateIndex
+
+
+def _row(record_id, name, modified, email=None):
+    return {
+        "record_id": record_id,
+        "candidate_name": name,
+        "candidate_id": f"C-{record_id}",
+        "candidate_email": email,
+        "modified_time": modified,
+    }
+
+
+class TestZohoCandidateIndex:
+    """Test cases for the in-memory APP-hc name index"""
+
+    @pytest.fixture
+    def settings(self):
+        settings = Mock()
+        settings.zoho_candidate_index_refresh_seconds = 300
+        settings.zoho_candidate_index_rebuild_seconds = 86400
+        return settings
+
+    @pytest.fixture
+    def zoho(self):
+        client = Mock()
+        client.iter_app_hc_candidates.return_value = iter([
+            _row("1", "田中 太郎", "2024-01-01T10:00:00+09:00", "taro@example.com"),
+            _row("2", "山田花子", "2024-01-02T10:00:00+09:00"),
+        ])
+        return client
+
+    @pytest.fixture
+    def index(self, zoho, settings):
+        index = ZohoCandidateIndex()
+        with patch('app.infrastructure.zoho.candidate_index.get_settings', return_value=settings):
+            assert index.ensure_fresh(zoho) is True
+        return index
+
+    def test_lookup_normalized_and_spaceless(self, index):
+        """Lookup follows is_exact_match normalization (width, spacing)"""
+        assert [m["record_id"] for m in index.lookup("田中太郎")] == ["1"]
+        assert [m["record_id"] for m in index.lookup("田中　太郎")] == ["1"]
+        assert [m["record_id"] for m in index.lookup("山田 花子")] == ["2"]
+        assert index.lookup("佐藤次郎") == []
+        assert index.lookup("田中太郎")[0]["candidate_email"] == "taro@example.com"
+
+    def test_lookup_returns_duplicates(self, index, zoho, settings):
+        """Same-name candidates are all returned so the caller can reject ambiguous matches"""
+        index._put(_row("3", "田中太郎", "2024-01-03T10:00:00+09:00"))
+        assert sorted(m["record_id"] for m in index.lookup("田中 太郎")) == ["1", "3"]
+
+    def test_delta_refresh_uses_watermark_and_handles_rename(self, index, zoho, settings):
+        """Delta refresh asks only for newer records and re-keys renamed ones"""
+        index._refreshed_at = 0
+        zoho.iter_app_hc_candidates.return_value = iter([
+            _row("2", "山田 花", "2024-01-05T10:00:00+09:00"),
+        ])
+        with patch('app.infrastructure.zoho.candidate_index.get_settings', return_value=settings):
+            assert index.ensure_fresh(zoho) is True
+
+        zoho.iter_app_hc_candidates.assert_called_with(modified_since="2024-01-02T10:00:00+09:00")
+        assert index.lookup("山田花子") == []
+        assert [m["record_id"] for m in index.lookup("山田花")] == ["2"]
+        assert len(index) == 2
+
+    def test_build_failure_is_reported_not_raised(self, settings):
+        """A failed COQL export leaves the index unavailable so callers fall back"""
+        zoho = Mock()
+        zoho.iter_app_hc_candidates.side_effect = RuntimeError("OAUTH_SCOPE_MISMATCH")
+        index = ZohoCandidateIndex()
+        with patch('app.infrastructure.zoho.candidate_index.get_settings', return_value=settings):
+            assert index.ensure_fresh(zoho) is False
+        assert not index.ready
@@ -0,0 +1,118 @@
+"""
+Unit tests for JobSeekerStore
+"""
+import pytest
+from unittest.mock import Mock, patch
+
+from app.infrastructure.zoho.job_seeker_store import JobSeekerStore
+
+
+def _row(record_id, channel, status, reg_date, modified, owner="佐藤", interviewed=None):
+    return {
+        "id": record_id,
+        "field14": channel,
+        "customer_status": status,
+        "field18": reg_date,
+        "field29": interviewed,
+        "Owner": {"id": f"u-{owner}", "name": owner},
+        "Modified_Time": modified,
+    }
+
+
+class TestJobSeekerStore:
+    """Test cases for the columnar APP-hc analytics replica"""
+
+    @pytest.fixture
+    def settings(self):
+        settings = Mock()
+        settings.zoho_job_seeker_store_refresh_seconds = 60
+        settings.zoho_job_seeker_store_rebuild_seconds = 21600
+        return settings
+
+    @pytest.fixture
+    def zoho(self):
+        client = Mock()
+        client.list_users.return_value = {}
+        client.iter_app_hc_analytics_rows.return_value = iter([
+            _row("1", "paid_meta", "1. リード", "2024-01-05", "2024-01-05T10:00:00+09:00"),
+            _row("2", "paid_meta", "14. 入社", "2024-01-20", "2024-01-21T10:00:00+09:00", interviewed="2024-01-10"),
+            _row("3", "sco_bizreach", "4. 面談済み", "2024-02-01", "2024-02-01T10:00:00+09:00", owner="鈴木", interviewed="2024-02-03"),
+            _row("4", "sco_bizreach", None, "", "2024-02-02T10:00:00+09:00", owner="鈴木"),
+        ])
+        return client
+
+    @pytest.fixture
+    def store(self, zoho, settings):
+        store = JobSeekerStore()
+        with patch('app.infrastructure.zoho.job_seeker_store.get_settings', return_value=settings):
+            assert store.ensure_fresh(zoho) is True
+        return store
+
+    def test_count_filters_by_registration_date_and_channel(self, store):
+        """Date bounds are inclusive and rows without 登録日 only count without bounds"""
+        assert store.count() == 4
+        assert store.count("2024-01-01", "2024-01-31") == 2
+        assert store.count("2024-01-20", "2024-02-01") == 2
+        assert store.count(date_to="2024-12-31", channel="sco_bizreach") == 1
+        assert store.count(channel="unknown") == 0
+
+    def test_count_by_groups_decoded_values(self, store):
+        """Group-by returns decoded value tuples, including the interviewed flag"""
+        counts = store.count_by(("channel", "status"), "2024-01-01", "2024-12-31")
+        assert counts[("paid_meta", "14. 入社")] == 1
+        assert counts[("sco_bizreach", "4. 面談済み")] == 1
+        assert sum(counts.values()) == 3
+
+        by_pic = store.count_by(("owner", "interviewed"), channel="sco_bizreach")
+        assert by_pic == {("鈴木", 1): 1, ("鈴木", 0): 1}
+
+    def test_period_counts_slice_one_memoised_cube(self, store):
+        """All periods are answered from one cube, rebuilt only after the data changes"""
+        periods = [("2024-01-01", "2024-01-31"), ("2024-02-01", "2024-02-29"), ("2024-03-01", "2024-03-31")]
+        assert store.period_counts(periods) == [2, 1, 0]
+        assert store.period_counts(periods, channel="paid_meta") == [2, 0, 0]
+        assert store.count_by(("channel",), "2024-01-01", "2024-02-29")[("sco_bizreach",)] == 1
+        assert store.metrics()["cube_builds"] == 1
+
+        store._put(_row("5", "paid_meta", "1. リード", "2024-03-15", "2024-03-15T10:00:00+09:00"))
+        assert store.period_counts(periods) == [2, 1, 1]
+        assert store.metrics()["cube_builds"] == 2
+
+    def test_delta_sync_updates_rows_in_place(self, store, zoho, settings):
+        """Delta sync asks for newer records and overwrites changed ones by id"""
+        store._refreshed_at = 0
+        zoho.iter_app_hc_analytics_rows.return_value = iter([
+            _row("1", "paid_meta", "4. 面談済み", "2024-03-01", "2024-03-02T10:00:00+09:00"),
+            _row("5", "org_hitocareer", "1. リード", "2024-03-02", "2024-03-02T11:00:00+09:00"),
+        ])
+        with patch('app.infrastructure.zoho.job_seeker_store.get_settings', return_value=settings):
+            assert store.ensure_fresh(zoho) is True
+
+        zoho.iter_app_hc_analytics_rows.assert_called_with(modified_since="2024-02-02T10:00:00+09:00")
+        assert len(store) == 5
+        assert store.count("2024-01-01", "2024-01-31") == 1
+        assert store.count_by(("status",), "2024-03-01", "2024-03-31") == {("4. 面談済み",): 1, ("1. リード",): 1}
+        assert store.metrics()["watermark"] == "2024-03-02T11:00:00+09:00"
+
+    def test_owner_name_resolved_from_users_when_coql_returns_id_only(self, settings):
+        """COQL lookups carry only the owner id; names come from the users API"""
+        zoho = Mock()
+        zoho.list_users.return_value = {"u1": "高橋 一郎"}
+        zoho.iter_app_hc_analytics_rows.return_value = iter([
+            {"id": "1", "field18": "2024-01-01", "Owner": {"id": "u1"}, "Modified_Time": "2024-01-01T00:00:00+09:00"},
+            {"id": "2", "field18": "2024-01-01", "Owner": None, "Modified_Time": "2024-01-01T00:00:00+09:00"},
+        ])
+        store = JobSeekerStore()
+        with patch('app.infrastructure.zoho.job_seeker_store.get_settings', return_value=settings):
+            assert store.ensure_fresh(zoho) is True
+        assert store.count_by(("owner",)) == {("高橋 一郎",): 1, ("未割当",): 1}
+
+    def test_build_failure_is_reported_not_raised(self, settings):
+        """A failed COQL export leaves the store unavailable so tools fall back"""
+        zoho = Mock()
+        zoho.list_users.return_value = {}
+        zoho.iter_app_hc_analytics_rows.side_effect = RuntimeError("OAUTH_SCOPE_MISMATCH")
+        store = JobSeekerStore()
+        with patch('app.infrastructure.zoho.job_seeker_store.get_settings', return_value=settings):
+            assert store.ensure_fresh(zoho) is False
+        assert not store.ready
@@ -0,0 +1,83 @@
+"""
+Unit tests for the Zoho prefetching pager
+"""
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock, patch
+
+from app.infrastructure.zoho.client import ZohoClient
+from app.infrastructure.zoho.paging import iter_pages
+
+
+def _page(records, more):
+    return {"data": records, "info": {"more_records": more}}
+
+
+class TestZohoPaging:
+    """Test cases for iter_pages and COQL OFFSET paging"""
+
+    @pytest.fixture
+    def settings(self):
+        settings = Mock()
+        settings.zoho_page_prefetch = 3
+        settings.zoho_max_concurrency = 8
+        settings.zoho_max_retries = 0
+        settings.zoho_app_hc_module = "CustomModule1"
+        return settings
+
+    def test_pages_yield_in_order_and_stop_at_last_page(self, settings):
+        """Later pages are fetched concurrently but yielded in order; pages past the end are dropped"""
+        in_flight, peak = 0, 0
+        lock = threading.Lock()
+
+        def fetch(index):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02 * (5 - index) if index < 5 else 0)
+            with lock:
+                in_flight -= 1
+            return _page([index] if index < 5 else [], index < 4)
+
+        with patch('app.infrastructure.zoho.paging.get_settings', return_value=settings):
+            pages = [index for index, _ in iter_pages(fetch, max_pages=50)]
+
+        assert pages == [0, 1, 2, 3, 4]
+        assert 1 < peak <= 3
+
+    def test_max_pages_bounds_the_walk(self, settings):
+        """Paging never requests beyond max_pages even when more_records stays true"""
+        requested = []
+
+        def fetch(index):
+            requested.append(index)
+            return _page([index], True)
+
+        with patch('app.infrastructure.zoho.paging.get_settings', return_value=settings):
+            pages = [index for index, _ in iter_pages(fetch, max_pages=4)]
+
+        assert pages == [0, 1, 2, 3]
+        assert sorted(requested) == [0, 1, 2, 3]
+
+    def test_coql_pages_with_offset_until_more_records_is_false(self, settings):
+        """iter_coql appends LIMIT/OFFSET per page and streams every record"""
+        with patch('app.infrastructure.zoho.client.get_settings', return_value=settings), \
+                patch('app.infrastructure.zoho.paging.get_settings', return_value=settings):
+            client = ZohoClient()
+            queries = []
+
+            def coql(query):
+                queries.append(query)
+                offset = int(query.rsplit("OFFSET ", 1)[1])
+                if offset >= 4:
+                    return {}
+                return _page([{"id": str(offset)}, {"id": str(offset + 1)}], offset < 2)
+
+            client._coql_query = coql
+            ids = [r["id"] for r in client.iter_coql("SELECT id FROM jobSeeker WHERE id is not null", page_size=2)]
+
+        assert ids == ["0", "1", "2", "3"]
+        assert queries[0] == "SELECT id FROM jobSeeker WHERE id is not null LIMIT 2 OFFSET 0"
@@ -0,0 +1,135 @@
+"""
+Unit tests for the pooled Zoho HTTP transport (zoho_urlopen / azoho_urlopen)
+"""
+import asyncio
+import json
+from unittest.mock import Mock, patch
+from urllib import error, request
+
+import httpx
+import pytest
+
+from app.infrastructure.zoho import transport as transport_module
+from app.infrastructure.zoho.client import ZohoAuthError, _refresh_access_token
+from app.infrastructure.zoho.transport import ZohoTransport, azoho_urlopen, zoho_urlopen
+
+
+class TestZohoTransport:
+    """Test cases for the urllib-compatible httpx transport"""
+
+    @pytest.fixture
+    def captured(self):
+        return []
+
+    @pytest.fixture
+    def handler(self, captured):
+        def handle(req: httpx.Request) -> httpx.Response:
+            captured.append(req)
+            if "/missing" in req.url.path:
+                return httpx.Response(404, json={"code": "INVALID_URL_PATTERN"})
+            if req.url.path.endswith("/oauth/v2/token"):
+                return httpx.Response(200, json={"access_token": "token-1", "expires_in": 3600})
+            return httpx.Response(200, json={"data": [{"id": "1"}]})
+        return handle
+
+    @pytest.fixture
+    def transport(self, handler):
+        settings = Mock()
+        settings.zoho_http_pool_size = 4
+        settings.zoho_http2 = False
+        settings.zoho_http_keepalive_seconds = 30
+
+        with patch('app.infrastructure.zoho.transport.get_settings', return_value=settings):
+            transport = ZohoTransport()
+        transport._client = httpx.Client(transport=httpx.MockTransport(handler))
+        with patch.object(transport_module, "_transport", transport):
+            yield transport
+
+    def test_zoho_urlopen_sends_method_body_and_headers(self, transport, captured):
+        """The urllib request's method, body and headers reach httpx unchanged"""
+        req = request.Request(
+            "https://www.zohoapis.jp/crm/v2/Leads/search",
+            data=json.dumps({"q": 1}).encode("utf-8"),
+            headers={"Authorization": "Zoho-oauthtoken abc", "Content-Type": "application/json"},
+            method="POST",
+        )
+
+        with zoho_urlopen(req, timeout=5) as resp:
+            payload = json.loads(resp.read().decode("utf-8"))
+
+        assert payload == {"data": [{"id": "1"}]}
+        sent = captured[0]
+        assert sent.method == "POST"
+        assert sent.content == b'{"q": 1}'
+        assert sent.headers["authorization"] == "Zoho-oauthtoken abc"
+        assert sent.headers["content-type"] == "application/json"
+
+    def test_token_refresh_is_sent_as_form(self, transport, captured):
+        """The refresh-token POST carries the form Content-Type urllib used to add"""
+        settings = Mock()
+        settings.zoho_client_id = "cid"
+        settings.zoho_client_secret = "secret"
+        settings.zoho_refresh_token = "refresh"
+        settings.zoho_accounts_base_url = "https://accounts.zoho.jp"
+
+        access, expires_in = _refresh_access_token(settings)
+
+        assert (access, expires_in) == ("token-1", 3600)
+        sent = captured[0]
+        assert sent.method == "POST"
+        assert sent.headers["content-type"] == "application/x-www-form-urlencoded"
+        assert b"grant_type=refresh_token" in sent.content
+
+    def test_body_without_content_type_defaults_to_form(self, transport, captured):
+        """Like urllib, a request with a body and no Content-Type is sent as a form"""
+        req = request.Request("https://www.zohoapis.jp/crm/v2/coql", data=b"a=1", method="POST")
+
+        zoho_urlopen(req)
+
+        assert captured[0].headers["content-type"] == "application/x-www-form-urlencoded"
+
+    def test_http_error_is_raised_as_urllib_http_error(self, transport):
+        """HTTP >= 400 surfaces as urllib.error.HTTPError with a readable body"""
+        req = request.Request("https://www.zohoapis.jp/crm/v2/missing", method="GET")
+
+        with pytest.raises(error.HTTPError) as exc_info:
+            zoho_urlopen(req)
+
+        assert exc_info.value.code == 404
+        assert json.loads(exc_info.value.read().decode("utf-8")) == {"code": "INVALID_URL_PATTERN"}
+
+    @pytest.mark.asyncio
+    async def test_azoho_urlopen_sends_request_and_maps_errors(self, transport, handler, captured):
+        """The async variant sends the same request and raises the same HTTPError"""
+        transport._async_clients[asyncio.get_running_loop()] = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        req = request.Request(
+            "https://accounts.zoho.jp/oauth/v2/token",
+            data=b"grant_type=refresh_token",
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            method="POST",
+        )
+
+        with await azoho_urlopen(req) as resp:
+            assert json.loads(resp.read())["access_token"] == "token-1"
+        assert captured[0].method == "POST"
+        assert captured[0].content == b"grant_type=refresh_token"
+        assert captured[0].headers["content-type"] == "application/x-www-form-urlencoded"
+
+        with pytest.raises(error.HTTPError) as exc_info:
+            await azoho_urlopen(request.Request("https://www.zohoapis.jp/crm/v2/missing"))
+        assert exc_info.value.code == 404
+        assert b"INVALID_URL_PATTERN" in exc_info.value.read()
+        await transport.aclose()
+
+    def test_token_refresh_error_keeps_zoho_message(self, transport):
+        """_refresh_access_token reads the HTTPError body into ZohoAuthError"""
+        settings = Mock()
+        settings.zoho_client_id = "cid"
+        settings.zoho_client_secret = "secret"
+        settings.zoho_refresh_token = "refresh"
+        settings.zoho_accounts_base_url = "https://accounts.zoho.jp/missing"
+
+        with pytest.raises(ZohoAuthError, match="INVALID_URL_PATTERN"):
+            _refresh_access_token(settings)
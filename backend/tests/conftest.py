@@ -31,6 +31,7 @@ def mock_settings():
     settings.candidate_title_regex = None
     settings.autoproc_gemini_model_small_threshold = 5000
     settings.autoproc_gemini_model_large_threshold = 15000
+    settings.zoho_candidate_index_enabled = False
     return settings
 
 
@@ -106,6 +107,7 @@ def mock_meeting_repository():
     # Mock get_meeting
     repo.get_meeting.return_value = None
     repo.get_meeting_core.return_value = None
+    repo.get_meetings_core_batch.return_value = {}
     
     return repo
 
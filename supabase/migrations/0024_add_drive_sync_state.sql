@@ -0,0 +1,20 @@
+-- Drive Changes API の startPageToken を subject（なりすましアカウント）ごとに保持する
+-- 議事録収集の差分モードで、前回以降に変更されたファイルだけを取得するために使用する
+
+CREATE TABLE IF NOT EXISTS public.drive_sync_state (
+  subject TEXT NOT NULL,
+  source TEXT NOT NULL DEFAULT 'google_docs',
+  start_page_token TEXT NOT NULL,
+  last_synced_at TIMESTAMPTZ DEFAULT NOW(),
+  created_at TIMESTAMPTZ DEFAULT NOW(),
+  updated_at TIMESTAMPTZ DEFAULT NOW(),
+  PRIMARY KEY (subject, source)
+);
+
+DROP TRIGGER IF EXISTS trg_updated_at_drive_sync_state ON public.drive_sync_state;
+CREATE TRIGGER trg_updated_at_drive_sync_state
+BEFORE UPDATE ON public.drive_sync_state
+FOR EACH ROW EXECUTE PROCEDURE set_updated_at();
+
+COMMENT ON TABLE public.drive_sync_state IS 'Per-subject Drive changes.startPageToken for incremental meeting collection.';
+COMMENT ON COLUMN public.drive_sync_state.start_page_token IS 'Token to pass to drive.changes.list on the next incremental run';
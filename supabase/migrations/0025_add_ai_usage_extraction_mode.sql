@@ -0,0 +1,9 @@
+-- 構造化抽出モード（merged / per_group / per_group_cached）ごとのレイテンシ・コスト比較用
+ALTER TABLE public.ai_usage_logs
+ADD COLUMN IF NOT EXISTS extraction_mode TEXT DEFAULT NULL;
+
+CREATE INDEX IF NOT EXISTS ai_usage_logs_extraction_mode_idx
+  ON public.ai_usage_logs (extraction_mode)
+  WHERE extraction_mode IS NOT NULL;
+
+COMMENT ON COLUMN public.ai_usage_logs.extraction_mode IS 'Structured extraction mode: merged | per_group | per_group_cached | NULL (legacy)';
@@ -0,0 +1,38 @@
+-- 構造化抽出結果のキャッシュ
+-- cache_key = sha256(議事録本文, schema_version, グループ名/スキーマ, モデル, プロンプトテンプレート版, 候補者名/エージェント名)
+-- 同一入力の再処理では Gemini を呼ばずにこの結果を再利用する
+
+CREATE TABLE IF NOT EXISTS public.extraction_result_cache (
+  cache_key TEXT PRIMARY KEY,
+  schema_version TEXT NOT NULL,
+  group_name TEXT NOT NULL,
+  model TEXT NOT NULL,
+  prompt_version TEXT NOT NULL,
+  result JSONB NOT NULL,
+  hit_count INTEGER NOT NULL DEFAULT 0,
+  last_hit_at TIMESTAMPTZ,
+  created_at TIMESTAMPTZ DEFAULT NOW(),
+  updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_extraction_result_cache_schema_version
+  ON public.extraction_result_cache (schema_version);
+
+DROP TRIGGER IF EXISTS trg_updated_at_extraction_result_cache ON public.extraction_result_cache;
+CREATE TRIGGER trg_updated_at_extraction_result_cache
+BEFORE UPDATE ON public.extraction_result_cache
+FOR EACH ROW EXECUTE PROCEDURE set_updated_at();
+
+-- キャッシュヒット時にまとめて hit_count / last_hit_at を更新する
+CREATE OR REPLACE FUNCTION public.touch_extraction_result_cache(p_keys TEXT[])
+RETURNS VOID
+LANGUAGE sql
+AS $$
+  UPDATE public.extraction_result_cache
+  SET hit_count = hit_count + 1,
+      last_hit_at = NOW()
+  WHERE cache_key = ANY(p_keys);
+$$;
+
+COMMENT ON TABLE public.extraction_result_cache IS 'Per-group structured extraction results keyed by a content hash of the extraction inputs.';
+COMMENT ON COLUMN public.extraction_result_cache.prompt_version IS 'Fingerprint of the extraction prompt template; changing the prompt invalidates old entries';
@@ -0,0 +1,18 @@
+-- meeting_documents_enriched に本文の文字数を追加
+-- 自動処理の候補選定で text_content を転送せずに本文有無・長さでスコアリングするために使用する
+CREATE OR REPLACE VIEW meeting_documents_enriched AS
+SELECT
+  md.id,
+  md.doc_id,
+  md.title,
+  md.meeting_datetime,
+  md.organizer_email,
+  md.organizer_name,
+  md.document_url,
+  md.invited_emails,
+  md.created_at,
+  md.updated_at,
+  EXISTS (SELECT 1 FROM structured_outputs so WHERE so.meeting_id = md.id) AS is_structured,
+  (SELECT so.zoho_sync_status FROM structured_outputs so WHERE so.meeting_id = md.id LIMIT 1) AS zoho_sync_status,
+  COALESCE(char_length(md.text_content), 0) AS text_length
+FROM meeting_documents md;
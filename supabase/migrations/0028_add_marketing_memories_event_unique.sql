@@ -0,0 +1,12 @@
+-- marketing_memories を (session_id, event_id) で一意にする
+-- セッション保存のたびに全イベントを insert していたため重複行が溜まっている。
+-- 重複を1行に畳んでから一意インデックスを作成し、以降は upsert(on_conflict) で差分のみ書き込む。
+
+DELETE FROM public.marketing_memories a
+USING public.marketing_memories b
+WHERE a.session_id = b.session_id
+  AND a.event_id = b.event_id
+  AND a.ctid > b.ctid;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_marketing_memories_session_event
+  ON public.marketing_memories (session_id, event_id);
@@ -0,0 +1,40 @@
+-- ADK セッションの永続化（SupabaseSessionService）
+-- インメモリセッション + フロントからの context_items 再送を置き換える。
+-- イベントは1件ずつ追記し、読み込み時は末尾N件のみ取得する（function_response も保持）。
+
+CREATE TABLE IF NOT EXISTS public.adk_sessions (
+  app_name TEXT NOT NULL,
+  user_id TEXT NOT NULL,
+  id TEXT NOT NULL,
+  state JSONB NOT NULL DEFAULT '{}'::jsonb,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  PRIMARY KEY (app_name, user_id, id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_adk_sessions_updated_at
+  ON public.adk_sessions (updated_at DESC);
+
+DROP TRIGGER IF EXISTS trg_updated_at_adk_sessions ON public.adk_sessions;
+CREATE TRIGGER trg_updated_at_adk_sessions
+BEFORE UPDATE ON public.adk_sessions
+FOR EACH ROW EXECUTE PROCEDURE set_updated_at();
+
+CREATE TABLE IF NOT EXISTS public.adk_session_events (
+  app_name TEXT NOT NULL,
+  user_id TEXT NOT NULL,
+  session_id TEXT NOT NULL,
+  event_id TEXT NOT NULL,
+  invocation_id TEXT,
+  author TEXT,
+  ts DOUBLE PRECISION NOT NULL,
+  event JSONB NOT NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  PRIMARY KEY (app_name, user_id, session_id, event_id),
+  FOREIGN KEY (app_name, user_id, session_id)
+    REFERENCES public.adk_sessions (app_name, user_id, id) ON DELETE CASCADE
+);
+
+-- 末尾ウィンドウ取得（ts DESC LIMIT N）用
+CREATE INDEX IF NOT EXISTS idx_adk_session_events_tail
+  ON public.adk_session_events (app_name, user_id, session_id, ts DESC);
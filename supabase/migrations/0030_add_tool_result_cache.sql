@@ -0,0 +1,20 @@
+-- ADK 分析ツール結果の共有キャッシュ（ToolResultCachePlugin の Supabase 層）
+-- 確定済み期間（終了日がデータ確定ラグより前）の GA4 / GSC / Meta Ads 結果のみを圧縮済みの形で保存する。
+-- cache_key = sha256(ツール名, 正規化済み引数, 実日付に解決した期間)
+
+CREATE TABLE IF NOT EXISTS public.tool_result_cache (
+  cache_key TEXT PRIMARY KEY,
+  tool_name TEXT NOT NULL,
+  result JSONB NOT NULL,
+  expires_at TIMESTAMPTZ NOT NULL,
+  created_at TIMESTAMPTZ DEFAULT NOW(),
+  updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_tool_result_cache_expires_at
+  ON public.tool_result_cache (expires_at);
+
+DROP TRIGGER IF EXISTS trg_updated_at_tool_result_cache ON public.tool_result_cache;
+CREATE TRIGGER trg_updated_at_tool_result_cache
+BEFORE UPDATE ON public.tool_result_cache
+FOR EACH ROW EXECUTE PROCEDURE set_updated_at();
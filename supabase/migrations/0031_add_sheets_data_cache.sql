@@ -0,0 +1,17 @@
+-- 企業DBスプレッドシートの共有キャッシュ（SheetsDataCache の Supabase 層）
+-- コールドスタートしたインスタンスが Sheets API を叩かずに最新の取得結果から開始できるようにする。
+-- cache_key = "<スプレッドシートID>:<シートキー>"、version = Drive の version@modifiedTime
+
+CREATE TABLE IF NOT EXISTS public.sheets_data_cache (
+  cache_key TEXT PRIMARY KEY,
+  payload JSONB NOT NULL,
+  version TEXT,
+  fetched_at TIMESTAMPTZ NOT NULL,
+  created_at TIMESTAMPTZ DEFAULT NOW(),
+  updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+DROP TRIGGER IF EXISTS trg_updated_at_sheets_data_cache ON public.sheets_data_cache;
+CREATE TRIGGER trg_updated_at_sheets_data_cache
+BEFORE UPDATE ON public.sheets_data_cache
+FOR EACH ROW EXECUTE PROCEDURE set_updated_at();
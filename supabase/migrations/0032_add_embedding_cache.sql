@@ -0,0 +1,18 @@
+-- 検索クエリ埋め込みの共有キャッシュ（EmbeddingService の L2）
+-- semantic_search_companies / メモリ検索で同じクエリを再度埋め込まないよう、デプロイを跨いで保持する。
+-- cache_key = sha256(モデル, 次元数, task_type, 正規化済みテキスト)
+
+CREATE TABLE IF NOT EXISTS public.embedding_cache (
+  cache_key TEXT PRIMARY KEY,
+  model TEXT NOT NULL,
+  dimensions INTEGER NOT NULL,
+  task_type TEXT,
+  embedding REAL[] NOT NULL,
+  created_at TIMESTAMPTZ DEFAULT NOW(),
+  updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+DROP TRIGGER IF EXISTS trg_updated_at_embedding_cache ON public.embedding_cache;
+CREATE TRIGGER trg_updated_at_embedding_cache
+BEFORE UPDATE ON public.embedding_cache
+FOR EACH ROW EXECUTE PROCEDURE set_updated_at();